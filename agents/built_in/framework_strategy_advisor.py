@@ -7,7 +7,7 @@ architectural decisions, component selection, and implementation approaches.
 
 import logging
 import re
-from typing import Dict, List, Any, Optional, Union
+from typing import Dict, List, Any, Optional, Union, Iterable, Iterator, Tuple
 import yaml
 import sys
 import os
@@ -71,30 +71,6 @@ class FrameworkStrategyAdvisor(BaseAgent):
             }
         }
         
-    def _get_llm_client(self, task_type: str) -> Optional[Any]:
-        """
-        Get an LLM client based on the task type.
-        
-        Args:
-            task_type: The type of task to perform (e.g., 'reasoning', 'generation', 'summarization')
-            
-        Returns:
-            An LLM client instance or None if initialization fails.
-        """
-        # Map task types to model names
-        task_to_model = {
-            'reasoning': 'openrouter.anthropic/claude-3-opus',
-            'generation': 'openrouter.anthropic/claude-3-sonnet',
-            'summarization': 'google_gemini.gemini-pro',
-            'default': 'openrouter.anthropic/claude-3-haiku'
-        }
-        
-        # Get the model name for the task type
-        model_name = task_to_model.get(task_type, task_to_model['default'])
-        
-        # Call the parent class's _get_llm_client method with the model name
-        return super()._get_llm_client(model_name)
-    
     def run(self, requirements: Dict[str, Any]) -> Dict[str, Any]:
         """
         Analyze requirements and provide strategic recommendations.
@@ -110,7 +86,7 @@ class FrameworkStrategyAdvisor(BaseAgent):
             self.logger.info(f"Analyzing requirements: {requirements}")
             
             # Get an LLM client for reasoning tasks
-            llm_client = self._get_llm_client(task_type='reasoning')
+            llm_client = self._get_llm_client_for_task(task_type='reasoning')
             if not llm_client:
                 error_msg = "Failed to obtain LLM client for reasoning task"
                 self.logger.error(error_msg)
@@ -119,8 +95,8 @@ class FrameworkStrategyAdvisor(BaseAgent):
             # Construct the prompt for the LLM
             prompt = self._construct_strategy_prompt(requirements)
             
-            # Call the LLM with the prompt
-            response_text = self._call_llm(llm_client, prompt)
+            # Call the LLM with the prompt, hedging with the backup model if configured
+            response_text = self._call_llm_hedged(llm_client, prompt)
             
             # Parse the response into a structured format
             structured_response = self._parse_llm_response(response_text)
@@ -143,6 +119,51 @@ class FrameworkStrategyAdvisor(BaseAgent):
                 "details": str(e)
             }
     
+    def run_streaming(self, requirements: Dict[str, Any]) -> Iterator[Tuple[str, Any]]:
+        """
+        Analyze requirements, emitting each recommendation section as soon as it is generated.
+        
+        Args:
+            requirements: Dictionary containing project requirements, constraints, and goals
+            
+        Yields:
+            (section_key, parsed_value) tuples as sections complete. On failure a
+            final ('error', error_info) tuple is yielded instead of raising.
+        """
+        try:
+            self.logger.info(f"Analyzing requirements (streaming): {requirements}")
+            
+            llm_client = self._get_llm_client_for_task(task_type='reasoning')
+            if not llm_client:
+                error_msg = "Failed to obtain LLM client for reasoning task"
+                self.logger.error(error_msg)
+                yield "error", {"error": True, "message": error_msg, "details": "LLM client initialization failed"}
+                return
+            
+            prompt = self._construct_strategy_prompt(requirements)
+            
+            structured_response = self._empty_structured_response()
+            for section_key, value in self._parse_llm_response_incremental(self.stream_llm(llm_client, prompt)):
+                if section_key in structured_response:
+                    structured_response[section_key] = value
+                yield section_key, value
+            
+            self._log_run_to_langsmith(run_data={
+                "inputs": requirements,
+                "outputs": structured_response
+            })
+            
+            self.logger.info(f"Generated recommendations: {structured_response}")
+            
+        except Exception as e:
+            error_msg = f"Error in strategy advisor: {str(e)}"
+            self.logger.error(error_msg)
+            yield "error", {
+                "error": True,
+                "message": "Failed to generate strategic recommendations",
+                "details": str(e)
+            }
+    
     def _construct_strategy_prompt(self, requirements: Dict[str, Any]) -> str:
         """
         Construct a detailed prompt for the LLM to generate strategic recommendations.
@@ -209,53 +230,97 @@ Your recommendations should be practical, well-justified, and tailored to the sp
             Structured dictionary containing the parsed recommendations
         """
         # Initialize the structured response
-        structured_response = {
+        structured_response = self._empty_structured_response()
+        
+        for section_key, value in self._parse_llm_response_incremental([response_text]):
+            if section_key in structured_response:
+                structured_response[section_key] = value
+        
+        return structured_response
+    
+    def _empty_structured_response(self) -> Dict[str, Any]:
+        """Get the structured response with every known section empty."""
+        return {
             "recommended_patterns": [],
             "architecture_overview": "",
             "implementation_approach": {},
             "technology_stack": {}
         }
+    
+    def _parse_llm_response_incremental(self, chunks: Iterable[str]) -> Iterator[Tuple[str, Any]]:
+        """
+        Parse streamed LLM output, emitting each markdown section as soon as it completes.
         
-        # Extract sections based on markdown headings
-        sections = {}
+        A section is complete when the next '## ' heading starts or the stream
+        ends. Text before the first heading is ignored.
+        
+        Args:
+            chunks: Text chunks of the response in arrival order (e.g. from stream_llm())
+            
+        Yields:
+            (section_key, parsed_value) tuples. Sections without a dedicated parser
+            yield their stripped text.
+        """
         current_section = None
+        section_lines: List[str] = []
+        buffer = ""
         
-        for line in response_text.split('\n'):
+        def _complete_line(line: str) -> Iterator[Tuple[str, Any]]:
+            nonlocal current_section, section_lines
             if line.startswith('## '):
+                if current_section:
+                    yield current_section, self._parse_section(current_section, section_lines)
                 current_section = line[3:].strip().lower().replace(' ', '_')
-                sections[current_section] = []
+                section_lines = []
             elif current_section:
-                sections[current_section].append(line)
+                section_lines.append(line)
+        
+        for chunk in chunks:
+            buffer += chunk
+            # Only complete lines can be classified; keep the trailing partial line buffered
+            *lines, buffer = buffer.split('\n')
+            for line in lines:
+                yield from _complete_line(line)
+        
+        yield from _complete_line(buffer)
+        if current_section:
+            yield current_section, self._parse_section(current_section, section_lines)
+    
+    def _parse_section(self, section_key: str, lines: List[str]) -> Any:
+        """
+        Parse the body of one markdown section.
+        
+        Args:
+            section_key: Normalized section heading (e.g. 'technology_stack')
+            lines: Lines of the section body
+            
+        Returns:
+            The parsed section value
+        """
+        section_text = '\n'.join(lines)
         
         # Process recommended patterns section
-        if 'recommended_patterns' in sections:
-            pattern_text = '\n'.join(sections['recommended_patterns'])
+        if section_key == 'recommended_patterns':
+            recommended_patterns = []
             # Extract pattern names (assuming they are mentioned in the text)
             for pattern in self.patterns_library.keys():
-                if pattern.lower() in pattern_text.lower() or self.patterns_library[pattern]['name'].lower() in pattern_text.lower():
-                    structured_response['recommended_patterns'].append(pattern)
-        
-        # Process architecture overview section
-        if 'architecture_overview' in sections:
-            structured_response['architecture_overview'] = '\n'.join(sections['architecture_overview']).strip()
+                if pattern.lower() in section_text.lower() or self.patterns_library[pattern]['name'].lower() in section_text.lower():
+                    recommended_patterns.append(pattern)
+            return recommended_patterns
         
         # Process implementation approach section
-        if 'implementation_approach' in sections:
-            approach_text = '\n'.join(sections['implementation_approach'])
-            
+        if section_key == 'implementation_approach':
             # Extract phases (assuming they are listed with bullet points or numbers)
-            phases = re.findall(r'[*-]\s*(.*?)(?=\n[*-]|\n\n|$)', approach_text)
-            considerations = re.findall(r'consideration[s]?:?\s*(.*?)(?=\n\n|$)', approach_text, re.IGNORECASE)
+            phases = re.findall(r'[*-]\s*(.*?)(?=\n[*-]|\n\n|$)', section_text)
+            considerations = re.findall(r'consideration[s]?:?\s*(.*?)(?=\n\n|$)', section_text, re.IGNORECASE)
             
-            structured_response['implementation_approach'] = {
+            return {
                 "development_phases": phases if phases else [],
                 "key_considerations": considerations if considerations else []
             }
         
         # Process technology stack section
-        if 'technology_stack' in sections:
-            tech_text = '\n'.join(sections['technology_stack'])
-            
+        if section_key == 'technology_stack':
             # Initialize categories
             tech_stack = {
                 "frameworks": [],
@@ -266,7 +331,7 @@ Your recommendations should be practical, well-justified, and tailored to the sp
             
             # Extract technologies by category
             current_category = None
-            for line in tech_text.split('\n'):
+            for line in lines:
                 line = line.strip()
                 if not line:
                     continue
@@ -283,6 +348,7 @@ Your recommendations should be practical, well-justified, and tailored to the sp
                     tech = re.match(r'[*-]\s*(.*)', line).group(1).strip()
                     tech_stack[current_category].append(tech)
             
-            structured_response['technology_stack'] = tech_stack
+            return tech_stack
         
-        return structured_response
+        # Architecture overview and any other section: the stripped text
+        return section_text.strip()
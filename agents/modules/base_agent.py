@@ -6,11 +6,15 @@ in the Ultimate AI Architect Framework. It provides common functionality and int
 that all specialized agents will inherit.
 """
 
+import asyncio
 import logging
+import concurrent.futures
 import json
 import os
+import time
+import weakref
 import requests
-from typing import Dict, List, Any, Optional, Union, Tuple
+from typing import Dict, List, Any, Optional, Union, Tuple, Iterator, AsyncIterator
 
 # Import core modules
 from ultimate_ai_architect_framework.core_modules.config_loader import ConfigLoader
@@ -18,6 +22,8 @@ from ultimate_ai_architect_framework.core_modules.llm_router import LLMRouter
 from ultimate_ai_architect_framework.core_modules.tool_handler import ToolHandler
 from ultimate_ai_architect_framework.core_modules.flowise_client import FlowiseClient
 from ultimate_ai_architect_framework.core_modules.langsmith_setup import LangSmithSetup
+from ultimate_ai_architect_framework.core_modules.runtime_context import RuntimeContext
+from ultimate_ai_architect_framework.core_modules.response_cache import make_cache_key
 
 # Import agent modules
 from ultimate_ai_architect_framework.agents.modules.memory_manager import MemoryManager
@@ -29,6 +35,25 @@ from langchain_anthropic import ChatAnthropic
 from langchain_core.language_models.chat_models import BaseChatModel
 from langchain_core.language_models.llms import BaseLLM
 
+# Default cap on concurrent async LLM requests per provider, per agent
+DEFAULT_LLM_MAX_CONCURRENCY = 8
+
+# Defaults for llm.hedging (global settings, overridable per agent profile)
+DEFAULT_HEDGING_SETTINGS = {
+    'enabled': False,
+    'backup_model': None,      # Model used for the hedged call, e.g. 'google_gemini.gemini-pro'
+    'delay_seconds': None,     # Fixed hedge delay; None uses the primary model's observed p95
+    'default_delay': 2.0,      # Delay used before any p95 has been observed
+    'min_delay': 0.05,         # Lower bound on the p95-derived delay
+    'max_workers': 8           # Threads for hedged calls, shared by all agents (global setting only)
+}
+
+# Client attributes that change what a model generates; they are part of the response cache key
+LLM_GENERATION_PARAMS = (
+    'max_tokens', 'max_output_tokens', 'top_p', 'top_k', 'n', 'stop', 'seed',
+    'presence_penalty', 'frequency_penalty', 'model_kwargs'
+)
+
 class BaseAgent:
     """
     Base class for all agents in the framework.
@@ -45,7 +70,8 @@ class BaseAgent:
                  tool_handler=None,
                  memory_manager=None,
                  flowise_client=None,
-                 langsmith_setup=None):
+                 langsmith_setup=None,
+                 runtime_context=None):
         """
         Initialize a new BaseAgent instance.
         
@@ -58,17 +84,23 @@ class BaseAgent:
             memory_manager: Optional MemoryManager instance
             flowise_client: Optional FlowiseClient instance
             langsmith_setup: Optional LangSmithSetup instance
+            runtime_context: Optional RuntimeContext supplying shared components.
+                Defaults to the process-wide context for framework_root.
         """
         self.framework_root = framework_root
         self.agent_id = agent_id
         self.logger = logging.getLogger(f"agent.{agent_id}")
         
-        # Initialize or use provided framework components
-        self.config_loader = config_loader or ConfigLoader(framework_root)
-        self.llm_router = llm_router or LLMRouter()
-        self.tool_handler = tool_handler or ToolHandler(framework_root)
-        self.flowise_client = flowise_client or FlowiseClient(framework_root)
-        self.langsmith_setup = langsmith_setup or LangSmithSetup(framework_root)
+        # Use provided framework components, falling back to the shared ones
+        # so agents in the same process don't re-parse configs or re-create tools
+        self.runtime_context = runtime_context or RuntimeContext.for_root(framework_root)
+        self.config_loader = config_loader or self.runtime_context.get_config_loader()
+        self.llm_router = llm_router or self.runtime_context.get_llm_router()
+        self.tool_handler = tool_handler or self.runtime_context.get_tool_handler()
+        self.flowise_client = flowise_client or self.runtime_context.get_flowise_client()
+        self.langsmith_setup = langsmith_setup or self.runtime_context.get_langsmith_setup()
+        self.llm_client_pool = self.runtime_context.get_llm_client_pool()
+        self.rate_limiter = self.runtime_context.get_rate_limiter()
         
         # Load agent profile configuration
         agent_profiles = self.config_loader.load_agent_profiles()
@@ -76,6 +108,11 @@ class BaseAgent:
         if not self.profile_config:
             self.logger.warning(f"No profile configuration found for agent {agent_id}")
         
+        # Use the shared LLM response cache unless the profile opts out
+        self.response_cache = None
+        if self.profile_config.get('llm', {}).get('response_cache', True):
+            self.response_cache = self.runtime_context.get_response_cache()
+        
         # Initialize memory manager
         memory_config = self.profile_config.get('memory', {})
         self.memory_manager = memory_manager or MemoryManager(agent_id, memory_config)
@@ -83,6 +120,14 @@ class BaseAgent:
         # Initialize tools dictionary
         self.tools = {}
         
+        # Per-event-loop, per-provider semaphores for async LLM calls
+        self._llm_semaphores = weakref.WeakKeyDictionary()
+        
+        # Hedged-request settings: global llm.hedging overridden by the profile's
+        self.hedging_config = dict(DEFAULT_HEDGING_SETTINGS)
+        self.hedging_config.update(self.config_loader.load_global_config().get('llm', {}).get('hedging', {}) or {})
+        self.hedging_config.update(self.profile_config.get('llm', {}).get('hedging', {}) or {})
+        
         self.logger.info(f"Agent {agent_id} initialized with framework components")
     
     def run(self, input_data: Any) -> Any:
@@ -128,13 +173,20 @@ class BaseAgent:
         self.logger.debug(f"Agent {self.agent_id} using tool {tool_name}")
         return self.tools[tool_name].execute(**kwargs)
     
-    def _get_llm_client(self, model_name: str) -> Optional[Any]:
+    def _get_llm_client(self, model_name: str, temperature: float = 0.7, max_tokens: int = 1024) -> Optional[Any]:
         """
         Get an LLM client based on the model name prefix.
         
+        Clients are taken from the shared LLM client pool, keyed by
+        (provider, model, temperature, max_tokens, api_base), so repeated calls
+        reuse a warm client and its HTTP connections.
+        
         Args:
             model_name: The name of the model to use, with prefix indicating the provider.
-                        Supported prefixes: 'openrouter.', 'google_gemini.'
+                        Supported prefixes: 'openrouter.', 'google_gemini.' (or 'google.',
+                        the provider's name in llm.providers)
+            temperature: Sampling temperature for the client
+            max_tokens: Maximum number of tokens to generate
         
         Returns:
             An LLM client instance or None if initialization fails.
@@ -160,21 +212,22 @@ class BaseAgent:
                         self.logger.error("OPENROUTER_API_KEY environment variable not set")
                         return None
                     
-                    # Create and return the ChatOpenAI client with correct parameters
+                    # Reuse or create the ChatOpenAI client with correct parameters
                     # Note: No headers parameter as per requirements
-                    return ChatOpenAI(
+                    key = self.llm_client_pool.make_key("openrouter", actual_model, temperature, max_tokens, api_base)
+                    return self.llm_client_pool.get_or_create(key, lambda: ChatOpenAI(
                         model=actual_model,
                         openai_api_key=api_key,
                         openai_api_base=api_base,
-                        temperature=0.7,  # Default temperature, can be adjusted as needed
-                        max_tokens=1024   # Default max_tokens, can be adjusted as needed
-                    )
+                        temperature=temperature,
+                        max_tokens=max_tokens
+                    ))
                 except Exception as e:
                     self.logger.error(f"Failed to initialize OpenRouter client: {str(e)}")
                     return None
             
             # Handle Google Gemini models
-            elif model_name.startswith("google_gemini."):
+            elif model_name.startswith(("google_gemini.", "google.")):
                 try:
                     from langchain_google_genai import ChatGoogleGenerativeAI
                 except ImportError:
@@ -183,7 +236,7 @@ class BaseAgent:
                 
                 try:
                     # Get the actual model name (remove the prefix)
-                    actual_model = model_name.replace("google_gemini.", "")
+                    actual_model = model_name.split(".", 1)[1]
                     
                     # Get API key from environment variables
                     api_key = os.environ.get("GOOGLE_API_KEY")
@@ -192,32 +245,300 @@ class BaseAgent:
                         self.logger.error("GOOGLE_API_KEY environment variable not set")
                         return None
                     
-                    # Create and return the ChatGoogleGenerativeAI client
-                    return ChatGoogleGenerativeAI(
+                    # Reuse or create the ChatGoogleGenerativeAI client
+                    key = self.llm_client_pool.make_key("google_gemini", actual_model, temperature, max_tokens)
+                    return self.llm_client_pool.get_or_create(key, lambda: ChatGoogleGenerativeAI(
                         model=actual_model,
                         google_api_key=api_key,
-                        temperature=0.7,  # Default temperature, can be adjusted as needed
-                        max_tokens=1024   # Default max_tokens, can be adjusted as needed
-                    )
+                        temperature=temperature,
+                        max_tokens=max_tokens
+                    ))
                 except Exception as e:
                     self.logger.error(f"Failed to initialize Google Gemini client: {str(e)}")
                     return None
             
             # Unsupported model prefix
             else:
-                self.logger.error(f"Unsupported model prefix in '{model_name}'. Supported prefixes: 'openrouter.', 'google_gemini.'")
+                self.logger.error(f"Unsupported model prefix in '{model_name}'. Supported prefixes: 'openrouter.', 'google_gemini.', 'google.'")
                 return None
                 
         except Exception as e:
             self.logger.error(f"Unexpected error in _get_llm_client: {str(e)}")
             return None
     
+    def _get_llm_client_for_task(self,
+                                 task_type: Optional[str] = None,
+                                 temperature: Optional[float] = None,
+                                 max_tokens: Optional[int] = None) -> Optional[Any]:
+        """
+        Get an LLM client for the model the router picks for a task type.
+        
+        The router skips models that are degraded or whose provider circuit
+        is open, so repeated calls move to healthy models as results are recorded.
+        Only requests at or below llm.response_cache.max_temperature (0 by
+        default) are cached, so profiles whose answers may be replayed should
+        set llm.temperature to 0.
+        
+        Args:
+            task_type: The type of task (e.g. 'reasoning', 'generation', 'summarization'),
+                or None for the router's default chain
+            temperature: Sampling temperature for the client. Defaults to the
+                profile's llm.temperature, or 0.7.
+            max_tokens: Maximum number of tokens to generate. Defaults to the
+                profile's llm.max_tokens, or 1024.
+        
+        Returns:
+            An LLM client instance or None if initialization fails.
+        """
+        llm_profile = self.profile_config.get('llm', {})
+        if temperature is None:
+            temperature = llm_profile.get('temperature', 0.7)
+        if max_tokens is None:
+            max_tokens = llm_profile.get('max_tokens', 1024)
+        model_name = self.llm_router.route(task_type)
+        self.logger.debug(f"Routed task '{task_type}' to {model_name}")
+        return self._get_llm_client(model_name, temperature=temperature, max_tokens=max_tokens)
+    
+    def _start_llm_run(self, prompt: Union[str, List], cached: bool = False) -> Optional[str]:
+        """
+        Start a LangSmith run for a single LLM request if LangSmith is available.
+        
+        Args:
+            prompt: The prompt being sent to the LLM
+            cached: Whether the response is served from the response cache
+            
+        Returns:
+            The LangSmith run ID, or None if no run was started
+        """
+        if self.langsmith_setup and self.langsmith_setup.client:
+            run_name = f"{self.agent_id}_llm_call"
+            if cached:
+                return self.langsmith_setup.start_run(
+                    run_name=run_name,
+                    inputs={"prompt": prompt},
+                    tags=["cached"],
+                    metadata={"cached": True}
+                )
+            return self.langsmith_setup.start_run(
+                run_name=run_name,
+                inputs={"prompt": prompt}
+            )
+        return None
+    
+    def _end_llm_run(self, run_id: Optional[str], outputs: Optional[Dict[str, Any]] = None, error: Optional[str] = None) -> None:
+        """
+        Finish a LangSmith run started by _start_llm_run.
+        
+        Args:
+            run_id: The LangSmith run ID (no-op if None)
+            outputs: Outputs to record on success
+            error: Error message to record on failure
+        """
+        if not run_id or not self.langsmith_setup or not self.langsmith_setup.client:
+            return
+        if error is not None:
+            self.langsmith_setup.end_run(run_id=run_id, error=error)
+        else:
+            self.langsmith_setup.end_run(run_id=run_id, outputs=outputs)
+    
+    def _get_llm_model_info(self, llm_client: Union[BaseChatModel, BaseLLM]) -> Tuple[str, Optional[float]]:
+        """
+        Get the model identifier and temperature of an LLM client.
+        
+        Args:
+            llm_client: The initialized LangChain LLM client
+            
+        Returns:
+            Tuple of (model_id, temperature)
+        """
+        key = self.llm_client_pool.get_key(llm_client)
+        if key is not None:
+            return f"{key[0]}.{key[1]}", key[2]
+        model = getattr(llm_client, "model_name", None) or getattr(llm_client, "model", None)
+        return str(model or type(llm_client).__name__), getattr(llm_client, "temperature", None)
+    
+    def _get_llm_generation_params(self, llm_client: Union[BaseChatModel, BaseLLM]) -> Dict[str, Any]:
+        """
+        Get the generation parameters of an LLM client other than temperature.
+        
+        Args:
+            llm_client: The initialized LangChain LLM client
+            
+        Returns:
+            Dictionary of the parameters the client sets, such as max_tokens and top_p
+        """
+        params = {}
+        for name in LLM_GENERATION_PARAMS:
+            value = getattr(llm_client, name, None)
+            if value is not None and value != {}:
+                params[name] = value
+        return params
+    
+    def _get_cache_key(self, llm_client: Union[BaseChatModel, BaseLLM], prompt: Union[str, List]) -> Optional[str]:
+        """
+        Get the response cache key of a request without looking it up.
+        
+        Args:
+            llm_client: The initialized LangChain LLM client
+            prompt: Either a string prompt or a list of message dictionaries
+            
+        Returns:
+            The cache key, or None when caching is disabled or the client's
+            temperature is above the cache's max_temperature
+        """
+        if self.response_cache is None:
+            return None
+        try:
+            model_id, temperature = self._get_llm_model_info(llm_client)
+            if not self.response_cache.accepts(temperature):
+                return None
+            return make_cache_key(model_id, temperature, prompt, self._get_llm_generation_params(llm_client))
+        except Exception as e:
+            self.logger.warning(f"Response cache key could not be computed: {str(e)}")
+            return None
+    
+    def _get_cached_response(self, llm_client: Union[BaseChatModel, BaseLLM], prompt: Union[str, List]) -> Tuple[Optional[str], Optional[str]]:
+        """
+        Look up a prompt in the response cache.
+        
+        Cache hits are reported to LangSmith as runs tagged 'cached'. Cache
+        backend failures are logged and treated as misses.
+        
+        Args:
+            llm_client: The initialized LangChain LLM client
+            prompt: Either a string prompt or a list of message dictionaries
+            
+        Returns:
+            Tuple of (cache_key, cached_response). cache_key is None when the
+            request is not cacheable; cached_response is None on a miss.
+        """
+        cache_key = self._get_cache_key(llm_client, prompt)
+        if cache_key is None:
+            return None, None
+        
+        try:
+            cached = self.response_cache.get(cache_key)
+        except Exception as e:
+            self.logger.warning(f"Response cache lookup failed: {str(e)}")
+            return None, None
+        
+        if cached is not None:
+            self.logger.debug("Response cache hit")
+            run_id = self._start_llm_run(prompt, cached=True)
+            self._end_llm_run(run_id, outputs={"response": cached, "cached": True})
+        return cache_key, cached
+    
+    def _store_cached_response(self, cache_key: Optional[str], response: str) -> None:
+        """
+        Store a response in the response cache.
+        
+        Args:
+            cache_key: Key returned by _get_cached_response (no-op if None)
+            response: The LLM response text
+        """
+        if cache_key is None or self.response_cache is None:
+            return
+        try:
+            self.response_cache.set(cache_key, response)
+        except Exception as e:
+            self.logger.warning(f"Failed to store response in cache: {str(e)}")
+    
+    def _record_llm_result(self, llm_client: Union[BaseChatModel, BaseLLM], latency: float, success: bool, message: Any = None) -> None:
+        """
+        Report an LLM call outcome to the router's rolling statistics.
+        
+        Args:
+            llm_client: The LangChain LLM client that handled the call
+            latency: Call duration in seconds
+            success: Whether the call succeeded
+            message: The returned message, used to read token usage if available
+        """
+        try:
+            model_id, _ = self._get_llm_model_info(llm_client)
+            usage = getattr(message, "usage_metadata", None) or {}
+            self.llm_router.record_result(model_id, latency, success=success, tokens=usage.get("total_tokens", 0))
+        except Exception as e:
+            self.logger.debug(f"Failed to record LLM call statistics: {str(e)}")
+    
+    def _check_circuit(self, llm_client: Union[BaseChatModel, BaseLLM]) -> None:
+        """
+        Fail fast if the router's circuit breaker for the client's provider is open.
+        
+        Clients from _get_llm_client_for_task already avoid open providers,
+        since route() skips them; this guards clients chosen by model name
+        and circuits that opened after routing.
+        
+        Args:
+            llm_client: The LangChain LLM client about to be called
+            
+        Raises:
+            RuntimeError: If the provider's circuit is open
+        """
+        model_id, _ = self._get_llm_model_info(llm_client)
+        if not self.llm_router.allow_request(model_id):
+            error_msg = f"LLM call failed: circuit open for provider of {model_id}"
+            self.logger.warning(error_msg)
+            raise RuntimeError(error_msg)
+    
+    def _estimate_llm_tokens(self, llm_client: Union[BaseChatModel, BaseLLM], prompt: Union[str, List]) -> int:
+        """
+        Estimate the tokens a request will consume, for tokens-per-minute budgets.
+        
+        Uses ~4 characters per prompt token plus the client's max_tokens.
+        
+        Args:
+            llm_client: The LangChain LLM client
+            prompt: Either a string prompt or a list of message dictionaries
+            
+        Returns:
+            Estimated total tokens
+        """
+        prompt_chars = len(prompt) if isinstance(prompt, str) else len(json.dumps(prompt, default=str))
+        key = self.llm_client_pool.get_key(llm_client)
+        max_tokens = (key[3] if key else getattr(llm_client, "max_tokens", None)) or 0
+        return prompt_chars // 4 + max_tokens
+    
+    def _get_rate_limit_timeout(self) -> Optional[float]:
+        """Get the maximum seconds to wait for a rate limit slot (llm.rate_limiter.max_wait_seconds)."""
+        return self.config_loader.load_global_config().get('llm', {}).get('rate_limiter', {}).get('max_wait_seconds')
+    
+    def _acquire_rate_limit(self, llm_client: Union[BaseChatModel, BaseLLM], prompt: Union[str, List]) -> None:
+        """
+        Block until the client's provider has rate limit budget for the prompt.
+        
+        Raises:
+            RateLimitExceeded: If no slot is available within max_wait_seconds
+        """
+        waited = self.rate_limiter.acquire(
+            self._get_llm_provider_key(llm_client),
+            tokens=self._estimate_llm_tokens(llm_client, prompt),
+            timeout=self._get_rate_limit_timeout()
+        )
+        if waited > 0:
+            self.logger.debug(f"Waited {waited:.3f}s for LLM rate limit")
+    
+    async def _aacquire_rate_limit(self, llm_client: Union[BaseChatModel, BaseLLM], prompt: Union[str, List]) -> None:
+        """
+        Await until the client's provider has rate limit budget for the prompt.
+        
+        Raises:
+            RateLimitExceeded: If no slot is available within max_wait_seconds
+        """
+        waited = await self.rate_limiter.acquire_async(
+            self._get_llm_provider_key(llm_client),
+            tokens=self._estimate_llm_tokens(llm_client, prompt),
+            timeout=self._get_rate_limit_timeout()
+        )
+        if waited > 0:
+            self.logger.debug(f"Waited {waited:.3f}s for LLM rate limit")
+    
     def _call_llm(self, llm_client: Union[BaseChatModel, BaseLLM], prompt: Union[str, List]) -> str:
         """
         Execute a call to the initialized LLM client.
         
         Handles both string prompts and structured message lists.
-        Adds LangSmith logging if available.
+        Adds LangSmith logging if available. Responses are served from and
+        stored in the response cache when one is configured.
         
         Args:
             llm_client: The initialized LangChain LLM client
@@ -227,33 +548,52 @@ class BaseAgent:
             The LLM response as a string
             
         Raises:
-            RuntimeError: If the LLM call fails
+            RuntimeError: If the LLM call fails or the provider's circuit is open
+        """
+        cache_key, cached = self._get_cached_response(llm_client, prompt)
+        if cached is not None:
+            return cached
+        return self._invoke_llm(llm_client, prompt, cache_key)
+    
+    def _invoke_llm(self, llm_client: Union[BaseChatModel, BaseLLM], prompt: Union[str, List], cache_key: Optional[str]) -> str:
         """
+        Call the LLM client without consulting the response cache.
+        
+        Args:
+            llm_client: The initialized LangChain LLM client
+            prompt: Either a string prompt or a list of message dictionaries
+            cache_key: Key the response is stored under, or None to not store it
+            
+        Returns:
+            The LLM response as a string
+            
+        Raises:
+            RuntimeError: If the LLM call fails or the provider's circuit is open
+        """
+        self._check_circuit(llm_client)
+        
+        run_id = None
+        started = None
         try:
             self.logger.debug(f"Calling LLM with prompt: {prompt[:100]}...")
             
+            # Wait for the provider's shared rate limit budget
+            self._acquire_rate_limit(llm_client, prompt)
+            
             # Create a run in LangSmith if available
-            run_id = None
-            if self.langsmith_setup and self.langsmith_setup.client:
-                run_name = f"{self.agent_id}_llm_call"
-                run_id = self.langsmith_setup.start_run(
-                    run_name=run_name,
-                    inputs={"prompt": prompt}
-                )
+            run_id = self._start_llm_run(prompt)
             
-            # Execute the LLM call
-            if isinstance(prompt, str):
-                response = llm_client.invoke(prompt).content
-            else:
-                # Assume it's a list of message dictionaries
-                response = llm_client.invoke(prompt).content
+            # Execute the LLM call (string prompts and message lists are both accepted)
+            started = time.perf_counter()
+            message = llm_client.invoke(prompt)
+            self._record_llm_result(llm_client, time.perf_counter() - started, True, message)
+            started = None
+            response = message.content
             
             # Log the run completion in LangSmith
-            if run_id and self.langsmith_setup and self.langsmith_setup.client:
-                self.langsmith_setup.end_run(
-                    run_id=run_id,
-                    outputs={"response": response}
-                )
+            self._end_llm_run(run_id, outputs={"response": response})
+            
+            self._store_cached_response(cache_key, response)
             
             self.logger.debug(f"LLM response: {response[:100]}...")
             return response
@@ -262,15 +602,435 @@ class BaseAgent:
             error_msg = f"LLM call failed: {str(e)}"
             self.logger.error(error_msg)
             
+            if started is not None:
+                self._record_llm_result(llm_client, time.perf_counter() - started, False)
+            
             # Log the run failure in LangSmith
-            if run_id and self.langsmith_setup and self.langsmith_setup.client:
-                self.langsmith_setup.end_run(
-                    run_id=run_id,
-                    error=error_msg
-                )
+            self._end_llm_run(run_id, error=error_msg)
+                
+            raise RuntimeError(error_msg)
+    
+    def _get_hedge_delay(self, llm_client: Union[BaseChatModel, BaseLLM]) -> float:
+        """
+        Get how long to wait for the primary call before firing the hedge.
+        
+        Uses hedging.delay_seconds if set, otherwise the primary model's
+        observed p95 latency (bounded below by min_delay), falling back to
+        default_delay before any latency has been observed.
+        
+        Args:
+            llm_client: The primary LLM client
+            
+        Returns:
+            Delay in seconds
+        """
+        if self.hedging_config.get('delay_seconds') is not None:
+            return float(self.hedging_config['delay_seconds'])
+        model_id, _ = self._get_llm_model_info(llm_client)
+        p95 = self.llm_router.get_model_stats(model_id).get('p95')
+        if p95 is None:
+            return float(self.hedging_config['default_delay'])
+        return max(float(self.hedging_config['min_delay']), p95)
+    
+    def _call_llm_hedged(self,
+                         llm_client: Union[BaseChatModel, BaseLLM],
+                         prompt: Union[str, List],
+                         backup_client: Optional[Union[BaseChatModel, BaseLLM]] = None,
+                         hedge_delay: Optional[float] = None) -> str:
+        """
+        Execute an LLM call, hedging with a backup model if the primary is slow.
+        
+        The primary call starts immediately. If it has not succeeded after the
+        hedge delay (or fails sooner), the same prompt is sent to the backup
+        client and whichever succeeds first is returned. The other call is
+        cancelled if it has not started yet, and otherwise left to finish in
+        the background; its outcome still feeds the router's statistics. Calls
+        run on the RuntimeContext's shared hedge executor. Without a backup client, or when hedging is disabled in
+        the configuration and no backup is given, this is a plain _call_llm.
+        
+        Args:
+            llm_client: The primary LangChain LLM client
+            prompt: Either a string prompt or a list of message dictionaries
+            backup_client: Client for the hedged call. Defaults to a client for
+                hedging.backup_model when hedging is enabled.
+            hedge_delay: Seconds to wait before hedging. Defaults to _get_hedge_delay().
+            
+        Returns:
+            The first successful LLM response as a string
+            
+        Raises:
+            RuntimeError: If both calls fail
+        """
+        if backup_client is None and self.hedging_config.get('enabled') and self.hedging_config.get('backup_model'):
+            backup_client = self._get_llm_client(self.hedging_config['backup_model'])
+        if backup_client is None or backup_client is llm_client:
+            return self._call_llm(llm_client, prompt)
+        
+        # Serve cache hits without starting any thread; the calls below skip the lookup
+        cache_key, cached = self._get_cached_response(llm_client, prompt)
+        if cached is not None:
+            return cached
+        
+        delay = hedge_delay if hedge_delay is not None else self._get_hedge_delay(llm_client)
+        
+        executor = self.runtime_context.get_hedge_executor()
+        
+        primary = executor.submit(self._invoke_llm, llm_client, prompt, cache_key)
+        done, _ = concurrent.futures.wait([primary], timeout=delay)
+        if primary in done and primary.exception() is None:
+            return primary.result()
+        
+        self.logger.info(f"Primary LLM call {'failed' if primary in done else f'exceeded {delay:.2f}s'}, sending hedged request")
+        backup_key = self._get_cache_key(backup_client, prompt)
+        pending = {primary, executor.submit(self._invoke_llm, backup_client, prompt, backup_key)}
+        last_error = None
+        while pending:
+            done, pending = concurrent.futures.wait(pending, return_when=concurrent.futures.FIRST_COMPLETED)
+            for future in done:
+                if future.exception() is None:
+                    # The losing call is dropped if still queued; a running one cannot be interrupted
+                    for loser in pending:
+                        loser.cancel()
+                    return future.result()
+                last_error = future.exception()
+        
+        raise RuntimeError(f"Hedged LLM call failed: {str(last_error)}")
+    
+    def _get_llm_provider_key(self, llm_client: Union[BaseChatModel, BaseLLM]) -> str:
+        """
+        Get the key used to group concurrent requests to the same provider.
+        
+        Args:
+            llm_client: The initialized LangChain LLM client
+            
+        Returns:
+            Provider key for the client
+        """
+        key = self.llm_client_pool.get_key(llm_client)
+        if key is not None:
+            return key[0]
+        return type(llm_client).__name__
+    
+    def _get_llm_semaphore(self, llm_client: Union[BaseChatModel, BaseLLM]) -> asyncio.Semaphore:
+        """
+        Get the per-provider semaphore bounding in-flight async LLM requests.
+        
+        Semaphores are created per running event loop, since asyncio primitives
+        cannot be shared across loops. The limit comes from the agent profile's
+        llm.max_concurrency setting.
+        
+        Args:
+            llm_client: The initialized LangChain LLM client
+            
+        Returns:
+            The semaphore for the client's provider on the current loop
+        """
+        loop = asyncio.get_running_loop()
+        semaphores = self._llm_semaphores.get(loop)
+        if semaphores is None:
+            semaphores = {}
+            self._llm_semaphores[loop] = semaphores
+        
+        provider_key = self._get_llm_provider_key(llm_client)
+        semaphore = semaphores.get(provider_key)
+        if semaphore is None:
+            limit = self.profile_config.get('llm', {}).get('max_concurrency', DEFAULT_LLM_MAX_CONCURRENCY)
+            semaphore = asyncio.Semaphore(max(1, int(limit)))
+            semaphores[provider_key] = semaphore
+        return semaphore
+    
+    async def _acall_llm(self, llm_client: Union[BaseChatModel, BaseLLM], prompt: Union[str, List]) -> str:
+        """
+        Asynchronously execute a call to the initialized LLM client.
+        
+        Uses the LangChain ainvoke interface and holds the provider's semaphore
+        for the duration of the request. Each request gets its own LangSmith run.
+        Cached responses are returned without acquiring the semaphore.
+        
+        Args:
+            llm_client: The initialized LangChain LLM client
+            prompt: Either a string prompt or a list of message dictionaries
+            
+        Returns:
+            The LLM response as a string
+            
+        Raises:
+            RuntimeError: If the LLM call fails or the provider's circuit is open
+        """
+        cache_key, cached = self._get_cached_response(llm_client, prompt)
+        if cached is not None:
+            return cached
+        
+        self._check_circuit(llm_client)
+        
+        async with self._get_llm_semaphore(llm_client):
+            run_id = None
+            started = None
+            try:
+                self.logger.debug(f"Calling LLM asynchronously with prompt: {prompt[:100]}...")
+                
+                await self._aacquire_rate_limit(llm_client, prompt)
+                
+                run_id = self._start_llm_run(prompt)
+                
+                started = time.perf_counter()
+                message = await llm_client.ainvoke(prompt)
+                self._record_llm_result(llm_client, time.perf_counter() - started, True, message)
+                started = None
+                response = message.content
+                
+                self._end_llm_run(run_id, outputs={"response": response})
+                
+                self._store_cached_response(cache_key, response)
+                
+                self.logger.debug(f"LLM response: {response[:100]}...")
+                return response
                 
+            except Exception as e:
+                error_msg = f"LLM call failed: {str(e)}"
+                self.logger.error(error_msg)
+                
+                if started is not None:
+                    self._record_llm_result(llm_client, time.perf_counter() - started, False)
+                
+                self._end_llm_run(run_id, error=error_msg)
+                
+                raise RuntimeError(error_msg)
+    
+    async def abatch_call_llm(self,
+                              llm_client: Union[BaseChatModel, BaseLLM],
+                              prompts: List[Union[str, List]],
+                              max_concurrency: Optional[int] = None,
+                              return_exceptions: bool = False) -> List[Union[str, Exception]]:
+        """
+        Asynchronously send several prompts to the LLM in parallel.
+        
+        At most max_concurrency prompts from this batch are in flight at once,
+        and the provider semaphore additionally bounds requests across batches.
+        
+        Args:
+            llm_client: The initialized LangChain LLM client
+            prompts: Prompts to send, each a string or a list of messages
+            max_concurrency: Maximum in-flight requests for this batch (default: unbounded)
+            return_exceptions: If True, failed prompts yield their RuntimeError in
+                the result list instead of failing the whole batch
+            
+        Returns:
+            Responses in the same order as prompts
+            
+        Raises:
+            RuntimeError: If any LLM call fails and return_exceptions is False
+        """
+        if not prompts:
+            return []
+        
+        batch_semaphore = asyncio.Semaphore(max(1, max_concurrency or len(prompts)))
+        
+        async def _call(prompt):
+            async with batch_semaphore:
+                return await self._acall_llm(llm_client, prompt)
+        
+        self.logger.info(f"Agent {self.agent_id} sending batch of {len(prompts)} prompts")
+        return await asyncio.gather(*(_call(prompt) for prompt in prompts), return_exceptions=return_exceptions)
+    
+    def batch_call_llm(self,
+                       llm_client: Union[BaseChatModel, BaseLLM],
+                       prompts: List[Union[str, List]],
+                       max_concurrency: Optional[int] = None,
+                       return_exceptions: bool = False) -> List[Union[str, Exception]]:
+        """
+        Send several prompts to the LLM in parallel from synchronous code.
+        
+        Runs abatch_call_llm on the RuntimeContext's background event loop, so
+        pooled clients and their async HTTP sessions stay bound to one live
+        loop across batches. From async code, await abatch_call_llm directly
+        instead.
+        
+        Args:
+            llm_client: The initialized LangChain LLM client
+            prompts: Prompts to send, each a string or a list of messages
+            max_concurrency: Maximum in-flight requests for this batch (default: unbounded)
+            return_exceptions: If True, failed prompts yield their RuntimeError in
+                the result list instead of failing the whole batch
+            
+        Returns:
+            Responses in the same order as prompts
+            
+        Raises:
+            RuntimeError: If called from a running event loop, or if any LLM call
+                fails and return_exceptions is False
+        """
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            return self.runtime_context.get_event_loop().run(
+                self.abatch_call_llm(llm_client, prompts, max_concurrency, return_exceptions)
+            )
+        raise RuntimeError("batch_call_llm cannot be used inside a running event loop; await abatch_call_llm instead")
+    
+    @staticmethod
+    def _chunk_text(chunk: Any) -> str:
+        """Extract the text of a streamed LLM chunk."""
+        content = getattr(chunk, "content", chunk)
+        return content if isinstance(content, str) else ""
+    
+    def _finish_stream(self,
+                       llm_client: Union[BaseChatModel, BaseLLM],
+                       run_id: Optional[str],
+                       cache_key: Optional[str],
+                       chunks: List[str],
+                       aggregate: Any,
+                       started: float,
+                       first_chunk_at: Optional[float]) -> None:
+        """
+        Record a completed stream: router statistics, one aggregated LangSmith run and the cache.
+        
+        Args:
+            llm_client: The client that produced the stream
+            run_id: The LangSmith run started for the stream
+            cache_key: Response cache key, or None
+            chunks: Text chunks in arrival order
+            aggregate: Sum of the raw message chunks, used for token usage
+            started: perf_counter() value when the request was sent
+            first_chunk_at: perf_counter() value when the first text chunk arrived
+        """
+        self._record_llm_result(llm_client, time.perf_counter() - started, True, aggregate)
+        response = "".join(chunks)
+        outputs = {"response": response}
+        if first_chunk_at is not None:
+            outputs["time_to_first_token"] = first_chunk_at - started
+        self._end_llm_run(run_id, outputs=outputs)
+        self._store_cached_response(cache_key, response)
+        self.logger.debug(f"Streamed LLM response: {response[:100]}...")
+    
+    def stream_llm(self, llm_client: Union[BaseChatModel, BaseLLM], prompt: Union[str, List]) -> Iterator[str]:
+        """
+        Stream an LLM response as text chunks as they are generated.
+        
+        Uses the LangChain stream interface. LangSmith receives one run with the
+        aggregated response once the stream completes. Cached responses are
+        yielded as a single chunk.
+        
+        Args:
+            llm_client: The initialized LangChain LLM client
+            prompt: Either a string prompt or a list of message dictionaries
+            
+        Yields:
+            Response text chunks
+            
+        Raises:
+            RuntimeError: If the LLM call fails or the provider's circuit is open
+        """
+        cache_key, cached = self._get_cached_response(llm_client, prompt)
+        if cached is not None:
+            yield cached
+            return
+        
+        self._check_circuit(llm_client)
+        
+        run_id = None
+        started = None
+        chunks: List[str] = []
+        try:
+            self.logger.debug(f"Streaming LLM with prompt: {prompt[:100]}...")
+            
+            self._acquire_rate_limit(llm_client, prompt)
+            run_id = self._start_llm_run(prompt)
+            
+            started = time.perf_counter()
+            first_chunk_at = None
+            aggregate = None
+            for chunk in llm_client.stream(prompt):
+                aggregate = chunk if aggregate is None else aggregate + chunk
+                text = self._chunk_text(chunk)
+                if text:
+                    if first_chunk_at is None:
+                        first_chunk_at = time.perf_counter()
+                    chunks.append(text)
+                    yield text
+            
+            self._finish_stream(llm_client, run_id, cache_key, chunks, aggregate, started, first_chunk_at)
+            
+        except GeneratorExit:
+            # The consumer stopped reading; close the run without caching a partial response
+            self._end_llm_run(run_id, error=f"Stream closed by consumer after {len(chunks)} chunks")
+            raise
+        
+        except Exception as e:
+            error_msg = f"LLM call failed: {str(e)}"
+            self.logger.error(error_msg)
+            
+            if started is not None:
+                self._record_llm_result(llm_client, time.perf_counter() - started, False)
+            
+            self._end_llm_run(run_id, error=error_msg)
+            
             raise RuntimeError(error_msg)
     
+    async def astream_llm(self, llm_client: Union[BaseChatModel, BaseLLM], prompt: Union[str, List]) -> AsyncIterator[str]:
+        """
+        Asynchronously stream an LLM response as text chunks as they are generated.
+        
+        Uses the LangChain astream interface and holds the provider's semaphore
+        while the stream is open. LangSmith receives one run with the aggregated
+        response once the stream completes.
+        
+        Args:
+            llm_client: The initialized LangChain LLM client
+            prompt: Either a string prompt or a list of message dictionaries
+            
+        Yields:
+            Response text chunks
+            
+        Raises:
+            RuntimeError: If the LLM call fails or the provider's circuit is open
+        """
+        cache_key, cached = self._get_cached_response(llm_client, prompt)
+        if cached is not None:
+            yield cached
+            return
+        
+        self._check_circuit(llm_client)
+        
+        async with self._get_llm_semaphore(llm_client):
+            run_id = None
+            started = None
+            chunks: List[str] = []
+            try:
+                self.logger.debug(f"Streaming LLM asynchronously with prompt: {prompt[:100]}...")
+                
+                await self._aacquire_rate_limit(llm_client, prompt)
+                run_id = self._start_llm_run(prompt)
+                
+                started = time.perf_counter()
+                first_chunk_at = None
+                aggregate = None
+                async for chunk in llm_client.astream(prompt):
+                    aggregate = chunk if aggregate is None else aggregate + chunk
+                    text = self._chunk_text(chunk)
+                    if text:
+                        if first_chunk_at is None:
+                            first_chunk_at = time.perf_counter()
+                        chunks.append(text)
+                        yield text
+                
+                self._finish_stream(llm_client, run_id, cache_key, chunks, aggregate, started, first_chunk_at)
+                
+            except GeneratorExit:
+                self._end_llm_run(run_id, error=f"Stream closed by consumer after {len(chunks)} chunks")
+                raise
+            
+            except Exception as e:
+                error_msg = f"LLM call failed: {str(e)}"
+                self.logger.error(error_msg)
+                
+                if started is not None:
+                    self._record_llm_result(llm_client, time.perf_counter() - started, False)
+                
+                self._end_llm_run(run_id, error=error_msg)
+                
+                raise RuntimeError(error_msg)
+    
     def _use_tool(self, tool_name: str, **kwargs) -> Any:
         """
         Execute a tool through the tool handler with agent-specific context.
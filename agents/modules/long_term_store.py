@@ -0,0 +1,695 @@
+"""
+Long-Term Store Module
+
+This module provides the storage backends for MemoryManager's long-term memory.
+InMemoryLongTermStore keeps items in RAM and persists them to append-only segment
+logs; SQLiteLongTermStore keeps them on disk in SQLite, translating search
+queries to SQL and caching only a bounded hot set of items in memory.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import sqlite3
+import threading
+from collections import OrderedDict
+from typing import Dict, List, Any, Iterable, Iterator, Optional, Sequence, Tuple
+
+from ultimate_ai_architect_framework.agents.modules.memory_index import MemoryIndex, matches_query, time_slice
+from ultimate_ai_architect_framework.agents.modules.memory_item import MemoryItem, json_default
+from ultimate_ai_architect_framework.agents.modules.memory_log import SegmentLog, load_segment_items
+
+logger = logging.getLogger("memory.long_term_store")
+
+
+class LongTermStore:
+    """
+    Base class for long-term memory backends.
+
+    Items are MemoryItem instances; stores return MemoryItems as well, loading
+    older dictionary records through MemoryItem.from_dict(). Within a segment,
+    items are returned in the order they were added.
+    """
+
+    def add(self, segment: str, item: Dict[str, Any]) -> None:
+        """
+        Store an item.
+
+        Args:
+            segment: Segment the item belongs to
+            item: Memory item
+        """
+        raise NotImplementedError("Subclasses must implement add()")
+
+    def add_many(self, segment: str, items: Iterable[Dict[str, Any]]) -> None:
+        """
+        Store several items of one segment.
+
+        Backends override this to write the batch at once.
+
+        Args:
+            segment: Segment the items belong to
+            items: Memory items, in order
+        """
+        for item in items:
+            self.add(segment, item)
+
+    def get(self, memory_id: str) -> Optional[Dict[str, Any]]:
+        """
+        Retrieve an item by id.
+
+        Args:
+            memory_id: ID of the memory item
+
+        Returns:
+            The item, or None if not stored
+        """
+        raise NotImplementedError("Subclasses must implement get()")
+
+    def search(self, segment: str, query: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """
+        Find the items of a segment matching an equality query.
+
+        Args:
+            segment: Segment to search
+            query: Dictionary of field-value pairs (dot notation allowed) to match
+
+        Returns:
+            Matching items in insertion order
+        """
+        raise NotImplementedError("Subclasses must implement search()")
+
+    def time_range(self, segment: str, start: Optional[float] = None, end: Optional[float] = None) -> List[MemoryItem]:
+        """
+        Find the items of a segment created in a time range.
+
+        Backends override this with an indexed lookup; the default scans.
+
+        Args:
+            segment: Segment to search
+            start: Inclusive lower bound in epoch seconds, or None
+            end: Exclusive upper bound in epoch seconds, or None
+
+        Returns:
+            Matching items, oldest first
+        """
+        items = [
+            item for item in self.iter_items(segment)
+            if (start is None or item['timestamp'] >= start) and (end is None or item['timestamp'] < end)
+        ]
+        return sorted(items, key=lambda item: item['timestamp'])
+
+    def recent(self, segment: str, k: int) -> List[MemoryItem]:
+        """
+        Get the k most recently created items of a segment.
+
+        Backends override this with an indexed lookup; the default scans.
+
+        Args:
+            segment: Segment to read
+            k: Number of items
+
+        Returns:
+            Up to k items, oldest first
+        """
+        if k <= 0:
+            return []
+        return sorted(self.iter_items(segment), key=lambda item: item['timestamp'])[-k:]
+
+    def oldest(self, segment: str, k: int) -> List[MemoryItem]:
+        """
+        Get the k earliest created items of a segment.
+
+        Backends override this with an indexed lookup; the default scans.
+
+        Args:
+            segment: Segment to read
+            k: Number of items
+
+        Returns:
+            Up to k items, oldest first
+        """
+        if k <= 0:
+            return []
+        return sorted(self.iter_items(segment), key=lambda item: item['timestamp'])[:k]
+
+    def replace(self, segment: str, replacements: Sequence[Tuple[List[str], MemoryItem]]) -> None:
+        """
+        Replace runs of items with single items, such as summaries of them.
+
+        Backends override this to apply all replacements at once.
+
+        Args:
+            segment: Segment the items belong to
+            replacements: (ids of the items to remove, item to store instead) pairs
+        """
+        for memory_ids, item in replacements:
+            for memory_id in memory_ids:
+                self.delete(memory_id)
+            self.add(segment, item)
+
+    def delete(self, memory_id: str) -> bool:
+        """
+        Remove an item.
+
+        Args:
+            memory_id: ID of the memory item
+
+        Returns:
+            True if an item was removed
+        """
+        raise NotImplementedError("Subclasses must implement delete()")
+
+    def iter_items(self, segment: str) -> Iterator[Dict[str, Any]]:
+        """
+        Iterate over the items of a segment in insertion order.
+
+        Args:
+            segment: Segment to iterate
+        """
+        raise NotImplementedError("Subclasses must implement iter_items()")
+
+    def count(self, segment: Optional[str] = None) -> int:
+        """
+        Count stored items.
+
+        Args:
+            segment: Segment to count, or None for all segments
+        """
+        raise NotImplementedError("Subclasses must implement count()")
+
+    def sync(self) -> None:
+        """Force stored items to disk."""
+        pass
+
+    def close(self) -> None:
+        """Release any resources held by the store."""
+        pass
+
+
+class InMemoryLongTermStore(LongTermStore):
+    """
+    Long-term store holding every item in memory, indexed by MemoryIndex.
+
+    With a persistence path, each segment is persisted to an append-only
+    SegmentLog that is replayed on startup and compacted when too many of its
+    records are dead. A legacy {segment}.json file is migrated to the log format
+    on first load.
+    """
+
+    def __init__(self,
+                 segments: Iterable[str],
+                 indexed_fields: Optional[Iterable[str]] = None,
+                 persistence_path: Optional[str] = None,
+                 fsync_policy: str = "batch",
+                 fsync_batch_size: int = 100,
+                 fsync_interval: float = 1.0,
+                 compaction_min_dead_records: int = 1000,
+                 compaction_dead_ratio: float = 0.5):
+        """
+        Initialize the store, loading persisted items if a persistence path is given.
+
+        Args:
+            segments: Segment names
+            indexed_fields: Fields to build secondary indexes for
+            persistence_path: Directory holding the segment logs, or None to keep
+                items in memory only
+            fsync_policy: 'always', 'batch' or 'interval' (see SegmentLog)
+            fsync_batch_size: Records between fsyncs for the 'batch' policy
+            fsync_interval: Seconds between fsyncs for the 'interval' policy
+            compaction_min_dead_records: Dead records a log must hold before it is compacted
+            compaction_dead_ratio: Fraction of a log's records that must be dead before it is compacted
+        """
+        self.segments = list(segments)
+        self.items: Dict[str, List[MemoryItem]] = {segment: [] for segment in self.segments}
+        self.index = MemoryIndex(indexed_fields)
+        # Whether each segment's items are in timestamp order, so time
+        # queries can bisect; items are normally appended oldest first
+        self._chronological: Dict[str, bool] = {segment: True for segment in self.segments}
+        self.persistence_path = persistence_path
+        self.compaction_min_dead_records = compaction_min_dead_records
+        self.compaction_dead_ratio = compaction_dead_ratio
+
+        self._logs: Dict[str, SegmentLog] = {}
+        if persistence_path is not None:
+            self._logs = {
+                segment: SegmentLog(
+                    os.path.join(persistence_path, f"{segment}.jsonl"),
+                    fsync_policy=fsync_policy,
+                    batch_size=fsync_batch_size,
+                    fsync_interval=fsync_interval
+                )
+                for segment in self.segments
+            }
+            self._load()
+
+    def _load(self) -> None:
+        """Replay the segment logs, migrating legacy JSON files first."""
+        os.makedirs(self.persistence_path, exist_ok=True)
+        for segment in self.segments:
+            log = self._logs[segment]
+            legacy_path = os.path.join(self.persistence_path, f"{segment}.json")
+            if os.path.exists(legacy_path) and not os.path.exists(log.path):
+                self._migrate_legacy_segment(segment, legacy_path)
+
+            items = [MemoryItem.from_dict(item) for item in load_segment_items(log)]
+            if any(later.timestamp < earlier.timestamp for earlier, later in zip(items, items[1:])):
+                # Replacements (see replace()) append their put records after
+                # newer items; restore timestamp order
+                items.sort(key=lambda item: item.timestamp)
+            self.items[segment] = items
+            for item in items:
+                self.index.add(segment, item)
+            logger.debug(f"Loaded {len(items)} items from {segment} persistent memory")
+            self._maybe_compact(segment)
+
+    def _migrate_legacy_segment(self, segment: str, legacy_path: str) -> None:
+        """
+        Convert a legacy {segment}.json file into the segment log.
+
+        The legacy file is kept as {segment}.json.bak.
+        """
+        with open(legacy_path, "r") as f:
+            items = json.load(f)
+        self._logs[segment].compact(items)
+        os.replace(legacy_path, f"{legacy_path}.bak")
+        logger.info(f"Migrated {len(items)} items from {legacy_path} to {self._logs[segment].path}")
+
+    def _maybe_compact(self, segment: str) -> None:
+        """Compact a segment log if dead records exceed the configured thresholds."""
+        log = self._logs.get(segment)
+        if log is None:
+            return
+        dead = log.records - len(self.items[segment])
+        if dead >= self.compaction_min_dead_records and dead >= self.compaction_dead_ratio * log.records:
+            logger.debug(f"Compacting {segment} log: {dead} of {log.records} records are dead")
+            log.compact(self.items[segment])
+
+    def _check_order(self, segment: str, items: List[MemoryItem]) -> None:
+        """Track whether appending items keeps the segment in timestamp order."""
+        if not self._chronological[segment]:
+            return
+        previous = self.items[segment][-1].timestamp if self.items[segment] else None
+        for item in items:
+            if previous is not None and item.timestamp < previous:
+                self._chronological[segment] = False
+                return
+            previous = item.timestamp
+
+    def add(self, segment: str, item: Dict[str, Any]) -> None:
+        self._check_order(segment, [item])
+        self.items[segment].append(item)
+        self.index.add(segment, item)
+        if segment in self._logs:
+            self._logs[segment].append(item)
+
+    def add_many(self, segment: str, items: Iterable[Dict[str, Any]]) -> None:
+        items = list(items)
+        self._check_order(segment, items)
+        # Log first, so a failed write leaves the store unchanged for a retry
+        if segment in self._logs:
+            self._logs[segment].append_many(items)
+        self.items[segment].extend(items)
+        for item in items:
+            self.index.add(segment, item)
+
+    def get(self, memory_id: str) -> Optional[Dict[str, Any]]:
+        return self.index.get(memory_id)
+
+    def search(self, segment: str, query: Dict[str, Any]) -> List[Dict[str, Any]]:
+        candidates = self.index.lookup(segment, query)
+        if candidates is None:
+            candidates = self.items[segment]
+        return [item for item in candidates if matches_query(item, query)]
+
+    def time_range(self, segment: str, start: Optional[float] = None, end: Optional[float] = None) -> List[MemoryItem]:
+        if not self._chronological[segment]:
+            return super().time_range(segment, start, end)
+        return time_slice(self.items[segment], start, end)
+
+    def recent(self, segment: str, k: int) -> List[MemoryItem]:
+        if not self._chronological[segment]:
+            return super().recent(segment, k)
+        return self.items[segment][-k:] if k > 0 else []
+
+    def oldest(self, segment: str, k: int) -> List[MemoryItem]:
+        if not self._chronological[segment]:
+            return super().oldest(segment, k)
+        return self.items[segment][:k] if k > 0 else []
+
+    def replace(self, segment: str, replacements: Sequence[Tuple[List[str], MemoryItem]]) -> None:
+        # Each new item takes the place of the first stored item it replaces,
+        # all in one pass over the segment
+        replacement_of = {}
+        for position, (memory_ids, _) in enumerate(replacements):
+            for memory_id in memory_ids:
+                replacement_of[memory_id] = position
+        removed = []
+        placed = set()
+        items = []
+        for item in self.items[segment]:
+            position = replacement_of.get(item.id)
+            if position is None:
+                items.append(item)
+                continue
+            removed.append(item.id)
+            if position not in placed:
+                placed.add(position)
+                items.append(replacements[position][1])
+        unplaced = [item for position, (_, item) in enumerate(replacements) if position not in placed]
+        self._check_order(segment, unplaced)
+        items.extend(unplaced)
+
+        for memory_id in removed:
+            self.index.remove(memory_id)
+        for _, item in replacements:
+            self.index.add(segment, item)
+        self.items[segment] = items
+        if segment in self._logs:
+            self._logs[segment].append_replace(removed, [item for _, item in replacements])
+            self._maybe_compact(segment)
+
+    def delete(self, memory_id: str) -> bool:
+        segment = self.index.get_segment(memory_id)
+        if segment is None:
+            return False
+        self.index.remove(memory_id)
+        self.items[segment] = [item for item in self.items[segment] if item['id'] != memory_id]
+        if segment in self._logs:
+            self._logs[segment].append_delete(memory_id)
+            self._maybe_compact(segment)
+        return True
+
+    def iter_items(self, segment: str) -> Iterator[Dict[str, Any]]:
+        return iter(self.items[segment])
+
+    def count(self, segment: Optional[str] = None) -> int:
+        if segment is not None:
+            return len(self.items[segment])
+        return sum(len(items) for items in self.items.values())
+
+    def compact(self) -> None:
+        """Rewrite every segment log so it holds exactly the current items."""
+        for segment, log in self._logs.items():
+            log.compact(self.items[segment])
+
+    def sync(self) -> None:
+        for log in self._logs.values():
+            log.sync()
+
+    def close(self) -> None:
+        for log in self._logs.values():
+            log.close()
+
+
+def _json_path(key: str) -> str:
+    """Convert a dot-notation field name into a quoted SQLite JSON path."""
+    return "$." + ".".join('"' + part.replace('"', '\\"') + '"' for part in key.split("."))
+
+
+class SQLiteLongTermStore(LongTermStore):
+    """
+    Long-term store backed by SQLite, keeping only a bounded hot set in memory.
+
+    Each item is stored as a JSON document alongside its id, segment and
+    timestamp columns, which are indexed. Every configured indexed field gets
+    an expression index on (segment, json_extract(item, path)). search()
+    translates equality conditions to SQL and re-checks the results in Python,
+    so query semantics match InMemoryLongTermStore. The most recently added or
+    retrieved items are cached in an LRU hot set.
+    """
+
+    def __init__(self,
+                 path: str,
+                 indexed_fields: Optional[Iterable[str]] = None,
+                 hot_set_size: int = 1000):
+        """
+        Initialize the store, creating the database if needed.
+
+        Args:
+            path: Path to the SQLite database file
+            indexed_fields: Fields (dot notation allowed) to build expression indexes for
+            hot_set_size: Maximum number of items cached in memory
+        """
+        self.path = path
+        self.indexed_fields = list(indexed_fields or [])
+        self.hot_set_size = max(0, int(hot_set_size))
+        self._hot: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False, timeout=30)
+        with self._conn:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("PRAGMA synchronous=NORMAL")
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS memory_items ("
+                " seq INTEGER PRIMARY KEY AUTOINCREMENT,"
+                " id TEXT NOT NULL,"
+                " segment TEXT NOT NULL,"
+                " timestamp REAL,"
+                " item TEXT NOT NULL)"
+            )
+            self._conn.execute("CREATE INDEX IF NOT EXISTS idx_memory_items_id ON memory_items (id)")
+            self._conn.execute(
+                "CREATE INDEX IF NOT EXISTS idx_memory_items_segment_timestamp ON memory_items (segment, timestamp)"
+            )
+            for field in self.indexed_fields:
+                name = hashlib.sha1(field.encode("utf-8")).hexdigest()[:12]
+                self._conn.execute(
+                    f"CREATE INDEX IF NOT EXISTS idx_memory_items_field_{name} "
+                    f"ON memory_items (segment, json_extract(item, '{self._quote(_json_path(field))}'))"
+                )
+
+    @staticmethod
+    def _quote(literal: str) -> str:
+        """Escape a string for use inside a single-quoted SQL literal."""
+        return literal.replace("'", "''")
+
+    def _remember(self, item: Dict[str, Any]) -> None:
+        """Put an item in the hot set, evicting the least recently used (caller holds the lock)."""
+        if not self.hot_set_size:
+            return
+        self._hot[item['id']] = item
+        self._hot.move_to_end(item['id'])
+        while len(self._hot) > self.hot_set_size:
+            self._hot.popitem(last=False)
+
+    def add(self, segment: str, item: Dict[str, Any]) -> None:
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT INTO memory_items (id, segment, timestamp, item) VALUES (?, ?, ?, ?)",
+                (item['id'], segment, item['timestamp'], json.dumps(item, default=json_default))
+            )
+            self._remember(item)
+
+    def add_many(self, segment: str, items: Iterable[Dict[str, Any]]) -> None:
+        # One transaction for the whole batch
+        with self._lock, self._conn:
+            self._conn.executemany(
+                "INSERT INTO memory_items (id, segment, timestamp, item) VALUES (?, ?, ?, ?)",
+                ((item['id'], segment, item['timestamp'], json.dumps(item, default=json_default)) for item in items)
+            )
+
+    def get(self, memory_id: str) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            item = self._hot.get(memory_id)
+            if item is not None:
+                self._hot.move_to_end(memory_id)
+                return item
+            row = self._conn.execute(
+                "SELECT item FROM memory_items WHERE id = ? ORDER BY seq LIMIT 1", (memory_id,)
+            ).fetchone()
+            if row is None:
+                return None
+            item = MemoryItem.from_dict(json.loads(row[0]))
+            self._remember(item)
+            return item
+
+    def _translate_query(self, segment: str, query: Dict[str, Any]) -> Tuple[str, List[Any]]:
+        """
+        Translate an equality query into a WHERE clause and parameters.
+
+        Conditions on values SQLite cannot compare exactly (dictionaries and
+        lists) are left to the Python re-check.
+        """
+        clauses = ["segment = ?"]
+        params: List[Any] = [segment]
+        for key, value in query.items():
+            if key == "id" and isinstance(value, str):
+                clauses.append("id = ?")
+                params.append(value)
+            elif key == "timestamp" and isinstance(value, (int, float)) and not isinstance(value, bool):
+                clauses.append("timestamp = ?")
+                params.append(value)
+            elif value is None:
+                clauses.append(f"json_type(item, '{self._quote(_json_path(key))}') = 'null'")
+            elif isinstance(value, (str, float)) or (isinstance(value, int) and -2 ** 63 <= value < 2 ** 63):
+                clauses.append(f"json_extract(item, '{self._quote(_json_path(key))}') = ?")
+                params.append(value)
+        return " AND ".join(clauses), params
+
+    def search(self, segment: str, query: Dict[str, Any]) -> List[Dict[str, Any]]:
+        where, params = self._translate_query(segment, query)
+        with self._lock:
+            rows = self._conn.execute(
+                f"SELECT item FROM memory_items WHERE {where} ORDER BY seq", params
+            ).fetchall()
+        items = (MemoryItem.from_dict(json.loads(row[0])) for row in rows)
+        return [item for item in items if matches_query(item, query)]
+
+    def time_range(self, segment: str, start: Optional[float] = None, end: Optional[float] = None) -> List[MemoryItem]:
+        # Answered from the (segment, timestamp) index
+        clauses = ["segment = ?"]
+        params: List[Any] = [segment]
+        if start is not None:
+            clauses.append("timestamp >= ?")
+            params.append(start)
+        if end is not None:
+            clauses.append("timestamp < ?")
+            params.append(end)
+        with self._lock:
+            rows = self._conn.execute(
+                f"SELECT item FROM memory_items WHERE {' AND '.join(clauses)} ORDER BY timestamp, seq", params
+            ).fetchall()
+        return [MemoryItem.from_dict(json.loads(row[0])) for row in rows]
+
+    def recent(self, segment: str, k: int) -> List[MemoryItem]:
+        if k <= 0:
+            return []
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT item FROM memory_items WHERE segment = ? ORDER BY timestamp DESC, seq DESC LIMIT ?",
+                (segment, k)
+            ).fetchall()
+        return [MemoryItem.from_dict(json.loads(row[0])) for row in reversed(rows)]
+
+    def oldest(self, segment: str, k: int) -> List[MemoryItem]:
+        if k <= 0:
+            return []
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT item FROM memory_items WHERE segment = ? ORDER BY timestamp, seq LIMIT ?",
+                (segment, k)
+            ).fetchall()
+        return [MemoryItem.from_dict(json.loads(row[0])) for row in rows]
+
+    def replace(self, segment: str, replacements: Sequence[Tuple[List[str], MemoryItem]]) -> None:
+        # One transaction, so readers see either the originals or their replacements
+        with self._lock, self._conn:
+            for memory_ids, item in replacements:
+                for memory_id in memory_ids:
+                    self._hot.pop(memory_id, None)
+                self._conn.executemany("DELETE FROM memory_items WHERE id = ?", ((memory_id,) for memory_id in memory_ids))
+                self._conn.execute(
+                    "INSERT INTO memory_items (id, segment, timestamp, item) VALUES (?, ?, ?, ?)",
+                    (item['id'], segment, item['timestamp'], json.dumps(item, default=json_default))
+                )
+
+    def delete(self, memory_id: str) -> bool:
+        with self._lock, self._conn:
+            self._hot.pop(memory_id, None)
+            cursor = self._conn.execute("DELETE FROM memory_items WHERE id = ?", (memory_id,))
+            return cursor.rowcount > 0
+
+    def iter_items(self, segment: str) -> Iterator[Dict[str, Any]]:
+        with self._lock:
+            cursor = self._conn.execute(
+                "SELECT item FROM memory_items WHERE segment = ? ORDER BY seq", (segment,)
+            )
+            rows = cursor.fetchall()
+        for row in rows:
+            yield MemoryItem.from_dict(json.loads(row[0]))
+
+    def count(self, segment: Optional[str] = None) -> int:
+        with self._lock:
+            if segment is None:
+                (count,) = self._conn.execute("SELECT COUNT(*) FROM memory_items").fetchone()
+            else:
+                (count,) = self._conn.execute(
+                    "SELECT COUNT(*) FROM memory_items WHERE segment = ?", (segment,)
+                ).fetchone()
+            return count
+
+    def import_segment_logs(self, persistence_path: str, segments: Iterable[str]) -> int:
+        """
+        Copy items from segment logs (or legacy JSON files) into an empty store.
+
+        Args:
+            persistence_path: Directory holding {segment}.jsonl or {segment}.json files
+            segments: Segment names
+
+        Returns:
+            Number of items imported
+        """
+        imported = 0
+        for segment in segments:
+            log_path = os.path.join(persistence_path, f"{segment}.jsonl")
+            legacy_path = os.path.join(persistence_path, f"{segment}.json")
+            if os.path.exists(log_path):
+                items = load_segment_items(SegmentLog(log_path))
+            elif os.path.exists(legacy_path):
+                with open(legacy_path, "r") as f:
+                    items = json.load(f)
+            else:
+                continue
+            items = [MemoryItem.from_dict(item) for item in items]
+            self.add_many(segment, items)
+            imported += len(items)
+        if imported:
+            logger.info(f"Imported {imported} long-term items into {self.path}")
+        return imported
+
+    def sync(self) -> None:
+        with self._lock:
+            self._conn.execute("PRAGMA wal_checkpoint(PASSIVE)")
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+
+def create_long_term_store(memory_config: Dict[str, Any]) -> LongTermStore:
+    """
+    Build the long-term store selected by a MemoryManager configuration.
+
+    Args:
+        memory_config: MemoryManager configuration. 'long_term_backend' selects
+            'memory' (default) or 'sqlite'; persistence settings apply when
+            'persistence_enabled' is true.
+
+    Returns:
+        A LongTermStore instance
+    """
+    backend = memory_config.get('long_term_backend', 'memory')
+    persistence_enabled = memory_config.get('persistence_enabled', True)
+    persistence_path = memory_config.get('persistence_path')
+    segments = memory_config['segments']
+    indexed_fields = memory_config.get('indexed_fields', [])
+
+    if backend == 'sqlite' and persistence_enabled:
+        sqlite_path = memory_config.get('sqlite_path') or os.path.join(persistence_path, "long_term.sqlite")
+        is_new = not os.path.exists(sqlite_path)
+        store = SQLiteLongTermStore(
+            sqlite_path,
+            indexed_fields=indexed_fields,
+            hot_set_size=memory_config.get('hot_set_size', 1000)
+        )
+        if is_new:
+            store.import_segment_logs(persistence_path, segments)
+        return store
+
+    if backend not in ('memory', 'sqlite'):
+        logger.error(f"Unknown long-term memory backend '{backend}'; using in-memory storage")
+
+    return InMemoryLongTermStore(
+        segments,
+        indexed_fields=indexed_fields,
+        persistence_path=persistence_path if persistence_enabled else None,
+        fsync_policy=memory_config.get('fsync_policy', 'batch'),
+        fsync_batch_size=memory_config.get('fsync_batch_size', 100),
+        fsync_interval=memory_config.get('fsync_interval', 1.0),
+        compaction_min_dead_records=memory_config.get('compaction_min_dead_records', 1000),
+        compaction_dead_ratio=memory_config.get('compaction_dead_ratio', 0.5)
+    )
@@ -0,0 +1,300 @@
+"""
+Memory Compaction Module
+
+This module provides the pieces MemoryManager uses to fold old long-term
+items into summaries:
+- Summarizers, which turn a run of items into one summary text. The
+  ExtractiveSummarizer is local and deterministic; any function from items to
+  text can be plugged in instead (for example one that calls an LLM).
+- ColdStorage, an append-only archive holding the original items of each
+  summary, so they can still be retrieved after leaving long-term memory.
+- CompactionWorker, a daemon thread that runs compaction passes periodically.
+"""
+
+import json
+import logging
+import os
+import re
+import threading
+from datetime import datetime
+from typing import Dict, List, Any, Callable, Optional, Sequence, Tuple, Union
+
+from ultimate_ai_architect_framework.agents.modules.memory_item import MemoryItem, item_text, json_default
+
+logger = logging.getLogger("memory.compaction")
+
+_SENTENCE_END = re.compile(r"(?<=[.!?])\s+")
+
+
+def is_summary(item: Dict[str, Any]) -> bool:
+    """Whether a memory item is a summary produced by compaction."""
+    metadata = item.get('metadata')
+    return isinstance(metadata, dict) and metadata.get('summary') is True
+
+
+class Summarizer:
+    """Interface for summarizers."""
+
+    name = "base"
+
+    def summarize(self, items: Sequence[MemoryItem]) -> str:
+        """
+        Summarize a run of memory items.
+
+        Args:
+            items: Items to summarize, oldest first
+
+        Returns:
+            Summary text
+        """
+        raise NotImplementedError
+
+
+class ExtractiveSummarizer(Summarizer):
+    """
+    Deterministic summarizer that keeps the first sentence of every item.
+
+    Conversation turns stored as {'role': ..., 'content': ...} are rendered as
+    "role: content". Each line is shortened so the summary stays within
+    max_chars.
+    """
+
+    name = "extractive"
+
+    def __init__(self, max_chars: int = 2000, max_chars_per_item: int = 200):
+        """
+        Initialize a new ExtractiveSummarizer instance.
+
+        Args:
+            max_chars: Approximate maximum length of a summary
+            max_chars_per_item: Maximum length of the line kept for one item
+        """
+        self.max_chars = max_chars
+        self.max_chars_per_item = max_chars_per_item
+
+    def _line(self, item: MemoryItem, limit: int) -> str:
+        data = item.get('data')
+        if isinstance(data, dict) and 'content' in data:
+            content = data['content'] if isinstance(data['content'], str) else json.dumps(data['content'], default=str)
+            text = f"{data['role']}: {content}" if data.get('role') else content
+        else:
+            text = item_text(item)
+        text = " ".join(text.split())
+        text = _SENTENCE_END.split(text, 1)[0]
+        if len(text) > limit:
+            text = text[:max(1, limit - 3)].rstrip() + "..."
+        return text
+
+    def summarize(self, items: Sequence[MemoryItem]) -> str:
+        if not items:
+            return ""
+        start = datetime.fromtimestamp(items[0].timestamp).isoformat(timespec="seconds")
+        end = datetime.fromtimestamp(items[-1].timestamp).isoformat(timespec="seconds")
+        limit = max(16, min(self.max_chars_per_item, self.max_chars // len(items)))
+        lines = [f"Summary of {len(items)} items from {start} to {end}:"]
+        lines.extend(f"- {self._line(item, limit)}" for item in items)
+        return "\n".join(lines)
+
+
+class CallableSummarizer(Summarizer):
+    """Adapts a function from a list of items to summary text."""
+
+    name = "callable"
+
+    def __init__(self, func: Callable[[Sequence[MemoryItem]], str]):
+        self.func = func
+
+    def summarize(self, items: Sequence[MemoryItem]) -> str:
+        return self.func(items)
+
+
+def create_summarizer(config: Union[None, Dict[str, Any], Summarizer, Callable] = None) -> Summarizer:
+    """
+    Build a summarizer from configuration.
+
+    Args:
+        config: A Summarizer, a function from a list of items to summary text,
+            or a settings dictionary. 'provider' is 'extractive' (the default),
+            which takes 'max_chars' and 'max_chars_per_item'.
+
+    Returns:
+        A Summarizer instance
+    """
+    if isinstance(config, Summarizer):
+        return config
+    if callable(config):
+        return CallableSummarizer(config)
+
+    config = config or {}
+    provider = config.get('provider', 'extractive')
+    if provider != 'extractive':
+        raise ValueError(f"Unknown summarizer provider: {provider}")
+    return ExtractiveSummarizer(
+        max_chars=config.get('max_chars', 2000),
+        max_chars_per_item=config.get('max_chars_per_item', 200)
+    )
+
+
+class ColdStorage:
+    """
+    Append-only archive of the items folded into summaries.
+
+    Each archived group is one JSON line, {"summary_id": ..., "items": [...]},
+    and is addressed by the byte offset it was written at, which the summary
+    keeps in its metadata. Reading a group is one seek, so no index of the
+    archive is held in memory. Without a path, groups are kept in memory.
+    """
+
+    def __init__(self, path: Optional[str] = None):
+        """
+        Initialize a new ColdStorage instance.
+
+        Args:
+            path: Path of the .jsonl archive, or None to keep groups in memory
+        """
+        self.path = path
+        self._groups: List[str] = []
+        self._lock = threading.Lock()
+        if path is not None and os.path.exists(path):
+            self._repair_tail()
+
+    def _repair_tail(self) -> None:
+        """Drop a torn final line left by a crash, so new groups start on a fresh line."""
+        with open(self.path, "rb+") as f:
+            data_end = f.seek(0, os.SEEK_END)
+            if data_end == 0:
+                return
+            f.seek(data_end - 1)
+            if f.read(1) == b"\n":
+                return
+            # Scan backwards for the last newline
+            position = data_end
+            while position > 0:
+                start = max(0, position - 4096)
+                f.seek(start)
+                newline = f.read(position - start).rfind(b"\n")
+                if newline >= 0:
+                    f.truncate(start + newline + 1)
+                    break
+                position = start
+            else:
+                f.truncate(0)
+        logger.warning(f"Discarded torn record at the end of {self.path}")
+
+    def archive(self, groups: Sequence[Tuple[str, Sequence[MemoryItem]]]) -> List[int]:
+        """
+        Archive the original items of summaries.
+
+        Groups are written with a single fsync, before the summaries replace
+        the items in long-term storage.
+
+        Args:
+            groups: (summary id, items) pairs
+
+        Returns:
+            The key of each group, for load()
+        """
+        lines = [
+            json.dumps({"summary_id": summary_id, "items": list(items)}, default=json_default) + "\n"
+            for summary_id, items in groups
+        ]
+        with self._lock:
+            if self.path is None:
+                first = len(self._groups)
+                self._groups.extend(lines)
+                return list(range(first, first + len(lines)))
+
+            os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+            keys = []
+            with open(self.path, "ab") as f:
+                offset = f.seek(0, os.SEEK_END)
+                for line in lines:
+                    encoded = line.encode("utf-8")
+                    keys.append(offset)
+                    f.write(encoded)
+                    offset += len(encoded)
+                f.flush()
+                os.fsync(f.fileno())
+            return keys
+
+    def load(self, key: int, summary_id: Optional[str] = None) -> List[MemoryItem]:
+        """
+        Read an archived group.
+
+        Args:
+            key: Key returned by archive()
+            summary_id: If given, the id the group must belong to
+
+        Returns:
+            The original items, oldest first
+
+        Raises:
+            KeyError: If there is no group at key, or it belongs to another summary
+        """
+        with self._lock:
+            if self.path is None:
+                if not 0 <= key < len(self._groups):
+                    raise KeyError(key)
+                line = self._groups[key]
+            else:
+                with open(self.path, "rb") as f:
+                    f.seek(key)
+                    line = f.readline().decode("utf-8")
+        try:
+            group = json.loads(line)
+        except ValueError:
+            raise KeyError(key)
+        if summary_id is not None and group.get("summary_id") != summary_id:
+            raise KeyError(key)
+        return [MemoryItem.from_dict(item) for item in group["items"]]
+
+
+class CompactionWorker:
+    """Daemon thread that calls a compaction function every interval seconds."""
+
+    def __init__(self, run: Callable[[], Any], interval: float = 60.0, name: str = "memory-compaction"):
+        """
+        Initialize a new CompactionWorker instance.
+
+        Args:
+            run: Function performing one compaction pass
+            interval: Seconds between passes
+            name: Thread name
+        """
+        self.run = run
+        self.interval = interval
+        self.name = name
+        self._wake = threading.Event()
+        self._stopping = False
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self) -> None:
+        """Start the thread if it is not running."""
+        if self._thread is not None and self._thread.is_alive():
+            return
+        self._stopping = False
+        self._thread = threading.Thread(target=self._loop, name=self.name, daemon=True)
+        self._thread.start()
+
+    def wake(self) -> None:
+        """Run a pass now instead of waiting for the interval."""
+        self._wake.set()
+
+    def stop(self, timeout: Optional[float] = None) -> None:
+        """Stop the thread, waiting for a running pass to finish."""
+        self._stopping = True
+        self._wake.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+
+    def _loop(self) -> None:
+        while True:
+            self._wake.wait(self.interval)
+            self._wake.clear()
+            if self._stopping:
+                return
+            try:
+                self.run()
+            except Exception as e:
+                logger.error(f"Memory compaction pass failed: {e}")
@@ -0,0 +1,242 @@
+"""
+Memory Index Module
+
+This module provides the MemoryIndex class used by MemoryManager to find memory
+items without scanning every segment: a hash index from item id to item, plus
+optional secondary indexes on selected fields for answering equality queries.
+"""
+
+from typing import Dict, List, Any, Iterable, Optional, Sequence
+
+from ultimate_ai_architect_framework.agents.modules.memory_item import MemoryItem
+
+# Returned by get_field() when an item does not have the requested field
+MISSING = object()
+
+
+def get_field(item: Dict[str, Any], key: str) -> Any:
+    """
+    Get a possibly nested field of a memory item.
+
+    Args:
+        item: Memory item (MemoryItem or dictionary)
+        key: Field name, with dot notation for nested fields (e.g. 'metadata.type')
+
+    Returns:
+        The field value, or MISSING if the item does not have the field
+    """
+    current = item
+    for part in key.split('.'):
+        if not isinstance(current, (dict, MemoryItem)) or part not in current:
+            return MISSING
+        current = current[part]
+    return current
+
+
+def matches_query(item: Dict[str, Any], query: Dict[str, Any]) -> bool:
+    """
+    Check if a memory item matches an equality query.
+
+    Args:
+        item: Memory item to check
+        query: Dictionary of field-value pairs (dot notation allowed) to match
+
+    Returns:
+        True if every field in the query is present with an equal value
+    """
+    for key, value in query.items():
+        current = get_field(item, key)
+        if current is MISSING or current != value:
+            return False
+    return True
+
+
+def bisect_timestamp(items: Sequence[Any], timestamp: float, right: bool = False) -> int:
+    """
+    Binary-search items sorted by timestamp.
+
+    Args:
+        items: Memory items in non-decreasing timestamp order (list or deque)
+        timestamp: Epoch seconds to locate
+        right: Return the position after items with an equal timestamp
+            instead of before them
+
+    Returns:
+        Insertion position of timestamp in items
+    """
+    low, high = 0, len(items)
+    while low < high:
+        middle = (low + high) // 2
+        value = items[middle].timestamp
+        if value < timestamp or (right and value == timestamp):
+            low = middle + 1
+        else:
+            high = middle
+    return low
+
+
+def time_slice(items: Sequence[Any], start: Optional[float], end: Optional[float]) -> List[Any]:
+    """
+    Get the items with start <= timestamp < end from a timestamp-sorted sequence.
+
+    Args:
+        items: Memory items in non-decreasing timestamp order
+        start: Inclusive lower bound in epoch seconds, or None
+        end: Exclusive upper bound in epoch seconds, or None
+
+    Returns:
+        The matching items, oldest first
+    """
+    low = bisect_timestamp(items, start) if start is not None else 0
+    high = bisect_timestamp(items, end) if end is not None else len(items)
+    if isinstance(items, list):
+        return items[low:high]
+    return [items[position] for position in range(low, high)]
+
+
+def _is_hashable(value: Any) -> bool:
+    try:
+        hash(value)
+    except TypeError:
+        return False
+    return True
+
+
+class MemoryIndex:
+    """
+    Id and secondary-field indexes over memory items.
+
+    Every item is reachable by id in O(1). For each indexed field, items are
+    bucketed per segment by field value, so an equality query on that field
+    only has to look at the matching bucket. Buckets preserve insertion order.
+    Items whose value for a field is missing or unhashable are not entered in
+    that field's index; such items can never equal a hashable query value.
+    """
+
+    def __init__(self, indexed_fields: Optional[Iterable[str]] = None):
+        """
+        Initialize an empty MemoryIndex.
+
+        Args:
+            indexed_fields: Field names (dot notation allowed) to build
+                secondary indexes for, e.g. ['metadata.type', 'metadata.user_id']
+        """
+        self.indexed_fields = list(indexed_fields or [])
+        self._items: Dict[str, Dict[str, Any]] = {}
+        self._segments: Dict[str, str] = {}
+        # segment -> field -> value -> {item id: item}
+        self._field_indexes: Dict[str, Dict[str, Dict[Any, Dict[str, Dict[str, Any]]]]] = {}
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def __contains__(self, memory_id: str) -> bool:
+        return memory_id in self._items
+
+    def get(self, memory_id: str) -> Optional[Dict[str, Any]]:
+        """
+        Look up an item by id.
+
+        Args:
+            memory_id: ID of the memory item
+
+        Returns:
+            The item, or None if it is not indexed
+        """
+        return self._items.get(memory_id)
+
+    def get_segment(self, memory_id: str) -> Optional[str]:
+        """Get the segment an indexed item belongs to."""
+        return self._segments.get(memory_id)
+
+    def add(self, segment: str, item: Dict[str, Any]) -> None:
+        """
+        Index an item. An existing item with the same id is replaced.
+
+        Args:
+            segment: Segment the item belongs to
+            item: Memory item with an 'id' key
+        """
+        memory_id = item['id']
+        if memory_id in self._items:
+            self.remove(memory_id)
+        self._items[memory_id] = item
+        self._segments[memory_id] = segment
+
+        if not self.indexed_fields:
+            return
+        segment_indexes = self._field_indexes.setdefault(segment, {})
+        for field in self.indexed_fields:
+            value = get_field(item, field)
+            if value is MISSING or not _is_hashable(value):
+                continue
+            segment_indexes.setdefault(field, {}).setdefault(value, {})[memory_id] = item
+
+    def remove(self, memory_id: str) -> Optional[Dict[str, Any]]:
+        """
+        Remove an item from all indexes.
+
+        Args:
+            memory_id: ID of the memory item
+
+        Returns:
+            The removed item, or None if it was not indexed
+        """
+        item = self._items.pop(memory_id, None)
+        if item is None:
+            return None
+        segment = self._segments.pop(memory_id)
+
+        segment_indexes = self._field_indexes.get(segment, {})
+        for field, buckets in segment_indexes.items():
+            value = get_field(item, field)
+            if value is MISSING or not _is_hashable(value):
+                continue
+            bucket = buckets.get(value)
+            if bucket is not None:
+                bucket.pop(memory_id, None)
+                if not bucket:
+                    del buckets[value]
+        return item
+
+    def clear(self) -> None:
+        """Remove all items."""
+        self._items.clear()
+        self._segments.clear()
+        self._field_indexes.clear()
+
+    def lookup(self, segment: str, query: Dict[str, Any]) -> Optional[List[Dict[str, Any]]]:
+        """
+        Find candidate items for an equality query using the indexes.
+
+        The candidates are a superset of the matches: they satisfy the most
+        selective indexed condition, and the caller must still check the rest
+        of the query.
+
+        Args:
+            segment: Segment to search
+            query: Dictionary of field-value pairs to match
+
+        Returns:
+            Candidate items in insertion order, or None if no condition in the
+            query can be answered from an index
+        """
+        if 'id' in query and _is_hashable(query['id']):
+            item = self._items.get(query['id'])
+            if item is None or self._segments[query['id']] != segment:
+                return []
+            return [item]
+
+        segment_indexes = self._field_indexes.get(segment, {})
+        best = None
+        for field, value in query.items():
+            if field not in self.indexed_fields or not _is_hashable(value):
+                continue
+            bucket = segment_indexes.get(field, {}).get(value)
+            if not bucket:
+                return []
+            if best is None or len(bucket) < len(best):
+                best = bucket
+        if best is None:
+            return None
+        return list(best.values())
@@ -0,0 +1,211 @@
+"""
+Memory Item Module
+
+This module provides MemoryItem, the compact record MemoryManager stores for
+each memory, and new_ulid(), which generates its ids.
+
+A MemoryItem keeps its four fields in __slots__ instead of a per-item dict,
+uses a float epoch timestamp instead of an ISO string, and gets a 26-character
+ULID instead of f"{segment}_{timestamp}". It is a Mapping over
+'id', 'timestamp', 'data' and 'metadata', so code written against the
+previous dict items (item['data'], item.get('metadata'), dict(item)) keeps
+working; to_dict() materializes a real dict when one is needed.
+"""
+
+import json
+import os
+import threading
+import time
+from collections.abc import Mapping
+from datetime import datetime
+from typing import Dict, Any, Iterator, Optional
+
+_CROCKFORD = "0123456789ABCDEFGHJKMNPQRSTVWXYZ"
+# Two Crockford base32 characters per 10-bit group
+_PAIRS = [_CROCKFORD[i >> 5] + _CROCKFORD[i & 31] for i in range(1024)]
+_RANDOM_BITS = 80
+
+_ulid_lock = threading.Lock()
+_last_ms = -1
+_last_random = 0
+_last_prefix = ""
+
+
+def new_ulid() -> str:
+    """
+    Generate a ULID: 48 bits of millisecond time followed by 80 random bits.
+
+    ULIDs sort lexicographically in creation order. Within one millisecond the
+    random part is incremented rather than redrawn, so ids generated by this
+    process are strictly increasing and never collide.
+
+    Returns:
+        26-character Crockford base32 string
+    """
+    global _last_ms, _last_random, _last_prefix
+    with _ulid_lock:
+        ms = time.time_ns() // 1_000_000
+        if ms <= _last_ms:
+            ms = _last_ms
+            random_part = _last_random + 1
+            if random_part >> _RANDOM_BITS:
+                # Random part exhausted within this millisecond; borrow the next one
+                ms += 1
+                random_part = int.from_bytes(os.urandom(10), "big")
+        else:
+            random_part = int.from_bytes(os.urandom(10), "big")
+        if ms != _last_ms:
+            # 10 characters for the time (two leading zero bits), cached per millisecond
+            _last_prefix = (_PAIRS[(ms >> 40) & 1023] + _PAIRS[(ms >> 30) & 1023] + _PAIRS[(ms >> 20) & 1023]
+                            + _PAIRS[(ms >> 10) & 1023] + _PAIRS[ms & 1023])
+        _last_ms, _last_random = ms, random_part
+        prefix = _last_prefix
+    r = random_part
+    return (prefix + _PAIRS[r >> 70] + _PAIRS[(r >> 60) & 1023] + _PAIRS[(r >> 50) & 1023] + _PAIRS[(r >> 40) & 1023]
+            + _PAIRS[(r >> 30) & 1023] + _PAIRS[(r >> 20) & 1023] + _PAIRS[(r >> 10) & 1023] + _PAIRS[r & 1023])
+
+
+def parse_timestamp(value: Any) -> float:
+    """
+    Convert a stored timestamp to epoch seconds.
+
+    Args:
+        value: Epoch seconds, or an ISO 8601 string as written by earlier versions
+
+    Returns:
+        Epoch seconds (0.0 if the value cannot be parsed)
+    """
+    if isinstance(value, (int, float)) and not isinstance(value, bool):
+        return float(value)
+    if isinstance(value, str):
+        try:
+            return datetime.fromisoformat(value).timestamp()
+        except ValueError:
+            pass
+    return 0.0
+
+
+class MemoryItem(Mapping):
+    """
+    A memory item: id, epoch timestamp, data and metadata.
+
+    Fields are attributes (item.data) and also mapping keys (item['data']).
+    Fields can be reassigned either way; other keys raise KeyError.
+
+    token_count caches the item's size in prompt tokens. It is set when the
+    item is added and persisted with it, but is not one of the mapping keys.
+    """
+
+    __slots__ = ('id', 'timestamp', 'data', 'metadata', 'token_count')
+
+    FIELDS = ('id', 'timestamp', 'data', 'metadata')
+
+    def __init__(self, id: str, timestamp: float, data: Any, metadata: Optional[Dict[str, Any]] = None):
+        """
+        Initialize a new MemoryItem instance.
+
+        Args:
+            id: Unique item id (see new_ulid())
+            timestamp: Creation time in epoch seconds
+            data: The stored data
+            metadata: Additional metadata about the item
+        """
+        self.id = id
+        self.timestamp = timestamp
+        self.data = data
+        self.metadata = metadata if metadata is not None else {}
+        self.token_count: Optional[int] = None
+
+    @classmethod
+    def create(cls, data: Any, metadata: Optional[Dict[str, Any]] = None) -> "MemoryItem":
+        """Create an item with a new ULID and the current time."""
+        return cls(new_ulid(), time.time(), data, metadata)
+
+    @classmethod
+    def from_dict(cls, item: Dict[str, Any]) -> "MemoryItem":
+        """
+        Build an item from its dictionary form.
+
+        Args:
+            item: Dictionary with 'id', 'timestamp', 'data' and 'metadata';
+                ISO string timestamps from earlier versions are converted
+
+        Returns:
+            MemoryItem instance
+        """
+        if isinstance(item, MemoryItem):
+            return item
+        memory_item = cls(item['id'], parse_timestamp(item.get('timestamp')), item.get('data'), item.get('metadata'))
+        memory_item.token_count = item.get('token_count')
+        return memory_item
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Materialize the item as a plain dictionary."""
+        return {'id': self.id, 'timestamp': self.timestamp, 'data': self.data, 'metadata': self.metadata}
+
+    def to_record(self) -> Dict[str, Any]:
+        """The dictionary persisted for the item: to_dict() plus any cached token count."""
+        record = self.to_dict()
+        if self.token_count is not None:
+            record['token_count'] = self.token_count
+        return record
+
+    @property
+    def created_at(self) -> datetime:
+        """The timestamp as a local datetime."""
+        return datetime.fromtimestamp(self.timestamp)
+
+    def __getitem__(self, key: str) -> Any:
+        if key in MemoryItem.FIELDS:
+            return getattr(self, key)
+        raise KeyError(key)
+
+    def __setitem__(self, key: str, value: Any) -> None:
+        if key not in MemoryItem.FIELDS:
+            raise KeyError(f"MemoryItem has no field '{key}'")
+        setattr(self, key, value)
+
+    def get(self, key: str, default: Any = None) -> Any:
+        if key in MemoryItem.FIELDS:
+            return getattr(self, key)
+        return default
+
+    def __contains__(self, key: object) -> bool:
+        return key in MemoryItem.FIELDS
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(MemoryItem.FIELDS)
+
+    def __len__(self) -> int:
+        return len(MemoryItem.FIELDS)
+
+    def __repr__(self) -> str:
+        return f"MemoryItem(id={self.id!r}, timestamp={self.timestamp!r}, data={self.data!r}, metadata={self.metadata!r})"
+
+
+def item_text(item: Dict[str, Any]) -> str:
+    """
+    Get the text of a memory item, as embedded or placed in a prompt.
+
+    Args:
+        item: Memory item
+
+    Returns:
+        The item's data if it is a string, otherwise the data as JSON
+    """
+    data = item.get('data')
+    if isinstance(data, str):
+        return data
+    return json.dumps(data, sort_keys=True, ensure_ascii=False, default=str)
+
+
+def json_default(value: Any) -> Any:
+    """
+    json.dumps() default hook that serializes MemoryItems with to_record().
+
+    Raises:
+        TypeError: For any other non-serializable value
+    """
+    if isinstance(value, MemoryItem):
+        return value.to_record()
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
@@ -0,0 +1,285 @@
+"""
+Memory Log Module
+
+This module provides the SegmentLog class, an append-only JSON Lines log used by
+MemoryManager to persist one memory segment. Adding an item appends one record
+instead of rewriting the segment, and the log is periodically compacted into a
+fresh file holding only live items.
+"""
+
+import json
+import logging
+import os
+import threading
+import time
+from typing import Dict, List, Any, Iterable, Iterator
+
+from ultimate_ai_architect_framework.agents.modules.memory_item import json_default
+
+logger = logging.getLogger("memory.log")
+
+FSYNC_POLICIES = ("always", "batch", "interval")
+
+
+class SegmentLog:
+    """
+    Append-only JSON Lines log for one memory segment.
+
+    Each line is a record: {"op": "put", "item": {...}} appends an item and
+    {"op": "delete", "id": ...} removes the items with that id appended before
+    it. Replaying the log in order rebuilds the segment.
+
+    Every record is handed to the operating system as soon as it is appended,
+    so a crash of the process loses nothing. The fsync policy controls when
+    records are forced to disk, which bounds what an operating-system crash or
+    power loss can lose:
+    - 'always': after every record
+    - 'batch': after every batch_size records
+    - 'interval': on the first append at least fsync_interval seconds after
+      the previous fsync
+    sync() and close() force any remaining records to disk.
+
+    A torn final line left by a crash is discarded when the log is opened.
+    """
+
+    def __init__(self,
+                 path: str,
+                 fsync_policy: str = "batch",
+                 batch_size: int = 100,
+                 fsync_interval: float = 1.0):
+        """
+        Initialize a new SegmentLog instance.
+
+        Args:
+            path: Path of the .jsonl log file
+            fsync_policy: 'always', 'batch' or 'interval'
+            batch_size: Records between fsyncs for the 'batch' policy
+            fsync_interval: Seconds between fsyncs for the 'interval' policy
+        """
+        if fsync_policy not in FSYNC_POLICIES:
+            raise ValueError(f"Invalid fsync policy '{fsync_policy}'; expected one of {FSYNC_POLICIES}")
+        self.path = path
+        self.fsync_policy = fsync_policy
+        self.batch_size = max(1, int(batch_size))
+        self.fsync_interval = fsync_interval
+
+        self.records = 0
+        self._unsynced = 0
+        self._last_sync = time.monotonic()
+        self._file = None
+        self._lock = threading.Lock()
+
+    def _open(self):
+        """Open the log for appending, dropping a torn final line first."""
+        if self._file is None:
+            os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+            self._repair_tail()
+            self._file = open(self.path, "a", encoding="utf-8")
+        return self._file
+
+    def _repair_tail(self) -> None:
+        """Truncate the file after its last complete line."""
+        if not os.path.exists(self.path):
+            return
+        with open(self.path, "rb+") as f:
+            f.seek(0, os.SEEK_END)
+            size = f.tell()
+            if size == 0:
+                return
+            f.seek(size - 1)
+            if f.read(1) == b"\n":
+                return
+            # Scan backwards for the last newline
+            position = size
+            block = 4096
+            while position > 0:
+                start = max(0, position - block)
+                f.seek(start)
+                chunk = f.read(position - start)
+                newline = chunk.rfind(b"\n")
+                if newline >= 0:
+                    f.truncate(start + newline + 1)
+                    break
+                position = start
+            else:
+                f.truncate(0)
+            logger.warning(f"Discarded torn record at the end of {self.path}")
+
+    def replay(self) -> Iterator[Dict[str, Any]]:
+        """
+        Stream the records in the log, in order.
+
+        Lines that cannot be parsed (such as a record torn by a crash) are
+        skipped with a warning.
+
+        Yields:
+            Record dictionaries
+        """
+        if not os.path.exists(self.path):
+            return
+        records = 0
+        with open(self.path, "r", encoding="utf-8") as f:
+            for line_number, line in enumerate(f, 1):
+                if not line.strip():
+                    continue
+                try:
+                    record = json.loads(line)
+                except ValueError:
+                    logger.warning(f"Skipping unreadable record at {self.path}:{line_number}")
+                    continue
+                records += 1
+                yield record
+        self.records = records
+
+    def _write(self, record: Dict[str, Any]) -> None:
+        self._write_many([record])
+
+    def _write_many(self, records: List[Dict[str, Any]]) -> None:
+        if not records:
+            return
+        with self._lock:
+            f = self._open()
+            f.write("".join(json.dumps(record, default=json_default) + "\n" for record in records))
+            f.flush()
+            self.records += len(records)
+            self._unsynced += len(records)
+            if (self.fsync_policy == "always"
+                    or (self.fsync_policy == "batch" and self._unsynced >= self.batch_size)
+                    or (self.fsync_policy == "interval" and time.monotonic() - self._last_sync >= self.fsync_interval)):
+                self._fsync()
+
+    def append(self, item: Dict[str, Any]) -> None:
+        """
+        Append a put record for an item.
+
+        Args:
+            item: Memory item to persist
+        """
+        self._write({"op": "put", "item": item})
+
+    def append_many(self, items: Iterable[Dict[str, Any]]) -> None:
+        """
+        Append put records for several items with a single write.
+
+        The fsync policy is applied once for the whole batch.
+
+        Args:
+            items: Memory items to persist, in order
+        """
+        self._write_many([{"op": "put", "item": item} for item in items])
+
+    def append_delete(self, memory_id: str) -> None:
+        """
+        Append a delete record for an item.
+
+        Args:
+            memory_id: ID of the memory item to remove
+        """
+        self._write({"op": "delete", "id": memory_id})
+
+    def append_replace(self, memory_ids: Iterable[str], items: Iterable[Dict[str, Any]]) -> None:
+        """
+        Append delete records for some items and put records for others with a single write.
+
+        Args:
+            memory_ids: IDs of the memory items to remove
+            items: Memory items to persist, in order
+        """
+        records = [{"op": "delete", "id": memory_id} for memory_id in memory_ids]
+        records.extend({"op": "put", "item": item} for item in items)
+        self._write_many(records)
+
+    def _fsync(self) -> None:
+        """Force written records to disk (caller holds the lock)."""
+        if self._file is not None and self._unsynced:
+            os.fsync(self._file.fileno())
+        self._unsynced = 0
+        self._last_sync = time.monotonic()
+
+    def sync(self) -> None:
+        """Force all appended records to disk."""
+        with self._lock:
+            self._fsync()
+
+    def compact(self, items: Iterable[Dict[str, Any]]) -> int:
+        """
+        Replace the log with one put record per live item.
+
+        The new log is written to a temporary file, synced and atomically moved
+        over the old one, so a crash during compaction leaves the old log intact.
+
+        Args:
+            items: The live items of the segment, in order
+
+        Returns:
+            Number of records in the compacted log
+        """
+        tmp_path = f"{self.path}.tmp"
+        with self._lock:
+            os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+            records = 0
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                for item in items:
+                    f.write(json.dumps({"op": "put", "item": item}, default=json_default) + "\n")
+                    records += 1
+                f.flush()
+                os.fsync(f.fileno())
+
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+            os.replace(tmp_path, self.path)
+            self._fsync_directory()
+
+            self.records = records
+            self._unsynced = 0
+            self._last_sync = time.monotonic()
+        logger.debug(f"Compacted {self.path} to {records} records")
+        return records
+
+    def _fsync_directory(self) -> None:
+        """Persist the rename of the log file."""
+        try:
+            fd = os.open(os.path.dirname(self.path) or ".", os.O_RDONLY)
+        except OSError:
+            return  # Not supported on this platform
+        try:
+            os.fsync(fd)
+        except OSError:
+            pass
+        finally:
+            os.close(fd)
+
+    def close(self) -> None:
+        """Sync and close the log file."""
+        with self._lock:
+            if self._file is not None:
+                self._fsync()
+                self._file.close()
+                self._file = None
+
+
+def load_segment_items(log: SegmentLog) -> List[Dict[str, Any]]:
+    """
+    Rebuild a segment's live items by replaying its log.
+
+    Args:
+        log: The segment log
+
+    Returns:
+        Live items in the order they were appended
+    """
+    items = []
+    deleted_at = {}
+    for record in log.replay():
+        if record.get("op") == "put":
+            items.append(record["item"])
+        elif record.get("op") == "delete":
+            # Removes the items with this id appended before the delete
+            deleted_at[record["id"]] = len(items)
+    if deleted_at:
+        items = [
+            item for position, item in enumerate(items)
+            if deleted_at.get(item["id"], -1) <= position
+        ]
+    return items
@@ -6,10 +6,73 @@ allowing them to store, retrieve, and manage information across interactions.
 """
 
 import logging
-from typing import Dict, List, Any, Optional
-import json
 import os
+import threading
+import time
+import weakref
+from collections import deque
+from itertools import chain
 from datetime import datetime
+from typing import Deque, Dict, List, Any, Optional, Union
+
+from ultimate_ai_architect_framework.agents.modules.memory_index import MemoryIndex, matches_query, time_slice
+from ultimate_ai_architect_framework.agents.modules.memory_item import MemoryItem, item_text, new_ulid
+from ultimate_ai_architect_framework.agents.modules.long_term_store import (
+    LongTermStore, InMemoryLongTermStore, create_long_term_store
+)
+from ultimate_ai_architect_framework.agents.modules.memory_compaction import (
+    ColdStorage, CompactionWorker, create_summarizer, is_summary
+)
+from ultimate_ai_architect_framework.agents.modules.vector_memory import VectorMemory
+from ultimate_ai_architect_framework.core_modules.embeddings import create_embedder
+from ultimate_ai_architect_framework.core_modules.token_counter import create_token_counter
+
+
+def _flush_pending_evictions(pending_evictions: Dict[str, List[MemoryItem]], store: LongTermStore,
+                             lock: threading.RLock, logger: logging.Logger,
+                             segment: Optional[str] = None) -> Dict[str, List[MemoryItem]]:
+    """
+    Write pending evicted items to a long-term store.
+
+    Kept outside MemoryManager so the manager's finalizer can call it without
+    holding a reference to the manager. Items whose write fails stay pending
+    and are retried by the next flush.
+
+    Args:
+        pending_evictions: Pending items by segment, oldest first
+        store: Long-term store to write to
+        lock: Lock serializing memory writes
+        logger: Logger for write failures
+        segment: Segment to flush, or None for all segments
+
+    Returns:
+        The items written, by segment
+    """
+    written = {}
+    with lock:
+        for name in ([segment] if segment is not None else list(pending_evictions)):
+            pending = pending_evictions[name]
+            if not pending:
+                continue
+            try:
+                store.add_many(name, pending)
+            except Exception as e:
+                logger.error(f"Failed to persist {len(pending)} evicted {name} memory items: {e}")
+                continue
+            pending_evictions[name] = []
+            written[name] = pending
+    return written
+
+
+def _finalize_memory(pending_evictions: Dict[str, List[MemoryItem]], store: LongTermStore,
+                     lock: threading.RLock, logger: logging.Logger) -> None:
+    """Write pending evictions and sync the store for a manager that was never closed."""
+    try:
+        _flush_pending_evictions(pending_evictions, store, lock, logger)
+        store.sync()
+    except Exception as e:
+        logger.error(f"Failed to write pending memory at exit: {e}")
+
 
 class MemoryManager:
     """
@@ -17,9 +80,16 @@ class MemoryManager:
     
     Features:
     - Short-term working memory for current session
-    - Long-term persistent storage
+    - Long-term persistent storage in a pluggable backend (in-memory with
+      append-only segment logs, or SQLite)
     - Memory segmentation for different types of information
     - Memory search and retrieval
+    - Id and secondary-field indexes for fast lookups
+    - Semantic recall by embedding similarity for vector segments
+    - Time-range and most-recent queries over timestamp-ordered items
+    - Token-budgeted context assembly from recent turns and relevant knowledge
+    - Optional background summarization of old long-term items, with the
+      originals kept in cold storage
     """
     
     def __init__(self, agent_id: str, memory_config: Optional[Dict[str, Any]] = None):
@@ -36,25 +106,132 @@ class MemoryManager:
         # Default configuration
         self.config = {
             'max_short_term_items': 100,
+            # Items evicted from short-term memory are written to long-term
+            # storage in batches of this size. Pending items are also written
+            # by sync(), close() and at interpreter exit; a crash loses at
+            # most this many minus one per segment.
+            'eviction_batch_size': 10,
             'persistence_enabled': True,
             'persistence_path': f"memory/{agent_id}/",
-            'segments': ['conversation', 'knowledge', 'task']
+            'segments': ['conversation', 'knowledge', 'task'],
+            # Fields (dot notation allowed) indexed for equality queries in search()
+            'indexed_fields': [],
+            # Long-term storage backend: 'memory' (segment logs) or 'sqlite'
+            'long_term_backend': 'memory',
+            # SQLite database path; defaults to long_term.sqlite in persistence_path
+            'sqlite_path': None,
+            # Long-term items cached in memory by the SQLite backend
+            'hot_set_size': 1000,
+            # When long-term log records are forced to disk: 'always', 'batch' or 'interval'
+            'fsync_policy': 'batch',
+            'fsync_batch_size': 100,
+            'fsync_interval': 1.0,
+            # Compact a segment log once it holds this many dead records and
+            # they make up this fraction of the log
+            'compaction_min_dead_records': 1000,
+            'compaction_dead_ratio': 0.5,
+            # Segments whose items are embedded for similarity recall
+            'vector_segments': [],
+            # Embedder settings for vector segments (see create_embedder)
+            'embedder': {'provider': 'hashing', 'dimension': 256},
+            # Token counter for context assembly (see create_token_counter);
+            # every item is counted once, when it is added
+            'token_counter': {'provider': 'approximate'},
+            # Tokens added per item for message framing (role, separators)
+            'tokens_per_item': 4,
+            # Fold old long-term items into summaries (see compact_long_term)
+            'summarization_enabled': False,
+            'summarization_segments': ['conversation'],
+            # Summarize the oldest items once a segment's long-term store
+            # holds more than this many items (None to disable)
+            'summarization_max_items': 10000,
+            # Summarize items older than this many seconds (None to disable)
+            'summarization_max_age': None,
+            # Items folded into each summary
+            'summarization_chunk_size': 50,
+            # Seconds between passes of the background thread; with
+            # summarization_background off, call compact_long_term() instead
+            'summarization_interval': 60.0,
+            'summarization_background': True,
+            # Summarizer settings, a Summarizer or a function (see create_summarizer)
+            'summarizer': {'provider': 'extractive'}
         }
         
         # Override with provided config
         if memory_config:
             self.config.update(memory_config)
             
-        # Initialize memory segments
-        self.short_term = {segment: [] for segment in self.config['segments']}
-        self.long_term = {segment: [] for segment in self.config['segments']}
+        # Initialize memory segments as bounded ring buffers, oldest item first
+        self.short_term: Dict[str, Deque[MemoryItem]] = {
+            segment: deque() for segment in self.config['segments']
+        }
+        self._max_short_term = max(1, int(self.config['max_short_term_items']))
+        
+        # Evicted items waiting to be written to long-term storage, oldest first.
+        # They stay in the short-term index until written, so reads still see them.
+        self._pending_evictions: Dict[str, List[MemoryItem]] = {
+            segment: [] for segment in self.config['segments']
+        }
+        self._eviction_batch_size = max(1, int(self.config['eviction_batch_size']))
+        
+        # Items get non-decreasing timestamps, so every tier stays sorted by time
+        self._last_timestamp = 0.0
+        
+        # Serializes writes with the background summarization thread
+        self._lock = threading.RLock()
+        
+        # Indexes over short-term memory; the long-term store indexes its own items
+        self.index = MemoryIndex(self.config['indexed_fields'])
         
         # Load persistent memory if enabled
-        if self.config['persistence_enabled']:
-            self._load_persistent_memory()
+        self.long_term_store = self._create_long_term_store()
+        
+        # Token counter for the per-item counts used by context assembly
+        self.token_counter = create_token_counter(self.config['token_counter'])
+        
+        # Embedding matrices for vector segments, covering both tiers
+        self.vectors: Dict[str, VectorMemory] = {}
+        if self.config['vector_segments']:
+            embedder = create_embedder(self.config['embedder'])
+            for segment in self.config['vector_segments']:
+                if segment not in self.config['segments']:
+                    raise ValueError(f"Invalid vector memory segment: {segment}")
+                self.vectors[segment] = VectorMemory(embedder)
+                self._load_vectors(segment)
+        
+        # Summarization of old long-term items; originals go to cold storage
+        self.summarizer = create_summarizer(self.config['summarizer'])
+        self.cold_storage = ColdStorage(
+            os.path.join(self.config['persistence_path'], "cold_storage.jsonl")
+            if self.config['persistence_enabled'] else None
+        )
+        self._compaction_lock = threading.Lock()
+        self._compaction_worker: Optional[CompactionWorker] = None
+        if self.config['summarization_enabled'] and self.config['summarization_background']:
+            self._compaction_worker = CompactionWorker(
+                self.compact_long_term,
+                interval=self.config['summarization_interval'],
+                name=f"memory-compaction-{agent_id}"
+            )
+            self._compaction_worker.start()
+        
+        # Write pending evictions when the manager is collected or the
+        # interpreter exits without close() having been called
+        self._finalizer = weakref.finalize(
+            self, _finalize_memory,
+            self._pending_evictions, self.long_term_store, self._lock, self.logger
+        )
             
         self.logger.debug(f"Memory manager initialized for agent {agent_id}")
     
+    def _create_long_term_store(self) -> LongTermStore:
+        """Create the configured long-term store, falling back to a non-persistent one on failure."""
+        try:
+            return create_long_term_store(self.config)
+        except Exception as e:
+            self.logger.error(f"Failed to load persistent memory: {e}")
+            return InMemoryLongTermStore(self.config['segments'], indexed_fields=self.config['indexed_fields'])
+    
     def add(self, segment: str, data: Any, metadata: Optional[Dict[str, Any]] = None) -> str:
         """
         Add an item to memory.
@@ -71,34 +248,63 @@ class MemoryManager:
             self.logger.error(f"Invalid memory segment: {segment}")
             raise ValueError(f"Invalid memory segment: {segment}")
             
-        # Create memory item
-        timestamp = datetime.now().isoformat()
-        memory_id = f"{segment}_{timestamp}"
-        
-        memory_item = {
-            'id': memory_id,
-            'timestamp': timestamp,
-            'data': data,
-            'metadata': metadata or {}
-        }
+        # Create memory item with a unique, time-ordered id
+        memory_item = MemoryItem.create(data, metadata or {})
+        memory_id = memory_item.id
+        if memory_item.timestamp < self._last_timestamp:
+            # The wall clock stepped backwards; keep timestamps in add order
+            memory_item.timestamp = self._last_timestamp
+        self._last_timestamp = memory_item.timestamp
+        memory_item.token_count = self.token_counter.count(item_text(memory_item))
         
-        # Add to short-term memory
-        self.short_term[segment].append(memory_item)
-        
-        # Trim if exceeding max size
-        if len(self.short_term[segment]) > self.config['max_short_term_items']:
-            oldest = self.short_term[segment].pop(0)
-            self.logger.debug(f"Removed oldest item from short-term {segment} memory: {oldest['id']}")
+        with self._lock:
+            # Evict the oldest item first if the ring buffer is full
+            short_term = self.short_term[segment]
+            if len(short_term) >= self._max_short_term:
+                self._evict(segment, short_term.popleft())
             
-            # Move to long-term if persistence enabled
-            if self.config['persistence_enabled']:
-                self.long_term[segment].append(oldest)
-                self._save_persistent_memory()
+            # Add to short-term memory
+            short_term.append(memory_item)
+            self.index.add(segment, memory_item)
+            if segment in self.vectors:
+                self.vectors[segment].add(memory_item)
         
         self.logger.debug(f"Added item {memory_id} to {segment} memory")
         return memory_id
     
-    def get(self, memory_id: str) -> Optional[Dict[str, Any]]:
+    def _evict(self, segment: str, item: MemoryItem) -> None:
+        """Move an item out of short-term memory, queueing it for long-term storage."""
+        if self.config['persistence_enabled']:
+            pending = self._pending_evictions[segment]
+            pending.append(item)
+            if len(pending) >= self._eviction_batch_size:
+                self._flush_evictions(segment)
+            return
+        
+        # Without persistence, evicted items are dropped
+        if self.index.get(item['id']) is item:
+            self.index.remove(item['id'])
+        if segment in self.vectors:
+            self.vectors[segment].remove(item['id'])
+    
+    def _flush_evictions(self, segment: Optional[str] = None) -> None:
+        """
+        Write pending evicted items to long-term storage.
+        
+        Args:
+            segment: Segment to flush, or None for all segments
+        """
+        written = _flush_pending_evictions(
+            self._pending_evictions, self.long_term_store, self._lock, self.logger, segment
+        )
+        with self._lock:
+            for name, items in written.items():
+                for item in items:
+                    if self.index.get(item['id']) is item:
+                        self.index.remove(item['id'])
+                self.logger.debug(f"Moved {len(items)} items from short-term {name} memory to long-term storage")
+    
+    def get(self, memory_id: str) -> Optional[MemoryItem]:
         """
         Retrieve a specific memory item by ID.
         
@@ -109,21 +315,19 @@ class MemoryManager:
             Memory item if found, None otherwise
         """
         # Check short-term memory first
-        for segment in self.short_term:
-            for item in self.short_term[segment]:
-                if item['id'] == memory_id:
-                    return item
+        item = self.index.get(memory_id)
+        if item is not None:
+            return item
         
         # Check long-term memory if not found
-        for segment in self.long_term:
-            for item in self.long_term[segment]:
-                if item['id'] == memory_id:
-                    return item
+        item = self.long_term_store.get(memory_id)
+        if item is not None:
+            return item
                     
         self.logger.debug(f"Memory item {memory_id} not found")
         return None
     
-    def search(self, segment: str, query: Dict[str, Any]) -> List[Dict[str, Any]]:
+    def search(self, segment: str, query: Dict[str, Any]) -> List[MemoryItem]:
         """
         Search for memory items matching the query.
         
@@ -132,27 +336,354 @@ class MemoryManager:
             query: Dictionary of field-value pairs to match
             
         Returns:
-            List of matching memory items
+            List of matching memory items, short-term items first
         """
         if segment not in self.config['segments']:
             self.logger.error(f"Invalid memory segment: {segment}")
             raise ValueError(f"Invalid memory segment: {segment}")
-            
-        results = []
         
-        # Search in short-term memory
-        for item in self.short_term[segment]:
-            if self._matches_query(item, query):
-                results.append(item)
+        # Search in short-term memory, from an index when the query allows it
+        candidates = self.index.lookup(segment, query)
+        if candidates is None:
+            candidates = chain(self._pending_evictions[segment], self.short_term[segment])
+        results = [item for item in candidates if self._matches_query(item, query)]
                 
         # Search in long-term memory
-        for item in self.long_term[segment]:
-            if self._matches_query(item, query):
-                results.append(item)
+        results.extend(self.long_term_store.search(segment, query))
                 
         self.logger.debug(f"Found {len(results)} items matching query in {segment}")
         return results
     
+    @staticmethod
+    def _time_bound(value: Union[None, float, int, str, datetime]) -> Optional[float]:
+        """Convert a time-range bound (epoch seconds, datetime or ISO string) to epoch seconds."""
+        if value is None:
+            return None
+        if isinstance(value, datetime):
+            return value.timestamp()
+        if isinstance(value, str):
+            return datetime.fromisoformat(value).timestamp()
+        if isinstance(value, (int, float)) and not isinstance(value, bool):
+            return float(value)
+        raise ValueError(f"Invalid time bound: {value!r}")
+    
+    def time_range(self,
+                   segment: str,
+                   start: Union[None, float, str, datetime] = None,
+                   end: Union[None, float, str, datetime] = None) -> List[MemoryItem]:
+        """
+        Get the memory items created in a time range, e.g. the last hour.
+        
+        Args:
+            segment: Memory segment to read
+            start: Inclusive lower bound (epoch seconds, datetime or ISO string), or None
+            end: Exclusive upper bound (epoch seconds, datetime or ISO string), or None
+            
+        Returns:
+            List of memory items, oldest first
+        """
+        if segment not in self.config['segments']:
+            self.logger.error(f"Invalid memory segment: {segment}")
+            raise ValueError(f"Invalid memory segment: {segment}")
+        start, end = self._time_bound(start), self._time_bound(end)
+        
+        # Long-term items are older than pending evictions, which are older than short-term items
+        results = self.long_term_store.time_range(segment, start, end)
+        results.extend(time_slice(self._pending_evictions[segment], start, end))
+        results.extend(time_slice(self.short_term[segment], start, end))
+        
+        self.logger.debug(f"Found {len(results)} items in time range in {segment}")
+        return results
+    
+    def recent(self, segment: str, k: int = 10) -> List[MemoryItem]:
+        """
+        Get the k most recently added memory items, e.g. the last conversation turns.
+        
+        Args:
+            segment: Memory segment to read
+            k: Number of items
+            
+        Returns:
+            Up to k memory items, oldest first
+        """
+        if segment not in self.config['segments']:
+            self.logger.error(f"Invalid memory segment: {segment}")
+            raise ValueError(f"Invalid memory segment: {segment}")
+        if k <= 0:
+            return []
+        
+        # Take from the newest tier first
+        short_term = self.short_term[segment]
+        results = [short_term[position] for position in range(max(0, len(short_term) - k), len(short_term))]
+        needed = k - len(results)
+        if needed > 0:
+            pending = self._pending_evictions[segment]
+            results = pending[max(0, len(pending) - needed):] + results
+            needed = k - len(results)
+        if needed > 0:
+            results = self.long_term_store.recent(segment, needed) + results
+        return results
+    
+    def recall(self,
+               segment: str,
+               query: str,
+               k: int = 5,
+               filters: Optional[Dict[str, Any]] = None,
+               min_score: Optional[float] = None) -> List[Dict[str, Any]]:
+        """
+        Recall the memory items most semantically similar to a query.
+        
+        Args:
+            segment: Vector memory segment to search in
+            query: Query text
+            k: Maximum number of items to return
+            filters: Optional field-value pairs the items must also match
+            min_score: Optional minimum cosine similarity
+            
+        Returns:
+            List of {'item': memory item, 'score': cosine similarity}, most similar first
+        """
+        if segment not in self.vectors:
+            self.logger.error(f"Not a vector memory segment: {segment}")
+            raise ValueError(f"Not a vector memory segment: {segment}")
+        
+        found = {}
+        
+        def accept(memory_id: str) -> bool:
+            item = self.get(memory_id)
+            if item is None or (filters and not self._matches_query(item, filters)):
+                return False
+            found[memory_id] = item
+            return True
+        
+        with self._lock:
+            matches = self.vectors[segment].search(query, k, accept=accept)
+        
+        results = []
+        for memory_id, score in matches:
+            if min_score is not None and score < min_score:
+                break
+            results.append({'item': found[memory_id], 'score': score})
+        
+        self.logger.debug(f"Recalled {len(results)} items from {segment}")
+        return results
+    
+    def _item_tokens(self, item: MemoryItem) -> int:
+        """Prompt tokens for an item, from its cached count when available."""
+        if item.token_count is None:
+            # Items stored before token counting; count once and keep the result
+            item.token_count = self.token_counter.count(item_text(item))
+        return item.token_count + self.config['tokens_per_item']
+    
+    def _iter_newest(self, segment: str):
+        """Yield a segment's items from newest to oldest, fetching history in growing pages."""
+        page = 32
+        seen = 0
+        while True:
+            items = self.recent(segment, page)
+            for item in reversed(items[:len(items) - seen]):
+                yield item
+            if len(items) < page:
+                return
+            seen = len(items)
+            page *= 4
+    
+    def assemble_context(self,
+                         token_budget: int,
+                         query: Optional[str] = None,
+                         conversation_segment: str = 'conversation',
+                         knowledge_segment: Optional[str] = 'knowledge',
+                         knowledge_k: int = 5,
+                         knowledge_share: float = 0.3,
+                         min_score: Optional[float] = None) -> Dict[str, Any]:
+        """
+        Select recent turns and relevant knowledge that fit a token budget.
+        
+        Knowledge items most similar to the query are taken first, up to
+        knowledge_share of the budget. The remaining budget is filled with
+        the most recent conversation turns, newest first, stopping at the
+        first turn that does not fit so the history has no gaps. Budget the
+        turns leave unused goes to further knowledge candidates. Token counts
+        come from the cache filled when items were added.
+        
+        Args:
+            token_budget: Maximum total tokens of the selected items
+            query: Text to find relevant knowledge for; no knowledge is
+                included without a query
+            conversation_segment: Segment holding the conversation turns
+            knowledge_segment: Vector segment to recall knowledge from, or None
+            knowledge_k: Maximum knowledge items
+            knowledge_share: Fraction of the budget reserved for knowledge first
+            min_score: Minimum similarity for knowledge items
+            
+        Returns:
+            Dictionary with 'conversation' (turns, oldest first), 'knowledge'
+            (items, most relevant first) and 'tokens' (total tokens used)
+        """
+        if conversation_segment not in self.config['segments']:
+            self.logger.error(f"Invalid memory segment: {conversation_segment}")
+            raise ValueError(f"Invalid memory segment: {conversation_segment}")
+        
+        remaining = max(0, int(token_budget))
+        
+        candidates = []
+        if query and knowledge_segment in self.vectors and knowledge_k > 0:
+            candidates = [result['item'] for result in self.recall(knowledge_segment, query, knowledge_k, min_score=min_score)]
+        
+        # Knowledge, within its share of the budget
+        knowledge = []
+        knowledge_budget = int(remaining * knowledge_share)
+        deferred = []
+        for item in candidates:
+            tokens = self._item_tokens(item)
+            if tokens <= knowledge_budget:
+                knowledge.append(item)
+                knowledge_budget -= tokens
+                remaining -= tokens
+            else:
+                deferred.append(item)
+        
+        # Most recent turns, without gaps
+        conversation = []
+        for item in self._iter_newest(conversation_segment):
+            tokens = self._item_tokens(item)
+            if tokens > remaining:
+                break
+            conversation.append(item)
+            remaining -= tokens
+        conversation.reverse()
+        
+        # Leftover budget goes to knowledge that did not fit its share
+        for item in deferred:
+            tokens = self._item_tokens(item)
+            if tokens <= remaining:
+                knowledge.append(item)
+                remaining -= tokens
+        rank = {id(item): position for position, item in enumerate(candidates)}
+        knowledge.sort(key=lambda item: rank[id(item)])
+        
+        used = max(0, int(token_budget)) - remaining
+        self.logger.debug(f"Assembled context: {len(conversation)} turns, {len(knowledge)} knowledge items, {used} tokens")
+        return {'conversation': conversation, 'knowledge': knowledge, 'tokens': used}
+    
+    def _oldest_unsummarized(self, segment: str, n: int) -> List[MemoryItem]:
+        """The n oldest long-term items of a segment that are not summaries."""
+        # Summaries replace the oldest items, so they sit at the start of the segment
+        k = n + self.config['summarization_chunk_size']
+        while True:
+            items = self.long_term_store.oldest(segment, k)
+            fresh = [item for item in items if not is_summary(item)]
+            if len(fresh) >= n or len(items) < k:
+                return fresh[:n]
+            k *= 4
+    
+    def _summarization_chunks(self, segment: str) -> List[List[MemoryItem]]:
+        """Select the runs of long-term items the size and age thresholds call for folding."""
+        chunk_size = max(2, int(self.config['summarization_chunk_size']))
+        chunks_needed = 0
+        
+        max_items = self.config['summarization_max_items']
+        if max_items is not None:
+            excess = self.long_term_store.count(segment) - int(max_items)
+            if excess > 0:
+                # Each summary takes the place of chunk_size items
+                chunks_needed = -(-excess // (chunk_size - 1))
+        
+        max_age = self.config['summarization_max_age']
+        if max_age is not None:
+            aged = self.long_term_store.time_range(segment, None, time.time() - max_age)
+            # Only whole chunks, so items aging out one at a time are not summarized alone
+            chunks_needed = max(chunks_needed, sum(1 for item in aged if not is_summary(item)) // chunk_size)
+        
+        if not chunks_needed:
+            return []
+        items = self._oldest_unsummarized(segment, chunks_needed * chunk_size)
+        chunks = [items[start:start + chunk_size] for start in range(0, len(items), chunk_size)]
+        if chunks and len(chunks[-1]) < 2:
+            chunks.pop()
+        return chunks
+    
+    def compact_long_term(self, segment: Optional[str] = None) -> int:
+        """
+        Fold old long-term items into summaries.
+        
+        Runs of the oldest items are summarized once a segment exceeds
+        summarization_max_items or holds items older than
+        summarization_max_age seconds. The originals are archived to cold
+        storage, then each run is replaced in the long-term store by a summary
+        item whose metadata records the originals' ids and where they are
+        archived (see get_summarized_items()). The background thread calls
+        this every summarization_interval seconds when enabled.
+        
+        Args:
+            segment: Segment to compact, or None for every summarization segment
+            
+        Returns:
+            Number of items folded into summaries
+        """
+        segments = [segment] if segment is not None else self.config['summarization_segments']
+        folded = 0
+        with self._compaction_lock:
+            for name in segments:
+                if name not in self.config['segments']:
+                    self.logger.error(f"Invalid memory segment: {name}")
+                    raise ValueError(f"Invalid memory segment: {name}")
+                chunks = self._summarization_chunks(name)
+                if not chunks:
+                    continue
+                
+                # Summarizing can be slow (e.g. an LLM call), so it runs without the lock
+                summaries = []
+                for chunk in chunks:
+                    summary = MemoryItem(new_ulid(), chunk[-1].timestamp, self.summarizer.summarize(chunk), {
+                        'summary': True,
+                        'summarized_ids': [item.id for item in chunk],
+                        'start': chunk[0].timestamp,
+                        'end': chunk[-1].timestamp
+                    })
+                    summary.token_count = self.token_counter.count(item_text(summary))
+                    summaries.append(summary)
+                
+                # Archive the originals before they leave the long-term store
+                keys = self.cold_storage.archive([(summary.id, chunk) for summary, chunk in zip(summaries, chunks)])
+                for summary, key in zip(summaries, keys):
+                    summary.metadata['cold_storage_key'] = key
+                
+                with self._lock:
+                    self.long_term_store.replace(
+                        name, [(summary.metadata['summarized_ids'], summary) for summary in summaries]
+                    )
+                    if name in self.vectors:
+                        vectors = self.vectors[name]
+                        for chunk in chunks:
+                            for item in chunk:
+                                vectors.remove(item.id)
+                        vectors.add_many(summaries)
+                
+                count = sum(len(chunk) for chunk in chunks)
+                folded += count
+                self.logger.info(f"Summarized {count} {name} memory items into {len(summaries)} summaries")
+        return folded
+    
+    def get_summarized_items(self, summary_id: str) -> List[MemoryItem]:
+        """
+        Retrieve the original items a summary replaced, from cold storage.
+        
+        Args:
+            summary_id: ID of the summary item
+            
+        Returns:
+            The original items, oldest first (empty if the id is not a summary)
+        """
+        summary = self.get(summary_id)
+        if summary is None or not is_summary(summary):
+            return []
+        try:
+            return self.cold_storage.load(summary['metadata']['cold_storage_key'], summary_id)
+        except (KeyError, OSError) as e:
+            self.logger.error(f"Failed to read the items summarized by {summary_id} from cold storage: {e}")
+            return []
+    
     def _matches_query(self, item: Dict[str, Any], query: Dict[str, Any]) -> bool:
         """
         Check if a memory item matches the query.
@@ -164,48 +695,56 @@ class MemoryManager:
         Returns:
             True if item matches query, False otherwise
         """
-        for key, value in query.items():
-            # Handle nested keys with dot notation
-            if '.' in key:
-                parts = key.split('.')
-                current = item
-                for part in parts:
-                    if part not in current:
-                        return False
-                    current = current[part]
-                if current != value:
-                    return False
-            # Handle direct keys
-            elif key not in item or item[key] != value:
-                return False
-                
-        return True
+        return matches_query(item, query)
     
-    def _load_persistent_memory(self) -> None:
-        """Load persistent memory from disk."""
-        try:
-            base_path = self.config['persistence_path']
-            os.makedirs(base_path, exist_ok=True)
-            
-            for segment in self.config['segments']:
-                file_path = os.path.join(base_path, f"{segment}.json")
-                if os.path.exists(file_path):
-                    with open(file_path, 'r') as f:
-                        self.long_term[segment] = json.load(f)
-                    self.logger.debug(f"Loaded {len(self.long_term[segment])} items from {segment} persistent memory")
-        except Exception as e:
-            self.logger.error(f"Failed to load persistent memory: {e}")
+    def _vectors_path(self, segment: str) -> str:
+        return os.path.join(self.config['persistence_path'], f"{segment}.vectors.npz")
     
-    def _save_persistent_memory(self) -> None:
-        """Save persistent memory to disk."""
+    def _load_vectors(self, segment: str) -> None:
+        """Load a vector segment's saved embeddings and reconcile them with the long-term store."""
+        vectors = self.vectors[segment]
+        if not self.config['persistence_enabled']:
+            return
         try:
-            base_path = self.config['persistence_path']
-            os.makedirs(base_path, exist_ok=True)
-            
-            for segment in self.config['segments']:
-                file_path = os.path.join(base_path, f"{segment}.json")
-                with open(file_path, 'w') as f:
-                    json.dump(self.long_term[segment], f)
-                self.logger.debug(f"Saved {len(self.long_term[segment])} items to {segment} persistent memory")
+            vectors.load(self._vectors_path(segment))
         except Exception as e:
-            self.logger.error(f"Failed to save persistent memory: {e}")
+            self.logger.error(f"Failed to load embeddings for {segment}: {e}")
+        
+        # Embeddings saved before a crash can miss recent items or hold deleted ones
+        live_ids = set()
+        missing = []
+        for item in self.long_term_store.iter_items(segment):
+            live_ids.add(item['id'])
+            if item['id'] not in vectors:
+                missing.append(item)
+        for memory_id in [memory_id for memory_id in vectors.ids if memory_id not in live_ids]:
+            vectors.remove(memory_id)
+        vectors.add_many(missing)
+        if missing:
+            self.logger.debug(f"Embedded {len(missing)} long-term items in {segment}")
+    
+    def _save_vectors(self) -> None:
+        """Write the embeddings of vector segments next to the long-term store."""
+        if not self.config['persistence_enabled']:
+            return
+        for segment, vectors in self.vectors.items():
+            try:
+                vectors.save(self._vectors_path(segment))
+            except Exception as e:
+                self.logger.error(f"Failed to save embeddings for {segment}: {e}")
+    
+    def sync(self) -> None:
+        """Write pending evicted items and force all persisted long-term items to disk."""
+        self._flush_evictions()
+        self.long_term_store.sync()
+        self._save_vectors()
+    
+    def close(self) -> None:
+        """Stop background summarization, write pending evicted items, then sync and close the long-term store."""
+        if self._compaction_worker is not None:
+            self._compaction_worker.stop()
+            self._compaction_worker = None
+        self._finalizer.detach()
+        self._flush_evictions()
+        self._save_vectors()
+        self.long_term_store.close()
@@ -0,0 +1,214 @@
+"""
+Vector Memory Module
+
+This module provides the VectorMemory class used by MemoryManager for semantic
+recall. Each memory item's embedding is kept as one row of a contiguous float32
+matrix, so a recall query is a single matrix-vector product followed by a
+top-k selection rather than a Python loop over items.
+"""
+
+import logging
+import os
+from typing import Dict, List, Any, Callable, Iterable, Optional, Tuple
+
+import numpy as np
+
+from ultimate_ai_architect_framework.agents.modules.memory_item import item_text
+from ultimate_ai_architect_framework.core_modules.embeddings import Embedder, top_k_indices
+
+logger = logging.getLogger("memory.vector")
+
+
+class VectorMemory:
+    """
+    Embedding matrix for the items of one memory segment.
+
+    Rows are L2-normalized, so cosine similarity is the dot product. The matrix
+    grows by doubling its capacity; removing an item moves the last row into
+    its slot, so removal is O(dimension) and rows stay dense.
+    """
+
+    def __init__(self, embedder: Embedder, initial_capacity: int = 1024):
+        """
+        Initialize an empty VectorMemory.
+
+        Args:
+            embedder: Embedder used for items and queries
+            initial_capacity: Rows allocated up front
+        """
+        self.embedder = embedder
+        self.dimension = embedder.dimension
+        self._vectors = np.zeros((max(1, int(initial_capacity)), self.dimension), dtype=np.float32)
+        self._ids: List[str] = []
+        self._rows: Dict[str, int] = {}
+
+    def __len__(self) -> int:
+        return len(self._ids)
+
+    def __contains__(self, memory_id: str) -> bool:
+        return memory_id in self._rows
+
+    @property
+    def ids(self) -> List[str]:
+        """Ids of the stored items, in row order."""
+        return list(self._ids)
+
+    def _reserve(self, rows: int) -> None:
+        """Grow the matrix to hold at least rows rows."""
+        capacity = self._vectors.shape[0]
+        if rows <= capacity:
+            return
+        while capacity < rows:
+            capacity *= 2
+        grown = np.zeros((capacity, self.dimension), dtype=np.float32)
+        grown[:len(self._ids)] = self._vectors[:len(self._ids)]
+        self._vectors = grown
+
+    def add_vectors(self, ids: List[str], vectors: np.ndarray) -> None:
+        """
+        Add precomputed, normalized embeddings. Existing ids are overwritten.
+
+        Args:
+            ids: Memory item ids
+            vectors: float32 array of shape (len(ids), dimension)
+        """
+        if vectors.shape != (len(ids), self.dimension):
+            raise ValueError(f"Expected vectors of shape {(len(ids), self.dimension)}, got {vectors.shape}")
+        self._reserve(len(self._ids) + len(ids))
+        for memory_id, vector in zip(ids, vectors):
+            row = self._rows.get(memory_id)
+            if row is None:
+                row = len(self._ids)
+                self._ids.append(memory_id)
+                self._rows[memory_id] = row
+            self._vectors[row] = vector
+
+    def add(self, item: Dict[str, Any]) -> None:
+        """
+        Embed and add a memory item.
+
+        Args:
+            item: Memory item with 'id' and 'data'
+        """
+        self.add_many([item])
+
+    def add_many(self, items: Iterable[Dict[str, Any]]) -> None:
+        """
+        Embed and add memory items in one embedder call.
+
+        Args:
+            items: Memory items with 'id' and 'data'
+        """
+        items = list(items)
+        if not items:
+            return
+        vectors = self.embedder.embed([item_text(item) for item in items])
+        self.add_vectors([item['id'] for item in items], vectors)
+
+    def remove(self, memory_id: str) -> bool:
+        """
+        Remove an item's embedding.
+
+        Args:
+            memory_id: ID of the memory item
+
+        Returns:
+            True if the item had an embedding
+        """
+        row = self._rows.pop(memory_id, None)
+        if row is None:
+            return False
+        last = len(self._ids) - 1
+        if row != last:
+            moved_id = self._ids[last]
+            self._vectors[row] = self._vectors[last]
+            self._ids[row] = moved_id
+            self._rows[moved_id] = row
+        self._ids.pop()
+        return True
+
+    def scores(self, query: str) -> np.ndarray:
+        """
+        Cosine similarity of every stored item to a query.
+
+        Args:
+            query: Query text
+
+        Returns:
+            float32 array of scores, aligned with the stored ids
+        """
+        vector = self.embedder.embed_query(query)
+        return self._vectors[:len(self._ids)] @ vector
+
+    def search(self,
+               query: str,
+               k: int = 5,
+               accept: Optional[Callable[[str], bool]] = None) -> List[Tuple[str, float]]:
+        """
+        Find the items most similar to a query.
+
+        Args:
+            query: Query text
+            k: Number of results
+            accept: Optional predicate on memory ids; rejected items are
+                skipped and the search looks further down the ranking
+
+        Returns:
+            (memory id, cosine similarity) pairs, most similar first
+        """
+        scores = self.scores(query)
+        if accept is None:
+            return [(self._ids[row], float(scores[row])) for row in top_k_indices(scores, k)]
+
+        # Rank a growing prefix until enough candidates pass the filter
+        results = []
+        window = max(k, 1) * 4
+        seen = 0
+        while True:
+            rows = top_k_indices(scores, window)
+            for row in rows[seen:]:
+                memory_id = self._ids[row]
+                if accept(memory_id):
+                    results.append((memory_id, float(scores[row])))
+                    if len(results) == k:
+                        return results
+            seen = len(rows)
+            if seen >= len(scores):
+                return results
+            window *= 4
+
+    def save(self, path: str) -> None:
+        """
+        Write the embeddings to an .npz file, atomically.
+
+        Args:
+            path: Destination path
+        """
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, "wb") as f:
+            np.savez(f, vectors=self._vectors[:len(self._ids)], ids=np.array(self._ids, dtype=str))
+        os.replace(tmp_path, path)
+
+    def load(self, path: str) -> bool:
+        """
+        Replace the contents with embeddings saved by save().
+
+        Args:
+            path: Source path
+
+        Returns:
+            True if the file existed and matched the embedder's dimension
+        """
+        if not os.path.exists(path):
+            return False
+        with np.load(path) as saved:
+            vectors = saved['vectors'].astype(np.float32, copy=False)
+            ids = [str(memory_id) for memory_id in saved['ids']]
+        if vectors.ndim != 2 or vectors.shape[1] != self.dimension:
+            logger.warning(f"Ignoring {path}: embedding dimension does not match the embedder")
+            return False
+        self._ids = []
+        self._rows = {}
+        self.add_vectors(ids, vectors)
+        return True
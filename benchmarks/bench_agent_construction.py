@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+"""
+Benchmark: BaseAgent construction cost with and without the shared RuntimeContext.
+
+Builds N agents the old way (every agent gets fresh ConfigLoader, LLMRouter,
+ToolHandler, FlowiseClient and LangSmithSetup instances) and the new way
+(components come from the process-wide RuntimeContext), and reports wall time
+plus the number of YAML documents parsed for each.
+
+Usage:
+    python benchmarks/bench_agent_construction.py --agents 200
+"""
+
+import argparse
+import logging
+import sys
+import time
+from pathlib import Path
+
+import yaml
+
+# Make the framework importable as a package, as project_main.py does
+framework_root = Path(__file__).resolve().parent.parent
+sys.path.append(str(framework_root.parent))
+
+from ultimate_ai_architect_framework.agents.modules.base_agent import BaseAgent
+from ultimate_ai_architect_framework.core_modules.config_loader import ConfigLoader
+from ultimate_ai_architect_framework.core_modules.llm_router import LLMRouter
+from ultimate_ai_architect_framework.core_modules.tool_handler import ToolHandler
+from ultimate_ai_architect_framework.core_modules.flowise_client import FlowiseClient
+from ultimate_ai_architect_framework.core_modules.langsmith_setup import LangSmithSetup
+from ultimate_ai_architect_framework.core_modules.runtime_context import RuntimeContext
+
+# Count YAML parses by wrapping yaml.load, which yaml.safe_load and
+# parse_yaml both go through, for the duration of the benchmark
+_yaml_parses = 0
+_original_load = yaml.load
+
+
+def _counting_load(stream, Loader):
+    global _yaml_parses
+    _yaml_parses += 1
+    return _original_load(stream, Loader)
+
+
+yaml.load = _counting_load
+
+
+def build_unshared(root: str, agent_id: str) -> BaseAgent:
+    """Construct an agent with private components, like the pre-context code path."""
+    return BaseAgent(
+        framework_root=root,
+        agent_id=agent_id,
+        config_loader=ConfigLoader(root),
+        llm_router=LLMRouter(str(Path(root) / "configs" / "global_settings.yaml")),
+        tool_handler=ToolHandler(root),
+        flowise_client=FlowiseClient(root),
+        langsmith_setup=LangSmithSetup(root),
+        runtime_context=RuntimeContext(root),
+    )
+
+
+def build_shared(root: str, agent_id: str) -> BaseAgent:
+    """Construct an agent using the shared process-wide components."""
+    return BaseAgent(framework_root=root, agent_id=agent_id)
+
+
+def measure(label: str, builder, root: str, count: int) -> None:
+    """Build count agents with builder and print timing and parse counts."""
+    global _yaml_parses
+    _yaml_parses = 0
+    start = time.perf_counter()
+    for i in range(count):
+        builder(root, "strategy_advisor" if i % 2 else "code_generator")
+    elapsed = time.perf_counter() - start
+    print(f"{label:<10} agents={count:<5} total={elapsed * 1000:9.1f} ms  "
+          f"per_agent={elapsed / count * 1e6:9.1f} us  yaml_parses={_yaml_parses}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="BaseAgent construction benchmark")
+    parser.add_argument("--agents", type=int, default=200, help="Number of agents to build per run")
+    args = parser.parse_args()
+
+    # Keep component logging from dominating the measurement
+    logging.disable(logging.CRITICAL)
+
+    root = str(framework_root)
+    RuntimeContext.reset()
+
+    for count in (args.agents // 10 or 1, args.agents):
+        measure("unshared", build_unshared, root, count)
+        RuntimeContext.reset()
+        measure("shared", build_shared, root, count)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,117 @@
+#!/usr/bin/env python3
+"""
+Benchmark: configuration loading cost at worker startup.
+
+Writes a framework root with the repository's global settings plus a large
+generated agent-profile file and tool registry, then measures what a fresh
+worker process pays to load them through a new ConfigLoader:
+- the pure-Python SafeLoader (the previous yaml.safe_load path)
+- LibYAML's CSafeLoader
+- the parsed-config snapshot cache, after another process wrote the snapshots
+
+Usage:
+    python benchmarks/bench_config_startup.py --profiles 2000 --tools 500
+"""
+
+import argparse
+import logging
+import shutil
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import yaml
+
+# Make the framework importable as a package, as project_main.py does
+framework_root = Path(__file__).resolve().parent.parent
+sys.path.append(str(framework_root.parent))
+
+from ultimate_ai_architect_framework.core_modules import config_loader as config_loader_module
+from ultimate_ai_architect_framework.core_modules.config_loader import ConfigLoader
+
+
+def write_root(root: Path, profiles: int, tools: int) -> None:
+    """Create configs/ with the real global settings and generated large files."""
+    configs = root / "configs"
+    configs.mkdir(parents=True)
+    shutil.copy(framework_root / "configs" / "global_settings.yaml", configs / "global_settings.yaml")
+    agent_profiles = {
+        "agents": {
+            f"agent_{i}": {
+                "name": f"Agent {i}",
+                "description": "Generated profile used to measure configuration loading at startup",
+                "model": "openrouter.anthropic/claude-3-haiku",
+                "temperature": 0.2 + (i % 5) / 10,
+                "tools": [f"tool_{(i + j) % max(1, tools)}" for j in range(4)],
+                "memory": {"max_short_term_items": 100, "segments": ["conversation", "knowledge", "task"]},
+            }
+            for i in range(profiles)
+        }
+    }
+    tool_registry = {
+        "tools": {
+            f"tool_{i}": {
+                "name": f"Tool {i}",
+                "description": "Generated tool entry",
+                "implementation": {"module": "tools.generated", "class": f"Tool{i}"},
+                "config": {"timeout": 30, "retries": 2, "options": {"verbose": False, "limit": i}},
+            }
+            for i in range(tools)
+        }
+    }
+    with open(configs / "base_agent_profiles.yaml", "w") as f:
+        yaml.safe_dump(agent_profiles, f, sort_keys=False)
+    with open(configs / "tool_registry.yaml", "w") as f:
+        yaml.safe_dump(tool_registry, f, sort_keys=False)
+
+
+def startup(root: Path, snapshot_dir: Path, use_snapshots: bool) -> float:
+    """Load every framework config with a fresh ConfigLoader; return milliseconds."""
+    start = time.perf_counter()
+    loader = ConfigLoader(str(root), snapshot_dir=str(snapshot_dir), use_snapshots=use_snapshots)
+    loader.load_global_config()
+    loader.load_agent_profiles()
+    loader.load_tool_registry()
+    return (time.perf_counter() - start) * 1000
+
+
+def best_of(runs: int, func) -> float:
+    return min(func() for _ in range(runs))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Configuration startup benchmark")
+    parser.add_argument("--profiles", type=int, default=2000, help="Generated agent profiles")
+    parser.add_argument("--tools", type=int, default=500, help="Generated tool registry entries")
+    parser.add_argument("--runs", type=int, default=5, help="Startups per measurement (best is reported)")
+    args = parser.parse_args()
+
+    logging.disable(logging.CRITICAL)
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        root = Path(tmp_dir) / "framework"
+        snapshot_dir = Path(tmp_dir) / "snapshots"
+        write_root(root, args.profiles, args.tools)
+        size_kb = sum(path.stat().st_size for path in (root / "configs").iterdir()) / 1024
+        print(f"config files: {size_kb:.0f} KB ({args.profiles} profiles, {args.tools} tools)")
+
+        c_loader = config_loader_module.YAMLLoader
+        config_loader_module.YAMLLoader = yaml.SafeLoader
+        python_ms = best_of(args.runs, lambda: startup(root, snapshot_dir, use_snapshots=False))
+        config_loader_module.YAMLLoader = c_loader
+
+        if c_loader is yaml.SafeLoader:
+            print("LibYAML is not available; CSafeLoader falls back to SafeLoader")
+        c_ms = best_of(args.runs, lambda: startup(root, snapshot_dir, use_snapshots=False))
+
+        first_ms = startup(root, snapshot_dir, use_snapshots=True)
+        snapshot_ms = best_of(args.runs, lambda: startup(root, snapshot_dir, use_snapshots=True))
+
+        print(f"{'SafeLoader (pure Python)':<34} {python_ms:9.1f} ms")
+        print(f"{'CSafeLoader':<34} {c_ms:9.1f} ms")
+        print(f"{'snapshot cache, first process':<34} {first_ms:9.1f} ms")
+        print(f"{'snapshot cache, later processes':<34} {snapshot_ms:9.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+"""
+Benchmark: token-budgeted context assembly from MemoryManager.
+
+Fills a conversation of N turns and a small knowledge segment, then compares
+assemble_context(), which uses the token counts cached when items were added,
+with re-tokenizing the newest turns on every call until the budget is spent.
+
+Usage:
+    python benchmarks/bench_context_assembly.py --turns 100000 --budget 4000 --counter tiktoken
+"""
+
+import argparse
+import logging
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+# Make the framework importable as a package, as project_main.py does
+framework_root = Path(__file__).resolve().parent.parent
+sys.path.append(str(framework_root.parent))
+
+from ultimate_ai_architect_framework.agents.modules.memory_item import item_text
+from ultimate_ai_architect_framework.agents.modules.memory_manager import MemoryManager
+
+WORDS = "the agent asked the tool for the weather in paris and then summarized the answer for the user".split()
+
+
+def retokenize_window(manager: MemoryManager, budget: int):
+    """The uncached way: count every recent turn's text again on each call."""
+    remaining = budget
+    selected = []
+    for item in reversed(manager.search("conversation", {})):
+        tokens = manager.token_counter.count(item_text(item)) + manager.config["tokens_per_item"]
+        if tokens > remaining:
+            break
+        selected.append(item)
+        remaining -= tokens
+    return selected[::-1]
+
+
+def time_per_call(func, iterations: int) -> float:
+    """Return microseconds per call of func over iterations calls."""
+    start = time.perf_counter()
+    for _ in range(iterations):
+        func()
+    return (time.perf_counter() - start) / iterations * 1e6
+
+
+def main():
+    parser = argparse.ArgumentParser(description="MemoryManager context assembly benchmark")
+    parser.add_argument("--turns", type=int, default=100000, help="Conversation turns stored")
+    parser.add_argument("--budget", type=int, default=4000, help="Token budget")
+    parser.add_argument("--counter", choices=["approximate", "tiktoken"], default="approximate")
+    parser.add_argument("--iterations", type=int, default=200, help="Calls per measurement")
+    args = parser.parse_args()
+
+    logging.disable(logging.CRITICAL)
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        manager = MemoryManager("bench", {
+            "persistence_path": tmp_dir,
+            "vector_segments": ["knowledge"],
+            "token_counter": {"provider": args.counter},
+        })
+        start = time.perf_counter()
+        for i in range(args.turns):
+            words = " ".join(WORDS[: 5 + i % len(WORDS)])
+            manager.add("conversation", {"role": "user" if i % 2 else "assistant", "content": f"{i}: {words}"})
+        add_us = (time.perf_counter() - start) / args.turns * 1e6
+        for i in range(200):
+            manager.add("knowledge", f"fact {i}: {' '.join(WORDS[i % 7:i % 7 + 8])}")
+
+        context = manager.assemble_context(args.budget, query="weather in paris")
+        print(f"counter {manager.token_counter.name}: add() {add_us:.1f} us/turn including counting")
+        print(f"selected {len(context['conversation'])} turns + {len(context['knowledge'])} knowledge items, "
+              f"{context['tokens']} of {args.budget} tokens")
+
+        cached_us = time_per_call(lambda: manager.assemble_context(args.budget), args.iterations)
+        with_query_us = time_per_call(lambda: manager.assemble_context(args.budget, query="weather in paris"),
+                                      args.iterations)
+        scan_us = time_per_call(lambda: retokenize_window(manager, args.budget), max(1, args.iterations // 20))
+        print(f"{'assemble_context (cached counts)':<36} {cached_us:>10.0f} us")
+        print(f"{'assemble_context + knowledge recall':<36} {with_query_us:>10.0f} us")
+        print(f"{'search + re-tokenize per call':<36} {scan_us:>10.0f} us")
+        manager.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+"""
+Throughput benchmark: FlowiseClient batch execution against the local stub server.
+
+Starts benchmarks/flowise_stub_server.py in-process with a fixed per-request
+latency, then pushes the same inputs through:
+- run_flow() called sequentially (the previous one-at-a-time pattern)
+- run_flows() at several concurrency levels, ordered and as-completed
+- AsyncFlowiseClient.arun_flows()
+
+and prints requests per second for each.
+
+Usage:
+    python benchmarks/bench_flowise_throughput.py --requests 400 --latency 0.02
+"""
+
+import argparse
+import asyncio
+import logging
+import sys
+import time
+from pathlib import Path
+
+# Make the framework importable as a package, as project_main.py does
+framework_root = Path(__file__).resolve().parent.parent
+sys.path.append(str(framework_root.parent))
+sys.path.append(str(Path(__file__).resolve().parent))
+
+from ultimate_ai_architect_framework.core_modules.flowise_client import FlowiseClient, AsyncFlowiseClient
+from flowise_stub_server import start_stub_server
+
+ENDPOINT = "/api/v1/prediction/bench"
+
+
+def report(label: str, count: int, seconds: float, errors: int = 0) -> None:
+    """Print throughput for one measurement."""
+    print(f"{label:<36} {count / seconds:10.1f} req/s  ({seconds:6.2f}s, {errors} errors)")
+
+
+def count_errors(results) -> int:
+    return sum(1 for result in results if isinstance(result, Exception))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="FlowiseClient batch throughput benchmark")
+    parser.add_argument("--requests", type=int, default=400, help="Inputs per measurement")
+    parser.add_argument("--latency", type=float, default=0.02, help="Stub server latency per request (seconds)")
+    parser.add_argument("--concurrency", type=int, nargs="+", default=[1, 4, 16, 64], help="Concurrency levels")
+    args = parser.parse_args()
+
+    logging.disable(logging.CRITICAL)
+
+    server = start_stub_server(latency=args.latency)
+    base_url = f"http://127.0.0.1:{server.server_port}"
+    inputs = [{"question": f"question {i}"} for i in range(args.requests)]
+
+    try:
+        client = FlowiseClient(framework_root)
+        client.base_url = base_url
+
+        sequential = inputs[:max(1, args.requests // 10)]
+        start = time.perf_counter()
+        results = [client.run_flow(ENDPOINT, input_data) for input_data in sequential]
+        report("run_flow() sequential", len(sequential), time.perf_counter() - start, count_errors(results))
+
+        for concurrency in args.concurrency:
+            start = time.perf_counter()
+            results = client.run_flows(ENDPOINT, inputs, concurrency=concurrency)
+            report(f"run_flows() ordered, N={concurrency}", len(inputs), time.perf_counter() - start, count_errors(results))
+
+        concurrency = max(args.concurrency)
+        start = time.perf_counter()
+        results = [result for _, result in client.run_flows(ENDPOINT, inputs, concurrency=concurrency, ordered=False)]
+        report(f"run_flows() as-completed, N={concurrency}", len(inputs), time.perf_counter() - start, count_errors(results))
+
+        async def run_async():
+            async with AsyncFlowiseClient(framework_root) as async_client:
+                async_client.base_url = base_url
+                async_client.max_concurrency = concurrency
+                async_client.max_connections = concurrency
+                start = time.perf_counter()
+                results = await async_client.arun_flows(ENDPOINT, inputs)
+                report(f"arun_flows(), N={concurrency}", len(inputs), time.perf_counter() - start, count_errors(results))
+
+        try:
+            asyncio.run(run_async())
+        except ImportError as e:
+            print(f"Skipping async measurement: {e}")
+    finally:
+        server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
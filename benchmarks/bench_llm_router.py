@@ -0,0 +1,102 @@
+#!/usr/bin/env python3
+"""
+Microbenchmark: LLMRouter.route() hot path, fallback path and no-model path.
+
+Writes a temporary routing configuration, then times route() for:
+- hot path: the task's mapped model is available
+- fallback path: the task's mapped model is unavailable, so the fallback is used
+- no-model path: no provider has an API key, so route() returns the fallback anyway
+
+The per-call cost of _validate_model, which route() used to run on every call,
+is printed alongside for reference, together with the one-off compile cost.
+
+Usage:
+    python benchmarks/bench_llm_router.py --iterations 200000
+"""
+
+import argparse
+import logging
+import os
+import sys
+import tempfile
+import timeit
+from pathlib import Path
+
+import yaml
+
+# Make the framework importable as a package, as project_main.py does
+framework_root = Path(__file__).resolve().parent.parent
+sys.path.append(str(framework_root.parent))
+
+from ultimate_ai_architect_framework.core_modules.llm_router import LLMRouter
+
+BENCH_CONFIG = {
+    "routellm": {
+        "default_strategy": "balanced",
+        "fallback_model": "openrouter.anthropic/claude-3-haiku",
+        "task_model_mapping": {
+            "code_generation": "openrouter.anthropic/claude-3-sonnet",
+            "creative_writing": "google.gemini-pro",
+            "reasoning": "openrouter.anthropic/claude-3-opus",
+        },
+    },
+    "llm_providers": {
+        "openrouter": {
+            "enabled": True,
+            "api_key_env": "BENCH_OPENROUTER_KEY",
+            "default_model": "anthropic/claude-3-haiku",
+            "available_models": ["anthropic/claude-3-haiku", "anthropic/claude-3-sonnet", "anthropic/claude-3-opus"],
+        },
+        "google": {
+            "enabled": True,
+            "api_key_env": "BENCH_GOOGLE_KEY",
+            "default_model": "gemini-pro",
+            "available_models": ["gemini-pro"],
+        },
+    },
+}
+
+
+def time_call(label: str, func, iterations: int) -> None:
+    """Time func over iterations calls and print ns per call."""
+    seconds = timeit.timeit(func, number=iterations)
+    print(f"{label:<38} {seconds / iterations * 1e9:10.1f} ns/call")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="LLMRouter.route() microbenchmark")
+    parser.add_argument("--iterations", type=int, default=200000, help="Calls per measurement")
+    args = parser.parse_args()
+
+    logging.disable(logging.CRITICAL)
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        config_path = os.path.join(tmp_dir, "global_settings.yaml")
+        with open(config_path, "w") as f:
+            yaml.dump(BENCH_CONFIG, f)
+
+        # Hot and fallback paths: only OpenRouter has a key, so the Google mapping falls back
+        os.environ["BENCH_OPENROUTER_KEY"] = "bench"
+        os.environ.pop("BENCH_GOOGLE_KEY", None)
+        router = LLMRouter(config_path)
+
+        compile_seconds = timeit.timeit(router._compile_routing_table, number=100) / 100
+        print(f"{'compile routing table':<38} {compile_seconds * 1e6:10.1f} us/compile")
+
+        time_call("route() hot path", lambda: router.route("code_generation"), args.iterations)
+        time_call("route() fallback path", lambda: router.route("creative_writing"), args.iterations)
+        time_call("route() unknown task", lambda: router.route("unknown_task"), args.iterations)
+        time_call("_validate_model() (old per-call cost)",
+                  lambda: router._validate_model("openrouter.anthropic/claude-3-sonnet"), args.iterations)
+
+        watched = LLMRouter(config_path, refresh_interval=1.0)
+        time_call("route() hot path, mtime watch on", lambda: watched.route("code_generation"), args.iterations)
+
+        # No-model path: no provider has a key
+        os.environ.pop("BENCH_OPENROUTER_KEY", None)
+        router.refresh()
+        time_call("route() no-model path", lambda: router.route("code_generation"), args.iterations)
+
+
+if __name__ == "__main__":
+    main()
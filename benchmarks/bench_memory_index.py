@@ -0,0 +1,102 @@
+#!/usr/bin/env python3
+"""
+Benchmark: MemoryManager.get() and search() with the id and secondary indexes.
+
+For each size, writes a long-term 'knowledge' segment of N items to a temporary
+persistence directory, loads it into a MemoryManager with indexes on
+metadata.user_id and metadata.type, and times:
+- get() by id (hash index) against the previous linear scan over all segments
+- search() on an indexed field (bucket lookup)
+- search() on an unindexed field (full scan, the previous behaviour for every query)
+
+Usage:
+    python benchmarks/bench_memory_index.py --sizes 10000 100000 1000000
+"""
+
+import argparse
+import json
+import logging
+import os
+import random
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+# Make the framework importable as a package, as project_main.py does
+framework_root = Path(__file__).resolve().parent.parent
+sys.path.append(str(framework_root.parent))
+
+from ultimate_ai_architect_framework.agents.modules.memory_manager import MemoryManager
+
+
+def write_segment(path: str, size: int) -> list:
+    """Write a legacy {segment}.json file with size items and return their ids."""
+    items = [
+        {
+            "id": f"knowledge_{i}",
+            "timestamp": f"2024-01-01T00:00:00.{i:06d}",
+            "data": f"fact number {i}",
+            "metadata": {"user_id": i % 1000, "type": f"type_{i % 10}", "topic": f"topic_{i % 500}"}
+        }
+        for i in range(size)
+    ]
+    with open(os.path.join(path, "knowledge.json"), "w") as f:
+        json.dump(items, f)
+    return [item["id"] for item in items]
+
+
+def linear_get(manager: MemoryManager, memory_id: str):
+    """The pre-index get(): scan every short-term and long-term segment."""
+    for tier in (manager.short_term, manager.long_term_store.items):
+        for segment in tier:
+            for item in tier[segment]:
+                if item["id"] == memory_id:
+                    return item
+    return None
+
+
+def time_per_call(func, iterations: int) -> float:
+    """Return microseconds per call of func over iterations calls."""
+    start = time.perf_counter()
+    for _ in range(iterations):
+        func()
+    return (time.perf_counter() - start) / iterations * 1e6
+
+
+def main():
+    parser = argparse.ArgumentParser(description="MemoryManager index benchmark")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10000, 100000, 1000000], help="Long-term items")
+    parser.add_argument("--iterations", type=int, default=2000, help="Lookups per measurement")
+    args = parser.parse_args()
+
+    logging.disable(logging.CRITICAL)
+    rng = random.Random(0)
+
+    print(f"{'items':>9} {'load s':>8} {'get us':>9} {'scan get us':>12} {'indexed search us':>18} {'unindexed search us':>20}")
+    for size in args.sizes:
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            ids = write_segment(tmp_dir, size)
+
+            start = time.perf_counter()
+            manager = MemoryManager("bench", {
+                "persistence_path": tmp_dir,
+                "indexed_fields": ["metadata.user_id", "metadata.type"]
+            })
+            load_seconds = time.perf_counter() - start
+
+            get_us = time_per_call(lambda: manager.get(rng.choice(ids)), args.iterations)
+            scan_iterations = max(1, args.iterations * 1000 // size)
+            scan_get_us = time_per_call(lambda: linear_get(manager, rng.choice(ids)), scan_iterations)
+            indexed_us = time_per_call(
+                lambda: manager.search("knowledge", {"metadata.user_id": rng.randrange(1000)}), args.iterations
+            )
+            unindexed_us = time_per_call(
+                lambda: manager.search("knowledge", {"metadata.topic": f"topic_{rng.randrange(500)}"}), scan_iterations
+            )
+
+            print(f"{size:>9} {load_seconds:>8.2f} {get_us:>9.2f} {scan_get_us:>12.1f} {indexed_us:>18.2f} {unindexed_us:>20.1f}")
+
+
+if __name__ == "__main__":
+    main()
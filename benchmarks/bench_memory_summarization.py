@@ -0,0 +1,78 @@
+#!/usr/bin/env python3
+"""
+Benchmark: long-term memory size and search cost before and after summarization.
+
+Fills the conversation segment with N turns, then runs compact_long_term()
+with a size threshold and compares long-term item count, segment log size,
+search() latency and the time the compaction pass took.
+
+Usage:
+    python benchmarks/bench_memory_summarization.py --turns 200000 --max-items 10000
+"""
+
+import argparse
+import logging
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+# Make the framework importable as a package, as project_main.py does
+framework_root = Path(__file__).resolve().parent.parent
+sys.path.append(str(framework_root.parent))
+
+from ultimate_ai_architect_framework.agents.modules.memory_manager import MemoryManager
+
+
+def time_per_call(func, iterations: int) -> float:
+    """Return milliseconds per call of func over iterations calls."""
+    start = time.perf_counter()
+    for _ in range(iterations):
+        func()
+    return (time.perf_counter() - start) / iterations * 1e3
+
+
+def report(label: str, manager: MemoryManager, tmp_dir: str) -> None:
+    manager.sync()
+    log_bytes = os.path.getsize(os.path.join(tmp_dir, "conversation.jsonl"))
+    search_ms = time_per_call(lambda: manager.search("conversation", {"data.role": "user"}), 5)
+    print(f"{label:<22} {manager.long_term_store.count('conversation'):>10} {log_bytes / 1e6:>9.1f} {search_ms:>10.1f}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="MemoryManager summarization benchmark")
+    parser.add_argument("--turns", type=int, default=200000, help="Conversation turns added")
+    parser.add_argument("--max-items", type=int, default=10000, help="summarization_max_items")
+    parser.add_argument("--chunk-size", type=int, default=50, help="summarization_chunk_size")
+    args = parser.parse_args()
+
+    logging.disable(logging.CRITICAL)
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        manager = MemoryManager("bench", {
+            "persistence_path": tmp_dir,
+            "summarization_enabled": True,
+            "summarization_background": False,
+            "summarization_max_items": args.max_items,
+            "summarization_chunk_size": args.chunk_size,
+        })
+        for i in range(args.turns):
+            role = "user" if i % 2 else "assistant"
+            manager.add("conversation", {"role": role, "content": f"Turn {i}. The user asked about order {i % 97}."})
+
+        print(f"{'':<22} {'long-term':>10} {'log MB':>9} {'search ms':>10}")
+        report("before", manager, tmp_dir)
+
+        start = time.perf_counter()
+        folded = manager.compact_long_term()
+        seconds = time.perf_counter() - start
+        report("after", manager, tmp_dir)
+
+        cold_bytes = os.path.getsize(os.path.join(tmp_dir, "cold_storage.jsonl"))
+        print(f"\nfolded {folded} items in {seconds:.2f} s ({folded / seconds:.0f} items/s); "
+              f"cold storage {cold_bytes / 1e6:.1f} MB")
+        manager.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,74 @@
+#!/usr/bin/env python3
+"""
+Benchmark: MemoryManager.add() throughput with a full short-term window.
+
+Every add past the window evicts the oldest item, so this measures the
+steady-state cost of append + evict + (optionally) persisting evictions:
+- without persistence (evicted items are dropped)
+- with persistence, writing evictions one at a time and in batches
+- the bare window structures: the previous list.pop(0) against the deque
+
+Usage:
+    python benchmarks/bench_memory_throughput.py --items 1000000 --window 10000
+"""
+
+import argparse
+import logging
+import sys
+import tempfile
+import time
+from collections import deque
+from pathlib import Path
+
+# Make the framework importable as a package, as project_main.py does
+framework_root = Path(__file__).resolve().parent.parent
+sys.path.append(str(framework_root.parent))
+
+from ultimate_ai_architect_framework.agents.modules.memory_manager import MemoryManager
+
+
+def run_manager(label: str, items: int, config: dict) -> None:
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        manager = MemoryManager("bench", {"persistence_path": tmp_dir, **config})
+        start = time.perf_counter()
+        for i in range(items):
+            manager.add("conversation", f"turn {i}")
+        manager.close()
+        seconds = time.perf_counter() - start
+        print(f"{label:<36} {items / seconds:12.0f} adds/s")
+
+
+def run_window(label: str, items: int, window: int, short_term, evict) -> None:
+    """Append + evict on a bare window structure, without the rest of add()."""
+    start = time.perf_counter()
+    for i in range(items):
+        if len(short_term) >= window:
+            evict()
+        short_term.append(i)
+    seconds = time.perf_counter() - start
+    print(f"{label:<36} {items / seconds:12.0f} adds/s")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="MemoryManager add() throughput benchmark")
+    parser.add_argument("--items", type=int, default=1000000, help="Items added per measurement")
+    parser.add_argument("--window", type=int, default=10000, help="max_short_term_items")
+    args = parser.parse_args()
+
+    logging.disable(logging.CRITICAL)
+    window = {"max_short_term_items": args.window}
+
+    run_manager("no persistence", args.items, {**window, "persistence_enabled": False})
+    run_manager("persistence, batches of 100", args.items, {**window, "eviction_batch_size": 100})
+    run_manager("persistence, one eviction per write", args.items // 10, {**window, "eviction_batch_size": 1})
+
+    # The window structures alone: the previous list.pop(0) against the deque
+    for size in (args.window, args.window * 10):
+        short_term = []
+        run_window(f"list.pop(0), window {size}", args.items, size, short_term, lambda: short_term.pop(0))
+        ring = deque()
+        run_window(f"deque.popleft(), window {size}", args.items, size, ring, ring.popleft)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,84 @@
+#!/usr/bin/env python3
+"""
+Benchmark: time-range and most-recent-k queries over MemoryManager.
+
+Writes a long-term segment log of N items one second apart, loads it with the
+in-memory and SQLite backends, and compares recent() and time_range() with
+the previous approach of a full search() followed by sorting by timestamp.
+
+Usage:
+    python benchmarks/bench_memory_time_queries.py --sizes 10000 100000 1000000
+"""
+
+import argparse
+import json
+import logging
+import os
+import random
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+# Make the framework importable as a package, as project_main.py does
+framework_root = Path(__file__).resolve().parent.parent
+sys.path.append(str(framework_root.parent))
+
+from ultimate_ai_architect_framework.agents.modules.memory_item import new_ulid
+from ultimate_ai_architect_framework.agents.modules.memory_manager import MemoryManager
+
+START = 1_700_000_000.0
+
+
+def write_log(path: str, size: int) -> None:
+    with open(os.path.join(path, "conversation.jsonl"), "w") as f:
+        for i in range(size):
+            item = {"id": new_ulid(), "timestamp": START + i, "data": f"turn {i}", "metadata": {}}
+            f.write(json.dumps({"op": "put", "item": item}) + "\n")
+
+
+def time_per_call(func, iterations: int) -> float:
+    """Return microseconds per call of func over iterations calls."""
+    start = time.perf_counter()
+    for _ in range(iterations):
+        func()
+    return (time.perf_counter() - start) / iterations * 1e6
+
+
+def scan_recent(manager: MemoryManager, k: int):
+    """The previous way: fetch everything, then sort by timestamp in the caller."""
+    return sorted(manager.search("conversation", {}), key=lambda item: item["timestamp"])[-k:]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="MemoryManager time query benchmark")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10000, 100000, 1000000], help="Long-term items")
+    parser.add_argument("--iterations", type=int, default=1000, help="Queries per measurement")
+    args = parser.parse_args()
+
+    logging.disable(logging.CRITICAL)
+    rng = random.Random(0)
+
+    print(f"{'backend':<8} {'items':>9} {'recent(10) us':>14} {'1h range us':>12} {'scan+sort us':>13}")
+    for size in args.sizes:
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            write_log(tmp_dir, size)
+            for backend in ("memory", "sqlite"):
+                manager = MemoryManager("bench", {"persistence_path": tmp_dir, "long_term_backend": backend})
+
+                recent_us = time_per_call(lambda: manager.recent("conversation", 10), args.iterations)
+
+                def hour_window():
+                    start = START + rng.randrange(max(1, size - 3600))
+                    return manager.time_range("conversation", start, start + 3600)
+                range_us = time_per_call(hour_window, max(1, args.iterations // 10))
+
+                scan_iterations = max(1, args.iterations * 1000 // size // 10)
+                scan_us = time_per_call(lambda: scan_recent(manager, 10), scan_iterations)
+
+                print(f"{backend:<8} {size:>9} {recent_us:>14.1f} {range_us:>12.1f} {scan_us:>13.0f}")
+                manager.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+"""
+Benchmark: ToolHandler construction with eager and lazy tool loading.
+
+Writes a framework root whose tool registry lists the framework's bundled
+tools, then constructs a ToolHandler with each mode in a fresh interpreter,
+so module imports are not shared between measurements. Prints construction
+time, the time of the first execute/get of one tool, and the per-tool load
+report.
+
+Usage:
+    python benchmarks/bench_tool_startup.py
+"""
+
+import argparse
+import json
+import shutil
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+
+import yaml
+
+# Make the framework importable as a package, as project_main.py does
+framework_root = Path(__file__).resolve().parent.parent
+sys.path.append(str(framework_root.parent))
+
+TOOLS = {
+    "vector_db": ("ultimate_ai_architect_framework.core_modules.tools.vector_db_tool", "VectorDBTool"),
+    "file_operations": ("ultimate_ai_architect_framework.core_modules.tools.file_operations_tool", "FileOperationsTool"),
+    "code_execution": ("ultimate_ai_architect_framework.core_modules.tools.code_execution_tool", "CodeExecutionTool"),
+    "web_search": ("ultimate_ai_architect_framework.core_modules.tools.web_search_tool", "WebSearchTool"),
+}
+
+# Runs in the child interpreter
+CHILD = """
+import json, logging, sys, time
+sys.path.append({package_parent!r})
+logging.disable(logging.CRITICAL)
+start = time.perf_counter()
+from ultimate_ai_architect_framework.core_modules.tool_handler import ToolHandler
+handler = ToolHandler({root!r}, lazy_loading={lazy})
+constructed = time.perf_counter()
+handler.get_tool("file_operations")
+first_use = time.perf_counter()
+print(json.dumps({{
+    "construct_ms": (constructed - start) * 1000,
+    "first_use_ms": (first_use - constructed) * 1000,
+    "modules": len(sys.modules),
+    "report": handler.get_load_report(),
+}}))
+"""
+
+
+def write_root(root: Path) -> None:
+    configs = root / "configs"
+    configs.mkdir(parents=True)
+    shutil.copy(framework_root / "configs" / "global_settings.yaml", configs / "global_settings.yaml")
+    registry = {
+        "tools": {
+            tool_id: {"name": tool_id, "implementation": {"module": module, "class": class_name}}
+            for tool_id, (module, class_name) in TOOLS.items()
+        }
+    }
+    with open(configs / "tool_registry.yaml", "w") as f:
+        yaml.safe_dump(registry, f)
+
+
+def run(root: Path, lazy: bool) -> dict:
+    code = CHILD.format(package_parent=str(framework_root.parent), root=str(root), lazy=lazy)
+    output = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True).stdout
+    return json.loads(output.strip().splitlines()[-1])
+
+
+def main():
+    argparse.ArgumentParser(description="ToolHandler startup benchmark").parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        root = Path(tmp_dir)
+        write_root(root)
+        for label, lazy in (("eager", False), ("lazy", True)):
+            result = run(root, lazy)
+            print(f"{label:<6} construct {result['construct_ms']:8.1f} ms   "
+                  f"first get_tool {result['first_use_ms']:7.1f} ms   modules loaded {result['modules']}")
+            for entry in result["report"]:
+                if entry["error"]:
+                    status = f"failed: {entry['error']}"
+                elif entry["loaded"]:
+                    status = f"import {entry['import_ms']:7.1f} ms, init {entry['init_ms']:6.2f} ms"
+                else:
+                    status = "not loaded"
+                print(f"    {entry['id']:<16} {status}")
+
+
+if __name__ == "__main__":
+    main()
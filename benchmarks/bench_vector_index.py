@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+"""
+Benchmark: recall and QPS of the flat and IVF vector indexes.
+
+Builds both indexes over the same synthetic clustered embeddings, measures
+single-query throughput and recall@k of IVF against the exact flat results
+for several n_probe values, and times a memory-mapped load of the saved IVF
+index.
+
+Usage:
+    python benchmarks/bench_vector_index.py --size 1000000 --dimension 128
+"""
+
+import argparse
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import numpy as np
+
+# Make the framework importable as a package, as project_main.py does
+framework_root = Path(__file__).resolve().parent.parent
+sys.path.append(str(framework_root.parent))
+
+from ultimate_ai_architect_framework.core_modules.vector_index import FlatIndex, IVFIndex, load_index
+
+
+def make_data(size: int, dimension: int, queries: int, seed: int = 0):
+    """Clustered vectors, like real embeddings, plus queries drawn near them."""
+    rng = np.random.default_rng(seed)
+    centers = rng.standard_normal((max(1, size // 1000), dimension)).astype(np.float32)
+    vectors = centers[rng.integers(0, len(centers), size)]
+    vectors += 0.6 * rng.standard_normal((size, dimension)).astype(np.float32)
+    query_vectors = vectors[rng.integers(0, size, queries)]
+    query_vectors = query_vectors + 0.3 * rng.standard_normal(query_vectors.shape).astype(np.float32)
+    return vectors, query_vectors
+
+
+def run_queries(index, query_vectors, k):
+    start = time.perf_counter()
+    results = [[hit["id"] for hit in index.query(q, k)] for q in query_vectors]
+    return results, len(query_vectors) / (time.perf_counter() - start)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Vector index recall/QPS benchmark")
+    parser.add_argument("--size", type=int, default=200000, help="Indexed vectors")
+    parser.add_argument("--dimension", type=int, default=128, help="Vector dimension")
+    parser.add_argument("--queries", type=int, default=200, help="Queries per measurement")
+    parser.add_argument("--k", type=int, default=10, help="Results per query")
+    parser.add_argument("--n-lists", type=int, default=None, help="IVF lists (default 4 * sqrt(size))")
+    parser.add_argument("--n-probe", type=int, nargs="+", default=[4, 8, 16, 32], help="IVF n_probe values")
+    args = parser.parse_args()
+
+    n_lists = args.n_lists or int(4 * np.sqrt(args.size))
+    vectors, query_vectors = make_data(args.size, args.dimension, args.queries)
+    ids = [str(i) for i in range(args.size)]
+
+    flat = FlatIndex(args.dimension, initial_capacity=args.size)
+    start = time.perf_counter()
+    flat.upsert(ids, vectors)
+    print(f"flat build: {time.perf_counter() - start:.2f}s")
+
+    ivf = IVFIndex(args.dimension, n_lists=n_lists, train_threshold=0, initial_capacity=args.size)
+    start = time.perf_counter()
+    ivf.upsert(ids, vectors)
+    ivf.train()
+    print(f"ivf build ({n_lists} lists): {time.perf_counter() - start:.2f}s")
+
+    exact, flat_qps = run_queries(flat, query_vectors, args.k)
+    print(f"\n{'index':<18} {'QPS':>9} {'recall@' + str(args.k):>10}")
+    print(f"{'flat':<18} {flat_qps:>9.0f} {1.0:>10.3f}")
+    for n_probe in args.n_probe:
+        ivf.n_probe = n_probe
+        approximate, qps = run_queries(ivf, query_vectors, args.k)
+        recall = np.mean([len(set(a) & set(e)) / args.k for a, e in zip(approximate, exact)])
+        print(f"{'ivf n_probe=' + str(n_probe):<18} {qps:>9.0f} {recall:>10.3f}")
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        ivf.save(tmp_dir)
+        start = time.perf_counter()
+        loaded = load_index(tmp_dir, mmap=True)
+        load_seconds = time.perf_counter() - start
+        _, mmap_qps = run_queries(loaded, query_vectors, args.k)
+        print(f"\nmmap load: {load_seconds:.2f}s, first-pass QPS {mmap_qps:.0f}")
+
+
+if __name__ == "__main__":
+    main()
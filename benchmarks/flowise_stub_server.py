@@ -0,0 +1,181 @@
+#!/usr/bin/env python3
+"""
+Local stub of the Flowise prediction API for exercising FlowiseClient and
+AsyncFlowiseClient without a Flowise installation.
+
+POST /api/v1/prediction/<flow_id> echoes the question:
+- without "streaming": true, responds with JSON {"text": ..., "chatId": ...}
+- with "streaming": true, responds with a Server-Sent Events stream of token
+  events, a metadata event and an end event. The body is written in small
+  byte-sized pieces so multi-byte UTF-8 characters and SSE lines are split
+  across network reads.
+
+Flows whose id starts with "error" respond with HTTP 500. Flows whose id starts
+with "flaky" respond with HTTP 503 and "Retry-After: 0" to the first two attempts
+of a request, identified by its Idempotency-Key or, without one, by flow and
+body. The --latency option adds a fixed delay before each response. The handler
+class records the highest number of requests handled at once in max_in_flight
+(see start_stub_server).
+
+Usage:
+    python benchmarks/flowise_stub_server.py --port 3001 --latency 0.05
+
+Or from Python:
+    server = start_stub_server(port=0)
+    base_url = f"http://127.0.0.1:{server.server_port}"
+    ...
+    server.shutdown()
+"""
+
+import argparse
+import json
+import threading
+import time
+import uuid
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+PREDICTION_PREFIX = "/api/v1/prediction/"
+
+
+class FlowiseStubHandler(BaseHTTPRequestHandler):
+    """Request handler implementing the stubbed prediction endpoint."""
+
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True
+    latency = 0.0
+    chunk_size = 7
+    flaky_failures = 2
+
+    # Attempts seen per request for "flaky" flows
+    attempts_by_key = {}
+    attempts_lock = threading.Lock()
+
+    # Requests being handled now, and the most handled at once
+    in_flight = 0
+    max_in_flight = 0
+
+    def log_message(self, format, *args):
+        pass
+
+    def _send_json(self, status: int, payload, headers=None) -> None:
+        body = json.dumps(payload).encode("utf-8")
+        self.send_response(status)
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _track_in_flight(self, delta: int) -> None:
+        cls = type(self)
+        with cls.attempts_lock:
+            cls.in_flight += delta
+            cls.max_in_flight = max(cls.max_in_flight, cls.in_flight)
+
+    def do_POST(self):
+        self._track_in_flight(1)
+        try:
+            self._handle_prediction()
+        finally:
+            self._track_in_flight(-1)
+
+    def _handle_prediction(self):
+        if not self.path.startswith(PREDICTION_PREFIX):
+            self._send_json(404, {"message": f"Unknown path {self.path}"})
+            return
+
+        length = int(self.headers.get("Content-Length", 0))
+        body = self.rfile.read(length)
+        try:
+            payload = json.loads(body or b"{}")
+        except ValueError:
+            self._send_json(400, {"message": "Invalid JSON body"})
+            return
+
+        if self.latency:
+            time.sleep(self.latency)
+
+        flow_id = self.path[len(PREDICTION_PREFIX):]
+        if flow_id.startswith("error"):
+            self._send_json(500, {"message": f"Flow {flow_id} failed"})
+            return
+        if flow_id.startswith("flaky"):
+            key = self.headers.get("Idempotency-Key") or f"{flow_id}:{body.decode('utf-8', 'replace')}"
+            with self.attempts_lock:
+                attempts = self.attempts_by_key.get(key, 0) + 1
+                self.attempts_by_key[key] = attempts
+            if attempts <= self.flaky_failures:
+                self._send_json(503, {"message": "Service unavailable"}, {"Retry-After": "0"})
+                return
+
+        answer = f"Echo: {payload.get('question', '')}"
+        chat_id = str(uuid.uuid4())
+        if payload.get("streaming"):
+            self._send_stream(answer, chat_id)
+        else:
+            self._send_json(200, {"text": answer, "chatId": chat_id})
+
+    def _send_stream(self, answer: str, chat_id: str) -> None:
+        events = [("start", "")]
+        events += [("token", token) for token in answer.split(" ")]
+        events.append(("metadata", json.dumps({"chatId": chat_id})))
+        events.append(("end", "[DONE]"))
+        body = "".join(f"event: {name}\ndata: {data}\n\n" for name, data in events).encode("utf-8")
+
+        self.send_response(200)
+        self.send_header("Content-Type", "text/event-stream")
+        self.send_header("Cache-Control", "no-cache")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        for start in range(0, len(body), self.chunk_size):
+            self.wfile.write(body[start:start + self.chunk_size])
+            self.wfile.flush()
+
+
+def start_stub_server(host: str = "127.0.0.1", port: int = 0, latency: float = 0.0) -> ThreadingHTTPServer:
+    """
+    Start the stub server on a background thread.
+
+    Args:
+        host: Interface to bind
+        port: Port to bind (0 picks a free port; see server.server_port)
+        latency: Seconds to wait before each response
+
+    Returns:
+        The running server; call shutdown() to stop it. Its RequestHandlerClass
+        holds the server's own attempt counts and max_in_flight.
+    """
+    handler = type("ConfiguredFlowiseStubHandler", (FlowiseStubHandler,), {
+        "latency": latency,
+        "attempts_by_key": {},
+        "attempts_lock": threading.Lock(),
+    })
+    server = ThreadingHTTPServer((host, port), handler)
+    server.daemon_threads = True
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    return server
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Stub Flowise prediction API")
+    parser.add_argument("--host", default="127.0.0.1", help="Interface to bind")
+    parser.add_argument("--port", type=int, default=3001, help="Port to bind")
+    parser.add_argument("--latency", type=float, default=0.0, help="Seconds to wait before each response")
+    args = parser.parse_args()
+
+    handler = type("ConfiguredFlowiseStubHandler", (FlowiseStubHandler,), {"latency": args.latency})
+    server = ThreadingHTTPServer((args.host, args.port), handler)
+    server.daemon_threads = True
+    print(f"Flowise stub listening on http://{args.host}:{server.server_port}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+
+if __name__ == "__main__":
+    main()
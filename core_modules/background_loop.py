@@ -0,0 +1,88 @@
+"""
+Background Event Loop Module
+
+This module provides the BackgroundEventLoop class, a single asyncio event loop
+running on a daemon thread. Synchronous code submits coroutines to it instead of
+calling asyncio.run(), which creates and closes a new loop every time. Async
+clients shared across calls (such as pooled LLM clients and their HTTP sessions)
+stay bound to one loop that is never closed under them.
+"""
+
+import asyncio
+import logging
+import threading
+from typing import Any, Coroutine, Optional
+
+logger = logging.getLogger("core.background_loop")
+
+
+class BackgroundEventLoop:
+    """
+    An asyncio event loop running forever on a daemon thread.
+
+    The loop and its thread are started on the first run() call. run() may be
+    called from any thread except the loop's own.
+    """
+
+    def __init__(self, name: str = "background-loop"):
+        """
+        Initialize a new BackgroundEventLoop instance.
+
+        Args:
+            name: Name of the loop's thread
+        """
+        self.name = name
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._thread: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+
+    def _get_loop(self) -> asyncio.AbstractEventLoop:
+        """Start the loop thread if needed and return the loop."""
+        with self._lock:
+            if self._loop is None or self._loop.is_closed():
+                loop = asyncio.new_event_loop()
+                self._thread = threading.Thread(target=self._serve, args=(loop,), name=self.name, daemon=True)
+                self._thread.start()
+                self._loop = loop
+                logger.debug(f"Started event loop thread {self.name}")
+            return self._loop
+
+    @staticmethod
+    def _serve(loop: asyncio.AbstractEventLoop) -> None:
+        asyncio.set_event_loop(loop)
+        try:
+            loop.run_forever()
+        finally:
+            loop.close()
+
+    def run(self, coro: Coroutine[Any, Any, Any], timeout: Optional[float] = None) -> Any:
+        """
+        Run a coroutine on the loop and wait for its result.
+
+        Args:
+            coro: The coroutine to run
+            timeout: Seconds to wait, or None to wait indefinitely
+
+        Returns:
+            The coroutine's result
+
+        Raises:
+            RuntimeError: If called from the loop's own thread
+            Exception: Whatever the coroutine raised
+        """
+        if self._thread is not None and threading.current_thread() is self._thread:
+            coro.close()
+            raise RuntimeError("BackgroundEventLoop.run() cannot be called from the loop's own thread")
+        future = asyncio.run_coroutine_threadsafe(coro, self._get_loop())
+        return future.result(timeout)
+
+    def close(self) -> None:
+        """Stop the loop and wait for its thread to exit; a later run() starts a new one."""
+        with self._lock:
+            loop, thread = self._loop, self._thread
+            self._loop = None
+            self._thread = None
+        if loop is not None and not loop.is_closed():
+            loop.call_soon_threadsafe(loop.stop)
+        if thread is not None:
+            thread.join()
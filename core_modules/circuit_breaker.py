@@ -0,0 +1,210 @@
+"""
+Circuit Breaker Module
+
+This module provides the CircuitBreaker class used to stop sending requests to an
+LLM provider that is failing or too slow. A breaker is closed while the provider
+is healthy, opens when the recent failure or slow-call rate crosses a threshold,
+and after a cool-down lets a few trial calls through (half-open) to decide
+whether to close again.
+"""
+
+import logging
+import threading
+import time
+from collections import deque
+from typing import Dict, Any, Callable, Optional
+
+logger = logging.getLogger("core.circuit_breaker")
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+
+class CircuitBreaker:
+    """
+    Thread-safe closed/open/half-open circuit breaker driven by failure rate and latency.
+
+    Outcomes are kept in a rolling window of the last window_size calls. Once
+    at least min_calls are recorded, the breaker opens if the failure rate
+    reaches failure_rate_threshold or, when slow_call_duration is set, the
+    fraction of calls slower than it reaches slow_call_rate_threshold. After
+    open_duration seconds the breaker goes half-open and grants up to
+    half_open_max_calls trial requests. It closes if they all succeed, and
+    re-opens on the first failing or slow trial.
+    """
+
+    def __init__(self,
+                 name: str,
+                 failure_rate_threshold: float = 0.5,
+                 slow_call_duration: Optional[float] = None,
+                 slow_call_rate_threshold: float = 0.8,
+                 window_size: int = 20,
+                 min_calls: int = 5,
+                 open_duration: float = 30.0,
+                 half_open_max_calls: int = 1,
+                 clock: Callable[[], float] = time.monotonic):
+        """
+        Initialize a new CircuitBreaker in the closed state.
+
+        Args:
+            name: Name used in log messages (typically the provider name)
+            failure_rate_threshold: Failure fraction at which the breaker opens
+            slow_call_duration: Seconds above which a call counts as slow, or
+                None to ignore latency
+            slow_call_rate_threshold: Slow-call fraction at which the breaker opens
+            window_size: Number of recent calls considered
+            min_calls: Calls required in the window before the breaker can open
+            open_duration: Seconds to stay open before allowing trial calls
+            half_open_max_calls: Trial calls granted while half-open
+            clock: Monotonic time source (injectable for testing)
+        """
+        self.name = name
+        self.failure_rate_threshold = failure_rate_threshold
+        self.slow_call_duration = slow_call_duration
+        self.slow_call_rate_threshold = slow_call_rate_threshold
+        self.min_calls = max(1, int(min_calls))
+        self.open_duration = open_duration
+        self.half_open_max_calls = max(1, int(half_open_max_calls))
+        self._clock = clock
+
+        # Rolling window of (failed, slow) flags
+        self._window = deque(maxlen=max(1, int(window_size)))
+        self._state = CLOSED
+        self._opened_at = 0.0
+        self._trials_granted = 0
+        self._trial_successes = 0
+        self._lock = threading.Lock()
+
+    @property
+    def state(self) -> str:
+        """Current state: 'closed', 'open' or 'half_open'."""
+        with self._lock:
+            self._update_state()
+            return self._state
+
+    def _update_state(self) -> None:
+        """Move from open to half-open once the cool-down has elapsed (caller holds the lock)."""
+        if self._state == OPEN and self._clock() - self._opened_at >= self.open_duration:
+            self._state = HALF_OPEN
+            self._opened_at = self._clock()
+            self._trials_granted = 0
+            self._trial_successes = 0
+            logger.info(f"Circuit for '{self.name}' is half-open, allowing trial calls")
+        elif self._state == HALF_OPEN and self._clock() - self._opened_at >= self.open_duration:
+            # Granted trials never reported back; grant a fresh round
+            self._opened_at = self._clock()
+            self._trials_granted = 0
+
+    def is_available(self) -> bool:
+        """
+        Check, without consuming a trial slot, whether a request could be sent.
+
+        Returns:
+            True if the breaker is closed, or half-open with trial slots left
+        """
+        with self._lock:
+            self._update_state()
+            if self._state == CLOSED:
+                return True
+            if self._state == HALF_OPEN:
+                return self._trials_granted < self.half_open_max_calls
+            return False
+
+    def allow_request(self) -> bool:
+        """
+        Ask permission to send a request, consuming a trial slot when half-open.
+
+        Every granted request should be followed by record_success() or
+        record_failure().
+
+        Returns:
+            True if the request may be sent
+        """
+        with self._lock:
+            self._update_state()
+            if self._state == CLOSED:
+                return True
+            if self._state == HALF_OPEN and self._trials_granted < self.half_open_max_calls:
+                self._trials_granted += 1
+                return True
+            return False
+
+    def _is_slow(self, duration: Optional[float]) -> bool:
+        return self.slow_call_duration is not None and duration is not None and duration > self.slow_call_duration
+
+    def _open(self, reason: str) -> None:
+        """Trip the breaker (caller holds the lock)."""
+        self._state = OPEN
+        self._opened_at = self._clock()
+        self._window.clear()
+        logger.warning(f"Circuit for '{self.name}' opened: {reason}")
+
+    def record_success(self, duration: Optional[float] = None) -> None:
+        """
+        Record a successful call.
+
+        Args:
+            duration: Call duration in seconds
+        """
+        self._record(failed=False, duration=duration)
+
+    def record_failure(self, duration: Optional[float] = None) -> None:
+        """
+        Record a failed call.
+
+        Args:
+            duration: Call duration in seconds
+        """
+        self._record(failed=True, duration=duration)
+
+    def _record(self, failed: bool, duration: Optional[float]) -> None:
+        slow = self._is_slow(duration)
+        with self._lock:
+            self._update_state()
+
+            if self._state == HALF_OPEN:
+                if failed or slow:
+                    self._open("trial call failed" if failed else "trial call was slow")
+                    return
+                self._trial_successes += 1
+                if self._trial_successes >= self.half_open_max_calls:
+                    self._state = CLOSED
+                    self._window.clear()
+                    logger.info(f"Circuit for '{self.name}' closed after successful trial calls")
+                return
+
+            if self._state == OPEN:
+                # Late result from a call started before the breaker opened
+                return
+
+            self._window.append((failed, slow))
+            calls = len(self._window)
+            if calls < self.min_calls:
+                return
+            failure_rate = sum(1 for f, _ in self._window if f) / calls
+            if failure_rate >= self.failure_rate_threshold:
+                self._open(f"failure rate {failure_rate:.0%} over last {calls} calls")
+                return
+            if self.slow_call_duration is not None:
+                slow_rate = sum(1 for _, s in self._window if s) / calls
+                if slow_rate >= self.slow_call_rate_threshold:
+                    self._open(f"slow-call rate {slow_rate:.0%} over last {calls} calls")
+
+    def snapshot(self) -> Dict[str, Any]:
+        """
+        Get the breaker's current state and window statistics.
+
+        Returns:
+            Dictionary with name, state, calls, failure_rate and slow_call_rate
+        """
+        with self._lock:
+            self._update_state()
+            calls = len(self._window)
+            return {
+                "name": self.name,
+                "state": self._state,
+                "calls": calls,
+                "failure_rate": sum(1 for f, _ in self._window if f) / calls if calls else 0.0,
+                "slow_call_rate": sum(1 for _, s in self._window if s) / calls if calls else 0.0
+            }
@@ -5,15 +5,175 @@ This module provides the ConfigLoader class for loading and managing YAML
 configuration files throughout the framework.
 """
 
+import hashlib
 import logging
 import os
+import json
 import re
+import threading
 import yaml
-from typing import Dict, List, Any, Optional, Union
+from typing import Dict, List, Any, Callable, Optional, Tuple, Union
 from pathlib import Path
 
 logger = logging.getLogger("core.config_loader")
 
+# (mtime_ns, size, inode) of a config file, or None if it does not exist
+FileSignature = Optional[Tuple[int, int, int]]
+
+# Called with (config_key, file_path) when a config file changes
+ConfigListener = Callable[[str, Path], None]
+
+# LibYAML's C parser when PyYAML was built with it, about 10x faster than the
+# pure-Python SafeLoader; both construct the same safe types
+try:
+    from yaml import CSafeLoader as YAMLLoader
+except ImportError:
+    from yaml import SafeLoader as YAMLLoader
+
+
+def parse_yaml(stream: Any) -> Any:
+    """
+    Parse a YAML document with the fastest available safe loader.
+
+    Args:
+        stream: YAML text, bytes or an open file
+
+    Returns:
+        The parsed document
+
+    Raises:
+        yaml.YAMLError: If the document is malformed
+    """
+    return yaml.load(stream, Loader=YAMLLoader)
+
+
+def file_signature(file_path: Union[str, Path]) -> FileSignature:
+    """
+    Get a cheap change-detection signature for a file with a single stat call.
+
+    The inode catches files replaced by an atomic rename, which can keep the
+    modification time and size of the previous file.
+
+    Args:
+        file_path: Path to the file
+
+    Returns:
+        Tuple of (mtime_ns, size, inode), or None if the file cannot be stat'ed
+    """
+    try:
+        stat_result = os.stat(file_path)
+    except OSError:
+        return None
+    return (stat_result.st_mtime_ns, stat_result.st_size, stat_result.st_ino)
+
+class ConfigSnapshotCache:
+    """
+    On-disk cache of parsed YAML documents, keyed by a hash of their content.
+
+    Each snapshot is the parse result of one document stored as JSON, in
+    <sha256 of the content>.json, so a worker process that starts after a
+    config file was first parsed only reads and hashes the file. Edited files
+    hash differently and are parsed again; the oldest snapshots are removed
+    once the directory holds more than max_entries. Snapshots hold the
+    document before environment variable expansion, so environment changes
+    still apply.
+
+    Snapshots are plain data, so reading one cannot run code. Documents that
+    do not survive a JSON round trip unchanged (dates, non-string keys) are
+    not snapshotted and are always parsed.
+    """
+
+    # Bumped when the snapshot format or the parse result changes
+    FORMAT_VERSION = 2
+
+    def __init__(self, directory: Union[str, Path], max_entries: int = 256):
+        """
+        Initialize a new ConfigSnapshotCache instance.
+
+        Args:
+            directory: Directory holding the snapshots; created on first write
+            max_entries: Maximum number of snapshots kept
+        """
+        self.directory = Path(directory)
+        self.max_entries = max_entries
+
+    def _snapshot_path(self, content: bytes) -> Path:
+        digest = hashlib.sha256(content)
+        digest.update(f"|v{self.FORMAT_VERSION}|{YAMLLoader.__name__}".encode("utf-8"))
+        return self.directory / f"{digest.hexdigest()}.json"
+
+    def load(self, file_path: Union[str, Path]) -> Any:
+        """
+        Parse a YAML file, using its snapshot when one exists.
+
+        Args:
+            file_path: Path to the YAML file
+
+        Returns:
+            The parsed document
+
+        Raises:
+            OSError: If the file cannot be read
+            yaml.YAMLError: If the document is malformed
+        """
+        with open(file_path, "rb") as f:
+            content = f.read()
+        snapshot_path = self._snapshot_path(content)
+        try:
+            with open(snapshot_path, "rb") as f:
+                return json.loads(f.read())
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            logger.warning(f"Ignoring unreadable config snapshot {snapshot_path}: {e}")
+
+        data = parse_yaml(content)
+        self._write(snapshot_path, data)
+        return data
+
+    def _write(self, snapshot_path: Path, data: Any) -> None:
+        """Write a snapshot atomically; failures only cost a parse next time."""
+        try:
+            encoded = json.dumps(data, ensure_ascii=False, allow_nan=False)
+        except (TypeError, ValueError):
+            return
+        if json.loads(encoded) != data:
+            return
+        tmp_path = snapshot_path.with_name(f"{snapshot_path.name}.{os.getpid()}.tmp")
+        try:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                f.write(encoded)
+            os.replace(tmp_path, snapshot_path)
+            self._prune()
+        except Exception as e:
+            logger.debug(f"Could not write config snapshot {snapshot_path}: {e}")
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
+
+    def _prune(self) -> None:
+        """Remove the least recently written snapshots beyond max_entries."""
+        snapshots = list(self.directory.glob("*.json"))
+        if len(snapshots) <= self.max_entries:
+            return
+        snapshots.sort(key=lambda path: path.stat().st_mtime)
+        for path in snapshots[:len(snapshots) - self.max_entries]:
+            try:
+                path.unlink()
+            except OSError:
+                pass
+
+    def clear(self) -> None:
+        """Remove every snapshot."""
+        for path in self.directory.glob("*.json"):
+            try:
+                path.unlink()
+            except OSError:
+                pass
+
+
 class ConfigLoader:
     """
     Loads and manages YAML configuration files for the framework and projects.
@@ -24,29 +184,69 @@ class ConfigLoader:
     - Tool registry (tool_registry.yaml)
     - Project-specific settings (projects/<project_name>/configs/project_settings.yaml)
     - Project-specific agent config (projects/<project_name>/configs/agent_config.yaml)
-    - Caching loaded configurations
+    - Caching loaded configurations, revalidated against each file's
+      mtime, size and inode with a stat call on every read
+    - Optionally watching config files from a background thread and
+      notifying subscribers (such as LLMRouter and ToolHandler) of changes
+    - Parsing with LibYAML's C loader when available, and optionally reusing
+      parsed documents across processes through an on-disk snapshot cache
     - Environment variable expansion for values like ${VAR_NAME}
     - Converting relative paths to absolute paths
     - Saving configurations back to files
     - Merging global and project configurations
     """
 
-    def __init__(self, framework_root: str):
+    def __init__(self, framework_root: str, snapshot_dir: Optional[str] = None, use_snapshots: bool = False):
         """
         Initialize a new ConfigLoader instance.
 
         Args:
             framework_root: Absolute path to the framework root directory.
+            snapshot_dir: Directory for parsed-config snapshots. Defaults to
+                data/config_snapshots under the framework root.
+            use_snapshots: Whether to use the snapshot cache (see enable_snapshots).
         """
         self.framework_root = Path(os.path.expanduser(framework_root)).resolve()  # Ensure absolute path
         self.configs_dir = self.framework_root / "configs"
         self.projects_dir = self.framework_root / "projects"
 
-        # Cache for loaded configurations
+        # Parsed documents shared with other processes, keyed by file content
+        self.snapshot_cache: Optional[ConfigSnapshotCache] = None
+        if use_snapshots:
+            self.enable_snapshots(snapshot_dir)
+
+        # Cache for loaded configurations, with the file path and signature
+        # each entry was loaded from
         self.config_cache: Dict[str, Dict[str, Any]] = {}
+        self._cache_paths: Dict[str, Path] = {}
+        self._cache_signatures: Dict[str, FileSignature] = {}
+        self._lock = threading.RLock()
+
+        # Change notifications
+        self._listeners: List[ConfigListener] = []
+        self._watcher: Optional[threading.Thread] = None
+        self._stop_watching = threading.Event()
 
         logger.info(f"Config Loader initialized with root: {self.framework_root}")
 
+    def enable_snapshots(self, snapshot_dir: Optional[str] = None) -> ConfigSnapshotCache:
+        """
+        Start reading and writing parsed-config snapshots.
+
+        Args:
+            snapshot_dir: Directory for the snapshots, relative to the framework
+                root unless absolute. Defaults to data/config_snapshots.
+
+        Returns:
+            The snapshot cache now in use
+        """
+        if self.snapshot_cache is None:
+            directory = Path(os.path.expanduser(snapshot_dir)) if snapshot_dir else Path("data") / "config_snapshots"
+            if not directory.is_absolute():
+                directory = self.framework_root / directory
+            self.snapshot_cache = ConfigSnapshotCache(directory)
+        return self.snapshot_cache
+
     def _expand_env_vars(self, value: Any) -> Any:
         """
         Recursively expand environment variables in string values.
@@ -110,8 +310,11 @@ class ConfigLoader:
             return {}
             
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                config_data = yaml.safe_load(f) or {}
+            if self.snapshot_cache is not None:
+                config_data = self.snapshot_cache.load(file_path) or {}
+            else:
+                with open(file_path, 'r', encoding='utf-8') as f:
+                    config_data = parse_yaml(f) or {}
                 
             # Expand environment variables in the loaded data
             config_data = self._expand_env_vars(config_data)
@@ -136,18 +339,160 @@ class ConfigLoader:
         Returns:
             The loaded configuration dictionary
         """
-        if config_key in self.config_cache:
+        # Revalidate the cached entry with a stat call instead of re-parsing
+        signature = file_signature(file_path)
+        if config_key in self.config_cache and self._cache_signatures.get(config_key) == signature:
             return self.config_cache[config_key]
 
+        # The signature is taken before reading, so an edit made during the
+        # read is picked up by the next call
         config_data = self._load_yaml_file(file_path)
         
         # Process global config if needed (convert paths to absolute)
         if process_global:
             config_data = self._absolutize_paths(config_data)
             
-        self.config_cache[config_key] = config_data
+        with self._lock:
+            self.config_cache[config_key] = config_data
+            self._cache_paths[config_key] = file_path
+            self._cache_signatures[config_key] = signature
         return config_data
 
+    def invalidate(self, config_key: Optional[str] = None) -> None:
+        """
+        Drop cached configurations so the next read loads them from disk.
+
+        Args:
+            config_key: Cache key to drop (e.g. 'global_config'), or None to drop all
+        """
+        with self._lock:
+            if config_key is None:
+                self.config_cache.clear()
+                self._cache_signatures.clear()
+            else:
+                self.config_cache.pop(config_key, None)
+                self._cache_signatures.pop(config_key, None)
+
+    def subscribe(self, listener: ConfigListener) -> None:
+        """
+        Register a function called with (config_key, file_path) when a config file changes.
+
+        Listeners are notified of changes found by the watcher thread (see
+        start_watching()) and of saves through save_config(). Notifications
+        from the watcher run on its thread.
+
+        Args:
+            listener: Function to call
+        """
+        with self._lock:
+            if listener not in self._listeners:
+                self._listeners.append(listener)
+
+    def unsubscribe(self, listener: ConfigListener) -> None:
+        """
+        Remove a listener registered with subscribe().
+
+        Args:
+            listener: Function to remove
+        """
+        with self._lock:
+            if listener in self._listeners:
+                self._listeners.remove(listener)
+
+    def _notify(self, config_key: str, file_path: Path) -> None:
+        """Call every listener for a changed config file, logging listener errors."""
+        with self._lock:
+            listeners = list(self._listeners)
+        for listener in listeners:
+            try:
+                listener(config_key, file_path)
+            except Exception as e:
+                logger.error(f"Config change listener failed for {file_path}: {e}")
+
+    def _watched_files(self) -> Dict[str, Path]:
+        """The framework config files plus every other file loaded through the cache."""
+        files = {
+            "global_config": self.configs_dir / "global_settings.yaml",
+            "agent_profiles": self.configs_dir / "base_agent_profiles.yaml",
+            "tool_registry": self.configs_dir / "tool_registry.yaml",
+        }
+        with self._lock:
+            files.update(self._cache_paths)
+        return files
+
+    def check_for_changes(self, signatures: Optional[Dict[str, FileSignature]] = None) -> List[str]:
+        """
+        Stat the watched config files and handle the ones that changed.
+
+        Changed files are dropped from the cache and reported to listeners;
+        nothing is parsed until a listener or caller reads the config again.
+
+        Args:
+            signatures: Signatures from the previous check, updated in place.
+                Defaults to the signatures of the cached entries.
+
+        Returns:
+            Cache keys of the changed files
+        """
+        changed = []
+        for config_key, file_path in self._watched_files().items():
+            signature = file_signature(file_path)
+            if signatures is not None:
+                if config_key not in signatures:
+                    signatures[config_key] = signature
+                    continue
+                previous = signatures[config_key]
+                signatures[config_key] = signature
+            else:
+                with self._lock:
+                    if config_key not in self._cache_signatures:
+                        continue
+                    previous = self._cache_signatures[config_key]
+            if signature == previous:
+                continue
+            self.invalidate(config_key)
+            changed.append(config_key)
+            logger.info(f"Configuration file changed: {file_path}")
+            self._notify(config_key, file_path)
+        return changed
+
+    def start_watching(self, interval: float = 1.0) -> None:
+        """
+        Start a daemon thread that checks the config files for changes.
+
+        Each check is one stat call per file, so a steady state costs no YAML
+        parsing. Polling is used rather than OS file notifications so the
+        watcher works on every platform and on network filesystems.
+
+        Args:
+            interval: Seconds between checks
+        """
+        with self._lock:
+            if self._watcher is not None and self._watcher.is_alive():
+                return
+            self._stop_watching.clear()
+            signatures = {key: file_signature(path) for key, path in self._watched_files().items()}
+
+            def watch() -> None:
+                while not self._stop_watching.wait(interval):
+                    try:
+                        self.check_for_changes(signatures)
+                    except Exception as e:
+                        logger.error(f"Config watcher check failed: {e}")
+
+            self._watcher = threading.Thread(target=watch, name="config-watcher", daemon=True)
+            self._watcher.start()
+        logger.info(f"Watching configuration files every {interval}s")
+
+    def stop_watching(self) -> None:
+        """Stop the watcher thread started by start_watching()."""
+        with self._lock:
+            watcher = self._watcher
+            self._watcher = None
+        if watcher is not None:
+            self._stop_watching.set()
+            watcher.join()
+
     def load_global_config(self) -> Dict[str, Any]:
         """
         Loads global_settings.yaml with path absolutization.
@@ -245,6 +590,26 @@ class ConfigLoader:
             logger.error(f"Unknown configuration type: {config_type}")
             return None
 
+    @staticmethod
+    def _get_cache_key(config_type: str, project_name: Optional[str] = None) -> str:
+        """
+        Map a config type to the key its loader caches it under.
+
+        Args:
+            config_type: Type of configuration ('global', 'agent_profiles', 'tool_registry', 'project', 'project_agent')
+            project_name: Project name for the project config types
+
+        Returns:
+            The config cache key
+        """
+        if config_type == "global":
+            return "global_config"
+        if config_type == "project":
+            return f"project_config_{project_name}"
+        if config_type == "project_agent":
+            return f"project_agent_config_{project_name}"
+        return config_type
+
     def save_config(self, config_type: str, config_data: Dict[str, Any], project_name: Optional[str] = None) -> bool:
         """
         Save configuration data back to its corresponding YAML file.
@@ -268,19 +633,12 @@ class ConfigLoader:
             with open(config_path, 'w', encoding='utf-8') as f:
                 yaml.dump(config_data, f, default_flow_style=False, sort_keys=False)
 
-            # Update cache after successful save
-            cache_key = config_type
-            if project_name:
-                cache_key = f"{config_type}_{project_name}" if config_type.startswith("project") else config_type
-
-            # Special mapping for project types
-            if config_type == "project": 
-                cache_key = f"project_config_{project_name}"
-            if config_type == "project_agent": 
-                cache_key = f"project_agent_config_{project_name}"
-
-            self.config_cache[cache_key] = config_data
+            # Drop the cached entry; the next read re-applies environment
+            # variable expansion and path absolutization to the saved data
+            cache_key = self._get_cache_key(config_type, project_name)
+            self.invalidate(cache_key)
             logger.info(f"Successfully saved {config_type} configuration to {config_path}")
+            self._notify(cache_key, config_path)
             return True
         except Exception as e:
             logger.error(f"Failed to save {config_type} configuration to {config_path}: {e}")
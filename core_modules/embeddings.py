@@ -0,0 +1,207 @@
+"""
+Embeddings Module
+
+This module provides text embedders for vector similarity search. Embedders
+return contiguous float32 NumPy matrices with L2-normalized rows, so cosine
+similarity against a stored matrix is a single matrix-vector product. It also
+provides the shared helpers used to rank those products.
+
+Available embedders:
+- HashingEmbedder: local, deterministic feature hashing of word unigrams and
+  bigrams; needs no model or network and is stable across processes
+- LangChainEmbedder: wraps any LangChain Embeddings object (e.g. OpenAIEmbeddings)
+"""
+
+import hashlib
+import logging
+import re
+from functools import lru_cache
+from typing import Dict, Any, List, Optional, Sequence
+
+import numpy as np
+
+logger = logging.getLogger("core.embeddings")
+
+_TOKEN_PATTERN = re.compile(r"\w+")
+
+
+def normalize_rows(vectors: np.ndarray) -> np.ndarray:
+    """
+    L2-normalize the rows of a matrix in place. All-zero rows are left as zeros.
+
+    Args:
+        vectors: 2-D float32 array
+
+    Returns:
+        The same array
+    """
+    norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+    np.divide(vectors, norms, out=vectors, where=norms > 0)
+    return vectors
+
+
+def top_k_indices(scores: np.ndarray, k: int) -> np.ndarray:
+    """
+    Get the indices of the k highest scores, best first.
+
+    Uses argpartition to select the k candidates in linear time and only sorts
+    those k.
+
+    Args:
+        scores: 1-D array of scores
+        k: Number of indices to return
+
+    Returns:
+        Array of at most k indices ordered by descending score
+    """
+    n = scores.shape[0]
+    if k <= 0 or n == 0:
+        return np.empty(0, dtype=np.int64)
+    if k < n:
+        candidates = np.argpartition(-scores, k - 1)[:k]
+    else:
+        candidates = np.arange(n)
+    return candidates[np.argsort(-scores[candidates], kind="stable")]
+
+
+class Embedder:
+    """
+    Interface for text embedders.
+
+    Subclasses implement embed(); embed_query() defaults to embedding a single
+    text the same way.
+    """
+
+    dimension: int = 0
+
+    def embed(self, texts: Sequence[str]) -> np.ndarray:
+        """
+        Embed a batch of texts.
+
+        Args:
+            texts: Texts to embed
+
+        Returns:
+            C-contiguous float32 array of shape (len(texts), dimension) with
+            L2-normalized rows
+        """
+        raise NotImplementedError
+
+    def embed_query(self, text: str) -> np.ndarray:
+        """
+        Embed a search query.
+
+        Args:
+            text: Query text
+
+        Returns:
+            float32 vector of shape (dimension,)
+        """
+        return self.embed([text])[0]
+
+
+@lru_cache(maxsize=65536)
+def _hash_feature(feature: str) -> int:
+    # blake2b rather than hash(): Python string hashing is salted per process
+    return int.from_bytes(hashlib.blake2b(feature.encode("utf-8"), digest_size=8).digest(), "little")
+
+
+class HashingEmbedder(Embedder):
+    """
+    Deterministic feature-hashing embedder.
+
+    Each lowercase word unigram (and bigram, if enabled) is hashed to one of
+    `dimension` buckets with a hash-derived sign, and the resulting counts are
+    L2-normalized. Texts that share words get similar vectors; the same text
+    always gets the same vector, in any process.
+    """
+
+    def __init__(self, dimension: int = 256, use_bigrams: bool = True):
+        """
+        Initialize a new HashingEmbedder instance.
+
+        Args:
+            dimension: Length of the embedding vectors
+            use_bigrams: Whether to hash adjacent word pairs as well as words
+        """
+        if dimension <= 0:
+            raise ValueError(f"Embedding dimension must be positive, got {dimension}")
+        self.dimension = int(dimension)
+        self.use_bigrams = use_bigrams
+
+    def _features(self, text: str) -> List[str]:
+        tokens = _TOKEN_PATTERN.findall(text.lower())
+        if self.use_bigrams and len(tokens) > 1:
+            return tokens + [f"{a} {b}" for a, b in zip(tokens, tokens[1:])]
+        return tokens
+
+    def embed(self, texts: Sequence[str]) -> np.ndarray:
+        vectors = np.zeros((len(texts), self.dimension), dtype=np.float32)
+        for row, text in enumerate(texts):
+            for feature in self._features(text):
+                hashed = _hash_feature(feature)
+                sign = 1.0 if hashed >> 63 else -1.0
+                vectors[row, hashed % self.dimension] += sign
+        return normalize_rows(vectors)
+
+
+class LangChainEmbedder(Embedder):
+    """Adapter for LangChain Embeddings objects (embed_documents / embed_query)."""
+
+    def __init__(self, embeddings: Any, dimension: Optional[int] = None):
+        """
+        Initialize a new LangChainEmbedder instance.
+
+        Args:
+            embeddings: A LangChain Embeddings instance
+            dimension: Embedding length; detected with a probe query if omitted
+        """
+        self.embeddings = embeddings
+        self.dimension = int(dimension) if dimension else len(embeddings.embed_query("dimension probe"))
+
+    def _to_matrix(self, vectors: List[List[float]]) -> np.ndarray:
+        matrix = np.ascontiguousarray(vectors, dtype=np.float32).reshape(len(vectors), self.dimension)
+        return normalize_rows(matrix)
+
+    def embed(self, texts: Sequence[str]) -> np.ndarray:
+        if not texts:
+            return np.zeros((0, self.dimension), dtype=np.float32)
+        return self._to_matrix(self.embeddings.embed_documents(list(texts)))
+
+    def embed_query(self, text: str) -> np.ndarray:
+        return self._to_matrix([self.embeddings.embed_query(text)])[0]
+
+
+def create_embedder(config: Optional[Dict[str, Any]] = None) -> Embedder:
+    """
+    Build an embedder from configuration.
+
+    Args:
+        config: Embedder settings. 'provider' is 'hashing' (default) or
+            'openai'. Hashing takes 'dimension' and 'use_bigrams'; OpenAI takes
+            'model' (default 'text-embedding-3-small') and optional 'dimension'.
+
+    Returns:
+        An Embedder instance
+
+    Raises:
+        ValueError: If the provider is unknown
+        ImportError: If the provider's package is not installed
+    """
+    config = config or {}
+    provider = config.get('provider', 'hashing')
+
+    if provider == 'hashing':
+        return HashingEmbedder(
+            dimension=config.get('dimension', 256),
+            use_bigrams=config.get('use_bigrams', True)
+        )
+
+    if provider == 'openai':
+        from langchain_openai import OpenAIEmbeddings
+        model = config.get('model', 'text-embedding-3-small')
+        embeddings = OpenAIEmbeddings(model=model, dimensions=config.get('dimension'))
+        logger.debug(f"Created OpenAI embedder for {model}")
+        return LangChainEmbedder(embeddings, dimension=config.get('dimension'))
+
+    raise ValueError(f"Unknown embedder provider: {provider}")
@@ -5,14 +5,34 @@ This module provides the FlowiseClient class for interacting with the FlowiseAI
 allowing the framework to execute flows designed in FlowiseAI.
 """
 
+import asyncio
+import codecs
+import concurrent.futures
+import json
 import logging
 import os
+import threading
+import time
+import uuid
+import weakref
 import requests
-from typing import Dict, Any, Optional, Union, Generator
+from requests.adapters import HTTPAdapter
+from urllib3.exceptions import NewConnectionError
+from typing import Dict, Any, List, Optional, Union, Generator, AsyncIterator, Iterable, Iterator, Tuple
 from pathlib import Path
 from os import PathLike
 
+try:
+    import httpx
+except ImportError:  # pragma: no cover - only needed by AsyncFlowiseClient
+    httpx = None
+
 from .config_loader import ConfigLoader
+from .sse_parser import SSEMessage, SSEParser
+from .retry_policy import (
+    CONNECT_ERROR, CONNECT_TIMEOUT, CONNECTION_ERROR, READ_TIMEOUT,
+    create_retry_budget, create_retry_policy, parse_retry_after
+)
 
 # Set up module logger
 logger = logging.getLogger("core.flowise_client")
@@ -33,6 +53,80 @@ class FlowiseAPIError(Exception):
     pass
 
 
+# Typed event kinds yielded by stream_events()
+EVENT_TOKEN = "token"
+EVENT_METADATA = "metadata"
+EVENT_END = "end"
+EVENT_ERROR = "error"
+
+_END_EVENT_NAMES = {"end", "abort"}
+
+
+class FlowiseEvent:
+    """
+    A typed event from a streamed Flowise prediction.
+
+    Attributes:
+        type: One of 'token', 'metadata', 'end' or 'error'
+        name: The event name sent by Flowise (e.g. 'sourceDocuments')
+        data: Token text for token events, decoded JSON (or text) otherwise
+    """
+
+    __slots__ = ("type", "name", "data")
+
+    def __init__(self, type: str, name: str, data: Any = None):
+        self.type = type
+        self.name = name
+        self.data = data
+
+    def __repr__(self) -> str:
+        return f"FlowiseEvent(type={self.type!r}, name={self.name!r}, data={self.data!r})"
+
+
+def _decode_data(data: str) -> Any:
+    try:
+        return json.loads(data)
+    except ValueError:
+        return data
+
+
+def to_flowise_event(message: SSEMessage) -> FlowiseEvent:
+    """
+    Convert an SSE message from a Flowise stream into a typed event.
+
+    Handles both framings used by Flowise: the event name in the SSE 'event'
+    field, and a JSON payload of the form {"event": ..., "data": ...}.
+
+    Args:
+        message: A parsed SSE message
+
+    Returns:
+        The corresponding FlowiseEvent
+    """
+    name = message.event
+    data: Any = message.data
+
+    if name == "message":
+        payload = _decode_data(data)
+        if isinstance(payload, dict) and "event" in payload:
+            name = payload["event"]
+            data = payload.get("data")
+        elif data == "[DONE]":
+            name = EVENT_END
+            data = None
+        else:
+            name = EVENT_TOKEN
+            data = payload if isinstance(payload, str) else data
+
+    if name == EVENT_TOKEN:
+        return FlowiseEvent(EVENT_TOKEN, name, data if isinstance(data, str) else json.dumps(data))
+    if name in _END_EVENT_NAMES:
+        return FlowiseEvent(EVENT_END, name, _decode_data(data) if isinstance(data, str) and data else data)
+    if name == EVENT_ERROR:
+        return FlowiseEvent(EVENT_ERROR, name, data)
+    return FlowiseEvent(EVENT_METADATA, name, _decode_data(data) if isinstance(data, str) else data)
+
+
 class FlowiseClient:
     """
     Client for interacting with the FlowiseAI API.
@@ -42,27 +136,37 @@ class FlowiseClient:
     connection pooling, error handling, and request formatting.
     """
 
-    def __init__(self, framework_root: Union[str, PathLike]):
+    def __init__(self, framework_root: Union[str, PathLike], config_loader: Optional[ConfigLoader] = None):
         """
         Initialize a new FlowiseClient instance.
 
         Args:
             framework_root: Absolute path to the framework root directory.
+            config_loader: Optional shared ConfigLoader instance. When provided,
+                the cached global configuration is reused instead of re-reading
+                global_settings.yaml.
         """
         self.framework_root = Path(os.path.expanduser(framework_root)).resolve()
         self.logger = logging.getLogger("core.flowise_client")
         
         # Load configuration
-        config_loader = ConfigLoader(framework_root)
-        global_config = config_loader._load_yaml_file(
-            config_loader.configs_dir / "global_settings.yaml"
-        )
+        if config_loader is not None:
+            global_config = config_loader.load_global_config()
+        else:
+            config_loader = ConfigLoader(framework_root)
+            global_config = config_loader._load_yaml_file(
+                config_loader.configs_dir / "global_settings.yaml"
+            )
         
         # Extract Flowise configuration
         flowise_config = global_config.get("flowise", {})
         self.enabled = flowise_config.get("enabled", False)
         self.base_url = flowise_config.get("base_url", "http://localhost:3000")
         self.default_timeout = flowise_config.get("default_timeout", 60)
+        self.connect_timeout = flowise_config.get("connect_timeout", self.default_timeout)
+        self.read_timeout = flowise_config.get("read_timeout", self.default_timeout)
+        self.max_concurrency = flowise_config.get("max_concurrency", 8)
+        self.max_connections = flowise_config.get("max_connections", 20)
         
         # Set up API key if configured
         self.api_key = None
@@ -75,13 +179,235 @@ class FlowiseClient:
                     "Proceeding without authentication."
                 )
         
+        # Retry policy and the per-client retry budget
+        retry_config = flowise_config.get("retry", {}) or {}
+        self.retry_policy = create_retry_policy(retry_config)
+        self.retry_budget = create_retry_budget(retry_config.get("budget"))
+        
+        # Attempt counters exposed through get_stats()
+        self._stats: Dict[str, Any] = {
+            "requests": 0,
+            "attempts": 0,
+            "succeeded": 0,
+            "failed": 0,
+            "retries": 0,
+            "retries_denied_by_budget": 0,
+            "retry_reasons": {},
+            "attempts_per_request": {}
+        }
+        self._stats_lock = threading.Lock()
+        
         # Initialize session for connection pooling
         self.session = requests.Session()
+        self._pool_size = 0
+        self._pool_lock = threading.Lock()
+        self._ensure_pool_size(self.max_connections)
         
         self.logger.info(f"FlowiseClient initialized with base URL: {self.base_url}")
         if not self.enabled:
             self.logger.warning("Flowise integration is disabled in configuration")
 
+    def _ensure_pool_size(self, size: int) -> None:
+        """
+        Make sure the session keeps at least size connections per host.
+
+        Retries are handled by the retry policy, so the adapter itself never retries.
+        """
+        with self._pool_lock:
+            if size <= self._pool_size:
+                return
+            adapter = HTTPAdapter(pool_connections=10, pool_maxsize=size, max_retries=0)
+            self.session.mount("http://", adapter)
+            self.session.mount("https://", adapter)
+            self._pool_size = size
+
+    def _build_url(self, flow_endpoint_url: str) -> str:
+        """Resolve a flow endpoint, which may be relative to the base URL."""
+        if flow_endpoint_url.startswith(("http://", "https://")):
+            return flow_endpoint_url
+        # Assume it's a relative path to the base URL
+        if flow_endpoint_url.startswith("/"):
+            return f"{self.base_url}{flow_endpoint_url}"
+        return f"{self.base_url}/{flow_endpoint_url}"
+
+    def _build_headers(self, stream: bool = False) -> Dict[str, str]:
+        """Build the request headers, including authentication if configured."""
+        headers = {}
+        if self.api_key:
+            headers["Authorization"] = f"Bearer {self.api_key}"
+        
+        if stream:
+            headers["Accept"] = "text/event-stream"
+        return headers
+
+    @staticmethod
+    def _streaming_input(input_data: Dict[str, Any]) -> Dict[str, Any]:
+        """Copy input_data with Flowise's streaming flag set."""
+        streaming_input = dict(input_data)
+        streaming_input.setdefault("streaming", True)
+        return streaming_input
+
+    def _api_error_message(self, status_code: Any, error: Exception, response: Any) -> str:
+        """Format an API error, including the response body when it is JSON."""
+        error_msg = f"FlowiseAI API returned error (status {status_code}): {str(error)}"
+        self.logger.error(error_msg)
+        
+        # Try to extract more detailed error information from the response
+        try:
+            error_details = response.json() if response is not None else {}
+            error_msg += f" Details: {error_details}"
+        except (ValueError, AttributeError):
+            pass
+        return error_msg
+
+    def _build_request_headers(self, stream: bool = False) -> Dict[str, str]:
+        """Build the headers for one logical request, shared by all its attempts."""
+        headers = self._build_headers(stream)
+        if self.retry_policy.send_idempotency_key:
+            headers["Idempotency-Key"] = str(uuid.uuid4())
+        return headers
+
+    def _start_request(self) -> None:
+        """Count a new logical request against the stats and the retry budget."""
+        self.retry_budget.record_request()
+        with self._stats_lock:
+            self._stats["requests"] += 1
+
+    def _count_attempt(self) -> None:
+        with self._stats_lock:
+            self._stats["attempts"] += 1
+
+    def _finish_request(self, attempts: int, succeeded: bool) -> None:
+        """Record the outcome and attempt count of a logical request."""
+        with self._stats_lock:
+            self._stats["succeeded" if succeeded else "failed"] += 1
+            histogram = self._stats["attempts_per_request"]
+            histogram[attempts] = histogram.get(attempts, 0) + 1
+
+    def _get_retry_delay(self,
+                         attempt: int,
+                         kind: Optional[str] = None,
+                         status_code: Optional[int] = None,
+                         retry_after: Optional[float] = None) -> Optional[float]:
+        """
+        Decide whether a failed attempt is retried.
+
+        Args:
+            attempt: Number of the attempt that failed (1 for the first)
+            kind: Failure kind for transport errors
+            status_code: HTTP status code for error responses
+            retry_after: Parsed Retry-After header value, if any
+
+        Returns:
+            Seconds to wait before retrying, or None to give up
+        """
+        policy = self.retry_policy
+        if attempt >= policy.max_attempts or not policy.is_retryable(kind, status_code):
+            return None
+        delay = policy.get_delay(attempt, retry_after)
+        if delay is None:
+            return None
+        
+        reason = str(status_code) if status_code is not None else kind
+        if not self.retry_budget.try_acquire_retry():
+            self.logger.warning(f"Retry budget exhausted; not retrying FlowiseAI request ({reason})")
+            with self._stats_lock:
+                self._stats["retries_denied_by_budget"] += 1
+            return None
+        
+        with self._stats_lock:
+            self._stats["retries"] += 1
+            reasons = self._stats["retry_reasons"]
+            reasons[reason] = reasons.get(reason, 0) + 1
+        self.logger.warning(
+            f"Retrying FlowiseAI request ({reason}) in {delay:.2f}s "
+            f"(attempt {attempt + 1}/{policy.max_attempts})"
+        )
+        return delay
+
+    @staticmethod
+    def _classify_requests_error(error: requests.RequestException) -> Optional[str]:
+        """Map a requests transport exception to a retry failure kind."""
+        if isinstance(error, requests.ConnectTimeout):
+            return CONNECT_TIMEOUT
+        if isinstance(error, requests.Timeout):
+            return READ_TIMEOUT
+        if isinstance(error, requests.ConnectionError):
+            # requests wraps urllib3's MaxRetryError, whose reason tells connect failures apart
+            reason = getattr(error.args[0], "reason", None) if error.args else None
+            return CONNECT_ERROR if isinstance(reason, NewConnectionError) else CONNECTION_ERROR
+        return None
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get request and retry counters for tuning the retry policy.
+
+        Returns:
+            Dictionary with requests, attempts, succeeded, failed, retries,
+            retries_denied_by_budget, retry_reasons (retries per status code or
+            failure kind), attempts_per_request (histogram) and retry_budget
+        """
+        with self._stats_lock:
+            stats = dict(self._stats)
+            stats["retry_reasons"] = dict(self._stats["retry_reasons"])
+            stats["attempts_per_request"] = dict(self._stats["attempts_per_request"])
+        stats["retry_budget"] = self.retry_budget.snapshot()
+        return stats
+
+    def _post_with_retry(self,
+                         flow_endpoint_url: str,
+                         input_data: Dict[str, Any],
+                         headers: Dict[str, str],
+                         stream: bool) -> requests.Response:
+        """
+        POST to a flow, retrying transient failures according to the retry policy.
+
+        Returns:
+            The successful response
+
+        Raises:
+            requests.RequestException: The last error once retries are exhausted
+        """
+        self._start_request()
+        attempt = 0
+        while True:
+            attempt += 1
+            self._count_attempt()
+            try:
+                response = self.session.post(
+                    flow_endpoint_url,
+                    json=input_data,
+                    headers=headers,
+                    timeout=(self.connect_timeout, self.read_timeout),
+                    stream=stream
+                )
+                
+                # Check for HTTP errors
+                response.raise_for_status()
+                self._finish_request(attempt, True)
+                return response
+            
+            except (requests.ConnectionError, requests.Timeout) as e:
+                delay = self._get_retry_delay(attempt, kind=self._classify_requests_error(e))
+                if delay is None:
+                    self._finish_request(attempt, False)
+                    raise
+            
+            except requests.HTTPError as e:
+                response = e.response
+                retry_after = parse_retry_after(response.headers.get("Retry-After"))
+                delay = self._get_retry_delay(attempt, status_code=response.status_code, retry_after=retry_after)
+                if delay is None:
+                    self._finish_request(attempt, False)
+                    raise
+                response.close()
+            
+            except requests.RequestException:
+                self._finish_request(attempt, False)
+                raise
+            
+            time.sleep(delay)
+
     def run_flow(self, flow_endpoint_url: str, input_data: Dict[str, Any], stream: bool = False) -> Union[Dict[str, Any], Generator]:
         """
         Execute a flow in FlowiseAI.
@@ -91,7 +417,8 @@ class FlowiseClient:
                 This should be the full URL including the base URL.
             input_data: Dictionary containing the input data for the flow.
             stream: Whether to stream the response. If True, returns a generator
-                that yields chunks of the response as they arrive.
+                that yields decoded text chunks of the raw response as they arrive.
+                Use stream_events() to receive parsed events instead.
 
         Returns:
             If stream=False: Dictionary containing the flow execution results.
@@ -105,42 +432,30 @@ class FlowiseClient:
         if not self.enabled:
             self.logger.warning("Attempting to run a flow while Flowise integration is disabled")
         
-        # Prepare headers
-        headers = {}
-        if self.api_key:
-            headers["Authorization"] = f"Bearer {self.api_key}"
-        
-        if stream:
-            headers["Accept"] = "text/event-stream"
-        
-        # Ensure the URL is properly formatted
-        if not flow_endpoint_url.startswith(("http://", "https://")):
-            # Assume it's a relative path to the base URL
-            if flow_endpoint_url.startswith("/"):
-                flow_endpoint_url = f"{self.base_url}{flow_endpoint_url}"
-            else:
-                flow_endpoint_url = f"{self.base_url}/{flow_endpoint_url}"
+        headers = self._build_request_headers(stream)
+        flow_endpoint_url = self._build_url(flow_endpoint_url)
         
         self.logger.debug(f"Making request to FlowiseAI flow: {flow_endpoint_url}")
         
         try:
-            response = self.session.post(
-                flow_endpoint_url,
-                json=input_data,
-                headers=headers,
-                timeout=self.default_timeout,
-                stream=stream
-            )
-            
-            # Check for HTTP errors
-            response.raise_for_status()
+            response = self._post_with_retry(flow_endpoint_url, input_data, headers, stream)
             
             if stream:
                 # Return a generator that yields chunks of the response
                 def response_generator():
-                    for chunk in response.iter_content(chunk_size=1024):
-                        if chunk:
-                            yield chunk.decode('utf-8')
+                    # Decode incrementally so multi-byte characters split across chunks survive
+                    decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+                    try:
+                        for chunk in response.iter_content(chunk_size=1024):
+                            if chunk:
+                                text = decoder.decode(chunk)
+                                if text:
+                                    yield text
+                        text = decoder.decode(b"", final=True)
+                        if text:
+                            yield text
+                    finally:
+                        response.close()
                 
                 return response_generator()
             else:
@@ -158,20 +473,344 @@ class FlowiseClient:
             raise FlowiseConnectionError(error_msg) from e
             
         except requests.Timeout as e:
-            error_msg = f"Request to FlowiseAI API timed out after {self.default_timeout} seconds"
+            error_msg = f"Request to FlowiseAI API timed out (connect {self.connect_timeout}s, read {self.read_timeout}s)"
             self.logger.error(error_msg)
             raise FlowiseTimeoutError(error_msg) from e
             
         except requests.HTTPError as e:
-            status_code = e.response.status_code if hasattr(e, 'response') else "unknown"
-            error_msg = f"FlowiseAI API returned error (status {status_code}): {str(e)}"
+            response = getattr(e, "response", None)
+            status_code = response.status_code if response is not None else "unknown"
+            raise FlowiseAPIError(self._api_error_message(status_code, e, response)) from e
+            
+        except requests.RequestException as e:
+            # e.g. ChunkedEncodingError when the connection drops mid-response
+            error_msg = f"Request to FlowiseAI API failed: {str(e)}"
             self.logger.error(error_msg)
+            raise FlowiseConnectionError(error_msg) from e
+
+    def stream_events(self, flow_endpoint_url: str, input_data: Dict[str, Any]) -> Generator[FlowiseEvent, None, None]:
+        """
+        Execute a flow with streaming and yield typed events as they arrive.
+
+        The request is sent with "streaming": true unless input_data sets it.
+        Iteration stops after the end event.
+
+        Args:
+            flow_endpoint_url: The endpoint URL for the flow to execute.
+            input_data: Dictionary containing the input data for the flow.
+
+        Yields:
+            FlowiseEvent objects of type 'token', 'metadata', 'end' or 'error'
+
+        Raises:
+            FlowiseConnectionError: If there's an issue connecting to the FlowiseAI API.
+            FlowiseTimeoutError: If the request times out.
+            FlowiseAPIError: If the FlowiseAI API returns an error.
+        """
+        parser = SSEParser()
+        for chunk in self.run_flow(flow_endpoint_url, self._streaming_input(input_data), stream=True):
+            for message in parser.feed(chunk):
+                event = to_flowise_event(message)
+                yield event
+                if event.type == EVENT_END:
+                    return
+        for message in parser.close():
+            yield to_flowise_event(message)
+
+    def run_flows(self,
+                  flow_endpoint_url: str,
+                  inputs: Iterable[Dict[str, Any]],
+                  concurrency: Optional[int] = None,
+                  ordered: bool = True) -> Union[List[Union[Dict[str, Any], Exception]], Iterator[Tuple[int, Union[Dict[str, Any], Exception]]]]:
+        """
+        Execute a flow for many inputs on a bounded pool of worker threads.
+
+        The workers share this client's session, whose connection pool is grown
+        to at least concurrency connections. A failure affects only its own
+        item: the raised exception (a Flowise exception for request failures)
+        takes the place of its result.
+
+        Args:
+            flow_endpoint_url: The endpoint URL for the flow to execute.
+            inputs: Input data dictionaries, one per flow execution.
+            concurrency: Number of requests in flight at once (defaults to
+                flowise.max_concurrency).
+            ordered: If True, wait for all items and return results in input
+                order. If False, return an iterator yielding (index, result)
+                pairs as items complete.
+
+        Returns:
+            If ordered=True: List of results in input order.
+            If ordered=False: Iterator of (input index, result) tuples.
+        """
+        concurrency = max(1, int(concurrency or self.max_concurrency))
+        self._ensure_pool_size(concurrency)
+        inputs = list(inputs)
+        self.logger.info(f"Running {len(inputs)} inputs through {flow_endpoint_url} with concurrency {concurrency}")
+        
+        def _run_one(input_data: Dict[str, Any]) -> Union[Dict[str, Any], Exception]:
+            try:
+                return self.run_flow(flow_endpoint_url, input_data)
+            except Exception as e:
+                return e
+        
+        if ordered:
+            with concurrent.futures.ThreadPoolExecutor(max_workers=concurrency, thread_name_prefix="flowise") as executor:
+                return list(executor.map(_run_one, inputs))
+        
+        def _as_completed() -> Iterator[Tuple[int, Union[Dict[str, Any], Exception]]]:
+            with concurrent.futures.ThreadPoolExecutor(max_workers=concurrency, thread_name_prefix="flowise") as executor:
+                futures = {executor.submit(_run_one, input_data): index for index, input_data in enumerate(inputs)}
+                try:
+                    for future in concurrent.futures.as_completed(futures):
+                        yield futures[future], future.result()
+                finally:
+                    # Drop queued work if the consumer stops early
+                    for future in futures:
+                        future.cancel()
+        
+        return _as_completed()
+
+
+class AsyncFlowiseClient(FlowiseClient):
+    """
+    Asynchronous client for the FlowiseAI API.
+
+    Adds coroutine counterparts of the FlowiseClient methods, built on a pooled
+    httpx.AsyncClient. The number of requests in flight is bounded by the
+    flowise.max_concurrency setting, so many flows can be started at once
+    without overwhelming the Flowise server. The synchronous methods inherited
+    from FlowiseClient remain available.
+
+    Requires the httpx package.
+    """
+
+    def __init__(self, framework_root: Union[str, PathLike], config_loader: Optional[ConfigLoader] = None):
+        """
+        Initialize a new AsyncFlowiseClient instance.
+
+        Args:
+            framework_root: Absolute path to the framework root directory.
+            config_loader: Optional shared ConfigLoader instance.
+
+        Raises:
+            ImportError: If httpx is not installed
+        """
+        if httpx is None:
+            raise ImportError("AsyncFlowiseClient requires the 'httpx' package. Install it with 'pip install httpx'.")
+        super().__init__(framework_root, config_loader=config_loader)
+        
+        # httpx clients and semaphores are bound to the event loop that first uses them
+        self._async_clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, Any]" = weakref.WeakKeyDictionary()
+        self._semaphores: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Semaphore]" = weakref.WeakKeyDictionary()
+
+    def _get_async_client(self) -> "httpx.AsyncClient":
+        """Get the pooled HTTP client for the running event loop."""
+        loop = asyncio.get_running_loop()
+        client = self._async_clients.get(loop)
+        if client is None:
+            client = httpx.AsyncClient(
+                timeout=httpx.Timeout(self.read_timeout, connect=self.connect_timeout),
+                limits=httpx.Limits(
+                    max_connections=self.max_connections,
+                    max_keepalive_connections=self.max_connections
+                )
+            )
+            self._async_clients[loop] = client
+        return client
+
+    def _get_semaphore(self) -> asyncio.Semaphore:
+        """Get the concurrency-limiting semaphore for the running event loop."""
+        loop = asyncio.get_running_loop()
+        semaphore = self._semaphores.get(loop)
+        if semaphore is None:
+            semaphore = asyncio.Semaphore(max(1, int(self.max_concurrency)))
+            self._semaphores[loop] = semaphore
+        return semaphore
+
+    @staticmethod
+    def _classify_httpx_error(error: Exception) -> Optional[str]:
+        """Map an httpx transport exception to a retry failure kind."""
+        if isinstance(error, (httpx.ConnectTimeout, httpx.PoolTimeout)):
+            return CONNECT_TIMEOUT
+        if isinstance(error, httpx.TimeoutException):
+            return READ_TIMEOUT
+        if isinstance(error, httpx.ConnectError):
+            return CONNECT_ERROR
+        return CONNECTION_ERROR
+
+    def _translate_error(self, error: Exception) -> Exception:
+        """Map an httpx exception to the corresponding Flowise exception."""
+        if isinstance(error, httpx.TimeoutException):
+            error_msg = f"Request to FlowiseAI API timed out (connect {self.connect_timeout}s, read {self.read_timeout}s)"
+            self.logger.error(error_msg)
+            return FlowiseTimeoutError(error_msg)
+        if isinstance(error, httpx.HTTPStatusError):
+            return FlowiseAPIError(self._api_error_message(error.response.status_code, error, error.response))
+        error_msg = f"Failed to connect to FlowiseAI API: {str(error)}"
+        self.logger.error(error_msg)
+        return FlowiseConnectionError(error_msg)
+
+    async def _asend_with_retry(self,
+                                flow_endpoint_url: str,
+                                input_data: Dict[str, Any],
+                                headers: Dict[str, str],
+                                stream: bool) -> "httpx.Response":
+        """
+        POST to a flow asynchronously, retrying transient failures according to the retry policy.
+
+        With stream=True the returned response body has not been read and must
+        be closed by the caller.
+
+        Raises:
+            FlowiseConnectionError, FlowiseTimeoutError, FlowiseAPIError: Once
+                retries are exhausted
+        """
+        client = self._get_async_client()
+        self._start_request()
+        attempt = 0
+        while True:
+            attempt += 1
+            self._count_attempt()
+            response = None
+            try:
+                request = client.build_request("POST", flow_endpoint_url, json=input_data, headers=headers)
+                response = await client.send(request, stream=stream)
+                if response.is_error:
+                    await response.aread()
+                response.raise_for_status()
+                self._finish_request(attempt, True)
+                return response
+            
+            except httpx.HTTPStatusError as e:
+                await e.response.aclose()
+                retry_after = parse_retry_after(e.response.headers.get("Retry-After"))
+                delay = self._get_retry_delay(attempt, status_code=e.response.status_code, retry_after=retry_after)
+                if delay is None:
+                    self._finish_request(attempt, False)
+                    raise self._translate_error(e) from e
+            
+            except httpx.HTTPError as e:
+                if response is not None:
+                    await response.aclose()
+                delay = self._get_retry_delay(attempt, kind=self._classify_httpx_error(e))
+                if delay is None:
+                    self._finish_request(attempt, False)
+                    raise self._translate_error(e) from e
             
-            # Try to extract more detailed error information from the response
+            await asyncio.sleep(delay)
+
+    async def arun_flow(self, flow_endpoint_url: str, input_data: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Execute a flow in FlowiseAI asynchronously.
+
+        Args:
+            flow_endpoint_url: The endpoint URL for the flow to execute.
+            input_data: Dictionary containing the input data for the flow.
+
+        Returns:
+            Dictionary containing the flow execution results.
+
+        Raises:
+            FlowiseConnectionError: If there's an issue connecting to the FlowiseAI API.
+            FlowiseTimeoutError: If the request times out.
+            FlowiseAPIError: If the FlowiseAI API returns an error.
+        """
+        if not self.enabled:
+            self.logger.warning("Attempting to run a flow while Flowise integration is disabled")
+        
+        flow_endpoint_url = self._build_url(flow_endpoint_url)
+        self.logger.debug(f"Making async request to FlowiseAI flow: {flow_endpoint_url}")
+        
+        async with self._get_semaphore():
+            response = await self._asend_with_retry(
+                flow_endpoint_url, input_data, self._build_request_headers(), stream=False
+            )
+        
+        try:
+            return response.json()
+        except ValueError:
+            error_msg = f"Failed to parse JSON response from FlowiseAI: {response.text}"
+            self.logger.error(error_msg)
+            raise FlowiseAPIError(error_msg)
+
+    async def astream_events(self, flow_endpoint_url: str, input_data: Dict[str, Any]) -> AsyncIterator[FlowiseEvent]:
+        """
+        Execute a flow with streaming and asynchronously yield typed events as they arrive.
+
+        The concurrency slot is held until the stream is exhausted or closed.
+        Retries only happen before the first event is received.
+
+        Args:
+            flow_endpoint_url: The endpoint URL for the flow to execute.
+            input_data: Dictionary containing the input data for the flow.
+
+        Yields:
+            FlowiseEvent objects of type 'token', 'metadata', 'end' or 'error'
+
+        Raises:
+            FlowiseConnectionError: If there's an issue connecting to the FlowiseAI API.
+            FlowiseTimeoutError: If the request times out.
+            FlowiseAPIError: If the FlowiseAI API returns an error.
+        """
+        if not self.enabled:
+            self.logger.warning("Attempting to run a flow while Flowise integration is disabled")
+        
+        flow_endpoint_url = self._build_url(flow_endpoint_url)
+        self.logger.debug(f"Streaming from FlowiseAI flow: {flow_endpoint_url}")
+        
+        parser = SSEParser()
+        async with self._get_semaphore():
+            response = await self._asend_with_retry(
+                flow_endpoint_url,
+                self._streaming_input(input_data),
+                self._build_request_headers(stream=True),
+                stream=True
+            )
             try:
-                error_details = e.response.json() if hasattr(e, 'response') else {}
-                error_msg += f" Details: {error_details}"
-            except (ValueError, AttributeError):
-                pass
-                
-            raise FlowiseAPIError(error_msg) from e
+                async for chunk in response.aiter_bytes():
+                    for message in parser.feed(chunk):
+                        event = to_flowise_event(message)
+                        yield event
+                        if event.type == EVENT_END:
+                            return
+            except httpx.HTTPError as e:
+                raise self._translate_error(e) from e
+            finally:
+                await response.aclose()
+        
+        for message in parser.close():
+            yield to_flowise_event(message)
+
+    async def arun_flows(self,
+                         flow_endpoint_url: str,
+                         inputs: Iterable[Dict[str, Any]]) -> List[Union[Dict[str, Any], Exception]]:
+        """
+        Execute a flow for many inputs concurrently.
+
+        At most max_concurrency requests are in flight at once. A failure affects
+        only its own item.
+
+        Args:
+            flow_endpoint_url: The endpoint URL for the flow to execute.
+            inputs: Input data dictionaries, one per flow execution.
+
+        Returns:
+            Results in input order; failed items hold the raised Flowise exception.
+        """
+        return await asyncio.gather(
+            *(self.arun_flow(flow_endpoint_url, input_data) for input_data in inputs),
+            return_exceptions=True
+        )
+
+    async def aclose(self) -> None:
+        """Close the HTTP client bound to the running event loop."""
+        client = self._async_clients.pop(asyncio.get_running_loop(), None)
+        if client is not None:
+            await client.aclose()
+
+    async def __aenter__(self) -> "AsyncFlowiseClient":
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        await self.aclose()
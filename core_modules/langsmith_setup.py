@@ -7,6 +7,8 @@ integration for tracing, evaluation, and monitoring of AI components.
 
 import logging
 import os
+import uuid
+from datetime import datetime, timezone
 from typing import Dict, Any, Optional, List
 
 from ultimate_ai_architect_framework.core_modules.config_loader import ConfigLoader
@@ -22,12 +24,13 @@ class LangSmithSetup:
     - Evaluation configuration
     """
     
-    def __init__(self, framework_root: str):
+    def __init__(self, framework_root: str, config_loader: Optional[ConfigLoader] = None):
         """
         Initialize a new LangSmithSetup instance.
         
         Args:
             framework_root: Path to the framework root directory
+            config_loader: Optional shared ConfigLoader instance
         """
         # Initialize logger
         self.logger = logging.getLogger("core.langsmith_setup")
@@ -35,8 +38,8 @@ class LangSmithSetup:
         # Store framework root
         self.framework_root = framework_root
         
-        # Load global configuration using ConfigLoader
-        self.config_loader = ConfigLoader(framework_root)
+        # Load global configuration using the provided or a new ConfigLoader
+        self.config_loader = config_loader or ConfigLoader(framework_root)
         self.global_config = self.config_loader.load_global_config()
         
         # Initialize LangSmith client
@@ -207,6 +210,74 @@ class LangSmithSetup:
             self.logger.error(f"Failed to log run to LangSmith: {e}")
             return None
     
+    def start_run(self,
+                  run_name: str,
+                  inputs: Dict[str, Any],
+                  run_type: str = "llm",
+                  tags: Optional[List[str]] = None,
+                  metadata: Optional[Dict[str, Any]] = None) -> Optional[str]:
+        """
+        Start a LangSmith run that is completed later with end_run().
+        
+        Args:
+            run_name: Name of the run
+            inputs: Inputs to record for the run
+            run_type: LangSmith run type (default: 'llm')
+            tags: Optional tags to attach to the run
+            metadata: Optional metadata to attach to the run
+            
+        Returns:
+            Run ID if the run was created, None otherwise
+        """
+        if not self.client:
+            return None
+        
+        try:
+            run_id = str(uuid.uuid4())
+            self.client.create_run(
+                id=run_id,
+                name=run_name,
+                run_type=run_type,
+                inputs=inputs,
+                start_time=datetime.now(timezone.utc),
+                tags=tags,
+                extra={"metadata": metadata} if metadata else None
+            )
+            return run_id
+        except Exception as e:
+            self.logger.error(f"Failed to start LangSmith run '{run_name}': {e}")
+            return None
+    
+    def end_run(self,
+                run_id: str,
+                outputs: Optional[Dict[str, Any]] = None,
+                error: Optional[str] = None) -> bool:
+        """
+        Complete a run started with start_run().
+        
+        Args:
+            run_id: ID returned by start_run()
+            outputs: Outputs to record on success
+            error: Error message to record on failure
+            
+        Returns:
+            True if the run was updated successfully, False otherwise
+        """
+        if not self.client or not run_id:
+            return False
+        
+        try:
+            self.client.update_run(
+                run_id,
+                outputs=outputs,
+                error=error,
+                end_time=datetime.now(timezone.utc)
+            )
+            return True
+        except Exception as e:
+            self.logger.error(f"Failed to end LangSmith run {run_id}: {e}")
+            return False
+    
     def get_runs(self, project_name: str = None, limit: int = 10) -> List[dict]:
         """
         Get runs from LangSmith for a specific project.
@@ -0,0 +1,149 @@
+"""
+LLM Client Pool Module
+
+This module provides the LLMClientPool class, a bounded LRU cache of LangChain
+chat model clients. Reusing clients keeps their underlying HTTP connection pools
+and TLS sessions warm across agent runs instead of rebuilding them per call.
+"""
+
+import logging
+import threading
+import weakref
+from collections import OrderedDict
+from typing import Dict, Any, Callable, Optional, Tuple
+
+logger = logging.getLogger("core.llm_client_pool")
+
+# Pool key: (provider, model, temperature, max_tokens, api_base)
+ClientKey = Tuple[str, str, Optional[float], Optional[int], Optional[str]]
+
+
+class LLMClientPool:
+    """
+    Thread-safe, LRU-bounded pool of LLM clients keyed by their configuration.
+
+    Clients are keyed by (provider, model, temperature, max_tokens, api_base).
+    When the pool is full, the least recently used client is evicted. Hit, miss
+    and eviction counters are exposed through get_stats(). A client's key stays
+    available from get_key() after eviction for as long as callers still hold
+    the client.
+    """
+
+    def __init__(self, max_size: int = 32):
+        """
+        Initialize a new LLMClientPool instance.
+
+        Args:
+            max_size: Maximum number of clients to keep (must be at least 1)
+        """
+        self.max_size = max(1, int(max_size))
+        self._clients: "OrderedDict[ClientKey, Any]" = OrderedDict()
+        # Reverse lookup so callers can recover a client's key; entries are
+        # removed when the client is garbage collected, not when it is evicted
+        self._keys_by_client: Dict[int, ClientKey] = {}
+        self._lock = threading.Lock()
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    @staticmethod
+    def make_key(provider: str,
+                 model: str,
+                 temperature: Optional[float] = None,
+                 max_tokens: Optional[int] = None,
+                 api_base: Optional[str] = None) -> ClientKey:
+        """
+        Build the pool key for a client configuration.
+
+        Args:
+            provider: Provider prefix (e.g. 'openrouter', 'google_gemini')
+            model: Provider-specific model name
+            temperature: Sampling temperature
+            max_tokens: Maximum completion tokens
+            api_base: API base URL, if the provider uses one
+
+        Returns:
+            Hashable key tuple
+        """
+        return (provider, model, temperature, max_tokens, api_base)
+
+    def get_or_create(self, key: ClientKey, factory: Callable[[], Any]) -> Any:
+        """
+        Return the pooled client for key, building it with factory on a miss.
+
+        Args:
+            key: Pool key from make_key()
+            factory: Zero-argument callable that builds the client
+
+        Returns:
+            The pooled client instance
+
+        Raises:
+            Exception: Any exception raised by factory is propagated and nothing
+                is cached.
+        """
+        with self._lock:
+            client = self._clients.get(key)
+            if client is not None:
+                self._clients.move_to_end(key)
+                self.hits += 1
+                return client
+
+            self.misses += 1
+            client = factory()
+            self._clients[key] = client
+            self._track_key(client, key)
+
+            while len(self._clients) > self.max_size:
+                self._clients.popitem(last=False)
+                self.evictions += 1
+
+        logger.debug(f"Created pooled LLM client for {key[0]}.{key[1]}")
+        return client
+
+    def _track_key(self, client: Any, key: ClientKey) -> None:
+        """Record a new client's key until the client is garbage collected (caller holds the lock)."""
+        client_id = id(client)
+        self._keys_by_client[client_id] = key
+        # The id cannot be reused before the client is collected, so the
+        # callback never removes a newer client's entry. It runs from the
+        # garbage collector and must not take the lock.
+        weakref.finalize(client, self._keys_by_client.pop, client_id, None)
+
+    def get_key(self, client: Any) -> Optional[ClientKey]:
+        """
+        Get the pool key of a client handed out by this pool.
+
+        Args:
+            client: A client instance
+
+        Returns:
+            The client's key, or None if it was not created by this pool.
+            Evicted clients keep their key while they are still referenced.
+        """
+        with self._lock:
+            return self._keys_by_client.get(id(client))
+
+    def clear(self) -> None:
+        """Drop all pooled clients, e.g. after rotating API keys."""
+        with self._lock:
+            self._clients.clear()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get pool usage counters.
+
+        Returns:
+            Dictionary with size, max_size, hits, misses, evictions and hit_rate
+        """
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "size": len(self._clients),
+                "max_size": self.max_size,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "hit_rate": self.hits / lookups if lookups else 0.0
+            }
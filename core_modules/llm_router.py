@@ -6,9 +6,20 @@ based on task types and configured strategies.
 """
 
 import os
+import re
+import math
+import time
 import yaml
 import logging
-from typing import Optional, Dict, List, Any
+import threading
+from collections import deque
+from pathlib import Path
+from types import MappingProxyType
+from typing import Optional, Dict, List, Any, Tuple
+
+from .circuit_breaker import CircuitBreaker
+from .config_loader import ConfigSnapshotCache, FileSignature, file_signature, parse_yaml
+from .rate_limiter import PROVIDER_ALIASES
 
 # Configure logging
 logging.basicConfig(
@@ -17,6 +28,128 @@ logging.basicConfig(
 )
 logger = logging.getLogger("LLMRouter")
 
+# Matches an api_key value that names an environment variable, e.g. "${OPENROUTER_API_KEY}"
+ENV_REFERENCE = re.compile(r'^\$\{(\w+)\}$')
+
+# Supported routing strategies
+ROUTING_STRATEGIES = ('balanced', 'cost_optimized', 'performance_optimized')
+
+# Defaults for routellm.strategy_settings
+DEFAULT_STRATEGY_SETTINGS = {
+    'window_size': 100,        # Calls kept per model for rolling statistics
+    'min_samples': 5,          # Calls needed before a model can be judged degraded
+    'max_error_rate': 0.25,    # Error rate above which a model is degraded
+    'max_p95_latency': None,   # p95 latency (seconds) above which a model is degraded
+}
+
+# Defaults for routellm.circuit_breaker (see CircuitBreaker for meanings)
+DEFAULT_CIRCUIT_BREAKER_SETTINGS = {
+    'enabled': True,
+    'failure_rate_threshold': 0.5,
+    'slow_call_duration': None,
+    'slow_call_rate_threshold': 0.8,
+    'window_size': 20,
+    'min_calls': 5,
+    'open_duration': 30.0,
+    'half_open_max_calls': 1,
+}
+
+
+class ModelStats:
+    """
+    Rolling latency, error-rate and token-cost statistics for one model.
+    
+    Keeps the most recent window_size call outcomes. Latency percentiles are
+    computed over successful calls and cached until the next recorded call.
+    """
+    
+    def __init__(self, window_size: int = 100):
+        """
+        Initialize an empty statistics window.
+        
+        Args:
+            window_size: Number of recent calls to keep.
+        """
+        self._latencies = deque(maxlen=window_size)
+        self._outcomes = deque(maxlen=window_size)
+        self._tokens = deque(maxlen=window_size)
+        self._costs = deque(maxlen=window_size)
+        self._sorted_latencies: Optional[List[float]] = None
+        self.total_calls = 0
+    
+    def record(self, latency: float, success: bool, tokens: int = 0, cost: Optional[float] = None) -> None:
+        """
+        Record the outcome of one call.
+        
+        Args:
+            latency: Call duration in seconds.
+            success: Whether the call succeeded.
+            tokens: Total tokens used by the call.
+            cost: Cost of the call, if known.
+        """
+        self._outcomes.append(bool(success))
+        if success:
+            self._latencies.append(latency)
+            self._sorted_latencies = None
+        if tokens and cost is not None:
+            self._tokens.append(tokens)
+            self._costs.append(cost)
+        self.total_calls += 1
+    
+    @property
+    def samples(self) -> int:
+        """Number of calls in the current window."""
+        return len(self._outcomes)
+    
+    @property
+    def error_rate(self) -> float:
+        """Fraction of failed calls in the current window."""
+        if not self._outcomes:
+            return 0.0
+        return 1.0 - sum(self._outcomes) / len(self._outcomes)
+    
+    def percentile(self, pct: float) -> Optional[float]:
+        """
+        Get a latency percentile over successful calls in the window.
+        
+        Args:
+            pct: Percentile between 0 and 100.
+            
+        Returns:
+            Latency in seconds, or None if no successful calls were recorded.
+        """
+        if not self._latencies:
+            return None
+        if self._sorted_latencies is None:
+            self._sorted_latencies = sorted(self._latencies)
+        values = self._sorted_latencies
+        index = min(len(values) - 1, max(0, math.ceil(pct / 100.0 * len(values)) - 1))
+        return values[index]
+    
+    @property
+    def cost_per_1k_tokens(self) -> Optional[float]:
+        """Observed cost per 1,000 tokens, or None if no costed calls were recorded."""
+        total_tokens = sum(self._tokens)
+        if not total_tokens:
+            return None
+        return sum(self._costs) / total_tokens * 1000.0
+    
+    def snapshot(self) -> Dict[str, Any]:
+        """
+        Get the current statistics as a dictionary.
+        
+        Returns:
+            Dictionary with samples, total_calls, error_rate, p50, p95 and cost_per_1k_tokens.
+        """
+        return {
+            'samples': self.samples,
+            'total_calls': self.total_calls,
+            'error_rate': self.error_rate,
+            'p50': self.percentile(50),
+            'p95': self.percentile(95),
+            'cost_per_1k_tokens': self.cost_per_1k_tokens
+        }
+
 
 class LLMRouter:
     """
@@ -25,32 +158,274 @@ class LLMRouter:
     
     The router loads configuration from the global_settings.yaml file and implements
     various routing strategies including 'balanced', 'cost_optimized', and 'performance_optimized'.
+    
+    Model validation (provider enablement, API key presence and available models)
+    is compiled into an immutable routing table at initialization, so route() is
+    a dictionary lookup. The table is rebuilt by refresh(), or automatically when
+    refresh_interval is set and the config file or API key environment changes.
+    Subscribing on_config_changed() to a ConfigLoader whose watcher is running
+    refreshes the router as soon as the file changes instead.
+    
+    Callers report call outcomes through record_result(). The router keeps
+    rolling per-model latency, error-rate and cost statistics, and the active
+    strategy uses them to choose among a task's candidate models:
+    - 'balanced': the most preferred candidate that is not degraded
+    - 'cost_optimized': the cheapest healthy candidate
+    - 'performance_optimized': the healthy candidate with the lowest p50 latency
+    
+    Each provider also has a circuit breaker fed by record_result(). Models of
+    providers whose circuit is open are skipped at routing time, and callers
+    can check allow_request() before sending a request.
     """
     
-    def __init__(self, config_path: str = None):
+    def __init__(self,
+                 config_path: str = None,
+                 refresh_interval: Optional[float] = None,
+                 snapshot_cache: Optional[ConfigSnapshotCache] = None):
         """
         Initialize the LLMRouter by loading configuration from the specified YAML file.
         
         Args:
             config_path: Path to the configuration YAML file. If None, uses the default path.
+            refresh_interval: If set, route() checks at most this often (in seconds)
+                whether the config file or API key environment changed, and
+                recompiles the routing table if so. Defaults to the
+                routellm.refresh_interval config value; None disables the check.
+            snapshot_cache: Optional parsed-config snapshot cache (usually the
+                shared ConfigLoader's), so the config file is not re-parsed
+                by every process.
         """
         if config_path is None:
             config_path = os.path.expanduser("~/projects/ultimate_ai_architect_framework/ultimate_ai_architect_framework/configs/global_settings.yaml")
         
         self.config_path = config_path
-        self.config = self._load_config()
+        self.snapshot_cache = snapshot_cache
+        
+        # Rolling per-model call statistics, fed by record_result()
+        self._model_stats: Dict[str, ModelStats] = {}
+        self._stats_lock = threading.Lock()
+        
+        # Per-provider circuit breakers, created on first use
+        self._breakers: Dict[str, CircuitBreaker] = {}
+        
+        self._apply_config(self._load_config())
+        
+        if refresh_interval is None:
+            refresh_interval = self.routellm_config.get('refresh_interval')
+        self.refresh_interval = refresh_interval
+        self._next_refresh_check = time.monotonic() + (refresh_interval or 0)
+        
+        logger.info(f"LLMRouter initialized with strategy: {self.default_strategy}")
+        logger.info(f"Fallback model set to: {self.fallback_model}")
+    
+    def _apply_config(self, config: Dict[str, Any]) -> None:
+        """
+        Extract routing settings from a loaded configuration and compile the routing table.
+        
+        Args:
+            config: The parsed configuration dictionary.
+        """
+        self.config = config or {}
         
         # Extract relevant configuration sections
         self.routellm_config = self.config.get('routellm', {})
-        self.llm_providers_config = self.config.get('llm_providers', {})
+        self.llm_providers_config = self._load_providers_config(self.config)
         
         # Extract key routing parameters
         self.default_strategy = self.routellm_config.get('default_strategy', 'balanced')
         self.fallback_model = self.routellm_config.get('fallback_model', 'openai.gpt-3.5-turbo')
-        self.task_model_mapping = self.routellm_config.get('task_model_mapping', {})
+        self.fallback_model = self.normalize_model_id(self.fallback_model)
+        self.task_model_mapping = {
+            task_type: self.normalize_model_id(model_id)
+            for task_type, model_id in (self.routellm_config.get('task_model_mapping', {}) or {}).items()
+        }
         
-        logger.info(f"LLMRouter initialized with strategy: {self.default_strategy}")
-        logger.info(f"Fallback model set to: {self.fallback_model}")
+        self.strategy_settings = dict(DEFAULT_STRATEGY_SETTINGS)
+        self.strategy_settings.update(self.routellm_config.get('strategy_settings', {}) or {})
+        self.circuit_breaker_settings = dict(DEFAULT_CIRCUIT_BREAKER_SETTINGS)
+        self.circuit_breaker_settings.update(self.routellm_config.get('circuit_breaker', {}) or {})
+        
+        if self.default_strategy not in ROUTING_STRATEGIES:
+            logger.warning(f"Unknown routing strategy '{self.default_strategy}', using 'balanced'")
+            self.default_strategy = 'balanced'
+        
+        self._compile_routing_table()
+    
+    @staticmethod
+    def _load_providers_config(config: Dict[str, Any]) -> Dict[str, Dict[str, Any]]:
+        """
+        Get the provider settings in the router's format.
+        
+        Providers are read from llm.providers, falling back to the legacy
+        top-level llm_providers section. llm.providers entries are enabled
+        unless they set 'enabled: false', take their key from an
+        api_key: "${VAR}" reference, and offer their default_model and the
+        values of their per-task 'models' map.
+        
+        Args:
+            config: The parsed configuration dictionary.
+            
+        Returns:
+            Mapping of provider name to settings with 'enabled', 'api_key_env'
+            and 'available_models' keys.
+        """
+        providers = (config.get('llm', {}) or {}).get('providers')
+        if not providers:
+            return config.get('llm_providers', {}) or {}
+        
+        normalized = {}
+        for provider_name, provider_config in providers.items():
+            provider_config = dict(provider_config or {})
+            provider_config.setdefault('enabled', True)
+            if 'api_key_env' not in provider_config:
+                match = ENV_REFERENCE.match(str(provider_config.get('api_key') or ''))
+                if match:
+                    provider_config['api_key_env'] = match.group(1)
+            if 'available_models' not in provider_config:
+                models = [provider_config.get('default_model')]
+                models.extend((provider_config.get('models', {}) or {}).values())
+                provider_config['available_models'] = list(dict.fromkeys(m for m in models if m))
+            normalized[provider_name] = provider_config
+        return normalized
+    
+    @staticmethod
+    def normalize_model_id(model_id: str) -> str:
+        """
+        Rewrite a client-side provider prefix to the configured provider name.
+        
+        Args:
+            model_id: Model identifier in the format 'provider.model_name'.
+            
+        Returns:
+            The identifier with an aliased provider (e.g. 'google_gemini')
+            replaced by its configured name (e.g. 'google').
+        """
+        provider_name, sep, model_name = model_id.partition('.')
+        if sep and provider_name in PROVIDER_ALIASES:
+            return f"{PROVIDER_ALIASES[provider_name]}.{model_name}"
+        return model_id
+    
+    def _get_config_signature(self) -> FileSignature:
+        """
+        Get a cheap change-detection signature for the config file.
+        
+        Returns:
+            Tuple of (mtime_ns, size, inode), or None if the file cannot be stat'ed.
+        """
+        return file_signature(self.config_path)
+    
+    def _get_env_signature(self) -> Tuple[Tuple[str, bool], ...]:
+        """
+        Get the API key presence for every configured provider.
+        
+        Returns:
+            Tuple of (provider_name, api_key_available) pairs.
+        """
+        return tuple(
+            (provider_name, self._is_api_key_available(provider_name))
+            for provider_name in self.llm_providers_config
+        )
+    
+    def _compile_routing_table(self) -> None:
+        """
+        Precompute the ordered candidate models for every mapped task type.
+        
+        Each task maps to a tuple of usable models: its mapped model (if valid),
+        then the fallback model (if valid), then the default model of each
+        enabled provider with an API key, then the remaining available models
+        of those providers. Requests without a mapped task use the same chain
+        minus the task-specific model. Strategies other than 'balanced' pick
+        from the whole chain.
+        """
+        validity: Dict[str, bool] = {}
+        
+        def is_valid(model_id: str) -> bool:
+            if model_id not in validity:
+                validity[model_id] = self._validate_model(model_id)
+            return validity[model_id]
+        
+        default_candidates: List[str] = []
+        if is_valid(self.fallback_model):
+            default_candidates.append(self.fallback_model)
+        else:
+            logger.warning(f"Fallback model {self.fallback_model} is not available, alternative provider defaults will be used")
+        
+        for provider_name, provider_config in self.llm_providers_config.items():
+            if self._is_provider_available(provider_name) and self._is_api_key_available(provider_name):
+                default_model = provider_config.get('default_model')
+                if default_model:
+                    model_id = f"{provider_name}.{default_model}"
+                    if model_id not in default_candidates:
+                        default_candidates.append(model_id)
+        
+        if not default_candidates:
+            logger.error("No available models found. Routing will return the fallback model, but it may not work.")
+        
+        for provider_name, provider_config in self.llm_providers_config.items():
+            if self._is_provider_available(provider_name) and self._is_api_key_available(provider_name):
+                for model_name in provider_config.get('available_models', []):
+                    model_id = f"{provider_name}.{model_name}"
+                    if model_id not in default_candidates:
+                        default_candidates.append(model_id)
+        
+        routing_table: Dict[str, Tuple[str, ...]] = {}
+        for task_type, candidate_model in self.task_model_mapping.items():
+            if is_valid(candidate_model):
+                chain = [candidate_model] + [m for m in default_candidates if m != candidate_model]
+            else:
+                logger.warning(f"Model {candidate_model} mapped to task '{task_type}' is not available, tasks will use the fallback chain")
+                chain = list(default_candidates)
+            routing_table[task_type] = tuple(chain)
+        
+        self._routing_table = MappingProxyType(routing_table)
+        self._default_candidates = tuple(default_candidates)
+        self._config_signature = self._get_config_signature()
+        self._env_signature = self._get_env_signature()
+        
+        logger.debug(f"Compiled routing table for {len(routing_table)} task types")
+    
+    def refresh(self) -> None:
+        """
+        Reload the configuration file and recompile the routing table.
+        
+        Call this after editing the config file or changing API key
+        environment variables.
+        """
+        self._apply_config(self._load_config())
+        logger.info(f"Routing table refreshed from {self.config_path}")
+    
+    def on_config_changed(self, config_key: str, file_path: Path) -> None:
+        """
+        ConfigLoader listener: refresh the router when its config file changed.
+        
+        Args:
+            config_key: Cache key of the changed configuration
+            file_path: Path of the changed file
+        """
+        if os.path.realpath(file_path) != os.path.realpath(self.config_path):
+            return
+        if self._get_config_signature() == self._config_signature:
+            return
+        try:
+            self.refresh()
+        except Exception as e:
+            logger.error(f"Failed to refresh routing configuration, keeping previous table: {e}")
+    
+    def _maybe_refresh(self) -> None:
+        """Recompile the routing table if the config file or API key environment changed."""
+        now = time.monotonic()
+        if now < self._next_refresh_check:
+            return
+        self._next_refresh_check = now + self.refresh_interval
+        
+        if self._get_config_signature() != self._config_signature:
+            try:
+                self.refresh()
+            except Exception as e:
+                logger.error(f"Failed to refresh routing configuration, keeping previous table: {e}")
+        elif self._get_env_signature() != self._env_signature:
+            self._compile_routing_table()
+            logger.info("Routing table recompiled after API key environment change")
     
     def _load_config(self) -> Dict[str, Any]:
         """
@@ -64,10 +439,13 @@ class LLMRouter:
             yaml.YAMLError: If the YAML file is malformed.
         """
         try:
-            with open(self.config_path, 'r') as file:
-                config = yaml.safe_load(file)
-                logger.info(f"Configuration loaded from {self.config_path}")
-                return config
+            if self.snapshot_cache is not None:
+                config = self.snapshot_cache.load(self.config_path)
+            else:
+                with open(self.config_path, 'r') as file:
+                    config = parse_yaml(file)
+            logger.info(f"Configuration loaded from {self.config_path}")
+            return config
         except FileNotFoundError:
             logger.error(f"Configuration file not found: {self.config_path}")
             raise
@@ -90,7 +468,8 @@ class LLMRouter:
     
     def _is_api_key_available(self, provider_name: str) -> bool:
         """
-        Check if the API key for a provider is available in environment variables.
+        Check if the API key for a provider is available in environment variables
+        or set literally in the configuration.
         
         Args:
             provider_name: Name of the provider to check.
@@ -102,6 +481,9 @@ class LLMRouter:
         api_key_env = provider_config.get('api_key_env')
         
         if not api_key_env:
+            api_key = provider_config.get('api_key')
+            if api_key and '${' not in str(api_key):
+                return True
             logger.warning(f"No API key environment variable configured for {provider_name}")
             return False
         
@@ -118,8 +500,8 @@ class LLMRouter:
         Returns:
             tuple: (provider_name, model_name)
         """
-        parts = model_id.split('.')
-        if len(parts) != 2:
+        parts = model_id.split('.', 1)
+        if len(parts) != 2 or not all(parts):
             logger.warning(f"Invalid model identifier format: {model_id}. Expected 'provider.model_name'")
             return None, None
         
@@ -135,7 +517,7 @@ class LLMRouter:
         Returns:
             bool: True if the model is valid and available, False otherwise.
         """
-        provider_name, model_name = self._parse_model_identifier(model_id)
+        provider_name, model_name = self._parse_model_identifier(self.normalize_model_id(model_id))
         
         if not provider_name or not model_name:
             return False
@@ -160,52 +542,253 @@ class LLMRouter:
         
         return True
     
-    def route(self, task_type: Optional[str] = None, query: Optional[str] = None) -> str:
+    def get_candidates(self, task_type: Optional[str] = None) -> Tuple[str, ...]:
+        """
+        Get the precompiled, ordered candidate models for a task type.
+        
+        Args:
+            task_type: Type of task to route, or None for the default chain.
+            
+        Returns:
+            Tuple of usable model identifiers, most preferred first.
+        """
+        if self.refresh_interval is not None:
+            self._maybe_refresh()
+        return self._routing_table.get(task_type, self._default_candidates)
+    
+    def route(self, task_type: Optional[str] = None, query: Optional[str] = None, strategy: Optional[str] = None) -> str:
         """
         Route to the appropriate LLM model based on task type and routing strategy.
         
         Args:
             task_type: Type of task to route (e.g., 'creative_writing', 'code_generation').
             query: The query text (not used in the current implementation but reserved for future use).
+            strategy: Routing strategy to use instead of the configured default_strategy.
             
         Returns:
             str: Selected model identifier in the format 'provider.model_name'.
+                If no model is available, the fallback model is returned anyway
+                (caller will need to handle the error).
+        """
+        candidates = self.get_candidates(task_type)
+        if not candidates:
+            return self.fallback_model
+        
+        strategy = strategy or self.default_strategy
+        # Fast path: with no observations yet, no circuit can be open and
+        # balanced routing keeps the static preference
+        if strategy == 'balanced' and not self._model_stats:
+            return candidates[0]
+        
+        available = tuple(m for m in candidates if self._is_circuit_available(m))
+        if not available:
+            logger.warning(f"Circuits are open for all candidate models, routing to {candidates[0]} anyway")
+            return candidates[0]
+        return self._select_by_strategy(available, strategy)
+    
+    @staticmethod
+    def _get_provider_name(model_id: str) -> str:
+        """Get the provider part of a 'provider.model_name' identifier."""
+        return model_id.split('.', 1)[0]
+    
+    def _get_breaker(self, model_id: str) -> Optional[CircuitBreaker]:
         """
-        # Use the 'balanced' strategy with task_model_mapping
-        if task_type and task_type in self.task_model_mapping:
-            candidate_model = self.task_model_mapping[task_type]
-            logger.info(f"Task type '{task_type}' mapped to model: {candidate_model}")
+        Get the circuit breaker for a model's provider, creating it if needed.
+        
+        Args:
+            model_id: Model identifier in the format 'provider.model_name'.
             
-            # Validate the candidate model
-            if self._validate_model(candidate_model):
-                logger.info(f"Selected model: {candidate_model} for task: {task_type}")
-                return candidate_model
-            else:
-                logger.warning(f"Candidate model {candidate_model} is not available, falling back to: {self.fallback_model}")
-        else:
-            if task_type:
-                logger.info(f"No mapping found for task type: {task_type}, using fallback model")
+        Returns:
+            The provider's CircuitBreaker, or None if circuit breaking is disabled.
+        """
+        settings = self.circuit_breaker_settings
+        if not settings.get('enabled', True):
+            return None
+        provider_name = self._get_provider_name(model_id)
+        breaker = self._breakers.get(provider_name)
+        if breaker is None:
+            with self._stats_lock:
+                breaker = self._breakers.get(provider_name)
+                if breaker is None:
+                    breaker = CircuitBreaker(
+                        provider_name,
+                        failure_rate_threshold=settings['failure_rate_threshold'],
+                        slow_call_duration=settings['slow_call_duration'],
+                        slow_call_rate_threshold=settings['slow_call_rate_threshold'],
+                        window_size=settings['window_size'],
+                        min_calls=settings['min_calls'],
+                        open_duration=settings['open_duration'],
+                        half_open_max_calls=settings['half_open_max_calls']
+                    )
+                    self._breakers[provider_name] = breaker
+        return breaker
+    
+    def _is_circuit_available(self, model_id: str) -> bool:
+        """Check, without consuming a trial slot, whether a model's provider circuit admits requests."""
+        breaker = self._breakers.get(self._get_provider_name(model_id))
+        return breaker is None or breaker.is_available()
+    
+    def allow_request(self, model_id: str) -> bool:
+        """
+        Ask the provider's circuit breaker whether a request may be sent.
+        
+        A granted request must be reported with record_result() so that
+        half-open trial calls can close or re-open the circuit.
+        
+        Args:
+            model_id: Model identifier in the format 'provider.model_name'.
+            
+        Returns:
+            bool: True if the request may be sent.
+        """
+        model_id = self.normalize_model_id(model_id)
+        breaker = self._get_breaker(model_id)
+        return breaker is None or breaker.allow_request()
+    
+    def get_circuit_states(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Get the state of every provider circuit breaker.
+        
+        Returns:
+            Mapping of provider name to breaker snapshot.
+        """
+        return {name: breaker.snapshot() for name, breaker in list(self._breakers.items())}
+    
+    def _get_configured_cost(self, model_id: str) -> Optional[float]:
+        """
+        Get the configured cost per 1,000 tokens for a model.
+        
+        Reads the provider's pricing.<model> setting first, then its
+        provider-wide cost_per_1k_tokens.
+        
+        Args:
+            model_id: Model identifier in the format 'provider.model_name'.
+            
+        Returns:
+            Cost per 1,000 tokens, or None if not configured.
+        """
+        provider_name, model_name = self._parse_model_identifier(model_id)
+        provider_config = self.llm_providers_config.get(provider_name, {}) if provider_name else {}
+        pricing = provider_config.get('pricing', {}) or {}
+        if model_name in pricing:
+            return pricing[model_name]
+        return provider_config.get('cost_per_1k_tokens')
+    
+    def _is_degraded(self, stats: Optional[ModelStats]) -> bool:
+        """
+        Check whether a model's recent statistics exceed the configured limits.
+        
+        Args:
+            stats: The model's statistics, or None if it has not been used.
+            
+        Returns:
+            bool: True if the model has enough samples and is over a limit.
+        """
+        if stats is None or stats.samples < self.strategy_settings['min_samples']:
+            return False
+        if stats.error_rate > self.strategy_settings['max_error_rate']:
+            return True
+        max_p95 = self.strategy_settings.get('max_p95_latency')
+        p95 = stats.percentile(95)
+        return max_p95 is not None and p95 is not None and p95 > max_p95
+    
+    def _select_by_strategy(self, candidates: Tuple[str, ...], strategy: str) -> str:
+        """
+        Pick a model from the candidates according to a routing strategy.
+        
+        Args:
+            candidates: Usable model identifiers, most preferred first.
+            strategy: One of 'balanced', 'cost_optimized' or 'performance_optimized'.
+            
+        Returns:
+            str: The selected model identifier.
+        """
+        with self._stats_lock:
+            stats = {model_id: self._model_stats.get(model_id) for model_id in candidates}
+            healthy = [model_id for model_id in candidates if not self._is_degraded(stats[model_id])]
+            
+            if not healthy:
+                # Everything is degraded: pick the least-bad model rather than failing
+                selected = min(candidates, key=lambda m: (stats[m].error_rate, stats[m].percentile(95) or 0.0))
+                logger.warning(f"All candidate models are degraded, selected least-degraded model: {selected}")
+                return selected
+            
+            if strategy == 'cost_optimized':
+                def cost_key(model_id: str) -> float:
+                    model_stats = stats[model_id]
+                    observed = model_stats.cost_per_1k_tokens if model_stats else None
+                    cost = observed if observed is not None else self._get_configured_cost(model_id)
+                    return cost if cost is not None else math.inf
+                # min() keeps the earliest (most preferred) model among equal costs
+                return min(healthy, key=cost_key)
+            
+            if strategy == 'performance_optimized':
+                def latency_key(model_id: str) -> float:
+                    model_stats = stats[model_id]
+                    if model_stats is None or not model_stats.samples:
+                        # Models never called are tried first so they get measured
+                        return 0.0
+                    p50 = model_stats.percentile(50)
+                    # Models whose calls have all failed rank after measured ones
+                    return p50 if p50 is not None else math.inf
+                return min(healthy, key=latency_key)
+            
+            return healthy[0]
+    
+    def record_result(self,
+                      model_id: str,
+                      latency: float,
+                      success: bool = True,
+                      tokens: int = 0,
+                      cost: Optional[float] = None) -> None:
+        """
+        Record the outcome of a call to a model for strategy-aware routing
+        and the provider's circuit breaker.
+        
+        Args:
+            model_id: Model identifier in the format 'provider.model_name'.
+            latency: Call duration in seconds.
+            success: Whether the call succeeded.
+            tokens: Total tokens used by the call.
+            cost: Actual cost of the call. If None, it is estimated from the
+                configured pricing.
+        """
+        model_id = self.normalize_model_id(model_id)
+        if cost is None and tokens:
+            price = self._get_configured_cost(model_id)
+            if price is not None:
+                cost = tokens / 1000.0 * price
+        
+        with self._stats_lock:
+            stats = self._model_stats.get(model_id)
+            if stats is None:
+                stats = ModelStats(self.strategy_settings['window_size'])
+                self._model_stats[model_id] = stats
+            stats.record(latency, success, tokens, cost)
+        
+        breaker = self._get_breaker(model_id)
+        if breaker is not None:
+            if success:
+                breaker.record_success(latency)
             else:
-                logger.info(f"No task type provided, using fallback model")
+                breaker.record_failure(latency)
+    
+    def get_model_stats(self, model_id: Optional[str] = None) -> Dict[str, Any]:
+        """
+        Get rolling call statistics.
         
-        # Validate the fallback model
-        if self._validate_model(self.fallback_model):
-            return self.fallback_model
-        else:
-            # If fallback model is also not available, find the first available model
-            logger.warning(f"Fallback model {self.fallback_model} is not available, searching for any available model")
-            
-            for provider_name, provider_config in self.llm_providers_config.items():
-                if self._is_provider_available(provider_name) and self._is_api_key_available(provider_name):
-                    default_model = provider_config.get('default_model')
-                    if default_model:
-                        model_id = f"{provider_name}.{default_model}"
-                        logger.info(f"Selected alternative model: {model_id}")
-                        return model_id
-            
-            # If no model is available, return the fallback model anyway (caller will need to handle the error)
-            logger.error("No available models found. Returning fallback model, but it may not work.")
-            return self.fallback_model
+        Args:
+            model_id: Model to report on, or None for all models.
+            
+        Returns:
+            The model's statistics dictionary, or a mapping of model
+            identifier to statistics when model_id is None.
+        """
+        with self._stats_lock:
+            if model_id is not None:
+                stats = self._model_stats.get(self.normalize_model_id(model_id))
+                return stats.snapshot() if stats else {}
+            return {m: stats.snapshot() for m, stats in self._model_stats.items()}
 
 
 if __name__ == "__main__":
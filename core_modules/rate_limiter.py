@@ -0,0 +1,357 @@
+"""
+Rate Limiter Module
+
+This module provides the RateLimiter class, a per-provider token-bucket limiter
+with requests-per-minute and tokens-per-minute budgets. One limiter is shared by
+all agents in a process; with a state file it can also coordinate several worker
+processes on the same host through an exclusive file lock.
+"""
+
+import asyncio
+import json
+import logging
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Dict, Any, Callable, Optional, Tuple, Union
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - not available on Windows
+    fcntl = None
+
+logger = logging.getLogger("core.rate_limiter")
+
+# Client-side provider prefixes that share a configured provider's budget
+PROVIDER_ALIASES = {
+    "google_gemini": "google",
+}
+
+
+class RateLimitExceeded(Exception):
+    """Exception raised when a rate limit slot cannot be acquired within the timeout."""
+    pass
+
+
+class TokenBucket:
+    """
+    A token bucket that refills continuously up to its capacity.
+
+    The bucket state is just (level, updated_at), so it can be persisted and
+    shared between processes.
+    """
+
+    def __init__(self, capacity: float, refill_per_second: float):
+        """
+        Initialize a full bucket.
+
+        Args:
+            capacity: Maximum number of tokens (the allowed burst)
+            refill_per_second: Tokens added per second
+        """
+        self.capacity = float(capacity)
+        self.refill_per_second = float(refill_per_second)
+        self.level = self.capacity
+        self.updated_at: Optional[float] = None
+
+    def refill(self, now: float) -> None:
+        """Add the tokens accrued since the last update."""
+        if self.updated_at is not None and now > self.updated_at:
+            self.level = min(self.capacity, self.level + (now - self.updated_at) * self.refill_per_second)
+        self.updated_at = now
+
+    def wait_time(self, amount: float) -> float:
+        """
+        Seconds until amount tokens are available (0 if available now).
+
+        Requests larger than the capacity only wait for a full bucket, so they
+        can never block forever.
+        """
+        needed = min(amount, self.capacity) - self.level
+        if needed <= 0:
+            return 0.0
+        return needed / self.refill_per_second
+
+    def consume(self, amount: float) -> None:
+        """Remove tokens; the level may go negative for oversized requests."""
+        self.level -= amount
+
+    def get_state(self) -> Tuple[float, Optional[float]]:
+        return (self.level, self.updated_at)
+
+    def set_state(self, state) -> None:
+        self.level, self.updated_at = state
+
+
+class RateLimiter:
+    """
+    Per-provider requests-per-minute and tokens-per-minute limiter.
+
+    Each provider with configured limits gets a request bucket and a token
+    bucket. acquire() blocks (and acquire_async() awaits) until both have
+    capacity, then consumes from both at once. Providers without limits are
+    never throttled.
+
+    In 'file' mode the bucket state lives in a JSON file guarded by an exclusive
+    fcntl lock, so all processes using the same state_path share one budget.
+    """
+
+    def __init__(self,
+                 limits: Dict[str, Dict[str, Any]],
+                 mode: str = "local",
+                 state_path: Optional[Union[str, Path]] = None,
+                 clock: Callable[[], float] = time.monotonic,
+                 sleep: Callable[[float], None] = time.sleep):
+        """
+        Initialize a new RateLimiter instance.
+
+        Args:
+            limits: Mapping of provider name to a dict with optional
+                'requests_per_minute' and 'tokens_per_minute' values
+            mode: 'local' for an in-process budget or 'file' for a budget shared
+                across processes through state_path
+            state_path: Path of the shared state file (required for 'file' mode)
+            clock: Monotonic time source for local buckets and wait times
+                (injectable for testing)
+            sleep: Blocking sleep used by acquire() (injectable for testing)
+        """
+        self.limits = {
+            provider: {
+                "requests_per_minute": config.get("requests_per_minute"),
+                "tokens_per_minute": config.get("tokens_per_minute")
+            }
+            for provider, config in (limits or {}).items()
+            if config and (config.get("requests_per_minute") or config.get("tokens_per_minute"))
+        }
+
+        if mode == "file" and (fcntl is None or not state_path):
+            logger.warning("File-locked rate limiting needs fcntl and a state_path; falling back to local mode")
+            mode = "local"
+        self.mode = mode
+        self.state_path = Path(state_path) if state_path else None
+        if self.state_path:
+            self.state_path.parent.mkdir(parents=True, exist_ok=True)
+
+        self._buckets: Dict[str, Dict[str, TokenBucket]] = {
+            provider: self._build_buckets(provider) for provider in self.limits
+        }
+        self._lock = threading.Lock()
+        self._clock = clock
+        self._sleep = sleep
+
+        # Wait-time metrics per provider
+        self._metrics: Dict[str, Dict[str, Any]] = {}
+
+        logger.info(f"Rate limiter initialized in {self.mode} mode for providers: {list(self.limits)}")
+
+    def _build_buckets(self, provider: str) -> Dict[str, TokenBucket]:
+        """Create the request and token buckets for a provider's limits."""
+        buckets = {}
+        rpm = self.limits[provider]["requests_per_minute"]
+        tpm = self.limits[provider]["tokens_per_minute"]
+        if rpm:
+            buckets["requests"] = TokenBucket(rpm, rpm / 60.0)
+        if tpm:
+            buckets["tokens"] = TokenBucket(tpm, tpm / 60.0)
+        return buckets
+
+    def _resolve_provider(self, provider: str) -> str:
+        return PROVIDER_ALIASES.get(provider, provider)
+
+    def _try_acquire_buckets(self, buckets: Dict[str, TokenBucket], tokens: int, now: float) -> float:
+        """
+        Consume one request and the given tokens if all buckets allow it.
+
+        Returns:
+            0.0 if acquired, otherwise the seconds to wait before retrying
+        """
+        amounts = {"requests": 1, "tokens": tokens}
+        wait = 0.0
+        for name, bucket in buckets.items():
+            bucket.refill(now)
+            wait = max(wait, bucket.wait_time(amounts[name]))
+        if wait > 0:
+            return wait
+        for name, bucket in buckets.items():
+            bucket.consume(amounts[name])
+        return 0.0
+
+    def _try_acquire(self, provider: str, tokens: int) -> float:
+        """Attempt one acquisition in the configured mode."""
+        buckets = self._buckets[provider]
+        if self.mode == "file":
+            return self._try_acquire_shared(provider, buckets, tokens)
+        with self._lock:
+            return self._try_acquire_buckets(buckets, tokens, self._clock())
+
+    def _try_acquire_shared(self, provider: str, buckets: Dict[str, TokenBucket], tokens: int) -> float:
+        """Attempt one acquisition against the file-locked shared state."""
+        with self._lock, open(self.state_path, "a+") as f:
+            fcntl.flock(f.fileno(), fcntl.LOCK_EX)
+            try:
+                f.seek(0)
+                content = f.read()
+                try:
+                    state = json.loads(content) if content else {}
+                except ValueError:
+                    logger.warning(f"Corrupt rate limiter state in {self.state_path}, resetting")
+                    state = {}
+
+                provider_state = state.get(provider, {})
+                for name, bucket in buckets.items():
+                    if name in provider_state:
+                        bucket.set_state(provider_state[name])
+                    else:
+                        bucket.set_state((bucket.capacity, None))
+
+                # Wall-clock time, since monotonic clocks are not comparable across processes
+                wait = self._try_acquire_buckets(buckets, tokens, time.time())
+
+                state[provider] = {name: bucket.get_state() for name, bucket in buckets.items()}
+                f.seek(0)
+                f.truncate()
+                json.dump(state, f)
+                f.flush()
+                return wait
+            finally:
+                fcntl.flock(f.fileno(), fcntl.LOCK_UN)
+
+    def _metrics_for(self, provider: str) -> Dict[str, Any]:
+        metrics = self._metrics.get(provider)
+        if metrics is None:
+            metrics = {"acquired": 0, "waiting": 0, "total_wait": 0.0, "max_wait": 0.0, "last_wait": 0.0, "timeouts": 0}
+            self._metrics[provider] = metrics
+        return metrics
+
+    def _record_wait(self, provider: str, waited: float, acquired: bool) -> None:
+        with self._lock:
+            metrics = self._metrics_for(provider)
+            metrics["waiting"] -= 1
+            if acquired:
+                metrics["acquired"] += 1
+                metrics["total_wait"] += waited
+                metrics["max_wait"] = max(metrics["max_wait"], waited)
+                metrics["last_wait"] = waited
+            else:
+                metrics["timeouts"] += 1
+
+    def _begin_wait(self, provider: str) -> None:
+        with self._lock:
+            self._metrics_for(provider)["waiting"] += 1
+
+    def acquire(self, provider: str, tokens: int = 0, timeout: Optional[float] = None) -> float:
+        """
+        Block until the provider's budgets admit one request using tokens tokens.
+
+        Args:
+            provider: Provider name (client prefixes such as 'google_gemini' are
+                mapped to their configured provider)
+            tokens: Estimated tokens the request will use
+            timeout: Maximum seconds to wait, or None to wait as long as needed
+
+        Returns:
+            Seconds spent waiting
+
+        Raises:
+            RateLimitExceeded: If the slot could not be acquired within timeout
+        """
+        provider = self._resolve_provider(provider)
+        if provider not in self._buckets:
+            return 0.0
+
+        start = self._clock()
+        self._begin_wait(provider)
+        while True:
+            wait = self._try_acquire(provider, tokens)
+            waited = self._clock() - start
+            if wait <= 0:
+                self._record_wait(provider, waited, True)
+                return waited
+            if timeout is not None and waited + wait > timeout:
+                self._record_wait(provider, waited, False)
+                raise RateLimitExceeded(f"Rate limit for '{provider}' not available within {timeout} seconds")
+            self._sleep(wait)
+
+    async def acquire_async(self, provider: str, tokens: int = 0, timeout: Optional[float] = None) -> float:
+        """
+        Await until the provider's budgets admit one request using tokens tokens.
+
+        Same semantics as acquire(), but waits with asyncio.sleep so the event
+        loop keeps running.
+
+        Returns:
+            Seconds spent waiting
+
+        Raises:
+            RateLimitExceeded: If the slot could not be acquired within timeout
+        """
+        provider = self._resolve_provider(provider)
+        if provider not in self._buckets:
+            return 0.0
+
+        start = self._clock()
+        self._begin_wait(provider)
+        while True:
+            wait = self._try_acquire(provider, tokens)
+            waited = self._clock() - start
+            if wait <= 0:
+                self._record_wait(provider, waited, True)
+                return waited
+            if timeout is not None and waited + wait > timeout:
+                self._record_wait(provider, waited, False)
+                raise RateLimitExceeded(f"Rate limit for '{provider}' not available within {timeout} seconds")
+            await asyncio.sleep(wait)
+
+    def get_metrics(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Get queue wait-time metrics per provider.
+
+        Returns:
+            Mapping of provider to a dict with acquired, waiting (current queue
+            depth), total_wait, avg_wait, max_wait, last_wait and timeouts
+        """
+        with self._lock:
+            result = {}
+            for provider, metrics in self._metrics.items():
+                snapshot = dict(metrics)
+                snapshot["avg_wait"] = metrics["total_wait"] / metrics["acquired"] if metrics["acquired"] else 0.0
+                result[provider] = snapshot
+            return result
+
+
+def create_rate_limiter(global_config: Dict[str, Any], framework_root: Union[str, Path]) -> RateLimiter:
+    """
+    Build a RateLimiter from the global configuration.
+
+    Limits are read from the rate_limit section of each provider under
+    llm.providers and llm_providers. The llm.rate_limiter section selects the
+    mode ('local' or 'file') and state_path.
+
+    Args:
+        global_config: The global configuration dictionary
+        framework_root: Framework root used to resolve a relative state_path
+
+    Returns:
+        A configured RateLimiter
+    """
+    limits: Dict[str, Dict[str, Any]] = {}
+    provider_sections = [
+        global_config.get("llm", {}).get("providers", {}) or {},
+        global_config.get("llm_providers", {}) or {}
+    ]
+    for providers in provider_sections:
+        for provider, provider_config in providers.items():
+            rate_limit = (provider_config or {}).get("rate_limit")
+            if rate_limit:
+                limits.setdefault(provider, {}).update(rate_limit)
+
+    limiter_config = global_config.get("llm", {}).get("rate_limiter", {}) or {}
+    mode = limiter_config.get("mode", "local")
+    state_path = None
+    if mode == "file":
+        state_path = Path(os.path.expanduser(limiter_config.get("state_path", "data/rate_limiter_state.json")))
+        if not state_path.is_absolute():
+            state_path = Path(framework_root) / state_path
+
+    return RateLimiter(limits, mode=mode, state_path=state_path)
@@ -0,0 +1,349 @@
+"""
+Response Cache Module
+
+This module provides exact-match caching of LLM responses. Responses are keyed by
+a stable hash of (model id, temperature, generation parameters, normalized prompt)
+and stored in a pluggable backend: an in-memory LRU or an on-disk SQLite database.
+Both backends support a time-to-live and size-based eviction. By default only
+requests at temperature 0 are cached, since replaying a sampled response changes
+the behavior of the caller.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Dict, Any, List, Optional, Tuple, Union
+
+logger = logging.getLogger("core.response_cache")
+
+
+def normalize_prompt(prompt: Union[str, List]) -> Any:
+    """
+    Normalize a prompt so trivially different renderings share a cache key.
+
+    String prompts have surrounding whitespace and trailing whitespace on each
+    line removed. Message lists are converted to plain (role, content) data.
+
+    Args:
+        prompt: A string prompt or a list of messages (LangChain messages,
+            dictionaries or (role, content) tuples)
+
+    Returns:
+        A JSON-serializable representation of the prompt
+    """
+    if isinstance(prompt, str):
+        return "\n".join(line.rstrip() for line in prompt.strip().splitlines())
+
+    messages = []
+    for message in prompt:
+        if isinstance(message, dict):
+            messages.append({k: normalize_prompt(v) if isinstance(v, str) else v for k, v in message.items()})
+        elif isinstance(message, (list, tuple)):
+            messages.append([normalize_prompt(v) if isinstance(v, str) else v for v in message])
+        elif hasattr(message, "content"):
+            content = message.content
+            messages.append({
+                "type": getattr(message, "type", type(message).__name__),
+                "content": normalize_prompt(content) if isinstance(content, str) else content
+            })
+        else:
+            messages.append(str(message))
+    return messages
+
+
+def make_cache_key(model_id: str,
+                   temperature: Optional[float],
+                   prompt: Union[str, List],
+                   params: Optional[Dict[str, Any]] = None) -> str:
+    """
+    Build a stable cache key for an LLM request.
+
+    Args:
+        model_id: Model identifier (e.g. 'openrouter.anthropic/claude-3-opus')
+        temperature: Sampling temperature used for the request
+        prompt: The prompt sent to the model
+        params: Other generation parameters of the request (max_tokens,
+            top_p, stop, ...); requests differing in any of them get
+            different keys
+
+    Returns:
+        Hex SHA-256 digest identifying the request
+    """
+    payload = json.dumps(
+        [model_id, temperature, params or {}, normalize_prompt(prompt)],
+        sort_keys=True,
+        ensure_ascii=False,
+        default=str
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class ResponseCache:
+    """
+    Base class for LLM response cache backends.
+
+    Subclasses implement _get, _set and clear. The base class tracks hit and
+    miss counters.
+    """
+
+    def __init__(self, ttl_seconds: Optional[float] = None, max_entries: int = 10000,
+                 max_temperature: Optional[float] = 0.0):
+        """
+        Initialize the cache.
+
+        Args:
+            ttl_seconds: Seconds an entry stays valid, or None for no expiry
+            max_entries: Maximum number of entries before eviction
+            max_temperature: Highest sampling temperature whose requests are
+                cached, or None to cache requests at any temperature
+        """
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max(1, int(max_entries))
+        self.max_temperature = max_temperature
+        self.hits = 0
+        self.misses = 0
+
+    def accepts(self, temperature: Optional[float]) -> bool:
+        """
+        Whether requests at a sampling temperature may be cached.
+
+        Args:
+            temperature: Sampling temperature of the request, or None if unknown
+
+        Returns:
+            True if responses for the request may be stored and replayed
+        """
+        if self.max_temperature is None:
+            return True
+        return temperature is not None and temperature <= self.max_temperature
+
+    def _expires_at(self) -> Optional[float]:
+        """Compute the expiry timestamp for an entry stored now."""
+        return time.time() + self.ttl_seconds if self.ttl_seconds else None
+
+    def get(self, key: str) -> Optional[str]:
+        """
+        Look up a cached response.
+
+        Args:
+            key: Cache key from make_cache_key()
+
+        Returns:
+            The cached response, or None on a miss or expired entry
+        """
+        value = self._get(key)
+        if value is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+        return value
+
+    def set(self, key: str, value: str) -> None:
+        """
+        Store a response.
+
+        Args:
+            key: Cache key from make_cache_key()
+            value: The response text
+        """
+        self._set(key, value)
+
+    def _get(self, key: str) -> Optional[str]:
+        raise NotImplementedError("Subclasses must implement _get()")
+
+    def _set(self, key: str, value: str) -> None:
+        raise NotImplementedError("Subclasses must implement _set()")
+
+    def clear(self) -> None:
+        """Remove all entries."""
+        raise NotImplementedError("Subclasses must implement clear()")
+
+    def __len__(self) -> int:
+        raise NotImplementedError("Subclasses must implement __len__()")
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get cache usage counters.
+
+        Returns:
+            Dictionary with backend, size, max_entries, hits, misses and hit_rate
+        """
+        lookups = self.hits + self.misses
+        return {
+            "backend": type(self).__name__,
+            "size": len(self),
+            "max_entries": self.max_entries,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / lookups if lookups else 0.0
+        }
+
+
+class InMemoryResponseCache(ResponseCache):
+    """Thread-safe in-process LRU response cache with optional TTL."""
+
+    def __init__(self, ttl_seconds: Optional[float] = None, max_entries: int = 10000,
+                 max_temperature: Optional[float] = 0.0):
+        super().__init__(ttl_seconds, max_entries, max_temperature)
+        self._entries: "OrderedDict[str, Tuple[Optional[float], str]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def _get(self, key: str) -> Optional[str]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires_at, value = entry
+            if expires_at is not None and expires_at <= time.time():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return value
+
+    def _set(self, key: str, value: str) -> None:
+        with self._lock:
+            self._entries[key] = (self._expires_at(), value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+class SQLiteResponseCache(ResponseCache):
+    """
+    On-disk response cache backed by SQLite, shareable across processes.
+
+    Entries past their TTL are ignored on read and purged during eviction.
+    When the entry count exceeds max_entries, the least recently accessed
+    entries are deleted.
+    """
+
+    def __init__(self, path: Union[str, Path], ttl_seconds: Optional[float] = None, max_entries: int = 10000,
+                 max_temperature: Optional[float] = 0.0):
+        """
+        Initialize the cache, creating the database if needed.
+
+        Args:
+            path: Path to the SQLite database file
+            ttl_seconds: Seconds an entry stays valid, or None for no expiry
+            max_entries: Maximum number of entries before eviction
+            max_temperature: Highest sampling temperature whose requests are
+                cached, or None for any temperature
+        """
+        super().__init__(ttl_seconds, max_entries, max_temperature)
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(self.path), check_same_thread=False, timeout=30)
+        with self._conn:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS response_cache ("
+                " key TEXT PRIMARY KEY,"
+                " value TEXT NOT NULL,"
+                " expires_at REAL,"
+                " last_access REAL NOT NULL)"
+            )
+            self._conn.execute(
+                "CREATE INDEX IF NOT EXISTS idx_response_cache_last_access ON response_cache (last_access)"
+            )
+
+    def _get(self, key: str) -> Optional[str]:
+        now = time.time()
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT value, expires_at FROM response_cache WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                return None
+            value, expires_at = row
+            with self._conn:
+                if expires_at is not None and expires_at <= now:
+                    self._conn.execute("DELETE FROM response_cache WHERE key = ?", (key,))
+                    return None
+                self._conn.execute("UPDATE response_cache SET last_access = ? WHERE key = ?", (now, key))
+            return value
+
+    def _set(self, key: str, value: str) -> None:
+        now = time.time()
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO response_cache (key, value, expires_at, last_access) VALUES (?, ?, ?, ?)",
+                (key, value, self._expires_at(), now)
+            )
+            self._evict(now)
+
+    def _evict(self, now: float) -> None:
+        """Purge expired entries and trim to max_entries (caller holds the lock)."""
+        self._conn.execute(
+            "DELETE FROM response_cache WHERE expires_at IS NOT NULL AND expires_at <= ?", (now,)
+        )
+        (count,) = self._conn.execute("SELECT COUNT(*) FROM response_cache").fetchone()
+        overflow = count - self.max_entries
+        if overflow > 0:
+            self._conn.execute(
+                "DELETE FROM response_cache WHERE key IN ("
+                " SELECT key FROM response_cache ORDER BY last_access ASC LIMIT ?)",
+                (overflow,)
+            )
+
+    def clear(self) -> None:
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM response_cache")
+
+    def __len__(self) -> int:
+        with self._lock:
+            (count,) = self._conn.execute("SELECT COUNT(*) FROM response_cache").fetchone()
+            return count
+
+    def close(self) -> None:
+        """Close the underlying database connection."""
+        with self._lock:
+            self._conn.close()
+
+
+def create_response_cache(cache_config: Dict[str, Any], framework_root: Union[str, Path]) -> Optional[ResponseCache]:
+    """
+    Build a response cache from the llm.response_cache configuration section.
+
+    Args:
+        cache_config: Configuration with keys enabled, backend ('memory' or
+            'sqlite'), path, ttl_seconds, max_entries and max_temperature
+        framework_root: Framework root used to resolve a relative path
+
+    Returns:
+        A ResponseCache instance, or None if caching is disabled
+    """
+    if not cache_config or not cache_config.get("enabled", False):
+        return None
+
+    backend = cache_config.get("backend", "memory")
+    ttl_seconds = cache_config.get("ttl_seconds")
+    max_entries = cache_config.get("max_entries", 10000)
+    max_temperature = cache_config.get("max_temperature", 0.0)
+
+    if backend == "memory":
+        return InMemoryResponseCache(ttl_seconds=ttl_seconds, max_entries=max_entries,
+                                     max_temperature=max_temperature)
+    if backend == "sqlite":
+        path = Path(os.path.expanduser(cache_config.get("path", "data/llm_response_cache.sqlite")))
+        if not path.is_absolute():
+            path = Path(framework_root) / path
+        return SQLiteResponseCache(path, ttl_seconds=ttl_seconds, max_entries=max_entries,
+                                   max_temperature=max_temperature)
+
+    logger.error(f"Unknown response cache backend '{backend}'; response caching disabled")
+    return None
@@ -0,0 +1,270 @@
+"""
+Retry Policy Module
+
+This module provides the RetryPolicy and RetryBudget classes used by the Flowise
+clients to retry transient failures. Delays use full-jitter exponential backoff
+and honour Retry-After headers. A per-client retry budget caps retries to a
+fraction of recent traffic, so retries cannot multiply load on a struggling server.
+"""
+
+import logging
+import random
+import threading
+import time
+from collections import deque
+from email.utils import parsedate_to_datetime
+from typing import Dict, Any, Callable, Iterable, Optional
+
+logger = logging.getLogger("core.retry_policy")
+
+# Failure kinds reported to the policy
+CONNECT_ERROR = "connect_error"
+CONNECT_TIMEOUT = "connect_timeout"
+CONNECTION_ERROR = "connection_error"
+READ_TIMEOUT = "read_timeout"
+
+# Failures where the server cannot have processed the request, so a retry is
+# safe even without an idempotency key
+_UNPROCESSED_KINDS = {CONNECT_ERROR, CONNECT_TIMEOUT}
+_UNPROCESSED_STATUSES = {429, 503}
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """
+    Parse a Retry-After header value.
+
+    Args:
+        value: Either a number of seconds or an HTTP date
+
+    Returns:
+        Seconds to wait (never negative), or None if absent or unparseable
+    """
+    if not value:
+        return None
+    value = value.strip()
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at is None:
+        return None
+    return max(0.0, retry_at.timestamp() - time.time())
+
+
+class RetryBudget:
+    """
+    Thread-safe cap on retries relative to recent request volume.
+
+    Within a sliding window, retries are allowed while their count stays below
+    min_retries plus ratio times the number of requests. min_retries keeps
+    retries possible for low-traffic clients.
+    """
+
+    def __init__(self,
+                 ratio: float = 0.2,
+                 min_retries: int = 10,
+                 window_seconds: float = 10.0,
+                 clock: Callable[[], float] = time.monotonic):
+        """
+        Initialize a new RetryBudget instance.
+
+        Args:
+            ratio: Retries allowed per request in the window
+            min_retries: Retries always allowed in the window
+            window_seconds: Length of the sliding window
+            clock: Monotonic time source (injectable for testing)
+        """
+        self.ratio = ratio
+        self.min_retries = max(0, int(min_retries))
+        self.window_seconds = window_seconds
+        self._clock = clock
+        self._requests = deque()
+        self._retries = deque()
+        self._lock = threading.Lock()
+
+    def _expire(self, now: float) -> None:
+        """Drop events older than the window (caller holds the lock)."""
+        cutoff = now - self.window_seconds
+        while self._requests and self._requests[0] <= cutoff:
+            self._requests.popleft()
+        while self._retries and self._retries[0] <= cutoff:
+            self._retries.popleft()
+
+    def record_request(self) -> None:
+        """Record a new logical request (not counting its retries)."""
+        with self._lock:
+            now = self._clock()
+            self._expire(now)
+            self._requests.append(now)
+
+    def try_acquire_retry(self) -> bool:
+        """
+        Consume one retry from the budget if available.
+
+        Returns:
+            True if the retry may proceed
+        """
+        with self._lock:
+            now = self._clock()
+            self._expire(now)
+            if len(self._retries) >= self.min_retries + self.ratio * len(self._requests):
+                return False
+            self._retries.append(now)
+            return True
+
+    def snapshot(self) -> Dict[str, Any]:
+        """
+        Get the requests and retries in the current window.
+
+        Returns:
+            Dictionary with requests, retries and available
+        """
+        with self._lock:
+            self._expire(self._clock())
+            allowed = self.min_retries + self.ratio * len(self._requests)
+            return {
+                "requests": len(self._requests),
+                "retries": len(self._retries),
+                "available": max(0, int(allowed - len(self._retries)))
+            }
+
+
+class RetryPolicy:
+    """
+    Decides whether and when to retry a failed HTTP attempt.
+
+    Retries use full-jitter exponential backoff: before retry n the delay is
+    uniform in [0, min(max_delay, base_delay * 2 ** (n - 1))]. A Retry-After
+    header, when present and respected, sets the delay instead (capped at
+    max_retry_after).
+
+    By default only failures where the server cannot have processed the
+    request are retried: connect errors and 429/503 responses. Read timeouts,
+    dropped connections and 502/504 responses may come after the flow already
+    ran, so retrying them re-runs its side effects and LLM calls. They are
+    retried only with send_idempotency_key, which should be enabled only when
+    a proxy in front of Flowise deduplicates requests on the Idempotency-Key
+    header; Flowise itself ignores it.
+    """
+
+    def __init__(self,
+                 max_attempts: int = 3,
+                 base_delay: float = 0.5,
+                 max_delay: float = 20.0,
+                 retry_on_status: Iterable[int] = (429, 502, 503, 504),
+                 retry_on_connection_errors: bool = True,
+                 retry_on_timeouts: bool = True,
+                 respect_retry_after: bool = True,
+                 max_retry_after: float = 60.0,
+                 send_idempotency_key: bool = False):
+        """
+        Initialize a new RetryPolicy instance.
+
+        Args:
+            max_attempts: Total attempts per request, including the first
+            base_delay: Backoff ceiling for the first retry, in seconds
+            max_delay: Upper bound on the backoff ceiling, in seconds
+            retry_on_status: HTTP status codes that are retried
+            retry_on_connection_errors: Whether connection failures are retried
+            retry_on_timeouts: Whether connect and read timeouts are retried
+            respect_retry_after: Whether a Retry-After header sets the delay
+            max_retry_after: Longest Retry-After delay honoured; longer ones fail
+            send_idempotency_key: Whether requests carry an Idempotency-Key
+                header, which also makes possibly-processed failures retryable.
+                Enable only behind a proxy that deduplicates on the key.
+        """
+        self.max_attempts = max(1, int(max_attempts))
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.retry_on_status = frozenset(retry_on_status)
+        self.retry_on_connection_errors = retry_on_connection_errors
+        self.retry_on_timeouts = retry_on_timeouts
+        self.respect_retry_after = respect_retry_after
+        self.max_retry_after = max_retry_after
+        self.send_idempotency_key = send_idempotency_key
+
+    def is_retryable(self, kind: Optional[str] = None, status_code: Optional[int] = None) -> bool:
+        """
+        Check whether a failure is retryable in principle.
+
+        Args:
+            kind: Failure kind for transport errors (e.g. 'read_timeout')
+            status_code: HTTP status code for error responses
+
+        Returns:
+            True if the failure may be retried
+        """
+        if status_code is not None:
+            if status_code not in self.retry_on_status:
+                return False
+            return self.send_idempotency_key or status_code in _UNPROCESSED_STATUSES
+        if kind in (CONNECT_TIMEOUT, READ_TIMEOUT) and not self.retry_on_timeouts:
+            return False
+        if kind in (CONNECT_ERROR, CONNECTION_ERROR) and not self.retry_on_connection_errors:
+            return False
+        return self.send_idempotency_key or kind in _UNPROCESSED_KINDS
+
+    def get_delay(self, attempt: int, retry_after: Optional[float] = None) -> Optional[float]:
+        """
+        Compute the wait before the next attempt.
+
+        Args:
+            attempt: Number of the attempt that just failed (1 for the first)
+            retry_after: Parsed Retry-After value in seconds, if any
+
+        Returns:
+            Seconds to wait, or None if the Retry-After delay exceeds max_retry_after
+        """
+        if retry_after is not None and self.respect_retry_after:
+            if retry_after > self.max_retry_after:
+                return None
+            return retry_after
+        ceiling = min(self.max_delay, self.base_delay * (2 ** (attempt - 1)))
+        return random.uniform(0, ceiling)
+
+
+def create_retry_policy(retry_config: Optional[Dict[str, Any]]) -> RetryPolicy:
+    """
+    Build a RetryPolicy from a retry configuration section.
+
+    Args:
+        retry_config: Configuration keyed by the RetryPolicy constructor
+            argument names; missing keys use the defaults
+
+    Returns:
+        A configured RetryPolicy
+    """
+    retry_config = retry_config or {}
+    return RetryPolicy(
+        max_attempts=retry_config.get("max_attempts", 3),
+        base_delay=retry_config.get("base_delay", 0.5),
+        max_delay=retry_config.get("max_delay", 20.0),
+        retry_on_status=retry_config.get("retry_on_status", (429, 502, 503, 504)),
+        retry_on_connection_errors=retry_config.get("retry_on_connection_errors", True),
+        retry_on_timeouts=retry_config.get("retry_on_timeouts", True),
+        respect_retry_after=retry_config.get("respect_retry_after", True),
+        max_retry_after=retry_config.get("max_retry_after", 60.0),
+        send_idempotency_key=retry_config.get("send_idempotency_key", False)
+    )
+
+
+def create_retry_budget(budget_config: Optional[Dict[str, Any]]) -> RetryBudget:
+    """
+    Build a RetryBudget from a retry.budget configuration section.
+
+    Args:
+        budget_config: Configuration with keys ratio, min_retries and window_seconds
+
+    Returns:
+        A configured RetryBudget
+    """
+    budget_config = budget_config or {}
+    return RetryBudget(
+        ratio=budget_config.get("ratio", 0.2),
+        min_retries=budget_config.get("min_retries", 10),
+        window_seconds=budget_config.get("window_seconds", 10.0)
+    )
@@ -0,0 +1,219 @@
+"""
+Runtime Context Module
+
+This module provides the RuntimeContext class, a process-wide registry of shared
+framework components. Agents created against the same framework root reuse a
+single ConfigLoader, LLMRouter, ToolHandler, FlowiseClient, LangSmithSetup,
+LLM client pool, hedged-request thread pool and background event loop instead
+of re-reading configuration files and re-instantiating tools each time.
+"""
+
+import concurrent.futures
+import logging
+import os
+import threading
+from os import PathLike
+from pathlib import Path
+from typing import Dict, Any, Callable, Optional, Union
+
+from ultimate_ai_architect_framework.core_modules.background_loop import BackgroundEventLoop
+from ultimate_ai_architect_framework.core_modules.config_loader import ConfigLoader
+from ultimate_ai_architect_framework.core_modules.llm_router import LLMRouter
+from ultimate_ai_architect_framework.core_modules.tool_handler import ToolHandler
+from ultimate_ai_architect_framework.core_modules.flowise_client import FlowiseClient, AsyncFlowiseClient
+from ultimate_ai_architect_framework.core_modules.langsmith_setup import LangSmithSetup
+from ultimate_ai_architect_framework.core_modules.llm_client_pool import LLMClientPool
+from ultimate_ai_architect_framework.core_modules.response_cache import ResponseCache, create_response_cache
+from ultimate_ai_architect_framework.core_modules.rate_limiter import RateLimiter, create_rate_limiter
+
+logger = logging.getLogger("core.runtime_context")
+
+
+class RuntimeContext:
+    """
+    Thread-safe registry of shared framework components for one framework root.
+
+    Use RuntimeContext.for_root() to obtain the process-wide context for a root;
+    components are created lazily on first request and then handed out as
+    singletons. Constructing a RuntimeContext directly yields a private context
+    that is not registered, which is useful for isolation in scripts.
+    """
+
+    # Process-wide contexts keyed by resolved framework root
+    _contexts: Dict[Path, "RuntimeContext"] = {}
+    _contexts_lock = threading.Lock()
+
+    def __init__(self, framework_root: Union[str, PathLike]):
+        """
+        Initialize a new RuntimeContext instance.
+
+        Args:
+            framework_root: Path to the framework root directory
+        """
+        self.framework_root = self._resolve_root(framework_root)
+
+        # Lazily created shared components, keyed by component name
+        self._components: Dict[str, Any] = {}
+        self._lock = threading.RLock()
+
+        logger.debug(f"Runtime context created for root: {self.framework_root}")
+
+    @staticmethod
+    def _resolve_root(framework_root: Union[str, PathLike]) -> Path:
+        """Normalize a framework root so equivalent paths share one context."""
+        return Path(os.path.expanduser(framework_root)).resolve()
+
+    @classmethod
+    def for_root(cls, framework_root: Union[str, PathLike]) -> "RuntimeContext":
+        """
+        Get the shared context for a framework root, creating it if needed.
+
+        Args:
+            framework_root: Path to the framework root directory
+
+        Returns:
+            The process-wide RuntimeContext for the given root
+        """
+        root = cls._resolve_root(framework_root)
+        context = cls._contexts.get(root)
+        if context is None:
+            with cls._contexts_lock:
+                context = cls._contexts.get(root)
+                if context is None:
+                    context = cls(root)
+                    cls._contexts[root] = context
+                    logger.info(f"Registered runtime context for root: {root}")
+        return context
+
+    @classmethod
+    def reset(cls, framework_root: Optional[Union[str, PathLike]] = None) -> None:
+        """
+        Drop registered contexts so the next for_root() call starts fresh.
+
+        Args:
+            framework_root: Root whose context should be dropped. If None, all
+                registered contexts are dropped.
+        """
+        with cls._contexts_lock:
+            if framework_root is None:
+                cls._contexts.clear()
+            else:
+                cls._contexts.pop(cls._resolve_root(framework_root), None)
+
+    def _get_or_create(self, name: str, factory: Callable[[], Any]) -> Any:
+        """
+        Return the named component, building it with factory on first use.
+
+        Args:
+            name: Registry key for the component
+            factory: Zero-argument callable that builds the component
+
+        Returns:
+            The shared component instance
+        """
+        try:
+            return self._components[name]
+        except KeyError:
+            pass
+        with self._lock:
+            if name not in self._components:
+                self._components[name] = factory()
+                logger.debug(f"Created shared component '{name}' for {self.framework_root}")
+            return self._components[name]
+
+    def get_config_loader(self) -> ConfigLoader:
+        """
+        Get the shared ConfigLoader.
+
+        Files are watched if config.watch is set in global settings, and parsed
+        documents are shared through snapshots if config.snapshots is set.
+        """
+        def _build() -> ConfigLoader:
+            config_loader = ConfigLoader(str(self.framework_root))
+            loader_config = config_loader.load_global_config().get("config", {}) or {}
+            if loader_config.get("snapshots", False):
+                config_loader.enable_snapshots(loader_config.get("snapshot_dir"))
+            if loader_config.get("watch", False):
+                config_loader.start_watching(loader_config.get("watch_interval", 1.0))
+            return config_loader
+        return self._get_or_create("config_loader", _build)
+
+    def get_llm_router(self) -> LLMRouter:
+        """Get the shared LLMRouter, configured from this root's global settings and refreshed on changes."""
+        def _build() -> LLMRouter:
+            config_loader = self.get_config_loader()
+            llm_router = LLMRouter(
+                str(config_loader.configs_dir / "global_settings.yaml"),
+                snapshot_cache=config_loader.snapshot_cache
+            )
+            config_loader.subscribe(llm_router.on_config_changed)
+            return llm_router
+        return self._get_or_create("llm_router", _build)
+
+    def get_tool_handler(self) -> ToolHandler:
+        """Get the shared ToolHandler for this framework root."""
+        return self._get_or_create(
+            "tool_handler",
+            lambda: ToolHandler(str(self.framework_root), config_loader=self.get_config_loader())
+        )
+
+    def get_flowise_client(self) -> FlowiseClient:
+        """Get the shared FlowiseClient for this framework root."""
+        return self._get_or_create(
+            "flowise_client",
+            lambda: FlowiseClient(self.framework_root, config_loader=self.get_config_loader())
+        )
+
+    def get_async_flowise_client(self) -> AsyncFlowiseClient:
+        """Get the shared AsyncFlowiseClient for this framework root (requires httpx)."""
+        return self._get_or_create(
+            "async_flowise_client",
+            lambda: AsyncFlowiseClient(self.framework_root, config_loader=self.get_config_loader())
+        )
+
+    def get_langsmith_setup(self) -> LangSmithSetup:
+        """Get the shared LangSmithSetup for this framework root."""
+        return self._get_or_create(
+            "langsmith_setup",
+            lambda: LangSmithSetup(str(self.framework_root), config_loader=self.get_config_loader())
+        )
+
+    def get_llm_client_pool(self) -> LLMClientPool:
+        """Get the shared LLM client pool, sized by llm.client_pool_size in global settings."""
+        def _build() -> LLMClientPool:
+            llm_config = self.get_config_loader().load_global_config().get("llm", {})
+            return LLMClientPool(max_size=llm_config.get("client_pool_size", 32))
+        return self._get_or_create("llm_client_pool", _build)
+
+    def get_response_cache(self) -> Optional[ResponseCache]:
+        """Get the shared LLM response cache, or None if llm.response_cache is disabled."""
+        def _build() -> Optional[ResponseCache]:
+            llm_config = self.get_config_loader().load_global_config().get("llm", {})
+            return create_response_cache(llm_config.get("response_cache", {}), self.framework_root)
+        return self._get_or_create("response_cache", _build)
+
+    def get_hedge_executor(self) -> concurrent.futures.ThreadPoolExecutor:
+        """
+        Get the thread pool running hedged LLM calls for all agents.
+
+        Sized by llm.hedging.max_workers in global settings. Its threads are
+        joined at interpreter exit.
+        """
+        def _build() -> concurrent.futures.ThreadPoolExecutor:
+            hedging_config = self.get_config_loader().load_global_config().get("llm", {}).get("hedging", {}) or {}
+            return concurrent.futures.ThreadPoolExecutor(
+                max_workers=max(1, int(hedging_config.get("max_workers", 8))),
+                thread_name_prefix="llm_hedge"
+            )
+        return self._get_or_create("hedge_executor", _build)
+
+    def get_event_loop(self) -> BackgroundEventLoop:
+        """Get the background event loop that runs async LLM batches for synchronous callers."""
+        return self._get_or_create("event_loop", lambda: BackgroundEventLoop(name="llm_event_loop"))
+
+    def get_rate_limiter(self) -> RateLimiter:
+        """Get the per-provider rate limiter shared by all agents in the process."""
+        return self._get_or_create(
+            "rate_limiter",
+            lambda: create_rate_limiter(self.get_config_loader().load_global_config(), self.framework_root)
+        )
@@ -0,0 +1,129 @@
+"""
+SSE Parser Module
+
+This module provides an incremental parser for Server-Sent Events streams. Bytes
+can be fed in arbitrary chunks: multi-byte UTF-8 characters and lines split across
+chunk boundaries are reassembled before events are emitted.
+"""
+
+import codecs
+import re
+from typing import List, Optional, Union
+
+_LINE_END = re.compile(r"\r\n|\r|\n")
+
+
+class SSEMessage:
+    """A single Server-Sent Events message."""
+
+    __slots__ = ("event", "data", "id", "retry")
+
+    def __init__(self, event: str = "message", data: str = "", id: Optional[str] = None, retry: Optional[int] = None):
+        self.event = event
+        self.data = data
+        self.id = id
+        self.retry = retry
+
+    def __repr__(self) -> str:
+        return f"SSEMessage(event={self.event!r}, data={self.data!r}, id={self.id!r})"
+
+
+class SSEParser:
+    """
+    Incremental Server-Sent Events parser.
+
+    Feed raw bytes (or already decoded text) as they arrive; each call returns the
+    messages completed by that chunk. Call close() at the end of the stream to
+    flush a final message that was not terminated by a blank line.
+    """
+
+    def __init__(self, encoding: str = "utf-8"):
+        """
+        Initialize a new SSEParser instance.
+
+        Args:
+            encoding: Encoding of the byte stream
+        """
+        self._decoder = codecs.getincrementaldecoder(encoding)(errors="replace")
+        self._buffer = ""
+        self._event = ""
+        self._data: List[str] = []
+        self._id: Optional[str] = None
+        self._retry: Optional[int] = None
+
+    def feed(self, chunk: Union[bytes, str]) -> List[SSEMessage]:
+        """
+        Parse the next chunk of the stream.
+
+        Args:
+            chunk: Raw bytes or decoded text
+
+        Returns:
+            Messages completed by this chunk, in order
+        """
+        text = self._decoder.decode(chunk) if isinstance(chunk, bytes) else chunk
+        self._buffer += text
+        return self._parse_lines(final=False)
+
+    def close(self) -> List[SSEMessage]:
+        """
+        Flush the parser at the end of the stream.
+
+        Returns:
+            Any message still pending
+        """
+        self._buffer += self._decoder.decode(b"", final=True)
+        messages = self._parse_lines(final=True)
+        if self._buffer:
+            self._process_line(self._buffer, messages)
+            self._buffer = ""
+        message = self._dispatch()
+        if message is not None:
+            messages.append(message)
+        return messages
+
+    def _parse_lines(self, final: bool) -> List[SSEMessage]:
+        """Consume every complete line in the buffer."""
+        messages: List[SSEMessage] = []
+        buffer = self._buffer
+        start = 0
+        for match in _LINE_END.finditer(buffer):
+            # A trailing '\r' may be the first half of '\r\n' split across chunks
+            if match.group() == "\r" and match.end() == len(buffer) and not final:
+                break
+            self._process_line(buffer[start:match.start()], messages)
+            start = match.end()
+        self._buffer = buffer[start:]
+        return messages
+
+    def _process_line(self, line: str, messages: List[SSEMessage]) -> None:
+        """Apply one line of the stream to the pending message."""
+        if not line:
+            message = self._dispatch()
+            if message is not None:
+                messages.append(message)
+            return
+        if line.startswith(":"):
+            return  # Comment / keep-alive
+
+        field, _, value = line.partition(":")
+        if value.startswith(" "):
+            value = value[1:]
+
+        if field == "event":
+            self._event = value
+        elif field == "data":
+            self._data.append(value)
+        elif field == "id":
+            self._id = value
+        elif field == "retry" and value.isdigit():
+            self._retry = int(value)
+
+    def _dispatch(self) -> Optional[SSEMessage]:
+        """Complete the pending message, if it has any data or an event name."""
+        if not self._data and not self._event:
+            return None
+        message = SSEMessage(self._event or "message", "\n".join(self._data), self._id, self._retry)
+        self._event = ""
+        self._data = []
+        return message
@@ -0,0 +1,123 @@
+"""
+Token Counter Module
+
+This module provides token counters used to keep prompts within a token
+budget. TiktokenCounter counts exactly with OpenAI's tiktoken encodings;
+ApproximateTokenCounter is a dependency-free estimate from character counts
+that is deterministic and cheap enough to run on every memory insert.
+"""
+
+import logging
+import math
+from typing import Any, Callable, Dict, Optional, Union
+
+logger = logging.getLogger("core.token_counter")
+
+
+class TokenCounter:
+    """Interface for token counters."""
+
+    name = "base"
+
+    def count(self, text: str) -> int:
+        """
+        Count the tokens in a text.
+
+        Args:
+            text: Text to count
+
+        Returns:
+            Number of tokens
+        """
+        raise NotImplementedError
+
+    def __call__(self, text: str) -> int:
+        return self.count(text)
+
+
+class ApproximateTokenCounter(TokenCounter):
+    """Estimates tokens as characters / chars_per_token, rounded up."""
+
+    name = "approximate"
+
+    def __init__(self, chars_per_token: float = 4.0):
+        """
+        Initialize a new ApproximateTokenCounter instance.
+
+        Args:
+            chars_per_token: Average characters per token (about 4 for English text)
+        """
+        if chars_per_token <= 0:
+            raise ValueError(f"chars_per_token must be positive, got {chars_per_token}")
+        self.chars_per_token = chars_per_token
+
+    def count(self, text: str) -> int:
+        return math.ceil(len(text) / self.chars_per_token)
+
+
+class TiktokenCounter(TokenCounter):
+    """Counts tokens with a tiktoken encoding."""
+
+    name = "tiktoken"
+
+    def __init__(self, encoding: str = "cl100k_base", model: Optional[str] = None):
+        """
+        Initialize a new TiktokenCounter instance.
+
+        Args:
+            encoding: tiktoken encoding name
+            model: Model name to pick the encoding for, overriding encoding
+
+        Raises:
+            ImportError: If tiktoken is not installed
+        """
+        import tiktoken
+        self.encoding = tiktoken.encoding_for_model(model) if model else tiktoken.get_encoding(encoding)
+
+    def count(self, text: str) -> int:
+        # Special-token text in memories is counted as plain text, not rejected
+        return len(self.encoding.encode(text, disallowed_special=()))
+
+
+class CallableTokenCounter(TokenCounter):
+    """Adapts a function from text to token count."""
+
+    name = "callable"
+
+    def __init__(self, func: Callable[[str], int]):
+        self.func = func
+
+    def count(self, text: str) -> int:
+        return int(self.func(text))
+
+
+def create_token_counter(config: Union[None, Dict[str, Any], TokenCounter, Callable[[str], int]] = None) -> TokenCounter:
+    """
+    Build a token counter from configuration.
+
+    Args:
+        config: A TokenCounter, a function from text to token count, or a
+            settings dictionary. 'provider' is 'approximate' (default) or
+            'tiktoken'; approximate takes 'chars_per_token', tiktoken takes
+            'encoding' or 'model'. If tiktoken cannot be loaded, the
+            approximate counter is used instead.
+
+    Returns:
+        A TokenCounter instance
+    """
+    if isinstance(config, TokenCounter):
+        return config
+    if callable(config):
+        return CallableTokenCounter(config)
+
+    config = config or {}
+    provider = config.get('provider', 'approximate')
+    if provider == 'tiktoken':
+        try:
+            return TiktokenCounter(encoding=config.get('encoding', 'cl100k_base'), model=config.get('model'))
+        except Exception as e:
+            logger.warning(f"tiktoken unavailable ({e}); using approximate token counts")
+            return ApproximateTokenCounter()
+    if provider != 'approximate':
+        raise ValueError(f"Unknown token counter provider: {provider}")
+    return ApproximateTokenCounter(config.get('chars_per_token', 4.0))
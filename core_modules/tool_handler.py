@@ -7,14 +7,123 @@ tools that can be used by agents in the framework.
 
 import logging
 import importlib
-from typing import Dict, List, Any, Optional, Callable
+import threading
+import time
+from typing import Dict, List, Any, Optional, Callable, Tuple
 import os
 import yaml
 import inspect
+from pathlib import Path
 
 # Import ConfigLoader
 from ultimate_ai_architect_framework.core_modules.config_loader import ConfigLoader
 
+logger = logging.getLogger("core.tool_handler")
+
+
+def instantiate_tool(tool_class: Callable, config: Optional[Dict[str, Any]] = None) -> Any:
+    """
+    Construct a tool with the 'config' section of its registry entry.
+
+    A constructor with a 'config' parameter receives the whole section.
+    Otherwise each constructor parameter is filled from the section key of
+    the same name (every key, if it takes **kwargs), so tools like
+    WebSearchTool(max_results=...) are configured from the registry too.
+
+    Args:
+        tool_class: The tool class
+        config: The tool's configuration section
+
+    Returns:
+        The tool instance
+    """
+    config = config or {}
+    try:
+        parameters = inspect.signature(tool_class).parameters
+    except (TypeError, ValueError):
+        return tool_class()
+    if "config" in parameters:
+        return tool_class(config=config)
+    if any(param.kind == inspect.Parameter.VAR_KEYWORD for param in parameters.values()):
+        return tool_class(**config)
+    kwargs = {
+        name: value for name, value in config.items()
+        if name in parameters and parameters[name].kind in (
+            inspect.Parameter.POSITIONAL_OR_KEYWORD, inspect.Parameter.KEYWORD_ONLY
+        )
+    }
+    ignored = set(config) - set(kwargs)
+    if ignored:
+        logger.debug(f"{getattr(tool_class, '__name__', tool_class)} does not take config keys: {sorted(ignored)}")
+    return tool_class(**kwargs)
+
+
+class ToolDescriptor:
+    """
+    A registered tool whose module is imported and class instantiated on first use.
+    
+    Loading is thread-safe and happens once; the time spent importing the
+    module (including any dependencies not imported before) and constructing
+    the instance is recorded for startup reports.
+    """
+    
+    def __init__(self, tool_id: str, module_path: str, class_name: str, config: Optional[Dict[str, Any]] = None):
+        """
+        Initialize a new ToolDescriptor instance.
+        
+        Args:
+            tool_id: Unique identifier for the tool
+            module_path: Module defining the tool class
+            class_name: Name of the tool class
+            config: The 'config' section of the tool's registry entry, passed
+                to the constructor (see instantiate_tool)
+        """
+        self.tool_id = tool_id
+        self.module_path = module_path
+        self.class_name = class_name
+        self.config = config or {}
+        self.instance: Any = None
+        self.import_seconds: Optional[float] = None
+        self.init_seconds: Optional[float] = None
+        self.error: Optional[str] = None
+        self._lock = threading.Lock()
+    
+    @property
+    def loaded(self) -> bool:
+        """Whether the tool has been instantiated."""
+        return self.instance is not None
+    
+    def load(self) -> Any:
+        """
+        Import the tool's module and instantiate its class, unless already done.
+        
+        Returns:
+            The tool instance
+            
+        Raises:
+            Exception: Whatever importing or constructing the tool raised
+        """
+        if self.instance is not None:
+            return self.instance
+        with self._lock:
+            if self.instance is None:
+                start = time.perf_counter()
+                try:
+                    module = importlib.import_module(self.module_path)
+                    tool_class = getattr(module, self.class_name)
+                    imported = time.perf_counter()
+                    self.import_seconds = imported - start
+                    instance = instantiate_tool(tool_class, self.config)
+                except Exception as e:
+                    self.error = str(e)
+                    raise
+                self.init_seconds = time.perf_counter() - imported
+                self.instance = instance
+                logger.info(f"Loaded tool {self.tool_id} in {(self.import_seconds + self.init_seconds) * 1000:.1f} ms "
+                            f"(import {self.import_seconds * 1000:.1f} ms)")
+        return self.instance
+
+
 class ToolHandler:
     """
     Manages tools that can be used by agents in the framework.
@@ -24,27 +133,63 @@ class ToolHandler:
     - Tool discovery
     - Tool execution
     - Tool permissions
+    - Reloading the tool registry when its file changes (see on_config_changed)
+    - Lazy tool loading: registry tools are imported and instantiated on
+      first get_tool()/execute_tool(), optionally warmed up in the background
     """
     
-    def __init__(self, framework_root: str):
+    def __init__(self,
+                 framework_root: str,
+                 config_loader: Optional[ConfigLoader] = None,
+                 lazy_loading: Optional[bool] = None,
+                 warm_up: Optional[bool] = None):
         """
         Initialize a new ToolHandler instance.
         
         Args:
             framework_root: Path to the framework root directory
+            config_loader: Optional shared ConfigLoader instance
+            lazy_loading: Whether registry tools are loaded on first use rather
+                than at construction. Defaults to tools.lazy_loading in global
+                settings (true).
+            warm_up: Whether to load every lazy tool in a background thread
+                after construction. Defaults to tools.warm_up in global
+                settings (false).
         """
         self.framework_root = framework_root
-        self.logger = logging.getLogger("core.tool_handler")
+        self.logger = logger
         
         # Dictionary of registered tools
         self.tools = {}
         
-        # Initialize ConfigLoader
-        self.config_loader = ConfigLoader(framework_root)
+        # IDs of the tools registered from the tool registry file
+        self._registry_tool_ids = set()
+        
+        # Descriptors of lazily registered tools that failed to load, for get_load_report()
+        self._failed_tools: Dict[str, ToolDescriptor] = {}
+        
+        # Guards self.tools and self._failed_tools, which the warm-up thread and
+        # registry reloads modify while other threads read them
+        self._tools_lock = threading.RLock()
+        
+        # Initialize or use provided ConfigLoader
+        self.config_loader = config_loader or ConfigLoader(framework_root)
+        
+        tools_settings = self.config_loader.load_global_config().get("tools", {}) or {}
+        self.lazy_loading = tools_settings.get("lazy_loading", True) if lazy_loading is None else lazy_loading
+        if warm_up is None:
+            warm_up = tools_settings.get("warm_up", False)
+        self._warm_up_thread: Optional[threading.Thread] = None
         
         # Load tool registry
         self._load_tool_registry()
         
+        # Reload the registry when the ConfigLoader reports a change
+        self.config_loader.subscribe(self.on_config_changed)
+        
+        if warm_up and self.lazy_loading:
+            self.start_warm_up()
+        
         self.logger.info("Tool Handler initialized")
     
     def _load_tool_registry(self) -> None:
@@ -57,9 +202,10 @@ class ToolHandler:
             self.logger.info(f"Loaded tool registry: {registry}")
             
             # Register each tool from the registry
+            registry_tool_ids = set()
             if registry and 'tools' in registry:
                 for tool_id, tool_config in registry['tools'].items():
-                    self.logger.debug(f"Registering tool {tool_id} from registry")
+                    registry_tool_ids.add(tool_id)
                     implementation = tool_config.get('implementation', {})
                     # Create a config that matches what register_tool_from_config expects
                     config_for_registration = {
@@ -69,17 +215,48 @@ class ToolHandler:
                         "description": tool_config.get('description', ''),
                         "config": tool_config.get('config', {})
                     }
+                    # On reload, tools whose entry is unchanged keep their instance
+                    with self._tools_lock:
+                        unchanged = (tool_id in self._registry_tool_ids
+                                     and self.tools.get(tool_id, {}).get("config") == config_for_registration)
+                    if unchanged:
+                        continue
+                    self.logger.debug(f"Registering tool {tool_id} from registry")
                     self.register_tool_from_config(tool_id, config_for_registration)
             else:
                 self.logger.warning("No tools found in registry or registry format is incorrect")
             
+            # Tools removed from the registry file are unregistered
+            for tool_id in self._registry_tool_ids - registry_tool_ids:
+                with self._tools_lock:
+                    self._failed_tools.pop(tool_id, None)
+                    removed = self.tools.pop(tool_id, None)
+                if removed is not None:
+                    self.logger.info(f"Unregistered tool removed from registry: {tool_id}")
+            self._registry_tool_ids = registry_tool_ids
+            
         except Exception as e:
             self.logger.error(f"Failed to load tool registry: {e}")
     
+    def on_config_changed(self, config_key: str, file_path: Path) -> None:
+        """
+        ConfigLoader listener: reload the tool registry when its file changed.
+        
+        Args:
+            config_key: Cache key of the changed configuration
+            file_path: Path of the changed file
+        """
+        if config_key == "tool_registry":
+            self.logger.info(f"Tool registry changed, reloading from {file_path}")
+            self._load_tool_registry()
+    
     def register_tool_from_config(self, tool_id: str, tool_config: Dict[str, Any]) -> bool:
         """
         Register a tool from configuration.
         
+        With lazy loading, the tool's module is not imported until the tool
+        is first used; otherwise it is imported and instantiated now.
+        
         Args:
             tool_id: Unique identifier for the tool
             tool_config: Tool configuration
@@ -87,6 +264,9 @@ class ToolHandler:
         Returns:
             True if tool was registered successfully, False otherwise
         """
+        descriptor = None
+        with self._tools_lock:
+            self._failed_tools.pop(tool_id, None)
         try:
             # Extract module and class information
             module_path = tool_config.get("module")
@@ -95,31 +275,100 @@ class ToolHandler:
             if not module_path or not class_name:
                 self.logger.error(f"Missing module or class for tool {tool_id}")
                 return False
-                
-            # Import module
-            module = importlib.import_module(module_path)
             
-            # Get class
-            tool_class = getattr(module, class_name)
-            
-            # Create instance
-            tool_instance = tool_class()
+            descriptor = ToolDescriptor(tool_id, module_path, class_name, tool_config.get("config"))
+            if not self.lazy_loading:
+                descriptor.load()
             
             # Register tool
-            self.tools[tool_id] = {
-                "id": tool_id,
-                "name": tool_config.get("name", tool_id),
-                "description": tool_config.get("description", ""),
-                "instance": tool_instance,
-                "config": tool_config
-            }
+            with self._tools_lock:
+                self.tools[tool_id] = {
+                    "id": tool_id,
+                    "name": tool_config.get("name", tool_id),
+                    "description": tool_config.get("description", ""),
+                    "instance": descriptor.instance,
+                    "config": tool_config,
+                    "descriptor": descriptor
+                }
             
             self.logger.info(f"Registered tool: {tool_id}")
             return True
         except Exception as e:
             self.logger.error(f"Failed to register tool {tool_id}: {e}")
+            if descriptor is not None:
+                with self._tools_lock:
+                    self._failed_tools[tool_id] = descriptor
             return False
     
+    def _load_tool(self, tool_id: str, tool_info: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """
+        Instantiate a lazily registered tool.
+        
+        A tool that fails to load is unregistered, as it would have been
+        when tools were loaded at construction.
+        
+        Args:
+            tool_id: ID of the tool
+            tool_info: The tool's registry entry
+            
+        Returns:
+            The entry with its instance set, or None if loading failed
+        """
+        try:
+            tool_info["instance"] = tool_info["descriptor"].load()
+            return tool_info
+        except Exception as e:
+            self.logger.error(f"Failed to load tool {tool_id}: {e}")
+            with self._tools_lock:
+                if self.tools.get(tool_id) is tool_info:
+                    del self.tools[tool_id]
+                    self._failed_tools[tool_id] = tool_info["descriptor"]
+            return None
+    
+    def _tool_items(self) -> List[Tuple[str, Dict[str, Any]]]:
+        """Snapshot of the registered tools, safe to iterate while other threads change them."""
+        with self._tools_lock:
+            return list(self.tools.items())
+    
+    def start_warm_up(self) -> None:
+        """Load every registered tool that is not loaded yet, in a background thread."""
+        if self._warm_up_thread is not None and self._warm_up_thread.is_alive():
+            return
+        
+        def warm_up() -> None:
+            for tool_id, tool_info in self._tool_items():
+                if tool_info.get("instance") is None and "descriptor" in tool_info:
+                    self._load_tool(tool_id, tool_info)
+            self.logger.info("Tool warm-up finished")
+        
+        self._warm_up_thread = threading.Thread(target=warm_up, name="tool-warm-up", daemon=True)
+        self._warm_up_thread.start()
+    
+    def get_load_report(self) -> List[Dict[str, Any]]:
+        """
+        Report how long each registry tool took to import and instantiate.
+        
+        Returns:
+            One entry per registry tool with 'id', 'loaded', 'import_ms',
+            'init_ms' and 'error', slowest first; tools not loaded yet have
+            no times
+        """
+        with self._tools_lock:
+            descriptors = [tool_info["descriptor"] for tool_info in self.tools.values() if "descriptor" in tool_info]
+            descriptors.extend(descriptor for tool_id, descriptor in self._failed_tools.items() if tool_id not in self.tools)
+        report = [
+            {
+                "id": descriptor.tool_id,
+                "loaded": descriptor.loaded,
+                "import_ms": descriptor.import_seconds * 1000 if descriptor.import_seconds is not None else None,
+                "init_ms": descriptor.init_seconds * 1000 if descriptor.init_seconds is not None else None,
+                "error": descriptor.error
+            }
+            for descriptor in descriptors
+        ]
+        report.sort(key=lambda entry: (entry["import_ms"] or 0) + (entry["init_ms"] or 0), reverse=True)
+        return report
+    
     def register_tool(self, tool_id: str, tool_instance: Any, name: str = "", description: str = "") -> bool:
         """
         Register a tool instance directly.
@@ -134,13 +383,14 @@ class ToolHandler:
             True if tool was registered successfully, False otherwise
         """
         try:
-            self.tools[tool_id] = {
-                "id": tool_id,
-                "name": name or tool_id,
-                "description": description,
-                "instance": tool_instance,
-                "config": {}
-            }
+            with self._tools_lock:
+                self.tools[tool_id] = {
+                    "id": tool_id,
+                    "name": name or tool_id,
+                    "description": description,
+                    "instance": tool_instance,
+                    "config": {}
+                }
             
             self.logger.info(f"Registered tool: {tool_id}")
             return True
@@ -158,7 +408,11 @@ class ToolHandler:
         Returns:
             Tool information if found, None otherwise
         """
-        return self.tools.get(tool_id)
+        tool_info = self.tools.get(tool_id)
+        if tool_info is not None and tool_info["instance"] is None and "descriptor" in tool_info:
+            # First use of a lazily registered tool
+            return self._load_tool(tool_id, tool_info)
+        return tool_info
     
     def list_tools(self) -> List[Dict[str, Any]]:
         """
@@ -173,7 +427,7 @@ class ToolHandler:
                 "name": tool_info["name"],
                 "description": tool_info["description"]
             }
-            for tool_id, tool_info in self.tools.items()
+            for tool_id, tool_info in self._tool_items()
         ]
     
     def execute_tool(self, tool_id: str, **kwargs) -> Any:
@@ -190,6 +444,10 @@ class ToolHandler:
         tool_info = self.get_tool(tool_id)
         
         if not tool_info:
+            with self._tools_lock:
+                failed = self._failed_tools.get(tool_id)
+            if failed is not None:
+                raise ValueError(f"Tool {tool_id} failed to load: {failed.error}")
             self.logger.error(f"Tool {tool_id} not found")
             raise ValueError(f"Tool {tool_id} not found")
             
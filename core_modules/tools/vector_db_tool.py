@@ -1,9 +1,280 @@
+"""
+Vector Database Tool
+
+This module provides VectorDBTool, an in-process vector store built on the
+indexes in core_modules.vector_index. Documents are grouped in named
+collections; each collection is a flat (exact) or IVF (approximate) index that
+can be saved to and memory-mapped from a storage directory.
+"""
+
 import logging
+import os
+import re
+import threading
+from typing import Dict, List, Any, Optional
+
+from ultimate_ai_architect_framework.core_modules.embeddings import Embedder, create_embedder
+from ultimate_ai_architect_framework.core_modules.vector_index import (
+    VectorIndex, VectorIndexError, create_index, load_index
+)
+
+_COLLECTION_NAME = re.compile(r"^[A-Za-z0-9_.-]+$")
+
 
 class VectorDBTool:
-    def __init__(self):
-        self.logger = logging.getLogger(__name__)
-        
-    def execute(self, **kwargs):
-        self.logger.info(f"Executing {self.__class__.__name__} with args: {kwargs}")
-        return {"status": "success", "result": "Placeholder result for vector database operations"}
+    """
+    Local vector store with upsert, delete and filtered similarity queries.
+
+    Callers pass either raw vectors or texts, which are embedded with the
+    configured embedder. Text passed on upsert is kept in the metadata under
+    'text'. Collections are created on first upsert and, when a storage path
+    is configured, loaded from disk on first use.
+    """
+
+    def __init__(self, config: Optional[Dict[str, Any]] = None):
+        """
+        Initialize a new VectorDBTool instance.
+
+        Args:
+            config: Tool configuration:
+                index_type: 'flat' (exact, default) or 'ivf' (approximate)
+                metric: 'cosine' (default) or 'ip'
+                storage_path: Directory for saved collections (None keeps them in memory)
+                mmap: Memory-map saved vectors on load (default True)
+                embedder: create_embedder() settings for text inputs
+                ivf: IVFIndex options (n_lists, n_probe, train_threshold, ...)
+        """
+        self.logger = logging.getLogger("core.tools.vector_db")
+        self.config = {
+            'index_type': 'flat',
+            'metric': 'cosine',
+            'storage_path': None,
+            'mmap': True,
+            'embedder': {'provider': 'hashing', 'dimension': 256},
+            'ivf': {'n_lists': 1024, 'n_probe': 16}
+        }
+        if config:
+            self.config.update(config)
+
+        self.collections: Dict[str, VectorIndex] = {}
+        self._embedder: Optional[Embedder] = None
+        self._lock = threading.RLock()
+
+    @property
+    def embedder(self) -> Embedder:
+        """The embedder for text inputs, created on first use."""
+        if self._embedder is None:
+            self._embedder = create_embedder(self.config['embedder'])
+        return self._embedder
+
+    def _collection_path(self, name: str) -> Optional[str]:
+        if not self.config['storage_path']:
+            return None
+        return os.path.join(self.config['storage_path'], name)
+
+    def get_collection(self, name: str, dimension: Optional[int] = None) -> Optional[VectorIndex]:
+        """
+        Get a collection, loading it from storage or creating it as needed.
+
+        Args:
+            name: Collection name (letters, digits, '_', '.', '-')
+            dimension: Vector length; if given, a missing collection is created
+
+        Returns:
+            The collection's index, or None if it does not exist and no
+            dimension was given
+        """
+        if not _COLLECTION_NAME.match(name):
+            raise VectorIndexError(f"Invalid collection name: {name}")
+        with self._lock:
+            index = self.collections.get(name)
+            if index is not None:
+                return index
+
+            path = self._collection_path(name)
+            if path and os.path.exists(os.path.join(path, "header.json")):
+                index = load_index(path, mmap=self.config['mmap'])
+                self.logger.info(f"Loaded collection {name} with {len(index)} vectors")
+            elif dimension is not None:
+                options = {'metric': self.config['metric']}
+                if self.config['index_type'] == 'ivf':
+                    options.update(self.config['ivf'])
+                index = create_index(self.config['index_type'], dimension, **options)
+                self.logger.info(f"Created {self.config['index_type']} collection {name}")
+            else:
+                return None
+            self.collections[name] = index
+            return index
+
+    def _vectors_for(self, vectors: Optional[List[List[float]]], texts: Optional[List[str]]) -> Any:
+        if vectors is not None:
+            return vectors
+        if texts is not None:
+            return self.embedder.embed(texts)
+        raise VectorIndexError("Either vectors or texts must be provided")
+
+    def upsert(self,
+               collection: str,
+               ids: List[str],
+               vectors: Optional[List[List[float]]] = None,
+               texts: Optional[List[str]] = None,
+               metadata: Optional[List[Dict[str, Any]]] = None) -> int:
+        """
+        Insert or replace documents.
+
+        Args:
+            collection: Collection name
+            ids: Document ids
+            vectors: Embeddings, one per id (alternative to texts)
+            texts: Texts to embed, one per id
+            metadata: Metadata dictionary per id
+
+        Returns:
+            Number of documents written
+        """
+        matrix = self._vectors_for(vectors, texts)
+        if texts is not None:
+            metadata = [
+                {'text': text, **(entry or {})}
+                for text, entry in zip(texts, metadata or [None] * len(texts))
+            ]
+        with self._lock:
+            dimension = len(matrix[0]) if len(matrix) else self.embedder.dimension
+            index = self.get_collection(collection, dimension=dimension)
+            return index.upsert(ids, matrix, metadata)
+
+    def delete(self, collection: str, ids: List[str]) -> int:
+        """
+        Delete documents by id.
+
+        Args:
+            collection: Collection name
+            ids: Document ids
+
+        Returns:
+            Number of documents deleted
+        """
+        with self._lock:
+            index = self.get_collection(collection)
+            return index.delete(ids) if index is not None else 0
+
+    def query(self,
+              collection: str,
+              vector: Optional[List[float]] = None,
+              text: Optional[str] = None,
+              k: int = 5,
+              filter: Optional[Dict[str, Any]] = None) -> List[Dict[str, Any]]:
+        """
+        Find the documents most similar to a query.
+
+        Args:
+            collection: Collection name
+            vector: Query embedding (alternative to text)
+            text: Query text to embed
+            k: Number of results
+            filter: Metadata filter, e.g. {'source': 'docs', 'year': {'$gte': 2020}}
+
+        Returns:
+            List of {'id', 'score', 'metadata'} dictionaries, best first
+        """
+        if vector is None:
+            if text is None:
+                raise VectorIndexError("Either vector or text must be provided")
+            vector = self.embedder.embed_query(text)
+        with self._lock:
+            index = self.get_collection(collection)
+            if index is None:
+                return []
+            return index.query(vector, k, filter)
+
+    def save(self, collection: Optional[str] = None) -> List[str]:
+        """
+        Save collections to the storage path.
+
+        Args:
+            collection: Collection to save (default: all loaded collections)
+
+        Returns:
+            Names of the saved collections
+        """
+        if not self.config['storage_path']:
+            raise VectorIndexError("No storage_path configured")
+        with self._lock:
+            names = [collection] if collection else list(self.collections)
+            for name in names:
+                index = self.get_collection(name)
+                if index is not None:
+                    index.save(self._collection_path(name))
+            return names
+
+    def stats(self, collection: str) -> Dict[str, Any]:
+        """
+        Describe a collection.
+
+        Args:
+            collection: Collection name
+
+        Returns:
+            Dictionary with count, dimension, index_type and metric
+        """
+        with self._lock:
+            index = self.get_collection(collection)
+            if index is None:
+                return {'count': 0}
+            stats = {
+                'count': len(index),
+                'dimension': index.dimension,
+                'index_type': index.index_type,
+                'metric': index.metric
+            }
+            if index.index_type == 'ivf':
+                stats.update({'n_lists': index.n_lists, 'n_probe': index.n_probe, 'trained': index.is_trained})
+            return stats
+
+    def execute(self,
+                action: str,
+                collection: str = "default",
+                ids: Optional[List[str]] = None,
+                vectors: Optional[List[List[float]]] = None,
+                texts: Optional[List[str]] = None,
+                metadata: Optional[List[Dict[str, Any]]] = None,
+                vector: Optional[List[float]] = None,
+                text: Optional[str] = None,
+                k: int = 5,
+                filter: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """
+        Run a vector store action.
+
+        Args:
+            action: 'upsert', 'delete', 'query', 'save' or 'stats'
+            collection: Collection name
+            ids: Document ids (upsert, delete)
+            vectors: Document embeddings (upsert)
+            texts: Document texts to embed (upsert)
+            metadata: Document metadata (upsert)
+            vector: Query embedding (query)
+            text: Query text (query)
+            k: Number of results (query)
+            filter: Metadata filter (query)
+
+        Returns:
+            {'status': 'success', 'result': ...} or {'status': 'error', 'error': message}
+        """
+        self.logger.info(f"Executing {self.__class__.__name__} action {action} on collection {collection}")
+        try:
+            if action == "upsert":
+                result = {'upserted': self.upsert(collection, ids or [], vectors, texts, metadata)}
+            elif action == "delete":
+                result = {'deleted': self.delete(collection, ids or [])}
+            elif action == "query":
+                result = self.query(collection, vector, text, k, filter)
+            elif action == "save":
+                result = {'saved': self.save(collection)}
+            elif action == "stats":
+                result = self.stats(collection)
+            else:
+                raise VectorIndexError(f"Unknown action: {action}")
+            return {"status": "success", "result": result}
+        except Exception as e:
+            self.logger.error(f"Vector database action {action} failed: {e}")
+            return {"status": "error", "error": str(e)}
@@ -0,0 +1,666 @@
+"""
+Vector Index Module
+
+This module provides in-process vector indexes used by VectorDBTool:
+- FlatIndex: exact brute-force search, one matrix-vector product per query
+- IVFIndex: approximate inverted-file search; vectors are clustered with
+  k-means and a query only scores the vectors in its n_probe nearest clusters
+
+Both indexes support upsert, delete and top-k queries with metadata filters,
+and are saved as a directory of .npy and JSON files. Loading memory-maps the
+vector matrix, so a large index opens without reading it into RAM; it is
+copied into memory only when it is first modified.
+"""
+
+import json
+import logging
+import os
+from typing import Dict, List, Any, Iterable, Optional, Sequence, Set
+
+import numpy as np
+
+from ultimate_ai_architect_framework.core_modules.embeddings import normalize_rows, top_k_indices
+
+logger = logging.getLogger("core.vector_index")
+
+FORMAT_VERSION = 1
+METRICS = ("cosine", "ip")
+_RANGE_OPERATORS = {
+    "$gt": lambda a, b: a > b,
+    "$gte": lambda a, b: a >= b,
+    "$lt": lambda a, b: a < b,
+    "$lte": lambda a, b: a <= b,
+    "$ne": lambda a, b: a != b
+}
+
+
+class VectorIndexError(Exception):
+    """Raised for invalid vector index operations or files."""
+    pass
+
+
+def _is_hashable(value: Any) -> bool:
+    try:
+        hash(value)
+    except TypeError:
+        return False
+    return True
+
+
+class VectorIndex:
+    """
+    Base class holding vectors, ids and metadata for an index.
+
+    Vectors live in rows of one float32 matrix. Deleting a vector moves the
+    last row into its slot, so rows stay dense. For the 'cosine' metric
+    vectors are normalized on insert and scores are cosine similarities; for
+    'ip' scores are raw inner products.
+
+    Metadata filters are dictionaries of field conditions, all of which must
+    hold. A condition is a value (equality) or a dictionary of operators:
+    $in, $ne, $gt, $gte, $lt, $lte. Equality and $in are answered from an
+    inverted index built on the first filtered query.
+    """
+
+    index_type = "base"
+
+    def __init__(self, dimension: int, metric: str = "cosine", initial_capacity: int = 1024):
+        """
+        Initialize an empty index.
+
+        Args:
+            dimension: Vector length
+            metric: 'cosine' or 'ip' (inner product)
+            initial_capacity: Rows allocated up front
+        """
+        if dimension <= 0:
+            raise VectorIndexError(f"Vector dimension must be positive, got {dimension}")
+        if metric not in METRICS:
+            raise VectorIndexError(f"Unknown metric '{metric}'; expected one of {METRICS}")
+        self.dimension = int(dimension)
+        self.metric = metric
+        self._vectors = np.zeros((max(1, int(initial_capacity)), self.dimension), dtype=np.float32)
+        self._ids: List[str] = []
+        self._rows: Dict[str, int] = {}
+        self._metadata: List[Dict[str, Any]] = []
+        # field -> value -> ids; built lazily by _filter_rows()
+        self._inverted: Optional[Dict[str, Dict[Any, Set[str]]]] = None
+
+    def __len__(self) -> int:
+        return len(self._ids)
+
+    def __contains__(self, vector_id: str) -> bool:
+        return vector_id in self._rows
+
+    # Per-row arrays kept aligned with the vector matrix (subclasses extend this)
+    def _row_arrays(self) -> List[np.ndarray]:
+        return []
+
+    def _resize_row_arrays(self, capacity: int) -> None:
+        pass
+
+    def _ensure_capacity(self, rows: int) -> None:
+        """Grow the matrix to hold rows rows, copying a memory-mapped matrix into RAM."""
+        capacity = self._vectors.shape[0]
+        if rows <= capacity and self._vectors.flags.writeable and not isinstance(self._vectors, np.memmap):
+            return
+        while capacity < rows:
+            capacity *= 2
+        count = len(self._ids)
+        grown = np.zeros((max(capacity, 1), self.dimension), dtype=np.float32)
+        grown[:count] = self._vectors[:count]
+        self._vectors = grown
+        self._resize_row_arrays(grown.shape[0])
+
+    def _prepare(self, vectors: Any) -> np.ndarray:
+        """Convert input vectors to a normalized (n, dimension) float32 matrix."""
+        matrix = np.array(vectors, dtype=np.float32, ndmin=2)
+        if matrix.ndim != 2 or matrix.shape[1] != self.dimension:
+            raise VectorIndexError(f"Expected vectors of dimension {self.dimension}, got shape {matrix.shape}")
+        if self.metric == "cosine":
+            normalize_rows(matrix)
+        return matrix
+
+    def _index_metadata(self, vector_id: str, metadata: Dict[str, Any]) -> None:
+        if self._inverted is None:
+            return
+        for field, value in metadata.items():
+            if _is_hashable(value):
+                self._inverted.setdefault(field, {}).setdefault(value, set()).add(vector_id)
+
+    def _unindex_metadata(self, vector_id: str, metadata: Dict[str, Any]) -> None:
+        if self._inverted is None:
+            return
+        for field, value in metadata.items():
+            if not _is_hashable(value):
+                continue
+            ids = self._inverted.get(field, {}).get(value)
+            if ids is not None:
+                ids.discard(vector_id)
+                if not ids:
+                    del self._inverted[field][value]
+
+    def upsert(self,
+               ids: Sequence[str],
+               vectors: Any,
+               metadata: Optional[Sequence[Optional[Dict[str, Any]]]] = None) -> int:
+        """
+        Insert vectors, replacing any existing vectors with the same ids.
+
+        Args:
+            ids: Vector ids
+            vectors: Array-like of shape (len(ids), dimension)
+            metadata: Optional metadata dictionary per vector
+
+        Returns:
+            Number of vectors written
+        """
+        ids = [str(vector_id) for vector_id in ids]
+        matrix = self._prepare(vectors)
+        if matrix.shape[0] != len(ids):
+            raise VectorIndexError(f"Got {len(ids)} ids for {matrix.shape[0]} vectors")
+        if metadata is not None and len(metadata) != len(ids):
+            raise VectorIndexError(f"Got {len(metadata)} metadata entries for {len(ids)} vectors")
+        if len(set(ids)) != len(ids):
+            raise VectorIndexError("Duplicate ids in one upsert")
+
+        self._ensure_capacity(len(self._ids) + len(ids))
+        rows = np.empty(len(ids), dtype=np.int64)
+        for position, vector_id in enumerate(ids):
+            entry = dict(metadata[position] or {}) if metadata is not None else {}
+            row = self._rows.get(vector_id)
+            if row is None:
+                row = len(self._ids)
+                self._ids.append(vector_id)
+                self._metadata.append(entry)
+                self._rows[vector_id] = row
+            else:
+                self._unindex_metadata(vector_id, self._metadata[row])
+                self._metadata[row] = entry
+            self._index_metadata(vector_id, entry)
+            rows[position] = row
+
+        self._vectors[rows] = matrix
+        self._on_rows_written(rows)
+        return len(ids)
+
+    def _on_rows_written(self, rows: np.ndarray) -> None:
+        """Hook called after vectors are written to rows."""
+        pass
+
+    def delete(self, ids: Iterable[str]) -> int:
+        """
+        Delete vectors by id. Unknown ids are ignored.
+
+        Args:
+            ids: Vector ids
+
+        Returns:
+            Number of vectors deleted
+        """
+        deleted = 0
+        for vector_id in ids:
+            row = self._rows.pop(str(vector_id), None)
+            if row is None:
+                continue
+            if deleted == 0:
+                self._ensure_capacity(len(self._ids))
+            self._unindex_metadata(str(vector_id), self._metadata[row])
+            last = len(self._ids) - 1
+            if row != last:
+                moved_id = self._ids[last]
+                self._vectors[row] = self._vectors[last]
+                for array in self._row_arrays():
+                    array[row] = array[last]
+                self._ids[row] = moved_id
+                self._metadata[row] = self._metadata[last]
+                self._rows[moved_id] = row
+            self._ids.pop()
+            self._metadata.pop()
+            deleted += 1
+        if deleted:
+            self._on_rows_deleted()
+        return deleted
+
+    def _on_rows_deleted(self) -> None:
+        """Hook called after rows are removed or moved by delete()."""
+        pass
+
+    def get(self, vector_id: str) -> Optional[Dict[str, Any]]:
+        """
+        Get a stored vector and its metadata.
+
+        Args:
+            vector_id: Vector id
+
+        Returns:
+            Dictionary with id, vector and metadata, or None if not found
+        """
+        row = self._rows.get(vector_id)
+        if row is None:
+            return None
+        return {"id": vector_id, "vector": np.array(self._vectors[row]), "metadata": self._metadata[row]}
+
+    def _build_inverted(self) -> None:
+        self._inverted = {}
+        for vector_id, metadata in zip(self._ids, self._metadata):
+            self._index_metadata(vector_id, metadata)
+
+    def _filter_rows(self, filter: Dict[str, Any]) -> np.ndarray:
+        """
+        Find the rows whose metadata satisfies a filter.
+
+        Args:
+            filter: Field conditions (see class docstring)
+
+        Returns:
+            Sorted array of matching rows
+        """
+        if self._inverted is None:
+            self._build_inverted()
+
+        candidates: Optional[Set[str]] = None
+        predicates = []
+        for field, condition in filter.items():
+            if isinstance(condition, dict):
+                for operator, operand in condition.items():
+                    if operator == "$in":
+                        ids = set()
+                        for value in operand:
+                            ids |= self._inverted.get(field, {}).get(value, set()) if _is_hashable(value) else set()
+                        candidates = ids if candidates is None else candidates & ids
+                    elif operator in _RANGE_OPERATORS:
+                        predicates.append((field, _RANGE_OPERATORS[operator], operand))
+                    else:
+                        raise VectorIndexError(f"Unknown filter operator '{operator}'")
+            elif _is_hashable(condition):
+                ids = self._inverted.get(field, {}).get(condition, set())
+                candidates = set(ids) if candidates is None else candidates & ids
+            else:
+                predicates.append((field, lambda a, b: a == b, condition))
+
+        if candidates is None:
+            rows = range(len(self._ids))
+        else:
+            rows = [self._rows[vector_id] for vector_id in candidates]
+        if predicates:
+            rows = [row for row in rows if self._satisfies(self._metadata[row], predicates)]
+        return np.array(sorted(rows), dtype=np.int64)
+
+    @staticmethod
+    def _satisfies(metadata: Dict[str, Any], predicates: List[Any]) -> bool:
+        for field, compare, operand in predicates:
+            if field not in metadata:
+                return False
+            try:
+                if not compare(metadata[field], operand):
+                    return False
+            except TypeError:
+                return False
+        return True
+
+    def _candidate_rows(self, query: np.ndarray) -> Optional[np.ndarray]:
+        """Rows to score for a query, or None to score every row."""
+        return None
+
+    def _results(self, rows: Optional[np.ndarray], scores: np.ndarray, k: int) -> List[Dict[str, Any]]:
+        results = []
+        for position in top_k_indices(scores, k):
+            row = int(rows[position]) if rows is not None else int(position)
+            results.append({"id": self._ids[row], "score": float(scores[position]), "metadata": self._metadata[row]})
+        return results
+
+    def query(self, vector: Any, k: int = 10, filter: Optional[Dict[str, Any]] = None) -> List[Dict[str, Any]]:
+        """
+        Find the stored vectors most similar to a query vector.
+
+        Args:
+            vector: Query vector of length dimension
+            k: Number of results
+            filter: Optional metadata filter
+
+        Returns:
+            List of {'id', 'score', 'metadata'} dictionaries, best first
+        """
+        query = self._prepare(vector)[0]
+        count = len(self._ids)
+        if count == 0:
+            return []
+
+        rows = self._candidate_rows(query)
+        if filter:
+            allowed = self._filter_rows(filter)
+            if rows is None or len(allowed) <= len(rows):
+                # Scoring every allowed row is exact and no more work
+                rows = allowed
+            else:
+                rows = rows[np.isin(rows, allowed, assume_unique=True)]
+
+        if rows is None:
+            scores = self._vectors[:count] @ query
+        else:
+            scores = self._vectors[rows] @ query
+        return self._results(rows, scores, k)
+
+    def query_batch(self,
+                    vectors: Any,
+                    k: int = 10,
+                    filter: Optional[Dict[str, Any]] = None) -> List[List[Dict[str, Any]]]:
+        """
+        Run query() for several query vectors.
+
+        Args:
+            vectors: Array-like of shape (n, dimension)
+            k: Number of results per query
+            filter: Optional metadata filter applied to every query
+
+        Returns:
+            One result list per query vector
+        """
+        return [self.query(vector, k, filter) for vector in self._prepare(vectors)]
+
+    # Persistence
+
+    def _header(self) -> Dict[str, Any]:
+        return {
+            "format": FORMAT_VERSION,
+            "index_type": self.index_type,
+            "dimension": self.dimension,
+            "metric": self.metric,
+            "count": len(self._ids)
+        }
+
+    def _save_order(self) -> Optional[np.ndarray]:
+        """Row order to write on save, or None for the current order."""
+        return None
+
+    def _save_arrays(self, order: Optional[np.ndarray]) -> Dict[str, np.ndarray]:
+        """Extra arrays written on save, in the saved row order."""
+        return {}
+
+    def save(self, path: str) -> None:
+        """
+        Save the index to a directory.
+
+        Files are written under temporary names and renamed into place, the
+        header last, so an interrupted save leaves the previous header valid
+        only with a complete set of files from some save.
+
+        Args:
+            path: Directory to write (created if needed)
+        """
+        os.makedirs(path, exist_ok=True)
+        count = len(self._ids)
+        order = self._save_order()
+        vectors = self._vectors[:count] if order is None else self._vectors[order]
+        ids = self._ids if order is None else [self._ids[row] for row in order]
+        metadata = self._metadata if order is None else [self._metadata[row] for row in order]
+
+        def write(name: str, writer) -> None:
+            tmp_path = os.path.join(path, f"{name}.tmp")
+            with open(tmp_path, "wb") as f:
+                writer(f)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_path, os.path.join(path, name))
+
+        write("vectors.npy", lambda f: np.save(f, np.ascontiguousarray(vectors)))
+        for name, array in self._save_arrays(order).items():
+            write(f"{name}.npy", lambda f, array=array: np.save(f, array))
+        write("ids.json", lambda f: f.write(json.dumps(ids).encode("utf-8")))
+        write("metadata.json", lambda f: f.write(json.dumps(metadata, default=str).encode("utf-8")))
+        write("header.json", lambda f: f.write(json.dumps(self._header(), indent=2).encode("utf-8")))
+        logger.debug(f"Saved {self.index_type} index with {count} vectors to {path}")
+
+    def _load_state(self, path: str, header: Dict[str, Any], mmap: bool) -> None:
+        mode = "r" if mmap else None
+        vectors = np.load(os.path.join(path, "vectors.npy"), mmap_mode=mode)
+        with open(os.path.join(path, "ids.json"), "r", encoding="utf-8") as f:
+            ids = json.load(f)
+        with open(os.path.join(path, "metadata.json"), "r", encoding="utf-8") as f:
+            metadata = json.load(f)
+        if vectors.shape != (header["count"], self.dimension) or len(ids) != len(vectors) or len(metadata) != len(ids):
+            raise VectorIndexError(f"Index files in {path} are inconsistent with its header")
+        self._vectors = vectors if len(ids) else self._vectors
+        self._ids = ids
+        self._rows = {vector_id: row for row, vector_id in enumerate(ids)}
+        self._metadata = metadata
+
+
+class FlatIndex(VectorIndex):
+    """Exact index: every query scores all stored vectors (or all filtered ones)."""
+
+    index_type = "flat"
+
+    def query_batch(self,
+                    vectors: Any,
+                    k: int = 10,
+                    filter: Optional[Dict[str, Any]] = None) -> List[List[Dict[str, Any]]]:
+        if filter or not len(self._ids):
+            return super().query_batch(vectors, k, filter)
+        queries = self._prepare(vectors)
+        # One matrix product for the whole batch
+        scores = queries @ self._vectors[:len(self._ids)].T
+        return [self._results(None, row_scores, k) for row_scores in scores]
+
+
+class IVFIndex(VectorIndex):
+    """
+    Inverted-file approximate index.
+
+    Vectors are partitioned into n_lists clusters by spherical k-means. A
+    query scores the centroids, then only the vectors in its n_probe best
+    clusters; raising n_probe trades speed for recall. Until the index has
+    been trained (explicitly, or automatically once it holds train_threshold
+    vectors) queries are exact.
+    """
+
+    index_type = "ivf"
+
+    def __init__(self,
+                 dimension: int,
+                 metric: str = "cosine",
+                 n_lists: int = 1024,
+                 n_probe: int = 16,
+                 train_threshold: Optional[int] = None,
+                 kmeans_iterations: int = 10,
+                 seed: int = 0,
+                 initial_capacity: int = 1024):
+        """
+        Initialize an empty IVFIndex.
+
+        Args:
+            dimension: Vector length
+            metric: 'cosine' or 'ip' (inner product)
+            n_lists: Number of clusters
+            n_probe: Clusters scored per query
+            train_threshold: Vector count that triggers automatic training
+                (default 39 * n_lists); 0 disables automatic training
+            kmeans_iterations: k-means iterations when training
+            seed: Random seed for training
+            initial_capacity: Rows allocated up front
+        """
+        super().__init__(dimension, metric, initial_capacity)
+        self.n_lists = max(1, int(n_lists))
+        self.n_probe = max(1, int(n_probe))
+        self.train_threshold = 39 * self.n_lists if train_threshold is None else int(train_threshold)
+        self.kmeans_iterations = max(1, int(kmeans_iterations))
+        self.seed = seed
+        self.centroids: Optional[np.ndarray] = None
+        self._assign = np.zeros(self._vectors.shape[0], dtype=np.int32)
+        # Rows grouped by list: rows of list c are _list_order[_list_bounds[c]:_list_bounds[c + 1]]
+        self._list_order: Optional[np.ndarray] = None
+        self._list_bounds: Optional[np.ndarray] = None
+
+    @property
+    def is_trained(self) -> bool:
+        return self.centroids is not None
+
+    def _row_arrays(self) -> List[np.ndarray]:
+        return [self._assign]
+
+    def _resize_row_arrays(self, capacity: int) -> None:
+        assign = np.zeros(capacity, dtype=np.int32)
+        count = min(len(self._ids), self._assign.shape[0])
+        assign[:count] = self._assign[:count]
+        self._assign = assign
+
+    def _nearest_centroids(self, vectors: np.ndarray, chunk_size: int = 65536) -> np.ndarray:
+        """Assign each vector to its highest-scoring centroid."""
+        assignments = np.empty(vectors.shape[0], dtype=np.int32)
+        for start in range(0, vectors.shape[0], chunk_size):
+            chunk = np.asarray(vectors[start:start + chunk_size])
+            assignments[start:start + chunk_size] = np.argmax(chunk @ self.centroids.T, axis=1)
+        return assignments
+
+    def train(self, sample_size: Optional[int] = None) -> None:
+        """
+        Cluster the stored vectors and assign every vector to a list.
+
+        Args:
+            sample_size: Vectors sampled for k-means (default 64 * n_lists)
+        """
+        count = len(self._ids)
+        if count == 0:
+            raise VectorIndexError("Cannot train an empty index")
+        n_lists = min(self.n_lists, count)
+        rng = np.random.default_rng(self.seed)
+        sample_size = min(count, sample_size or 64 * n_lists)
+        sample = np.asarray(self._vectors[np.sort(rng.choice(count, sample_size, replace=False))])
+
+        centroids = sample[rng.choice(sample_size, n_lists, replace=False)].copy()
+        for _ in range(self.kmeans_iterations):
+            assignments = np.argmax(sample @ centroids.T, axis=1)
+            sizes = np.bincount(assignments, minlength=n_lists)
+            # Per-cluster sums: sort the sample by cluster and reduce each run
+            order = np.argsort(assignments, kind="stable")
+            starts = np.concatenate(([0], np.cumsum(sizes)[:-1]))
+            empty = sizes == 0
+            sums = np.zeros_like(centroids)
+            sums[~empty] = np.add.reduceat(sample[order], starts[~empty], axis=0)
+            if empty.any():
+                # Reseed empty clusters with random sample vectors
+                sums[empty] = sample[rng.choice(sample_size, int(empty.sum()))]
+            centroids = normalize_rows(sums)
+
+        self.n_lists = n_lists
+        self.centroids = np.ascontiguousarray(centroids, dtype=np.float32)
+        self._assign[:count] = self._nearest_centroids(self._vectors[:count])
+        self._list_order = None
+        logger.debug(f"Trained IVF index: {count} vectors in {n_lists} lists")
+
+    def _on_rows_written(self, rows: np.ndarray) -> None:
+        if self.is_trained:
+            self._assign[rows] = self._nearest_centroids(self._vectors[rows])
+            self._list_order = None
+        elif self.train_threshold and len(self._ids) >= self.train_threshold:
+            self.train()
+
+    def _on_rows_deleted(self) -> None:
+        self._list_order = None
+
+    def _lists(self):
+        """Group rows by list, rebuilding the grouping after modifications."""
+        if self._list_order is None:
+            assign = self._assign[:len(self._ids)]
+            self._list_order = np.argsort(assign, kind="stable")
+            self._list_bounds = np.searchsorted(assign[self._list_order], np.arange(self.n_lists + 1))
+        return self._list_order, self._list_bounds
+
+    def _candidate_rows(self, query: np.ndarray) -> Optional[np.ndarray]:
+        if not self.is_trained or self.n_probe >= self.n_lists:
+            return None
+        order, bounds = self._lists()
+        probed = top_k_indices(self.centroids @ query, self.n_probe)
+        return np.concatenate([order[bounds[c]:bounds[c + 1]] for c in probed])
+
+    def _header(self) -> Dict[str, Any]:
+        header = super()._header()
+        header.update({
+            "n_lists": self.n_lists,
+            "n_probe": self.n_probe,
+            "train_threshold": self.train_threshold,
+            "kmeans_iterations": self.kmeans_iterations,
+            "seed": self.seed,
+            "trained": self.is_trained
+        })
+        return header
+
+    def _save_order(self) -> Optional[np.ndarray]:
+        # Store each list contiguously so a memory-mapped query reads few pages
+        if not self.is_trained:
+            return None
+        order, _ = self._lists()
+        return order
+
+    def _save_arrays(self, order: Optional[np.ndarray]) -> Dict[str, np.ndarray]:
+        if not self.is_trained:
+            return {}
+        assign = self._assign[:len(self._ids)]
+        return {"centroids": self.centroids, "assignments": assign if order is None else assign[order]}
+
+    def _load_state(self, path: str, header: Dict[str, Any], mmap: bool) -> None:
+        super()._load_state(path, header, mmap)
+        if header.get("trained"):
+            self.centroids = np.load(os.path.join(path, "centroids.npy"))
+            self._assign = np.load(os.path.join(path, "assignments.npy")).astype(np.int32)
+        else:
+            # An empty index keeps its freshly allocated matrix; match its rows
+            self._assign = np.zeros(self._vectors.shape[0], dtype=np.int32)
+        self._list_order = None
+
+
+INDEX_TYPES = {"flat": FlatIndex, "ivf": IVFIndex}
+
+
+def create_index(index_type: str, dimension: int, **options) -> VectorIndex:
+    """
+    Create an empty index.
+
+    Args:
+        index_type: 'flat' or 'ivf'
+        dimension: Vector length
+        **options: Constructor options of the index class
+
+    Returns:
+        A VectorIndex instance
+    """
+    if index_type not in INDEX_TYPES:
+        raise VectorIndexError(f"Unknown index type '{index_type}'; expected one of {tuple(INDEX_TYPES)}")
+    return INDEX_TYPES[index_type](dimension, **options)
+
+
+def load_index(path: str, mmap: bool = True) -> VectorIndex:
+    """
+    Load an index saved with VectorIndex.save().
+
+    Args:
+        path: Index directory
+        mmap: Memory-map the vector matrix instead of reading it into RAM
+
+    Returns:
+        The loaded index
+    """
+    header_path = os.path.join(path, "header.json")
+    try:
+        with open(header_path, "r", encoding="utf-8") as f:
+            header = json.load(f)
+    except (OSError, ValueError) as e:
+        raise VectorIndexError(f"Cannot read index header {header_path}: {e}")
+    if header.get("format") != FORMAT_VERSION:
+        raise VectorIndexError(f"Unsupported index format {header.get('format')} in {path}")
+
+    index_type = header.get("index_type")
+    options = {"metric": header.get("metric", "cosine")}
+    if index_type == "ivf":
+        options.update({
+            "n_lists": header["n_lists"],
+            "n_probe": header["n_probe"],
+            "train_threshold": header.get("train_threshold"),
+            "kmeans_iterations": header.get("kmeans_iterations", 10),
+            "seed": header.get("seed", 0)
+        })
+    index = create_index(index_type, header["dimension"], **options)
+    index._load_state(path, header, mmap)
+    logger.debug(f"Loaded {index_type} index with {len(index)} vectors from {path}")
+    return index
@@ -0,0 +1,21 @@
+"""
+Make the repository importable as the ultimate_ai_architect_framework package.
+
+Framework modules import each other by that name; outside a checkout whose
+directory carries it, the package is registered from the repository root.
+"""
+
+import sys
+import types
+from pathlib import Path
+
+PACKAGE = "ultimate_ai_architect_framework"
+FRAMEWORK_ROOT = Path(__file__).resolve().parent.parent
+
+if PACKAGE not in sys.modules:
+    try:
+        __import__(PACKAGE)
+    except ImportError:
+        package = types.ModuleType(PACKAGE)
+        package.__path__ = [str(FRAMEWORK_ROOT)]
+        sys.modules[PACKAGE] = package
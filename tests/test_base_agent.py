@@ -0,0 +1,114 @@
+"""Tests for BaseAgent LLM client selection, response caching and hedged calls."""
+
+from typing import Optional
+
+import pytest
+from langchain_core.language_models.fake_chat_models import FakeListChatModel
+
+from ultimate_ai_architect_framework.agents.built_in.framework_strategy_advisor import FrameworkStrategyAdvisor
+from ultimate_ai_architect_framework.core_modules.llm_router import LLMRouter
+from ultimate_ai_architect_framework.core_modules.response_cache import InMemoryResponseCache
+from conftest import FRAMEWORK_ROOT
+
+
+class FakeChatModel(FakeListChatModel):
+    temperature: Optional[float] = None
+    max_tokens: Optional[int] = None
+
+
+class FakeLangSmith:
+    client = object()
+
+    def __init__(self):
+        self.runs = []
+
+    def start_run(self, **kwargs):
+        self.runs.append(kwargs)
+        return len(self.runs)
+
+    def end_run(self, run_id, **kwargs):
+        self.runs[run_id - 1]["end"] = kwargs
+
+
+@pytest.fixture
+def advisor(monkeypatch):
+    monkeypatch.setenv("OPENROUTER_API_KEY", "test-openrouter-key")
+    monkeypatch.setenv("GOOGLE_API_KEY", "test-google-key")
+    advisor = FrameworkStrategyAdvisor(str(FRAMEWORK_ROOT))
+    # The shared router may have been compiled before the keys were set
+    advisor.llm_router.refresh()
+    advisor.response_cache = None
+    return advisor
+
+
+def test_task_clients_follow_router(advisor):
+    reasoning = advisor._get_llm_client_for_task("reasoning")
+    summarization = advisor._get_llm_client_for_task("summarization")
+
+    assert advisor.llm_client_pool.get_key(reasoning)[:2] == ("openrouter", "anthropic/claude-3-opus")
+    assert advisor.llm_client_pool.get_key(summarization)[:2] == ("google_gemini", "gemini-pro")
+
+
+def test_advisor_strategy_calls_are_cacheable(advisor):
+    advisor.response_cache = InMemoryResponseCache()
+    client = advisor._get_llm_client_for_task("reasoning")
+
+    assert client.temperature == 0.0
+    assert advisor._get_cache_key(client, "prompt") is not None
+    assert advisor._get_cache_key(advisor._get_llm_client_for_task("reasoning", temperature=0.7), "prompt") is None
+
+
+def test_call_llm_serves_cache_hits(advisor):
+    advisor.response_cache = InMemoryResponseCache()
+    advisor.langsmith_setup = FakeLangSmith()
+    client = FakeChatModel(responses=["first", "second"], temperature=0.0, max_tokens=100)
+
+    assert advisor._call_llm(client, "prompt") == "first"
+    assert advisor._call_llm(client, "prompt ") == "first"
+    assert advisor._call_llm(client, "other prompt") == "second"
+
+    assert advisor.response_cache.get_stats()["hits"] == 1
+    uncached, cached, _ = advisor.langsmith_setup.runs
+    assert "tags" not in uncached
+    assert cached["tags"] == ["cached"]
+    assert cached["end"]["outputs"] == {"response": "first", "cached": True}
+
+
+def test_sampled_calls_are_not_cached(advisor):
+    advisor.response_cache = InMemoryResponseCache()
+    client = FakeChatModel(responses=["first", "second"], temperature=0.7)
+
+    assert advisor._call_llm(client, "prompt") == "first"
+    assert advisor._call_llm(client, "prompt") == "second"
+    assert len(advisor.response_cache) == 0
+
+
+def test_task_client_avoids_open_circuit(advisor):
+    advisor.llm_router = LLMRouter(str(FRAMEWORK_ROOT / "configs" / "global_settings.yaml"))
+    for _ in range(5):
+        advisor.llm_router.record_result("openrouter.anthropic/claude-3-opus", 0.1, success=False)
+
+    client = advisor._get_llm_client_for_task("reasoning")
+
+    assert advisor.llm_client_pool.get_key(client)[0] == "google_gemini"
+
+
+def test_hedged_call_sends_backup_to_backup_provider(advisor, monkeypatch):
+    advisor.hedging_config.update(enabled=True, backup_model="google_gemini.gemini-pro")
+    called = []
+
+    def invoke(llm_client, prompt, cache_key):
+        called.append(llm_client)
+        if len(called) == 1:
+            raise RuntimeError("primary failed")
+        return "backup response"
+
+    monkeypatch.setattr(advisor, "_invoke_llm", invoke)
+    primary = advisor._get_llm_client_for_task("reasoning")
+
+    assert advisor._call_llm_hedged(primary, "prompt", hedge_delay=0) == "backup response"
+
+    primary_key, backup_key = (advisor.llm_client_pool.get_key(client) for client in called)
+    assert primary_key[0] == "openrouter"
+    assert backup_key[0] == "google_gemini"
+    assert backup_key[1] == "gemini-pro"
@@ -0,0 +1,104 @@
+"""Tests for CircuitBreaker state transitions."""
+
+import pytest
+
+from ultimate_ai_architect_framework.core_modules.circuit_breaker import CircuitBreaker
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def clock():
+    return FakeClock()
+
+
+def make_breaker(clock, **settings):
+    settings.setdefault("min_calls", 4)
+    settings.setdefault("open_duration", 10.0)
+    return CircuitBreaker("test", clock=clock, **settings)
+
+
+def test_closed_open_half_open_closed(clock):
+    breaker = make_breaker(clock, half_open_max_calls=2)
+
+    for _ in range(3):
+        breaker.record_failure()
+    assert breaker.state == "closed"
+    breaker.record_failure()
+    assert breaker.state == "open"
+    assert not breaker.is_available()
+    assert not breaker.allow_request()
+
+    clock.now = 10.0
+    assert breaker.state == "half_open"
+    assert breaker.allow_request()
+    assert breaker.allow_request()
+    assert not breaker.allow_request()
+
+    breaker.record_success()
+    assert breaker.state == "half_open"
+    breaker.record_success()
+    assert breaker.state == "closed"
+    assert breaker.snapshot()["calls"] == 0
+
+
+def test_failing_trial_reopens(clock):
+    breaker = make_breaker(clock)
+    for _ in range(4):
+        breaker.record_failure()
+
+    clock.now = 10.0
+    assert breaker.allow_request()
+    breaker.record_failure()
+    assert breaker.state == "open"
+
+    clock.now = 19.0
+    assert breaker.state == "open"
+    clock.now = 20.0
+    assert breaker.state == "half_open"
+
+
+def test_slow_calls_open_circuit(clock):
+    breaker = make_breaker(clock, slow_call_duration=1.0, slow_call_rate_threshold=0.75)
+
+    for _ in range(3):
+        breaker.record_success(duration=2.0)
+    breaker.record_success(duration=0.1)
+    assert breaker.state == "open"
+
+
+def test_stale_half_open_trial_is_reset(clock):
+    breaker = make_breaker(clock)
+    for _ in range(4):
+        breaker.record_failure()
+
+    clock.now = 10.0
+    assert breaker.allow_request()
+    # The trial call never reports back
+    assert not breaker.is_available()
+    assert not breaker.allow_request()
+
+    clock.now = 19.9
+    assert not breaker.allow_request()
+    clock.now = 20.0
+    assert breaker.state == "half_open"
+    assert breaker.is_available()
+    assert breaker.allow_request()
+    breaker.record_success()
+    assert breaker.state == "closed"
+
+
+def test_late_result_while_open_is_ignored(clock):
+    breaker = make_breaker(clock)
+    for _ in range(4):
+        breaker.record_failure()
+
+    breaker.record_success()
+    assert breaker.state == "open"
+    assert breaker.snapshot()["calls"] == 0
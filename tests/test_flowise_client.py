@@ -0,0 +1,115 @@
+"""Tests for FlowiseClient and AsyncFlowiseClient against the local Flowise stub server."""
+
+import asyncio
+import sys
+
+import pytest
+import requests
+import yaml
+
+from conftest import FRAMEWORK_ROOT
+
+sys.path.insert(0, str(FRAMEWORK_ROOT / "benchmarks"))
+
+from flowise_stub_server import start_stub_server
+from ultimate_ai_architect_framework.core_modules.flowise_client import (
+    EVENT_END, EVENT_TOKEN, AsyncFlowiseClient, FlowiseAPIError, FlowiseClient, FlowiseConnectionError
+)
+
+MAX_CONCURRENCY = 3
+
+
+@pytest.fixture
+def stub_server():
+    server = start_stub_server(latency=0.05)
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.fixture
+def framework_root(tmp_path, stub_server):
+    configs = tmp_path / "configs"
+    configs.mkdir()
+    settings = {
+        "flowise": {
+            "enabled": True,
+            "base_url": f"http://127.0.0.1:{stub_server.server_port}",
+            "max_concurrency": MAX_CONCURRENCY,
+            "retry": {"max_attempts": 3, "base_delay": 0.01, "max_delay": 0.05},
+        }
+    }
+    (configs / "global_settings.yaml").write_text(yaml.safe_dump(settings))
+    return tmp_path
+
+
+def run(client_root, coroutine_factory):
+    async def main():
+        async with AsyncFlowiseClient(client_root) as client:
+            return await coroutine_factory(client)
+    return asyncio.run(main())
+
+
+def test_arun_flow(framework_root):
+    result = run(framework_root, lambda client: client.arun_flow("/api/v1/prediction/f", {"question": "héllo"}))
+    assert result["text"] == "Echo: héllo"
+
+
+def test_astream_events_reassembles_split_chunks(framework_root):
+    async def collect(client):
+        return [event async for event in client.astream_events("/api/v1/prediction/f", {"question": "日本語 🎉 ok"})]
+
+    events = run(framework_root, collect)
+    tokens = [event.data for event in events if event.type == EVENT_TOKEN]
+    assert " ".join(tokens) == "Echo: 日本語 🎉 ok"
+    assert events[-1].type == EVENT_END
+
+
+def test_arun_flows_bounds_concurrency(framework_root, stub_server):
+    inputs = [{"question": i} for i in range(12)]
+    results = run(framework_root, lambda client: client.arun_flows("/api/v1/prediction/f", inputs))
+    assert [result["text"] for result in results] == [f"Echo: {i}" for i in range(12)]
+    assert stub_server.RequestHandlerClass.max_in_flight == MAX_CONCURRENCY
+
+
+def test_arun_flows_isolates_failures(framework_root):
+    async def mixed(client):
+        good = await client.arun_flows("/api/v1/prediction/f", [{"question": "a"}])
+        bad = await client.arun_flows("/api/v1/prediction/error1", [{"question": "b"}])
+        return good + bad
+
+    good, bad = run(framework_root, mixed)
+    assert good["text"] == "Echo: a"
+    assert isinstance(bad, FlowiseAPIError)
+
+
+def test_arun_flow_retries_unavailable_server(framework_root):
+    async def flaky(client):
+        result = await client.arun_flow("/api/v1/prediction/flaky1", {"question": "again"})
+        return result, client.get_stats()
+
+    result, stats = run(framework_root, flaky)
+    assert result["text"] == "Echo: again"
+    assert stats["attempts"] == 3
+
+
+@pytest.mark.parametrize("ordered", [True, False])
+def test_run_flows_isolates_dropped_connection(framework_root, monkeypatch, ordered):
+    client = FlowiseClient(framework_root)
+    post = client.session.post
+
+    def dropping_post(url, json=None, **kwargs):
+        if json["question"] == "drop":
+            raise requests.exceptions.ChunkedEncodingError("connection dropped mid-response")
+        return post(url, json=json, **kwargs)
+
+    monkeypatch.setattr(client.session, "post", dropping_post)
+    inputs = [{"question": "a"}, {"question": "drop"}, {"question": "b"}]
+    results = client.run_flows("/api/v1/prediction/f", inputs, concurrency=2, ordered=ordered)
+    if not ordered:
+        results = [result for _, result in sorted(results, key=lambda pair: pair[0])]
+
+    assert results[0]["text"] == "Echo: a"
+    assert isinstance(results[1], FlowiseConnectionError)
+    assert results[2]["text"] == "Echo: b"
+    assert client.get_stats()["failed"] == 1
@@ -0,0 +1,72 @@
+"""Tests for LLMClientPool reuse, LRU eviction and key lookup."""
+
+import gc
+
+import pytest
+
+from ultimate_ai_architect_framework.core_modules.llm_client_pool import LLMClientPool
+
+
+class Client:
+    def __init__(self, model):
+        self.model = model
+
+
+def get(pool, model):
+    return pool.get_or_create(pool.make_key("openrouter", model, 0.0, 1024), lambda: Client(model))
+
+
+def test_hits_and_misses():
+    pool = LLMClientPool(max_size=4)
+
+    first = get(pool, "a")
+    assert get(pool, "a") is first
+    get(pool, "b")
+
+    stats = pool.get_stats()
+    assert (stats["hits"], stats["misses"], stats["size"]) == (1, 2, 2)
+    assert stats["hit_rate"] == 1 / 3
+
+
+def test_lru_eviction():
+    pool = LLMClientPool(max_size=2)
+    a = get(pool, "a")
+    get(pool, "b")
+    # Touching "a" makes "b" the least recently used
+    assert get(pool, "a") is a
+    get(pool, "c")
+
+    assert pool.get_stats()["evictions"] == 1
+    assert get(pool, "a") is a
+    misses = pool.get_stats()["misses"]
+    get(pool, "b")
+    assert pool.get_stats()["misses"] == misses + 1
+
+
+def test_factory_error_caches_nothing():
+    pool = LLMClientPool()
+    key = pool.make_key("openrouter", "a")
+
+    def fail():
+        raise RuntimeError("no API key")
+
+    with pytest.raises(RuntimeError):
+        pool.get_or_create(key, fail)
+    assert pool.get_stats()["size"] == 0
+    assert pool.get_or_create(key, lambda: Client("a")).model == "a"
+
+
+def test_evicted_client_keeps_key_while_referenced():
+    pool = LLMClientPool(max_size=1)
+    a = get(pool, "a")
+    get(pool, "b")
+
+    assert pool.get_stats()["evictions"] == 1
+    assert pool.get_key(a) == ("openrouter", "a", 0.0, 1024, None)
+
+    pool.clear()
+    assert pool.get_key(a)[1] == "a"
+
+    del a
+    gc.collect()
+    assert len(pool._keys_by_client) == 0
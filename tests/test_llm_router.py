@@ -0,0 +1,107 @@
+"""Tests for LLMRouter configuration handling and strategy-aware routing."""
+
+import copy
+
+import pytest
+import yaml
+
+from ultimate_ai_architect_framework.core_modules.llm_router import LLMRouter
+from conftest import FRAMEWORK_ROOT
+
+CONFIG = {
+    "llm": {
+        "providers": {
+            "openrouter": {
+                "api_key": "${TEST_OPENROUTER_KEY}",
+                "default_model": "anthropic/claude-3-haiku",
+                "models": {
+                    "reasoning": "anthropic/claude-3-opus",
+                    "summarization": "anthropic/claude-3-haiku",
+                },
+            },
+            "google": {
+                "api_key": "${TEST_GOOGLE_KEY}",
+                "default_model": "gemini-1.5-pro",
+            },
+        },
+    },
+    "routellm": {
+        "default_strategy": "balanced",
+        "fallback_model": "openrouter.anthropic/claude-3-haiku",
+        "task_model_mapping": {
+            "reasoning": "openrouter.anthropic/claude-3-opus",
+            "summarization": "google_gemini.gemini-1.5-pro",
+        },
+        "strategy_settings": {"min_samples": 3, "max_error_rate": 0.5},
+        "circuit_breaker": {"enabled": False},
+    },
+}
+
+
+@pytest.fixture
+def make_router(tmp_path, monkeypatch):
+    monkeypatch.setenv("TEST_OPENROUTER_KEY", "test-key")
+    monkeypatch.setenv("TEST_GOOGLE_KEY", "test-key")
+
+    def make_router(config=CONFIG):
+        path = tmp_path / "global_settings.yaml"
+        path.write_text(yaml.safe_dump(config))
+        return LLMRouter(str(path))
+    return make_router
+
+
+def test_routes_with_llm_providers_section(make_router):
+    router = make_router()
+
+    assert router.route("reasoning") == "openrouter.anthropic/claude-3-opus"
+    # Aliased provider prefix, and a model name containing a dot
+    assert router.route("summarization") == "google.gemini-1.5-pro"
+    assert router.route("unmapped") == "openrouter.anthropic/claude-3-haiku"
+
+
+def test_provider_without_api_key_is_skipped(make_router, monkeypatch):
+    monkeypatch.delenv("TEST_OPENROUTER_KEY")
+    router = make_router()
+
+    assert router.route("reasoning") == "google.gemini-1.5-pro"
+
+
+def test_degraded_model_is_skipped(make_router):
+    router = make_router()
+
+    for _ in range(3):
+        router.record_result("openrouter.anthropic/claude-3-opus", 0.1, success=False)
+    assert router.route("reasoning") == "openrouter.anthropic/claude-3-haiku"
+
+    for _ in range(3):
+        router.record_result("google_gemini.gemini-1.5-pro", 0.1, success=False)
+    assert router.get_model_stats("google.gemini-1.5-pro")["samples"] == 3
+    assert router.route("summarization") == "openrouter.anthropic/claude-3-haiku"
+
+
+def test_open_circuit_is_routed_around(make_router):
+    config = copy.deepcopy(CONFIG)
+    config["routellm"]["strategy_settings"]["min_samples"] = 100
+    config["routellm"]["circuit_breaker"] = {"enabled": True, "min_calls": 3, "open_duration": 60}
+    router = make_router(config)
+
+    for _ in range(3):
+        assert router.allow_request("openrouter.anthropic/claude-3-opus")
+        router.record_result("openrouter.anthropic/claude-3-opus", 0.1, success=False)
+
+    assert router.get_circuit_states()["openrouter"]["state"] == "open"
+    assert not router.allow_request("openrouter.anthropic/claude-3-haiku")
+    # Every openrouter model shares the open circuit
+    assert router.route("reasoning") == "google.gemini-1.5-pro"
+    assert router.route("unmapped") == "google.gemini-1.5-pro"
+
+
+def test_shipped_config_routes_tasks(monkeypatch):
+    monkeypatch.setenv("OPENROUTER_API_KEY", "test-key")
+    monkeypatch.setenv("GOOGLE_API_KEY", "test-key")
+    monkeypatch.setenv("ANTHROPIC_API_KEY", "test-key")
+    router = LLMRouter(str(FRAMEWORK_ROOT / "configs" / "global_settings.yaml"))
+
+    assert router.route("reasoning") == "openrouter.anthropic/claude-3-opus"
+    assert router.route("summarization") == "google.gemini-pro"
+    assert not any(model_id.startswith("anthropic.") for model_id in router.get_candidates("reasoning"))
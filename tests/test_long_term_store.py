@@ -0,0 +1,107 @@
+"""Tests that SQLiteLongTermStore query pushdown matches InMemoryLongTermStore search."""
+
+import pytest
+
+from ultimate_ai_architect_framework.agents.modules.long_term_store import InMemoryLongTermStore, SQLiteLongTermStore
+from ultimate_ai_architect_framework.agents.modules.memory_item import MemoryItem
+
+INDEXED_FIELDS = ["metadata.type", "data.value"]
+
+VALUES = {
+    "null": None,
+    "true": True,
+    "false": False,
+    "zero": 0,
+    "one": 1,
+    "one_float": 1.0,
+    "half": 0.5,
+    "string_one": "1",
+    "string_null": "null",
+    "big": 2 ** 70,
+    "big_float": float(2 ** 70),
+    "int64_max": 2 ** 63 - 1,
+    "negative_big": -2 ** 64,
+    "list": ["a"],
+    "dict": {"nested": 1},
+}
+
+
+def make_items():
+    items = []
+    for position, (name, value) in enumerate(VALUES.items()):
+        items.append({
+            "id": name,
+            "timestamp": float(position),
+            "data": {"value": value, "deep": {"value": value}},
+            "metadata": {"type": "odd" if position % 2 else "even", "flag": value},
+        })
+    # Items missing the queried fields
+    items.append({"id": "missing", "timestamp": 100.0, "data": {}, "metadata": {}})
+    items.append({"id": "scalar_data", "timestamp": 101.0, "data": "value", "metadata": {"type": None}})
+    return [MemoryItem.from_dict(item) for item in items]
+
+
+@pytest.fixture(scope="module")
+def stores(tmp_path_factory):
+    items = make_items()
+    memory = InMemoryLongTermStore(["facts"], indexed_fields=INDEXED_FIELDS)
+    sqlite = SQLiteLongTermStore(str(tmp_path_factory.mktemp("store") / "memory.sqlite"),
+                                 indexed_fields=INDEXED_FIELDS, hot_set_size=0)
+    memory.add_many("facts", items)
+    sqlite.add_many("facts", items)
+    yield memory, sqlite
+    sqlite.close()
+
+
+QUERIES = [
+    {"data.value": None},
+    {"metadata.type": None},
+    {"data.value": True},
+    {"data.value": False},
+    {"data.value": 0},
+    {"data.value": 1},
+    {"data.value": 1.0},
+    {"data.value": 0.5},
+    {"data.value": "1"},
+    {"data.value": "null"},
+    {"data.value": 2 ** 70},
+    {"data.value": float(2 ** 70)},
+    {"data.value": 2 ** 63 - 1},
+    {"data.value": 2 ** 63},
+    {"data.value": -2 ** 64},
+    {"data.value": ["a"]},
+    {"data.value": {"nested": 1}},
+    {"data.value.nested": 1},
+    {"data.deep.value": 1},
+    {"data.deep.value": None},
+    {"metadata.flag": True},
+    {"metadata.type": "odd", "data.value": 1},
+    {"metadata.type": "even"},
+    {"data": "value"},
+    {"id": "one"},
+    {"timestamp": 3},
+    {"timestamp": 3.0, "data.value": 1.0},
+    {"no.such.field": None},
+    {},
+]
+
+
+@pytest.mark.parametrize("query", QUERIES, ids=repr)
+def test_sqlite_search_matches_in_memory(stores, query):
+    memory, sqlite = stores
+
+    expected = [item["id"] for item in memory.search("facts", query)]
+    assert [item["id"] for item in sqlite.search("facts", query)] == expected
+
+
+def test_null_query_does_not_match_missing_fields(stores):
+    memory, _ = stores
+
+    assert [item["id"] for item in memory.search("facts", {"data.value": None})] == ["null"]
+
+
+def test_numeric_queries_follow_python_equality(stores):
+    memory, _ = stores
+
+    assert [item["id"] for item in memory.search("facts", {"data.value": 1})] == ["true", "one", "one_float"]
+    assert [item["id"] for item in memory.search("facts", {"data.value": 2 ** 70})] == ["big", "big_float"]
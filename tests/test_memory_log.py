@@ -0,0 +1,110 @@
+"""Tests for SegmentLog replay, repair, compaction and legacy segment migration."""
+
+import json
+
+import pytest
+
+from ultimate_ai_architect_framework.agents.modules import memory_log
+from ultimate_ai_architect_framework.agents.modules.long_term_store import InMemoryLongTermStore
+from ultimate_ai_architect_framework.agents.modules.memory_item import MemoryItem
+from ultimate_ai_architect_framework.agents.modules.memory_log import SegmentLog, load_segment_items
+
+
+def item(memory_id, data=None, timestamp=1.0):
+    return {"id": memory_id, "timestamp": timestamp, "data": data or memory_id, "metadata": {}}
+
+
+@pytest.fixture
+def log(tmp_path):
+    log = SegmentLog(str(tmp_path / "conversation.jsonl"), fsync_policy="always")
+    yield log
+    log.close()
+
+
+def test_delete_removes_only_earlier_puts(log):
+    log.append_many([item("a"), item("b")])
+    log.append_delete("a")
+    log.append(item("a", "a again"))
+    log.append_delete("missing")
+
+    assert [(i["id"], i["data"]) for i in load_segment_items(log)] == [("b", "b"), ("a", "a again")]
+    assert log.records == 5
+
+
+def test_replace_deletes_before_puts(log):
+    log.append_many([item("a"), item("b"), item("c")])
+    log.append_replace(["a", "b"], [item("ab", "summary")])
+
+    assert [i["id"] for i in load_segment_items(log)] == ["c", "ab"]
+
+
+def test_torn_tail_is_truncated(log):
+    log.append_many([item("a"), item("b")])
+    log.close()
+    with open(log.path, "a", encoding="utf-8") as f:
+        f.write('{"op": "put", "item": {"id": "c", "tim')
+
+    reopened = SegmentLog(log.path)
+    reopened.append(item("d"))
+    reopened.close()
+
+    with open(log.path, encoding="utf-8") as f:
+        lines = f.read().splitlines()
+    assert len(lines) == 3
+    assert [i["id"] for i in load_segment_items(reopened)] == ["a", "b", "d"]
+
+
+def test_torn_only_line_is_truncated(tmp_path):
+    path = tmp_path / "conversation.jsonl"
+    path.write_text('{"op": "put"')
+
+    log = SegmentLog(str(path))
+    log.append(item("a"))
+    log.close()
+
+    assert [i["id"] for i in load_segment_items(log)] == ["a"]
+
+
+def test_compact_rewrites_live_items(log):
+    log.append_many([item("a"), item("b")])
+    log.append_delete("a")
+
+    assert log.compact(load_segment_items(log)) == 1
+    log.append(item("c"))
+
+    with open(log.path, encoding="utf-8") as f:
+        records = [json.loads(line) for line in f]
+    assert records == [{"op": "put", "item": item("b")}, {"op": "put", "item": item("c")}]
+
+
+def test_failed_compaction_keeps_old_log(log, monkeypatch):
+    log.append_many([item("a"), item("b")])
+
+    def fail_replace(src, dst):
+        raise OSError("disk full")
+
+    monkeypatch.setattr(memory_log.os, "replace", fail_replace)
+    with pytest.raises(OSError):
+        log.compact([item("b")])
+    monkeypatch.undo()
+
+    assert [i["id"] for i in load_segment_items(log)] == ["a", "b"]
+    log.append(item("c"))
+    assert [i["id"] for i in load_segment_items(log)] == ["a", "b", "c"]
+
+
+def test_legacy_json_segment_is_migrated(tmp_path):
+    legacy = [item("a", timestamp="2000-01-01T00:00:00"), item("b", timestamp=1704067300.0)]
+    (tmp_path / "conversation.json").write_text(json.dumps(legacy))
+
+    store = InMemoryLongTermStore(["conversation"], persistence_path=str(tmp_path))
+    assert [i["id"] for i in store.iter_items("conversation")] == ["a", "b"]
+    store.add("conversation", MemoryItem.from_dict(item("c", timestamp=1704067400.0)))
+    store.close()
+
+    assert not (tmp_path / "conversation.json").exists()
+    assert json.loads((tmp_path / "conversation.json.bak").read_text()) == legacy
+    reloaded = InMemoryLongTermStore(["conversation"], persistence_path=str(tmp_path))
+    assert [i["id"] for i in reloaded.iter_items("conversation")] == ["a", "b", "c"]
+    assert isinstance(reloaded.get("a")["timestamp"], float)
+    reloaded.close()
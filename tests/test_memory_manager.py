@@ -0,0 +1,64 @@
+"""Tests for MemoryManager persistence of evicted short-term items."""
+
+import subprocess
+import sys
+import textwrap
+
+import pytest
+
+from ultimate_ai_architect_framework.agents.modules.memory_manager import MemoryManager
+from conftest import FRAMEWORK_ROOT, PACKAGE
+
+# Fills a manager and exits without calling close()
+WRITER = textwrap.dedent("""
+    import sys, types
+    package = types.ModuleType({package!r})
+    package.__path__ = [{root!r}]
+    sys.modules[{package!r}] = package
+    from {package}.agents.modules.memory_manager import MemoryManager
+    manager = MemoryManager("writer", {config!r})
+    for i in range(150):
+        manager.add("conversation", {{"turn": i}})
+""")
+
+
+@pytest.mark.parametrize("backend", ["memory", "sqlite"])
+def test_evictions_survive_exit_without_close(tmp_path, backend):
+    config = {
+        "persistence_path": str(tmp_path),
+        "long_term_backend": backend,
+        "max_short_term_items": 10,
+        "eviction_batch_size": 100,
+    }
+    code = WRITER.format(package=PACKAGE, root=str(FRAMEWORK_ROOT), config=config)
+    subprocess.run([sys.executable, "-c", code], check=True)
+
+    manager = MemoryManager("reader", config)
+    try:
+        turns = [item["data"]["turn"] for item in manager.search("conversation", {})]
+    finally:
+        manager.close()
+    # The 10 items left in short-term memory are not persisted; every evicted one is
+    assert turns == list(range(140))
+
+
+def test_failed_eviction_write_keeps_items_pending(tmp_path):
+    manager = MemoryManager("failing", {
+        "persistence_path": str(tmp_path),
+        "max_short_term_items": 2,
+        "eviction_batch_size": 1,
+    })
+    store_add_many = manager.long_term_store.add_many
+
+    def broken_add_many(segment, items):
+        raise OSError("disk full")
+
+    manager.long_term_store.add_many = broken_add_many
+    for i in range(5):
+        manager.add("conversation", {"turn": i})
+    assert [item["data"]["turn"] for item in manager.search("conversation", {})] == list(range(5))
+
+    manager.long_term_store.add_many = store_add_many
+    manager.sync()
+    assert [item["data"]["turn"] for item in manager.long_term_store.search("conversation", {})] == [0, 1, 2]
+    manager.close()
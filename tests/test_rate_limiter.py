@@ -0,0 +1,155 @@
+"""Tests for the token-bucket rate limiter."""
+
+import subprocess
+import sys
+import textwrap
+
+import pytest
+
+from ultimate_ai_architect_framework.core_modules.rate_limiter import (
+    RateLimiter, RateLimitExceeded, TokenBucket, create_rate_limiter
+)
+from conftest import FRAMEWORK_ROOT, PACKAGE
+
+# Tries to take every request slot of a shared budget without waiting
+ACQUIRER = textwrap.dedent("""
+    import sys, types
+    package = types.ModuleType({package!r})
+    package.__path__ = [{root!r}]
+    sys.modules[{package!r}] = package
+    from {package}.core_modules.rate_limiter import RateLimiter, RateLimitExceeded
+    limiter = RateLimiter({limits!r}, mode="file", state_path={state_path!r})
+    granted = 0
+    for _ in range({attempts}):
+        try:
+            limiter.acquire("openrouter", timeout=0)
+            granted += 1
+        except RateLimitExceeded:
+            pass
+    print(granted)
+""")
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 100.0
+        self.sleeps = []
+
+    def __call__(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+@pytest.fixture
+def clock():
+    return FakeClock()
+
+
+def make_limiter(clock, **limits):
+    return RateLimiter({"openrouter": limits, "google": {"requests_per_minute": 60}}, clock=clock, sleep=clock.sleep)
+
+
+def test_token_bucket_refill_and_wait():
+    bucket = TokenBucket(capacity=10, refill_per_second=2)
+    bucket.refill(0.0)
+    assert bucket.wait_time(10) == 0.0
+
+    bucket.consume(10)
+    assert bucket.wait_time(1) == 0.5
+    bucket.refill(2.0)
+    assert bucket.level == 4.0
+    # Time going backwards adds nothing
+    bucket.refill(1.0)
+    assert bucket.level == 4.0
+    bucket.refill(100.0)
+    assert bucket.level == 10.0
+
+    # Oversized requests wait only for a full bucket and leave it in debt
+    bucket.consume(25)
+    assert bucket.wait_time(25) == pytest.approx(12.5)
+
+
+def test_requests_per_minute(clock):
+    limiter = make_limiter(clock, requests_per_minute=120)
+
+    for _ in range(120):
+        assert limiter.acquire("openrouter") == 0.0
+    assert limiter.acquire("openrouter") == pytest.approx(0.5)
+    assert clock.sleeps == [pytest.approx(0.5)]
+
+    metrics = limiter.get_metrics()["openrouter"]
+    assert metrics["acquired"] == 121
+    assert metrics["max_wait"] == pytest.approx(0.5)
+    assert metrics["waiting"] == 0
+
+
+def test_tokens_per_minute(clock):
+    limiter = make_limiter(clock, requests_per_minute=1000, tokens_per_minute=600)
+
+    limiter.acquire("openrouter", tokens=600)
+    assert limiter.acquire("openrouter", tokens=100) == pytest.approx(10.0)
+    # Larger than the whole budget: waits for a full bucket instead of forever
+    assert limiter.acquire("openrouter", tokens=5000) == pytest.approx(60.0)
+
+
+def test_timeout_raises_without_sleeping(clock):
+    limiter = make_limiter(clock, requests_per_minute=1)
+    limiter.acquire("openrouter")
+
+    with pytest.raises(RateLimitExceeded):
+        limiter.acquire("openrouter", timeout=30)
+    assert clock.sleeps == []
+    assert limiter.get_metrics()["openrouter"]["timeouts"] == 1
+
+
+def test_alias_shares_configured_provider_budget(clock):
+    limiter = make_limiter(clock, requests_per_minute=60)
+
+    for _ in range(60):
+        limiter.acquire("google_gemini")
+    assert limiter.acquire("google") == pytest.approx(1.0)
+    assert set(limiter.get_metrics()) == {"google"}
+    # Providers without limits are never throttled
+    assert limiter.acquire("unconfigured") == 0.0
+
+
+def test_create_rate_limiter_reads_provider_sections(tmp_path):
+    config = {
+        "llm": {
+            "providers": {"openrouter": {"rate_limit": {"requests_per_minute": 200}}},
+            "rate_limiter": {"mode": "file", "state_path": "data/limits.json"},
+        },
+        "llm_providers": {"google": {"rate_limit": {"tokens_per_minute": 1000}}},
+    }
+    limiter = create_rate_limiter(config, tmp_path)
+
+    assert limiter.mode == "file"
+    assert limiter.state_path == tmp_path / "data" / "limits.json"
+    assert limiter.limits == {
+        "openrouter": {"requests_per_minute": 200, "tokens_per_minute": None},
+        "google": {"requests_per_minute": None, "tokens_per_minute": 1000},
+    }
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="file mode needs fcntl")
+def test_file_mode_shares_budget_across_processes(tmp_path):
+    # 6 requests per minute: the budget refills one slot every 10 seconds
+    script = ACQUIRER.format(
+        package=PACKAGE,
+        root=str(FRAMEWORK_ROOT),
+        limits={"openrouter": {"requests_per_minute": 6}},
+        state_path=str(tmp_path / "limits.json"),
+        attempts=5,
+    )
+    processes = [
+        subprocess.Popen([sys.executable, "-c", script], stdout=subprocess.PIPE, text=True)
+        for _ in range(2)
+    ]
+    granted = [int(process.communicate(timeout=60)[0]) for process in processes]
+
+    assert all(process.returncode == 0 for process in processes)
+    # Separate budgets would grant 5 + 5
+    assert 6 <= sum(granted) <= 7
@@ -0,0 +1,91 @@
+"""Tests for the response cache backends and cache keys."""
+
+import time
+
+import pytest
+
+from ultimate_ai_architect_framework.core_modules.response_cache import (
+    InMemoryResponseCache, SQLiteResponseCache, create_response_cache, make_cache_key
+)
+
+
+@pytest.fixture(params=["memory", "sqlite"])
+def make_cache(request, tmp_path):
+    caches = []
+
+    def make_cache(**settings):
+        if request.param == "memory":
+            cache = InMemoryResponseCache(**settings)
+        else:
+            cache = SQLiteResponseCache(tmp_path / "cache.sqlite", **settings)
+        caches.append(cache)
+        return cache
+    yield make_cache
+    for cache in caches:
+        if isinstance(cache, SQLiteResponseCache):
+            cache.close()
+
+
+def test_hit_and_miss(make_cache):
+    cache = make_cache()
+    key = make_cache_key("openrouter.m", 0.0, "prompt")
+
+    assert cache.get(key) is None
+    cache.set(key, "response")
+    assert cache.get(key) == "response"
+    assert cache.get(make_cache_key("openrouter.m", 0.0, "other prompt")) is None
+
+    stats = cache.get_stats()
+    assert (stats["hits"], stats["misses"], stats["size"]) == (1, 2, 1)
+
+
+def test_ttl_expiry(make_cache, monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(time, "time", lambda: now[0])
+    cache = make_cache(ttl_seconds=60)
+    cache.set("key", "response")
+
+    now[0] += 59
+    assert cache.get("key") == "response"
+    now[0] += 1
+    assert cache.get("key") is None
+    assert len(cache) == 0
+
+
+def test_evicts_least_recently_used(make_cache, monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(time, "time", lambda: now[0])
+    cache = make_cache(max_entries=2)
+    for key in ("a", "b"):
+        cache.set(key, key)
+        now[0] += 1
+    cache.get("a")
+    now[0] += 1
+    cache.set("c", "c")
+
+    assert cache.get("b") is None
+    assert cache.get("a") == "a"
+    assert cache.get("c") == "c"
+
+
+def test_max_temperature(make_cache):
+    assert make_cache().accepts(0.0)
+    assert not make_cache().accepts(0.7)
+    assert not make_cache().accepts(None)
+    assert make_cache(max_temperature=None).accepts(0.7)
+
+
+def test_cache_key_normalizes_prompt_whitespace():
+    key = make_cache_key("openrouter.m", 0.0, "line one  \nline two\n")
+
+    assert key == make_cache_key("openrouter.m", 0.0, "  line one\nline two")
+    assert key != make_cache_key("openrouter.m", 0.1, "line one\nline two")
+    assert key != make_cache_key("openrouter.m", 0.0, "line one\nline two", {"max_tokens": 10})
+
+
+def test_create_response_cache(tmp_path):
+    assert create_response_cache({"enabled": False}, tmp_path) is None
+
+    cache = create_response_cache({"enabled": True, "backend": "sqlite", "path": "data/cache.sqlite"}, tmp_path)
+    assert cache.path == tmp_path / "data" / "cache.sqlite"
+    cache.close()
@@ -0,0 +1,69 @@
+"""Tests for incremental SSE parsing and Flowise event conversion."""
+
+from ultimate_ai_architect_framework.core_modules.sse_parser import SSEParser
+from ultimate_ai_architect_framework.core_modules.flowise_client import (
+    EVENT_END, EVENT_METADATA, EVENT_TOKEN, to_flowise_event
+)
+
+
+def feed_bytewise(parser, raw: bytes):
+    messages = []
+    for i in range(len(raw)):
+        messages.extend(parser.feed(raw[i:i + 1]))
+    return messages + parser.close()
+
+
+def test_multibyte_utf8_split_across_chunks():
+    messages = feed_bytewise(SSEParser(), "event: token\ndata: héllo 日本語 🎉\n\n".encode("utf-8"))
+    assert [(m.event, m.data) for m in messages] == [("token", "héllo 日本語 🎉")]
+
+
+def test_crlf_split_across_chunks_is_one_line_ending():
+    parser = SSEParser()
+    messages = parser.feed(b"data: a\r")
+    messages += parser.feed(b"\ndata: b\r")
+    messages += parser.feed(b"\n\r")
+    messages += parser.feed(b"\n")
+    assert [m.data for m in messages] == ["a\nb"]
+    assert parser.close() == []
+
+
+def test_mixed_line_endings_comments_and_fields():
+    raw = b": keep-alive\r\nid: 7\rretry: 1500\nevent: metadata\r\ndata: x\n\n"
+    messages = feed_bytewise(SSEParser(), raw)
+    assert len(messages) == 1
+    assert (messages[0].event, messages[0].data, messages[0].id, messages[0].retry) == ("metadata", "x", "7", 1500)
+
+
+def test_close_flushes_unterminated_message():
+    parser = SSEParser()
+    assert parser.feed(b"data: tail") == []
+    assert [m.data for m in parser.close()] == ["tail"]
+
+
+def test_event_field_framing():
+    parser = SSEParser()
+    messages = parser.feed(b'event: token\ndata: Hi\n\nevent: sourceDocuments\ndata: [{"id": 1}]\n\nevent: end\ndata: [DONE]\n\n')
+    events = [to_flowise_event(m) for m in messages]
+    assert [(e.type, e.name) for e in events] == [
+        (EVENT_TOKEN, "token"), (EVENT_METADATA, "sourceDocuments"), (EVENT_END, "end")
+    ]
+    assert events[0].data == "Hi"
+    assert events[1].data == [{"id": 1}]
+
+
+def test_json_payload_framing_and_done_marker():
+    parser = SSEParser()
+    messages = parser.feed(
+        b'data: {"event": "token", "data": "Hi"}\n\n'
+        b'data: {"event": "metadata", "data": {"chatId": "c1"}}\n\n'
+        b'data: plain text\n\n'
+        b'data: [DONE]\n\n'
+    )
+    events = [to_flowise_event(m) for m in messages]
+    assert [(e.type, e.data) for e in events] == [
+        (EVENT_TOKEN, "Hi"),
+        (EVENT_METADATA, {"chatId": "c1"}),
+        (EVENT_TOKEN, "plain text"),
+        (EVENT_END, None),
+    ]
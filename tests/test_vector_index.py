@@ -0,0 +1,163 @@
+"""Tests for IVFIndex training, updates, persistence and filtered queries."""
+
+import numpy as np
+import pytest
+
+from ultimate_ai_architect_framework.core_modules.vector_index import FlatIndex, IVFIndex, load_index
+
+DIMENSION = 16
+N_LISTS = 8
+
+
+def clustered_vectors(count, seed=0):
+    rng = np.random.default_rng(seed)
+    centers = rng.normal(size=(N_LISTS, DIMENSION))
+    labels = rng.integers(0, N_LISTS, size=count)
+    return (centers[labels] + 0.3 * rng.normal(size=(count, DIMENSION))).astype(np.float32)
+
+
+def metadata_for(count):
+    return [{"tag": f"t{i % 5}", "rank": i % 50} for i in range(count)]
+
+
+def build(count=400, n_probe=2):
+    vectors = clustered_vectors(count)
+    ids = [f"v{i}" for i in range(count)]
+    ivf = IVFIndex(DIMENSION, n_lists=N_LISTS, n_probe=n_probe, train_threshold=0)
+    flat = FlatIndex(DIMENSION)
+    for index in (ivf, flat):
+        index.upsert(ids, vectors, metadata_for(count))
+    ivf.train()
+    return ivf, flat, vectors
+
+
+def result_ids(results):
+    return [result["id"] for result in results]
+
+
+def assert_assignments_consistent(index):
+    count = len(index)
+    assert sorted(index._rows.values()) == list(range(count))
+    for vector_id, row in index._rows.items():
+        assert index._ids[row] == vector_id
+    expected = np.argmax(index._vectors[:count] @ index.centroids.T, axis=1)
+    assert np.array_equal(index._assign[:count], expected)
+
+
+def test_queries_are_exact_until_trained():
+    vectors = clustered_vectors(50)
+    ivf = IVFIndex(DIMENSION, n_lists=N_LISTS, n_probe=1, train_threshold=0)
+    flat = FlatIndex(DIMENSION)
+    for index in (ivf, flat):
+        index.upsert([f"v{i}" for i in range(50)], vectors)
+
+    assert not ivf.is_trained
+    assert result_ids(ivf.query(vectors[3], k=10)) == result_ids(flat.query(vectors[3], k=10))
+
+
+def test_train_threshold_trains_automatically():
+    index = IVFIndex(DIMENSION, n_lists=N_LISTS, train_threshold=100)
+    index.upsert([f"v{i}" for i in range(99)], clustered_vectors(99))
+    assert not index.is_trained
+    index.upsert(["last"], clustered_vectors(1, seed=1))
+    assert index.is_trained
+    assert_assignments_consistent(index)
+
+
+def test_upsert_after_training_assigns_lists():
+    ivf, _, _ = build()
+    new_vectors = clustered_vectors(30, seed=1)
+    ivf.upsert([f"new{i}" for i in range(30)], new_vectors)
+    # Replacing an existing id moves it to its new vector's list
+    ivf.upsert(["v0"], new_vectors[:1])
+
+    assert len(ivf) == 430
+    assert_assignments_consistent(ivf)
+    assert ivf.query(new_vectors[5], k=1)[0]["id"] == "new5"
+
+
+def test_delete_moves_last_row_and_its_assignment():
+    ivf, flat, vectors = build()
+    ivf.n_probe = N_LISTS
+
+    deleted = [f"v{i}" for i in range(0, 400, 7)] + ["missing"]
+    assert ivf.delete(deleted) == len(deleted) - 1
+    flat.delete(deleted)
+
+    assert "v0" not in ivf and "v398" in ivf
+    assert_assignments_consistent(ivf)
+    for query in vectors[:20]:
+        assert result_ids(ivf.query(query, k=10)) == result_ids(flat.query(query, k=10))
+
+
+def test_full_probe_matches_flat_and_partial_probe_recall():
+    ivf, flat, _ = build(n_probe=N_LISTS)
+    queries = clustered_vectors(50, seed=2)
+    exact = [set(result_ids(flat.query(query, k=10))) for query in queries]
+
+    assert [set(result_ids(ivf.query(query, k=10))) for query in queries] == exact
+
+    ivf.n_probe = 3
+    recall = np.mean([
+        len(set(result_ids(ivf.query(query, k=10))) & expected) / 10
+        for query, expected in zip(queries, exact)
+    ])
+    assert recall >= 0.9
+
+
+def test_save_and_load_round_trip(tmp_path):
+    ivf, _, vectors = build()
+    ivf.save(str(tmp_path))
+
+    loaded = load_index(str(tmp_path))
+    assert isinstance(loaded, IVFIndex) and loaded.is_trained
+    assert isinstance(loaded._vectors, np.memmap)
+    # Rows are saved grouped by list
+    assert np.all(np.diff(loaded._assign) >= 0)
+    assert (loaded.n_lists, loaded.n_probe) == (ivf.n_lists, ivf.n_probe)
+    assert_assignments_consistent(loaded)
+    for vector_id in ("v0", "v123", "v399"):
+        assert np.allclose(loaded.get(vector_id)["vector"], ivf.get(vector_id)["vector"])
+        assert loaded.get(vector_id)["metadata"] == ivf.get(vector_id)["metadata"]
+    for query in vectors[:20]:
+        assert result_ids(loaded.query(query, k=10)) == result_ids(ivf.query(query, k=10))
+
+    # Modifying a memory-mapped index copies it into memory first
+    loaded.delete(["v5"])
+    loaded.upsert(["extra"], clustered_vectors(1, seed=3))
+    assert not isinstance(loaded._vectors, np.memmap)
+    assert_assignments_consistent(loaded)
+    loaded.save(str(tmp_path))
+    assert len(load_index(str(tmp_path), mmap=False)) == 400
+
+
+def test_empty_untrained_round_trip(tmp_path):
+    IVFIndex(DIMENSION, n_lists=N_LISTS, train_threshold=0).save(str(tmp_path))
+
+    loaded = load_index(str(tmp_path))
+    loaded.upsert(["a", "b", "c"], clustered_vectors(3))
+    loaded.delete(["a"])
+    assert sorted(loaded._ids) == ["b", "c"]
+
+
+@pytest.mark.parametrize("filter", [
+    {"tag": "t1"},
+    {"tag": {"$in": ["t1", "t3"]}},
+    {"rank": {"$gte": 45}},
+    {"tag": {"$in": ["t0", "t2", "t4"]}, "rank": {"$gte": 10}},
+    {"tag": "t2", "rank": {"$gte": 20, "$lt": 40}},
+], ids=repr)
+def test_filters_combined_with_probed_lists(filter):
+    ivf, flat, _ = build()
+    queries = clustered_vectors(20, seed=4)
+
+    for query in queries:
+        probed = set(ivf._ids[row] for row in ivf._candidate_rows(ivf._prepare(query)[0]))
+        allowed = result_ids(flat.query(query, k=len(flat), filter=filter))
+        results = result_ids(ivf.query(query, k=10, filter=filter))
+
+        if len(allowed) <= len(probed):
+            # Small filtered sets are scored exactly
+            assert results == allowed[:10]
+        else:
+            assert results == [vector_id for vector_id in allowed if vector_id in probed][:10]